@@ -355,6 +355,53 @@ namespace MCP.Editor.Base
             return response;
         }
         
+        /// <summary>
+        /// "targets" 配列の各要素に単体の操作を適用し、入力順に結果を返します。
+        /// 要素ごとの失敗はエラーレスポンスとして結果に含め、残りの要素の処理は継続します。
+        /// "stopOnError" が true の場合は最初の失敗で打ち切り、以降の要素は実行せず結果にも含めません。
+        /// </summary>
+        protected Dictionary<string, object> ApplyEachTarget(
+            Dictionary<string, object> payload,
+            Func<Dictionary<string, object>, object> apply)
+        {
+            if (!(payload["targets"] is List<object> targets))
+            {
+                throw new InvalidOperationException("targets must be an array of objects");
+            }
+            
+            var stopOnError = GetBool(payload, "stopOnError", false);
+            var results = new List<object>(targets.Count);
+            foreach (var target in targets)
+            {
+                object result;
+                try
+                {
+                    if (!(target is Dictionary<string, object> targetPayload))
+                    {
+                        throw new InvalidOperationException("Each target must be an object");
+                    }
+                    result = apply(targetPayload);
+                }
+                catch (Exception ex)
+                {
+                    result = CreateErrorResponse(ex);
+                }
+                
+                results.Add(result);
+                if (stopOnError && result is Dictionary<string, object> resultDict
+                    && resultDict.TryGetValue("success", out var success) && success is bool succeeded && !succeeded)
+                {
+                    break;
+                }
+            }
+            
+            return CreateSuccessResponse(
+                ("results", results),
+                ("count", results.Count),
+                ("stopped", results.Count < targets.Count)
+            );
+        }
+        
         #endregion
         
         #region Resource Resolution Helper Methods
@@ -30,7 +30,8 @@ namespace MCP.Editor.Handlers
             "inspect",
             "findMultiple",
             "deleteMultiple",
-            "inspectMultiple"
+            "inspectMultiple",
+            "refresh"
         };
         
         #endregion
@@ -58,6 +59,7 @@ namespace MCP.Editor.Handlers
                 "findMultiple" => FindMultipleAssets(payload),
                 "deleteMultiple" => DeleteMultipleAssets(payload),
                 "inspectMultiple" => InspectMultipleAssets(payload),
+                "refresh" => RefreshAssetDatabase(),
                 _ => throw new InvalidOperationException($"Unknown asset operation: {operation}")
             };
         }
@@ -98,6 +100,16 @@ namespace MCP.Editor.Handlers
             
             // Write content
             File.WriteAllText(assetPath, content ?? string.Empty);
+            if (GetBool(payload, "deferRefresh"))
+            {
+                // Not imported until the next "refresh", so it has no GUID yet
+                return CreateSuccessResponse(
+                    ("assetPath", assetPath),
+                    ("importPending", true),
+                    ("message", "Asset created; it is imported by the next AssetDatabase refresh")
+                );
+            }
+            
             AssetDatabase.ImportAsset(assetPath);
             AssetDatabase.Refresh(); // Trigger compilation if needed
             
@@ -127,8 +139,11 @@ namespace MCP.Editor.Handlers
             }
             
             File.WriteAllText(assetPath, content ?? string.Empty);
-            AssetDatabase.ImportAsset(assetPath);
-            AssetDatabase.Refresh(); // Trigger compilation if needed
+            if (!GetBool(payload, "deferRefresh"))
+            {
+                AssetDatabase.ImportAsset(assetPath);
+                AssetDatabase.Refresh(); // Trigger compilation if needed
+            }
             
             return CreateSuccessResponse(
                 ("assetPath", assetPath),
@@ -200,7 +215,18 @@ namespace MCP.Editor.Handlers
                 throw new InvalidOperationException($"Asset does not exist: {assetPath}");
             }
             
-            if (!AssetDatabase.DeleteAsset(assetPath))
+            if (GetBool(payload, "deferRefresh"))
+            {
+                // Leave the AssetDatabase untouched until the next "refresh" so that
+                // several script deletions trigger a single compilation.
+                File.Delete(assetPath);
+                var metaPath = assetPath + ".meta";
+                if (File.Exists(metaPath))
+                {
+                    File.Delete(metaPath);
+                }
+            }
+            else if (!AssetDatabase.DeleteAsset(assetPath))
             {
                 throw new InvalidOperationException($"Failed to delete asset: {assetPath}");
             }
@@ -211,6 +237,19 @@ namespace MCP.Editor.Handlers
             );
         }
         
+        /// <summary>
+        /// Imports changes written with deferRefresh and reports whether a compilation was started.
+        /// </summary>
+        private object RefreshAssetDatabase()
+        {
+            AssetDatabase.Refresh();
+            
+            return CreateSuccessResponse(
+                ("compiling", EditorApplication.isCompiling),
+                ("message", "AssetDatabase refreshed")
+            );
+        }
+        
         /// <summary>
         /// Renames an asset.
         /// </summary>
@@ -220,10 +220,16 @@ namespace MCP.Editor.Handlers
         #region Batch Operations
         
         /// <summary>
-        /// Adds a component to multiple GameObjects matching a pattern.
+        /// Adds a component to multiple GameObjects matching a pattern, or applies a single
+        /// add to each entry of "targets".
         /// </summary>
         private object AddMultipleComponents(Dictionary<string, object> payload)
         {
+            if (payload.ContainsKey("targets"))
+            {
+                return ApplyEachTarget(payload, AddComponent);
+            }
+            
             var pattern = GetString(payload, "pattern");
             var componentType = GetString(payload, "componentType");
             var useRegex = GetBool(payload, "useRegex", false);
@@ -288,10 +294,16 @@ namespace MCP.Editor.Handlers
         }
         
         /// <summary>
-        /// Removes a component from multiple GameObjects matching a pattern.
+        /// Removes a component from multiple GameObjects matching a pattern, or applies a single
+        /// remove to each entry of "targets".
         /// </summary>
         private object RemoveMultipleComponents(Dictionary<string, object> payload)
         {
+            if (payload.ContainsKey("targets"))
+            {
+                return ApplyEachTarget(payload, RemoveComponent);
+            }
+            
             var pattern = GetString(payload, "pattern");
             var componentType = GetString(payload, "componentType");
             var useRegex = GetBool(payload, "useRegex", false);
@@ -361,10 +373,16 @@ namespace MCP.Editor.Handlers
         }
         
         /// <summary>
-        /// Updates a component on multiple GameObjects matching a pattern.
+        /// Updates a component on multiple GameObjects matching a pattern, or applies a single
+        /// update to each entry of "targets".
         /// </summary>
         private object UpdateMultipleComponents(Dictionary<string, object> payload)
         {
+            if (payload.ContainsKey("targets"))
+            {
+                return ApplyEachTarget(payload, UpdateComponent);
+            }
+            
             var pattern = GetString(payload, "pattern");
             var componentType = GetString(payload, "componentType");
             var propertyChanges = payload["propertyChanges"] as Dictionary<string, object>;
@@ -437,10 +455,16 @@ namespace MCP.Editor.Handlers
         }
         
         /// <summary>
-        /// Inspects a component on multiple GameObjects matching a pattern.
+        /// Inspects a component on multiple GameObjects matching a pattern, or each entry of
+        /// "targets" exactly like a single inspect.
         /// </summary>
         private object InspectMultipleComponents(Dictionary<string, object> payload)
         {
+            if (payload.ContainsKey("targets"))
+            {
+                return ApplyEachTarget(payload, InspectComponent);
+            }
+            
             var pattern = GetString(payload, "pattern");
             var componentType = GetString(payload, "componentType");
             var useRegex = GetBool(payload, "useRegex", false);
@@ -354,10 +354,16 @@ namespace MCP.Editor.Handlers
         }
         
         /// <summary>
-        /// Deletes multiple GameObjects matching a pattern.
+        /// Deletes multiple GameObjects matching a pattern, or each entry of "targets"
+        /// exactly like a single delete.
         /// </summary>
         private object DeleteMultipleGameObjects(Dictionary<string, object> payload)
         {
+            if (payload.ContainsKey("targets"))
+            {
+                return ApplyEachTarget(payload, DeleteGameObject);
+            }
+            
             var pattern = GetString(payload, "pattern");
             var useRegex = GetBool(payload, "useRegex", false);
             var maxResults = GetInt(payload, "maxResults", 1000);
@@ -385,10 +391,16 @@ namespace MCP.Editor.Handlers
         }
         
         /// <summary>
-        /// Inspects multiple GameObjects matching a pattern.
+        /// Inspects multiple GameObjects matching a pattern, or each entry of "targets"
+        /// exactly like a single inspect.
         /// </summary>
         private object InspectMultipleGameObjects(Dictionary<string, object> payload)
         {
+            if (payload.ContainsKey("targets"))
+            {
+                return ApplyEachTarget(payload, InspectGameObject);
+            }
+            
             var pattern = GetString(payload, "pattern");
             var useRegex = GetBool(payload, "useRegex", false);
             var maxResults = GetInt(payload, "maxResults", 1000);
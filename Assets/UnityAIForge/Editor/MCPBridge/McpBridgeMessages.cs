@@ -37,9 +37,14 @@ namespace MCP.Editor
             };
         }
 
-        public static Dictionary<string, object> CreateCommandResult(string commandId, bool ok, object result, string errorMessage = null)
+        public static Dictionary<string, object> CreateCommandResult(
+            string commandId,
+            bool ok,
+            object result,
+            string errorMessage = null,
+            Dictionary<string, object> timing = null)
         {
-            return new Dictionary<string, object>
+            var message = new Dictionary<string, object>
             {
                 ["type"] = "command:result",
                 ["commandId"] = commandId,
@@ -47,6 +52,11 @@ namespace MCP.Editor
                 ["result"] = result,
                 ["errorMessage"] = errorMessage,
             };
+            if (timing != null)
+            {
+                message["timing"] = timing;
+            }
+            return message;
         }
 
         public static Dictionary<string, object> CreateCompilationComplete(Dictionary<string, object> compilationResult)
@@ -76,12 +86,15 @@ namespace MCP.Editor
         public string CommandId { get; }
         public string ToolName { get; }
         public Dictionary<string, object> Payload { get; }
+        /// <summary>受信時刻。メインスレッドで実行されるまでの待ち時間の計測に使います。</summary>
+        public DateTime ReceivedAt { get; }
 
         public McpIncomingCommand(string commandId, string toolName, Dictionary<string, object> payload)
         {
             CommandId = commandId;
             ToolName = toolName;
             Payload = payload ?? new Dictionary<string, object>();
+            ReceivedAt = DateTime.UtcNow;
         }
 
         public static bool TryParse(object message, out McpIncomingCommand command)
@@ -1062,13 +1062,15 @@ namespace MCP.Editor
                 }
 
                 // Execute the command
+                var startedAt = DateTime.UtcNow;
                 var result = McpCommandProcessor.Execute(command);
 
                 // Send result immediately if not compiling
                 // If compiling started, the result will be sent after compilation completes
                 if (!willTriggerCompilation || !EditorApplication.isCompiling)
                 {
-                    Send(McpBridgeMessages.CreateCommandResult(command.CommandId, true, result));
+                    Send(McpBridgeMessages.CreateCommandResult(
+                        command.CommandId, true, result, timing: CreateCommandTiming(command, startedAt)));
                 }
 
                 MarkContextDirty();
@@ -1080,6 +1082,18 @@ namespace MCP.Editor
             }
         }
 
+        /// <summary>
+        /// Time the command waited for the main thread and spent executing, reported with its result.
+        /// </summary>
+        private static Dictionary<string, object> CreateCommandTiming(McpIncomingCommand command, DateTime startedAt)
+        {
+            return new Dictionary<string, object>
+            {
+                ["queuedMs"] = Math.Round((startedAt - command.ReceivedAt).TotalMilliseconds, 2),
+                ["executionMs"] = Math.Round((DateTime.UtcNow - startedAt).TotalMilliseconds, 2),
+            };
+        }
+
         /// <summary>
         /// Determines if a command will trigger Unity compilation.
         /// </summary>
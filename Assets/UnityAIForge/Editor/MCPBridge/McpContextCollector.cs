@@ -37,13 +37,14 @@ namespace MCP.Editor
         /// <summary>
         /// Builds a complete context payload containing all relevant project information.
         /// </summary>
-        /// <returns>Dictionary with activeScene, hierarchy, selection, assets, and gitDiffSummary.</returns>
+        /// <returns>Dictionary with activeScene, hierarchy, loadedSceneCount, selection, assets, and gitDiffSummary.</returns>
         public static Dictionary<string, object> BuildContextPayload()
         {
             return new Dictionary<string, object>
             {
                 ["activeScene"] = BuildActiveSceneInfo(),
                 ["hierarchy"] = BuildHierarchyTree(),
+                ["loadedSceneCount"] = CountLoadedScenes(),
                 ["selection"] = BuildSelectionInfo(),
                 ["assets"] = GetAssetIndexCached(),
                 ["gitDiffSummary"] = TryCaptureGitStatus(),
@@ -116,6 +117,23 @@ namespace MCP.Editor
             };
         }
 
+        /// <summary>
+        /// Counts loaded scenes; the hierarchy only covers the active one.
+        /// </summary>
+        private static int CountLoadedScenes()
+        {
+            var count = 0;
+            for (var i = 0; i < SceneManager.sceneCount; i++)
+            {
+                if (SceneManager.GetSceneAt(i).isLoaded)
+                {
+                    count++;
+                }
+            }
+
+            return count;
+        }
+
         private static Dictionary<string, object> BuildHierarchyTree()
         {
             var scene = SceneManager.GetActiveScene();
@@ -0,0 +1,108 @@
+"""
+Per-operation cost of persisting batch queue progress.
+
+Compares rewriting the whole ``.batch_queue_state.json`` (indent=2) after
+every operation, as the queue used to, with the snapshot + append-only
+journal ``BatchQueueState`` uses now, and times loading a snapshot with a
+long journal to replay. Every rewrite costs about the same, so the rewrite is
+timed over the first ``REWRITE_SAMPLE`` operations only. State files go to a
+temporary directory.
+
+Run from the MCPServer directory:
+
+    python benchmarks/bench_batch_journal.py
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import tools.batch_sequential as batch_sequential  # noqa: E402
+from tools.batch_sequential import BatchQueueState  # noqa: E402
+
+SIZES = (100, 1_000, 5_000)
+# Operations timed with full rewrites; 5,000 of them take minutes
+REWRITE_SAMPLE = 200
+
+
+def operations(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "tool": "unity_gameobject_crud",
+            "arguments": {
+                "operation": "create",
+                "name": f"Object_{i}",
+                "parentPath": "Level/Generated",
+                "components": [{"type": "UnityEngine.BoxCollider"}],
+            },
+        }
+        for i in range(count)
+    ]
+
+
+def full_rewrite(count: int) -> float:
+    """Seconds per operation."""
+    state = BatchQueueState()
+    state.operations = operations(count)
+    sample = min(count, REWRITE_SAMPLE)
+    started = time.perf_counter()
+    for index in range(sample):
+        state.current_index = index + 1
+        with open(batch_sequential.STATE_FILE, "w", encoding="utf-8") as stream:
+            json.dump(state.to_dict(), stream, indent=2, ensure_ascii=False)
+    return (time.perf_counter() - started) / sample
+
+
+def journaled(count: int) -> float:
+    """Seconds per operation."""
+    state = BatchQueueState()
+    state.operations = operations(count)
+    state.save()
+    started = time.perf_counter()
+    for index in range(count):
+        state.current_index = index + 1
+        state.record_progress()
+    elapsed = time.perf_counter() - started
+    state.clear()
+    return elapsed / count
+
+
+def replay(count: int) -> float:
+    state = BatchQueueState()
+    state.operations = operations(count)
+    state.save()
+    for index in range(count):
+        state.current_index = index + 1
+        state.record_progress()
+    state._close_journal()
+    started = time.perf_counter()
+    loaded = BatchQueueState.load()
+    elapsed = time.perf_counter() - started
+    assert loaded.current_index == count
+    loaded.clear()
+    return elapsed
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        batch_sequential.STATE_FILE = Path(directory) / ".batch_queue_state.json"
+        batch_sequential.JOURNAL_FILE = batch_sequential.STATE_FILE.with_suffix(".journal.jsonl")
+        for count in SIZES:
+            rewrite = full_rewrite(count)
+            journal = journaled(count)
+            print(
+                f"{count:>5} operations: full rewrite {rewrite * 1e6:9.1f} us/op "
+                f"(~{rewrite * count:6.1f} s per batch) | journal {journal * 1e6:5.1f} us/op | "
+                f"{rewrite / journal:5.0f}x | load + replay {replay(count) * 1000:6.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
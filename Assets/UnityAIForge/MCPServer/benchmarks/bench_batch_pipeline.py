@@ -0,0 +1,123 @@
+"""
+Wall time of a sequential batch against a bridge with round-trip latency.
+
+A fake Unity answers over a link with a fixed one-way latency and runs
+commands one at a time in arrival order, like the editor's main thread. The
+batch is timed at several ``pipeline_depth`` values, and adjacent component
+adds are timed with and without ``fuse_operations``. Queue state goes to a
+temporary directory.
+
+Run from the MCPServer directory:
+
+    python benchmarks/bench_batch_pipeline.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import tools.batch_sequential as batch_sequential  # noqa: E402
+from bridge.bridge_manager import bridge_manager  # noqa: E402
+from tools.builtin_tools import register_builtin_tools  # noqa: E402
+from tools.registry import tool_registry  # noqa: E402
+
+OPERATIONS = 100
+ONE_WAY_SECONDS = 0.025
+WORK_SECONDS = 0.002
+DEPTHS = (1, 2, 4, 8, 16)
+
+
+class FifoUnity:
+    """One-way latency in each direction, one command at a time in arrival order."""
+
+    def __init__(self) -> None:
+        self.queue: asyncio.Queue[tuple[dict[str, Any], asyncio.Future]] = asyncio.Queue()
+        self.applied: list[str] = []
+        self.worker = asyncio.ensure_future(self._run())
+
+    def _apply(self, payload: dict[str, Any]) -> dict[str, Any]:
+        name = payload.get("name") or payload.get("gameObjectPath")
+        self.applied.append(name)
+        return {"success": True, "name": name}
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            payload, answer = await self.queue.get()
+            targets = payload.get("targets")
+            await asyncio.sleep(WORK_SECONDS * len(targets or [payload]))
+            if targets is None:
+                response = self._apply(payload)
+            else:
+                results = [self._apply(target) for target in targets]
+                response = {"success": True, "results": results, "count": len(results)}
+            loop.call_later(ONE_WAY_SECONDS, answer.set_result, response)
+
+    async def send_command(self, tool_name: str, payload: Any, timeout_ms: int = 30_000) -> Any:
+        loop = asyncio.get_running_loop()
+        answer = loop.create_future()
+        loop.call_later(ONE_WAY_SECONDS, self.queue.put_nowait, (payload, answer))
+        return await answer
+
+
+def creates(count: int) -> list[dict[str, Any]]:
+    return [
+        {"tool": "unity_gameobject_crud", "arguments": {"operation": "create", "name": f"Object_{i}"}}
+        for i in range(count)
+    ]
+
+
+def component_adds(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "tool": "unity_component_crud",
+            "arguments": {
+                "operation": "add",
+                "gameObjectPath": f"Object_{i}",
+                "componentType": "UnityEngine.BoxCollider",
+            },
+        }
+        for i in range(count)
+    ]
+
+
+async def timed(operations: list[dict[str, Any]], **arguments: Any) -> float:
+    unity = FifoUnity()
+    bridge_manager.send_command = unity.send_command
+    started = time.perf_counter()
+    result = await batch_sequential.run_batch_sequential({"operations": operations, **arguments}, bridge_manager)
+    elapsed = time.perf_counter() - started
+    unity.worker.cancel()
+    assert result["success"], result.get("message")
+    expected = [op["arguments"].get("name") or op["arguments"]["gameObjectPath"] for op in operations]
+    assert unity.applied == expected
+    return elapsed
+
+
+async def main() -> None:
+    print(
+        f"{OPERATIONS} operations, {ONE_WAY_SECONDS * 2000:.0f} ms round trip, "
+        f"{WORK_SECONDS * 1000:.0f} ms of work each"
+    )
+    for depth in DEPTHS:
+        elapsed = await timed(creates(OPERATIONS), pipeline_depth=depth)
+        print(f"  create, pipeline_depth {depth:>2}: {elapsed * 1000:7.1f} ms ({elapsed / OPERATIONS * 1000:5.1f} ms/op)")
+    for fuse in (False, True):
+        elapsed = await timed(component_adds(OPERATIONS), fuse_operations=fuse)
+        print(f"  component add, fuse_operations={fuse!s:5}: {elapsed * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    register_builtin_tools(tool_registry)
+    bridge_manager.is_connected = lambda: True
+    with tempfile.TemporaryDirectory() as directory:
+        batch_sequential.STATE_FILE = Path(directory) / ".batch_queue_state.json"
+        batch_sequential.JOURNAL_FILE = batch_sequential.STATE_FILE.with_suffix(".journal.jsonl")
+        asyncio.run(main())
@@ -0,0 +1,117 @@
+"""
+Refresh cost of the Editor.log watcher on a large log.
+
+Writes a synthetic log of ``LOG_MEGABYTES`` to a temporary directory and
+compares reading the whole file on every refresh, as the watcher used to,
+with the watcher's tail-first initial read, incremental appends and idle
+refreshes. Then checks a multibyte character split across writes,
+truncation, rotation and a large burst.
+
+Run from the MCPServer directory:
+
+    python benchmarks/bench_editor_log.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from services.editor_log_watcher import MAX_LINES, EditorLogWatcher  # noqa: E402
+
+LOG_MEGABYTES = 120
+IDLE_REFRESHES = 1_000
+BURST_LINES = 60_000
+LINE = (
+    "[Licensing::Client] Successfully resolved entitlement details — ✓ ünïcödé 漢字 "
+    "Refreshing native plugins compatible for Editor in 12.34 ms\n"
+)
+
+
+def write_log(path: Path, megabytes: int) -> None:
+    chunk = LINE * 1_000
+    with open(path, "w", encoding="utf-8") as stream:
+        for _ in range(megabytes * 1024 * 1024 // len(chunk.encode())):
+            stream.write(chunk)
+
+
+def append(path: Path, data: bytes) -> None:
+    with open(path, "ab") as stream:
+        stream.write(data)
+
+
+def full_read(path: Path) -> list[str]:
+    return path.read_text(encoding="utf-8", errors="replace").splitlines()[-MAX_LINES:]
+
+
+async def measured(action: Callable[[], Awaitable[Any]]) -> tuple[float, float]:
+    """Seconds and peak traced MiB of one awaited call."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    await action()
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+async def main(directory: Path) -> None:
+    path = directory / "Editor.log"
+    write_log(path, LOG_MEGABYTES)
+    print(f"Editor.log of {path.stat().st_size / 2**20:.0f} MiB")
+
+    async def old_refresh() -> list[str]:
+        return full_read(path)
+
+    elapsed, peak = await measured(old_refresh)
+    print(f"  full read:              {elapsed * 1000:8.1f} ms, peak {peak:7.1f} MiB")
+
+    watcher = EditorLogWatcher(path)
+    elapsed, peak = await measured(watcher.refresh)
+    assert watcher.get_snapshot().lines == full_read(path)
+    print(f"  watcher, first refresh: {elapsed * 1000:8.1f} ms, peak {peak:7.2f} MiB")
+
+    diagnostic = "Assets/Scripts/Enemy.cs(3,1): error CS0103: 名前 'x' は存在しません\n".encode()
+    split = diagnostic.index("名".encode()) + 1
+    append(path, diagnostic[:split])
+    await watcher.refresh()
+    append(path, diagnostic[split:] + LINE.encode() * 10)
+    elapsed, _ = await measured(watcher.refresh)
+    assert watcher.get_snapshot().lines[-11] == diagnostic.decode().rstrip("\n")
+    print(f"  watcher, 11 new lines:  {elapsed * 1e6:8.0f} us (split UTF-8 character intact)")
+
+    started = time.perf_counter()
+    for _ in range(IDLE_REFRESHES):
+        await watcher.refresh()
+    print(f"  watcher, idle refresh:  {(time.perf_counter() - started) / IDLE_REFRESHES * 1e6:8.1f} us")
+
+    with open(path, "r+b") as stream:
+        stream.truncate(0)
+        stream.write(b"fresh\n")
+    await watcher.refresh()
+    assert watcher.get_snapshot().lines == ["fresh"]
+
+    os.replace(path, directory / "Editor-prev.log")
+    path.write_text("rotated\n", encoding="utf-8")
+    await watcher.refresh()
+    assert watcher.get_snapshot().lines == ["rotated"]
+    print("  truncation and rotation start over")
+
+    append(path, LINE.encode() * BURST_LINES)
+    elapsed, peak = await measured(watcher.refresh)
+    burst = BURST_LINES * len(LINE.encode()) / 2**20
+    print(f"  watcher, {burst:.0f} MiB burst:   {elapsed * 1000:8.1f} ms, peak {peak:7.2f} MiB")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(main(Path(directory)))
@@ -0,0 +1,150 @@
+"""
+Response size and encode/decode time of tool results.
+
+Compares the pretty JSON every result used to be rendered as with compact
+JSON, ``fields``/``exclude`` projection and the columnar encoding of
+``*Multiple`` results on synthetic ``inspect`` / ``inspectMultiple``
+payloads shaped like the bridge's.
+
+Run from the MCPServer directory:
+
+    python benchmarks/bench_response_encoding.py
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from utils.columnar import decode_columnar, encode_columnar  # noqa: E402
+from utils.json_utils import as_compact_json, as_pretty_json  # noqa: E402
+from utils.projection import project  # noqa: E402
+
+random.seed(1)
+
+
+def _transform(index: int) -> dict[str, Any]:
+    position = {"x": round(random.uniform(-50, 50), 3), "y": 0.0, "z": round(random.uniform(-50, 50), 3)}
+    return {
+        "position": position,
+        "rotation": {"x": 0.0, "y": 0.0, "z": 0.0, "w": 1.0},
+        "localScale": {"x": 1.0, "y": 1.0, "z": 1.0},
+        "eulerAngles": {"x": 0.0, "y": 90.0, "z": 0.0},
+        "localPosition": position,
+        "parent": {"name": "Enemies", "instanceID": -1234},
+        "hasChanged": True,
+        "childCount": 0,
+        "tag": random.choice(["Enemy", "Untagged", "Boss"]),
+        "name": f"Enemy_{index:05d}",
+    }
+
+
+def component_inspect() -> dict[str, Any]:
+    return {
+        "success": True,
+        "gameObjectPath": "Level/Enemies/Enemy_00001",
+        "componentType": "UnityEngine.Transform",
+        "instanceID": -4242,
+        "properties": _transform(1),
+    }
+
+
+def components_inspect_multiple(count: int) -> dict[str, Any]:
+    results = [
+        {
+            "gameObjectPath": f"Level/Enemies/Enemy_{i:05d}",
+            "componentType": "UnityEngine.Transform",
+            "instanceID": -1000 - i,
+            "properties": _transform(i),
+        }
+        for i in range(count)
+    ]
+    return {"success": True, "results": results, "count": count}
+
+
+def gameobjects_inspect_multiple(count: int) -> dict[str, Any]:
+    components = [
+        {"type": "UnityEngine.Transform", "name": "Transform"},
+        {"type": "UnityEngine.Rigidbody2D", "name": "Rigidbody2D"},
+        {"type": "UnityEngine.BoxCollider2D", "name": "BoxCollider2D"},
+        {"type": "UnityEngine.SpriteRenderer", "name": "SpriteRenderer"},
+    ]
+    results = []
+    for i in range(count):
+        result = {
+            "name": f"Enemy_{i:05d}",
+            "path": f"Level/Enemies/Enemy_{i:05d}",
+            "instanceID": -1000 - i,
+            "tag": "Enemy",
+            "layer": "Default",
+            "active": i % 7 != 0,
+            "components": components[:2] if i % 5 == 0 else components,
+        }
+        if i % 11 == 0:
+            del result["tag"]
+        results.append(result)
+    return {"success": True, "results": results, "count": count}
+
+
+def best_ms(action: Callable[[], Any], repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def report_sizes(name: str, payload: dict[str, Any], fields: list[str]) -> None:
+    pretty = as_pretty_json(payload)
+    compact = as_compact_json(payload)
+    projected = as_compact_json(project(payload, fields=fields))
+    print(
+        f"{name:35} pretty {len(pretty):>9,} B | compact {len(compact):>9,} B "
+        f"({len(compact) / len(pretty):.0%}) | compact + fields {len(projected):>9,} B "
+        f"({len(projected) / len(pretty):.0%})"
+    )
+
+
+def report_columnar(name: str, payload: dict[str, Any]) -> None:
+    rows = as_compact_json(payload)
+    columns = as_compact_json(encode_columnar(payload))
+    assert decode_columnar(json.loads(columns)) == json.loads(rows)
+    print(
+        f"{name:35} rows {len(rows) / 1024:8.0f} KiB | columnar {len(columns) / 1024:7.0f} KiB "
+        f"({len(columns) / len(rows):.0%}) | client json.loads {best_ms(lambda: json.loads(rows)):6.1f} ms "
+        f"vs {best_ms(lambda: json.loads(columns)):5.1f} ms | server encode "
+        f"{best_ms(lambda: as_compact_json(encode_columnar(payload))):6.1f} ms "
+        f"vs {best_ms(lambda: as_compact_json(payload)):5.1f} ms"
+    )
+
+
+def main() -> None:
+    print("Projection and compact output")
+    report_sizes("component inspect", component_inspect(), ["properties.position", "properties.name"])
+    report_sizes(
+        "component inspectMultiple (200)",
+        components_inspect_multiple(200),
+        ["results.gameObjectPath", "results.properties.position"],
+    )
+    report_sizes(
+        "gameObject inspectMultiple (200)",
+        gameobjects_inspect_multiple(200),
+        ["results.path", "results.active"],
+    )
+
+    print("\nColumnar encoding of *Multiple results")
+    for count in (1_000, 10_000):
+        report_columnar(f"component inspectMultiple ({count})", components_inspect_multiple(count))
+        report_columnar(f"gameObject inspectMultiple ({count})", gameobjects_inspect_multiple(count))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import contextvars
 import json
 import platform
 import sys
@@ -32,11 +33,23 @@ from logger import logger
 from utils.client_detector import get_client_info
 
 
+# When set, every command sent from this context appends a timing record
+# (sentAt/completedAt epoch seconds, request/response bytes, Unity timing)
+command_trace: contextvars.ContextVar[list[dict[str, Any]] | None] = contextvars.ContextVar(
+    "bridge_command_trace", default=None
+)
+
+
+class BridgeCommandError(RuntimeError):
+    """Unity received the command and reported that it failed."""
+
+
 @dataclass
 class PendingCommand:
     tool_name: str
     future: asyncio.Future[Any]
     timeout_handle: asyncio.TimerHandle
+    trace: dict[str, Any] | None = None
 
 
 class BridgeManager:
@@ -45,12 +58,15 @@ class BridgeManager:
         self._session_id: str | None = None
         self._last_heartbeat_at: int | None = None
         self._context: UnityContextPayload | None = None
+        # When the last command that may have changed editor state completed
+        self.last_write_at: float | None = None
         self._pending_commands: dict[str, PendingCommand] = {}
         self._compilation_waiters: list[asyncio.Future[dict[str, Any]]] = []
         self._listeners: dict[str, list[Callable[..., None]]] = {
             "connected": [],
             "disconnected": [],
             "contextUpdated": [],
+            "compilationProgress": [],
         }
         self._receive_task: asyncio.Task[None] | None = None
         self._send_lock = asyncio.Lock()
@@ -66,15 +82,27 @@ class BridgeManager:
             raise ValueError(f"Unsupported event: {event}")
         self._listeners[event].append(callback)
 
+    def off(self, event: str, callback: Callable[..., None]) -> None:
+        with contextlib.suppress(KeyError, ValueError):
+            self._listeners[event].remove(callback)
+
     def is_connected(self) -> bool:
         return _is_socket_open(self._socket)
 
+    def is_idle(self) -> bool:
+        """Return True if connected with no command in flight and no compilation awaited."""
+        return self.is_connected() and not self._pending_commands and not self._compilation_waiters
+
     def get_session_id(self) -> str | None:
         return self._session_id
 
     def get_context(self) -> UnityContextPayload | None:
         return self._context
 
+    def note_write(self) -> None:
+        """Record that editor state may have changed since the cached context."""
+        self.last_write_at = time.time()
+
     def get_last_heartbeat(self) -> int | None:
         return self._last_heartbeat_at
 
@@ -157,10 +185,16 @@ class BridgeManager:
                 )
 
         timeout_handle = loop.call_later(timeout_ms / 1000, on_timeout)
+        trace = None
+        traces = command_trace.get()
+        if traces is not None:
+            trace = {"command": tool_name}
+            traces.append(trace)
         self._pending_commands[command_id] = PendingCommand(
             tool_name=tool_name,
             future=future,
             timeout_handle=timeout_handle,
+            trace=trace,
         )
 
         message: ServerMessage = {
@@ -170,7 +204,7 @@ class BridgeManager:
             "payload": payload,
         }
 
-        await self._send_json(socket, message)
+        await self._send_json(socket, message, trace)
         return await future
 
     async def send_ping(self) -> None:
@@ -184,10 +218,18 @@ class BridgeManager:
         }
         await self._send_json(socket, message)
 
-    async def _send_json(self, socket: ClientConnection, message: ServerMessage) -> None:
+    async def _send_json(
+        self,
+        socket: ClientConnection,
+        message: ServerMessage,
+        trace: dict[str, Any] | None = None,
+    ) -> None:
+        text = json.dumps(message)
         async with self._send_lock:
+            if trace is not None:
+                trace.update(sentAt=time.time(), requestBytes=len(text))
             try:
-                await socket.send(json.dumps(message))
+                await socket.send(text)
             except ConnectionClosed:
                 await self._handle_disconnect(socket)
                 raise RuntimeError("Unity bridge is not connected") from None
@@ -202,7 +244,7 @@ class BridgeManager:
                     logger.error("Failed to decode bridge message: %s", exc)
                     continue
 
-                await self._handle_message(payload)
+                await self._handle_message(payload, len(raw))
         except ConnectionClosed as exc:
             logger.warning(
                 "Unity bridge connection closed (code=%s, reason=%s)",
@@ -214,7 +256,7 @@ class BridgeManager:
         finally:
             await self._handle_disconnect(socket)
 
-    async def _handle_message(self, message: BridgeNotificationMessage) -> None:
+    async def _handle_message(self, message: BridgeNotificationMessage, size: int = 0) -> None:
         message_type = message.get("type")
         if message_type == "hello":
             await self._handle_hello(message)
@@ -223,7 +265,7 @@ class BridgeManager:
         elif message_type == "context:update":
             self._handle_context_update(message)
         elif message_type == "command:result":
-            self._handle_command_result(message)
+            self._handle_command_result(message, size)
         elif message_type == "compilation:started":
             self._handle_compilation_started(message)
         elif message_type == "compilation:progress":
@@ -267,7 +309,7 @@ class BridgeManager:
         self._context = payload
         self._emit("contextUpdated", payload)
 
-    def _handle_command_result(self, message: BridgeCommandResultMessage) -> None:
+    def _handle_command_result(self, message: BridgeCommandResultMessage, size: int = 0) -> None:
         command_id = message.get("commandId")
         if not command_id:
             logger.warning("Received command result without commandId: %s", message)
@@ -279,12 +321,14 @@ class BridgeManager:
             return
 
         pending.timeout_handle.cancel()
+        if pending.trace is not None:
+            pending.trace.update(completedAt=time.time(), responseBytes=size, unity=message.get("timing"))
 
         if message.get("ok"):
             pending.future.set_result(message.get("result"))
         else:
             pending.future.set_exception(
-                RuntimeError(
+                BridgeCommandError(
                     message.get("errorMessage")
                     or f'Bridge command "{pending.tool_name}" failed without message'
                 )
@@ -313,6 +357,9 @@ class BridgeManager:
                 # and not stuck, so we can be patient
                 pass
 
+        # Let waiters forward the progress to their MCP clients
+        self._emit("compilationProgress", message)
+
     def _handle_compilation_complete(self, message: dict[str, Any]) -> None:
         """Handle compilation:complete message from Unity bridge."""
         result = message.get("result", {})
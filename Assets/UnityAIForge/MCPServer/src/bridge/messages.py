@@ -34,6 +34,8 @@ class AssetIndexEntry(TypedDict, total=False):
 class UnityContextPayload(TypedDict, total=False):
     activeScene: NotRequired[dict[str, str]]
     hierarchy: NotRequired[HierarchyNode]
+    # Scenes loaded in the editor; hierarchy only lists the active one
+    loadedSceneCount: NotRequired[int]
     selection: NotRequired[list[UnityObjectReference]]
     assets: NotRequired[list[AssetIndexEntry]]
     gitDiffSummary: NotRequired[str]
@@ -75,6 +77,8 @@ class BridgeCommandResultMessage(TypedDict, total=False):
     ok: bool
     result: NotRequired[Any]
     errorMessage: NotRequired[str]
+    # queuedMs (waiting for the editor main thread) and executionMs
+    timing: NotRequired[dict[str, float]]
 
 
 class BridgeRestartedMessage(TypedDict):
@@ -116,6 +116,22 @@ class ServerEnv:
     unity_bridge_host: str
     unity_bridge_port: int
     bridge_reconnect_ms: int
+    cursor_ttl_seconds: int
+    cursor_max_bytes: int
+    blob_store_dir: Path
+    blob_store_max_bytes: int
+    blob_threshold_bytes: int
+    inspect_batch_window_ms: int
+    inspect_batch_max_size: int
+    update_coalesce_window_ms: int
+    prefetch_budget_per_minute: int
+    prefetch_ttl_ms: int
+    editor_log_normal_lines: int
+    editor_log_warning_lines: int
+    editor_log_error_lines: int
+    editor_log_debounce_ms: int
+    editor_log_max_entries: int
+    compile_barrier_ttl_seconds: int
 
 
 env = ServerEnv(
@@ -138,4 +154,52 @@ env = ServerEnv(
     bridge_reconnect_ms=_parse_int(
         os.environ.get("MCP_BRIDGE_RECONNECT_MS"), default=5000, minimum=0
     ),
+    cursor_ttl_seconds=_parse_int(
+        os.environ.get("MCP_CURSOR_TTL_SECONDS"), default=300, minimum=1
+    ),
+    cursor_max_bytes=_parse_int(
+        os.environ.get("MCP_CURSOR_MAX_BYTES"), default=64 * 1024 * 1024, minimum=0
+    ),
+    blob_store_dir=_resolve_path(
+        os.environ.get("MCP_BLOB_DIR"), Path(__file__).resolve().parents[2] / ".blob_store"
+    ),
+    blob_store_max_bytes=_parse_int(
+        os.environ.get("MCP_BLOB_MAX_BYTES"), default=256 * 1024 * 1024, minimum=0
+    ),
+    blob_threshold_bytes=_parse_int(
+        os.environ.get("MCP_BLOB_THRESHOLD_BYTES"), default=256 * 1024, minimum=0
+    ),
+    inspect_batch_window_ms=_parse_int(
+        os.environ.get("MCP_INSPECT_BATCH_WINDOW_MS"), default=5, minimum=0
+    ),
+    inspect_batch_max_size=_parse_int(
+        os.environ.get("MCP_INSPECT_BATCH_MAX_SIZE"), default=50, minimum=1
+    ),
+    update_coalesce_window_ms=_parse_int(
+        os.environ.get("MCP_UPDATE_COALESCE_WINDOW_MS"), default=100, minimum=0
+    ),
+    prefetch_budget_per_minute=_parse_int(
+        os.environ.get("MCP_PREFETCH_BUDGET_PER_MINUTE"), default=30, minimum=0
+    ),
+    prefetch_ttl_ms=_parse_int(
+        os.environ.get("MCP_PREFETCH_TTL_MS"), default=5000, minimum=0
+    ),
+    editor_log_normal_lines=_parse_int(
+        os.environ.get("MCP_EDITOR_LOG_NORMAL_LINES"), default=2000, minimum=1
+    ),
+    editor_log_warning_lines=_parse_int(
+        os.environ.get("MCP_EDITOR_LOG_WARNING_LINES"), default=2000, minimum=1
+    ),
+    editor_log_error_lines=_parse_int(
+        os.environ.get("MCP_EDITOR_LOG_ERROR_LINES"), default=10000, minimum=1
+    ),
+    editor_log_debounce_ms=_parse_int(
+        os.environ.get("MCP_EDITOR_LOG_DEBOUNCE_MS"), default=10, minimum=0
+    ),
+    editor_log_max_entries=_parse_int(
+        os.environ.get("MCP_EDITOR_LOG_MAX_ENTRIES"), default=500, minimum=1
+    ),
+    compile_barrier_ttl_seconds=_parse_int(
+        os.environ.get("MCP_COMPILE_BARRIER_TTL_SECONDS"), default=600, minimum=0
+    ),
 )
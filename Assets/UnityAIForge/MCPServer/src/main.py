@@ -8,6 +8,7 @@ import sys
 from json import JSONDecodeError
 from pathlib import Path
 from typing import Any
+from uuid import uuid4
 
 import uvicorn
 from mcp.server import NotificationOptions
@@ -30,6 +31,8 @@ from config.env import env
 from logger import logger
 from server.create_mcp_server import create_mcp_server
 from services.editor_log_watcher import editor_log_watcher
+from tools.batch_sequential import session_queue_id
+from tools.compile_barrier import barrier_session, compile_barrier
 from version import SERVER_NAME, SERVER_VERSION
 
 mcp_server = create_mcp_server()
@@ -132,6 +135,9 @@ async def bridge_command_endpoint(request: Request) -> JSONResponse:
         return JSONResponse(
             {"error": f"Bridge command failed: {exc}"}, status_code=500
         )
+    finally:
+        # Raw commands may change anything the cached context describes
+        bridge_manager.note_write()
 
     return JSONResponse({"ok": True, "result": result})
 
@@ -148,6 +154,11 @@ async def mcp_ws_endpoint(websocket: WebSocket) -> None:
         client.port if client else "unknown",
         websocket.headers.get("user-agent"),
     )
+    # Batches of this connection go to their own queue unless the client names one,
+    # and a compile barrier it opens only applies to its own writes
+    session = f"session-{uuid4().hex[:8]}"
+    session_queue_id.set(session)
+    barrier_session.set(session)
 
     try:
         async with mcp_websocket_server(websocket.scope, websocket.receive, websocket.send) as (
@@ -160,6 +171,8 @@ async def mcp_ws_endpoint(websocket: WebSocket) -> None:
     except Exception as exc:  # pragma: no cover - defensive
         logger.exception("Failed to serve MCP client: %s", exc)
     finally:
+        # Compile what a barrier left open by this client deferred
+        await compile_barrier.close_session(session)
         with contextlib.suppress(Exception):
             await websocket.close()
 
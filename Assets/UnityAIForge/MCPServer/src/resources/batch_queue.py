@@ -1,20 +1,37 @@
 """
 Resource for batch queue status.
 
-Provides read-only access to the current batch execution queue state.
+Provides read-only access to the batch execution queue states.
+``batch://queue/status`` is the default queue, ``batch://queue/{queueId}/status``
+any named queue. ``batch://results/{runId}`` pages through the full results a
+batch spilled to disk under a bounded result_retention policy.
+``batch://queue/profile`` and ``batch://queue/{queueId}/profile`` report the
+timing profile of a queue's last batch, or export it as Chrome trace events
+with ``?format=chrome``.
 """
 
 import json
 import logging
+import re
 from typing import List
-from mcp.types import Resource, TextContent
+from urllib.parse import parse_qs, urlsplit
+from mcp.types import Resource, ResourceTemplate, TextContent
 
 logger = logging.getLogger(__name__)
 
+_NAMED_QUEUE_URI = re.compile(r"^batch://queue/([^/]+)/status$")
+_PROFILE_URI = re.compile(r"^batch://queue/(?:([^/?]+)/)?profile(?:\?(.*))?$")
+# Results returned per read of batch://results/{runId}
+RESULTS_PAGE_SIZE = 100
+
 
 def get_batch_queue_resources() -> List[Resource]:
     """Get batch queue resource definitions."""
-    return [
+    # Import here to avoid circular dependency
+    from tools.batch_results import list_result_runs, results_uri
+    from tools.batch_sequential import DEFAULT_QUEUE_ID, list_queue_ids, profile_path, profile_uri
+    
+    resources = [
         Resource(
             uri="batch://queue/status",
             name="Batch Queue Status",
@@ -22,6 +39,68 @@ def get_batch_queue_resources() -> List[Resource]:
             mimeType="application/json"
         )
     ]
+    for queue_id in list_queue_ids():
+        if queue_id == DEFAULT_QUEUE_ID:
+            continue
+        resources.append(Resource(
+            uri=f"batch://queue/{queue_id}/status",
+            name=f"Batch Queue Status ({queue_id})",
+            description=f"Current status of the '{queue_id}' batch execution queue",
+            mimeType="application/json"
+        ))
+    for queue_id in list_queue_ids():
+        if not profile_path(queue_id).exists():
+            continue
+        resources.append(Resource(
+            uri=profile_uri(queue_id),
+            name=f"Batch Timing Profile ({queue_id})",
+            description=f"Per-operation timing of the last batch in the '{queue_id}' queue (?format=chrome for a Chrome trace)",
+            mimeType="application/json"
+        ))
+    for run_id in list_result_runs():
+        resources.append(Resource(
+            uri=results_uri(run_id),
+            name=f"Batch Results ({run_id})",
+            description=f"Every result of a batch run, {RESULTS_PAGE_SIZE} at a time (use ?offset= for more)",
+            mimeType="application/json"
+        ))
+    return resources
+
+
+def get_batch_queue_resource_templates() -> List[ResourceTemplate]:
+    """Get batch queue resource template definitions."""
+    return [
+        ResourceTemplate(
+            uriTemplate="batch://queue/{queueId}/status",
+            name="Named Batch Queue Status",
+            description="Current status of a named sequential batch execution queue",
+            mimeType="application/json"
+        ),
+        ResourceTemplate(
+            uriTemplate="batch://queue/{queueId}/profile",
+            name="Batch Timing Profile",
+            description="Timing of a queue's last batch aggregated by tool/operation, with the slowest operations",
+            mimeType="application/json"
+        ),
+        ResourceTemplate(
+            uriTemplate="batch://queue/{queueId}/profile?format={format}",
+            name="Batch Timing Profile (Format)",
+            description="format=chrome exports the timing profile as Chrome trace-event JSON (chrome://tracing, Perfetto)",
+            mimeType="application/json"
+        ),
+        ResourceTemplate(
+            uriTemplate="batch://results/{runId}",
+            name="Batch Results",
+            description="Full results of a batch run with a bounded result_retention (see results_uri in its response)",
+            mimeType="application/json"
+        ),
+        ResourceTemplate(
+            uriTemplate="batch://results/{runId}?offset={offset}&limit={limit}",
+            name="Batch Results (Page)",
+            description="Up to limit results of a batch run starting at result offset",
+            mimeType="application/json"
+        )
+    ]
 
 
 async def read_batch_queue_resource(uri: str) -> str:
@@ -29,23 +108,60 @@ async def read_batch_queue_resource(uri: str) -> str:
     Read batch queue resource.
     
     Args:
-        uri: Resource URI (e.g., "batch://queue/status")
+        uri: Resource URI (e.g., "batch://queue/status" or "batch://queue/level_gen/status")
     
     Returns:
         JSON string with queue status
     """
     # Import here to avoid circular dependency
-    from ..tools.batch_sequential import get_batch_state
+    from tools.batch_profile import build_chrome_trace, build_report, load_records
+    from tools.batch_results import RESULTS_URI_PREFIX, read_results
+    from tools.batch_sequential import DEFAULT_QUEUE_ID, get_batch_state, is_queue_running, profile_path, resolve_queue_id
+    
+    if uri.startswith(RESULTS_URI_PREFIX):
+        parts = urlsplit(uri)
+        query = parse_qs(parts.query)
+        try:
+            offset = max(0, int(query.get("offset", ["0"])[0]))
+            limit = int(query.get("limit", [str(RESULTS_PAGE_SIZE)])[0])
+        except ValueError:
+            raise ValueError(f"Invalid offset or limit in {uri}") from None
+        data = read_results(parts.path.lstrip("/"), offset, limit)
+        return json.dumps(data, indent=2, ensure_ascii=False)
     
+    match = _PROFILE_URI.match(uri)
+    if match:
+        queue_id = resolve_queue_id(match.group(1) or DEFAULT_QUEUE_ID)
+        output = parse_qs(match.group(2) or "").get("format", ["report"])[0]
+        if output not in ("report", "chrome"):
+            raise ValueError(f"Unknown profile format '{output}'; use 'report' or 'chrome'")
+        records = load_records(profile_path(queue_id))
+        if output == "chrome":
+            return json.dumps(build_chrome_trace(records, f"batch {queue_id}"))
+        report = {"queue_id": queue_id, "running": is_queue_running(queue_id), **build_report(records)}
+        return json.dumps(report, indent=2, ensure_ascii=False)
+    
+    queue_id = None
     if uri == "batch://queue/status":
-        state = get_batch_state()
+        queue_id = DEFAULT_QUEUE_ID
+    else:
+        match = _NAMED_QUEUE_URI.match(uri)
+        if match:
+            queue_id = resolve_queue_id(match.group(1))
+    
+    if queue_id is not None:
+        state = get_batch_state(queue_id)
         status = state.to_dict()
+        status["running"] = is_queue_running(queue_id)
         
         # Add helpful information
-        if status["remaining_count"] > 0:
-            status["next_operation"] = state.operations[state.current_index] if state.current_index < len(state.operations) else None
+        if state.has_remaining():
+            status["next_operation"] = state.next_operation()
             status["can_resume"] = True
-            status["resume_hint"] = f"Call unity_batch_sequential_execute with resume=true to continue from operation {state.current_index + 1}/{status['total_count']}"
+            if state.operations_file:
+                status["resume_hint"] = f"Call unity_batch_sequential_execute with resume=true and queue_id='{queue_id}' to continue from operation {state.current_index + 1} (byte {state.byte_offset} of {state.operations_file})"
+            else:
+                status["resume_hint"] = f"Call unity_batch_sequential_execute with resume=true and queue_id='{queue_id}' to continue from operation {state.current_index + 1}/{status['total_count']}"
         else:
             status["can_resume"] = False
             status["resume_hint"] = "No pending operations. Start a new batch by calling unity_batch_sequential_execute with operations array."
@@ -0,0 +1,68 @@
+"""
+Resources for offloaded tool results.
+
+Oversized tool results are stored in the blob store and referenced by
+``blob://<sha256>`` URIs. Clients read them here, optionally as a byte range
+with ``blob://<sha256>?offset=<n>&length=<n>``.
+"""
+
+from __future__ import annotations
+
+from urllib.parse import parse_qs, urlsplit
+
+from mcp.types import ResourceTemplate
+
+from services.blob_store import blob_store
+
+
+def get_blob_resource_templates() -> list[ResourceTemplate]:
+    """Get blob resource template definitions."""
+    return [
+        ResourceTemplate(
+            uriTemplate="blob://{hash}",
+            name="Offloaded Tool Result",
+            description="Full content of a tool result that was too large to return inline",
+            mimeType="application/json",
+        ),
+        ResourceTemplate(
+            uriTemplate="blob://{hash}?offset={offset}&length={length}",
+            name="Offloaded Tool Result (Range)",
+            description="Byte range of an offloaded tool result",
+            mimeType="application/json",
+        ),
+    ]
+
+
+def _parse_int_param(query: dict[str, list[str]], name: str) -> int | None:
+    values = query.get(name)
+    if not values:
+        return None
+    try:
+        return max(0, int(values[0]))
+    except ValueError:
+        raise ValueError(f"Invalid '{name}' parameter: {values[0]}") from None
+
+
+async def read_blob_resource(uri: str) -> str:
+    """
+    Read an offloaded result.
+
+    Args:
+        uri: Resource URI (e.g., "blob://<sha256>?offset=0&length=65536")
+
+    Returns:
+        The stored content, or the requested byte range of it. Multi-byte
+        characters cut by the range boundaries are replaced.
+    """
+    parts = urlsplit(uri)
+    digest = parts.netloc
+    query = parse_qs(parts.query)
+    offset = _parse_int_param(query, "offset") or 0
+    length = _parse_int_param(query, "length")
+
+    try:
+        data = blob_store.read(digest, offset, length)
+    except (KeyError, FileNotFoundError):
+        raise ValueError(f"Blob not found or evicted: {uri}") from None
+
+    return data.decode("utf-8", errors="replace")
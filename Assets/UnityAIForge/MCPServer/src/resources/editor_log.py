@@ -0,0 +1,193 @@
+"""
+Resources for the Unity Editor log.
+
+``unity://editor-log`` returns the deduplicated entries parsed from
+``Editor.log`` (see ``services.editor_log_entries``), newest last. Filters
+are applied on the server:
+
+- ``severity``: ``error``, ``warning``, ``normal`` or a comma separated list
+- ``since``: only entries seen after this Unix timestamp
+- ``cursor``: only entries seen after a previous response's ``cursor``
+- ``pattern``: regular expression searched in the message
+- ``file``: source file path, or its trailing path segments (``Player.cs``)
+- ``limit``: entries to return (default 50, at most 500)
+- ``frames``: stack frames to include per entry (default 5)
+
+Every response carries a ``cursor``; passing it back returns only entries
+that are new or were seen again since, oldest first, and ``hasMore`` tells
+whether another read with the new cursor has more of them.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from functools import lru_cache
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from mcp.types import Resource, ResourceTemplate
+
+from services.editor_log_entries import SEVERITIES, LogEntry
+from services.editor_log_watcher import editor_log_watcher
+
+EDITOR_LOG_URI = "unity://editor-log"
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+DEFAULT_FRAMES = 5
+
+
+def get_editor_log_resources() -> list[Resource]:
+    """Get editor log resource definitions."""
+    return [
+        Resource(
+            uri=EDITOR_LOG_URI,
+            name="Unity Editor Log",
+            description="Recent Editor.log entries deduplicated with counts, stack frames and compiler error locations",
+            mimeType="application/json",
+        ),
+        Resource(
+            uri=f"{EDITOR_LOG_URI}?severity=error,warning",
+            name="Unity Editor Log Errors and Warnings",
+            description="Compiler errors, exceptions and warnings from Editor.log",
+            mimeType="application/json",
+        ),
+    ]
+
+
+def get_editor_log_resource_templates() -> list[ResourceTemplate]:
+    """Get editor log resource template definitions."""
+    return [
+        ResourceTemplate(
+            uriTemplate=f"{EDITOR_LOG_URI}?severity={{severity}}&limit={{limit}}",
+            name="Unity Editor Log (Severity)",
+            description="Newest Editor.log entries of the given severities (error, warning, normal; comma separated)",
+            mimeType="application/json",
+        ),
+        ResourceTemplate(
+            uriTemplate=f"{EDITOR_LOG_URI}?cursor={{cursor}}",
+            name="Unity Editor Log (Follow)",
+            description="Editor.log entries new or seen again since the cursor of a previous read",
+            mimeType="application/json",
+        ),
+        ResourceTemplate(
+            uriTemplate=(
+                f"{EDITOR_LOG_URI}?severity={{severity}}&pattern={{pattern}}&file={{file}}"
+                "&since={since}&cursor={cursor}&limit={limit}"
+            ),
+            name="Unity Editor Log (Query)",
+            description="Editor.log entries filtered by severity, message regex, source file and time or cursor",
+            mimeType="application/json",
+        ),
+    ]
+
+
+@lru_cache(maxsize=64)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    try:
+        return re.compile(pattern)
+    except re.error as exc:
+        raise ValueError(f"Invalid 'pattern' parameter: {exc}") from None
+
+
+def _param(query: dict[str, list[str]], name: str) -> str | None:
+    values = query.get(name)
+    return values[0] if values and values[0] != "" else None
+
+
+def _parse_number(query: dict[str, list[str]], name: str, kind: type[int] | type[float]) -> Any:
+    value = _param(query, name)
+    if value is None:
+        return None
+    try:
+        return max(kind(value), 0)
+    except ValueError:
+        raise ValueError(f"Invalid '{name}' parameter: {value}") from None
+
+
+def _parse_severities(value: str | None) -> tuple[str, ...]:
+    if value is None:
+        return SEVERITIES
+    severities = tuple(name.strip().lower() for name in value.split(",") if name.strip())
+    unknown = [name for name in severities if name not in SEVERITIES]
+    if unknown:
+        raise ValueError(f"Unknown severity '{unknown[0]}'; use {', '.join(SEVERITIES)}")
+    return severities
+
+
+def _same_file(path: str | None, source: str) -> bool:
+    """Whether ``path`` is ``source`` or ends with it as whole path segments."""
+    if path is None:
+        return False
+    path = path.replace("\\", "/")
+    return path == source or path.endswith("/" + source)
+
+
+def _entry_dict(entry: LogEntry, frames: int) -> dict[str, Any]:
+    data = entry.to_dict()
+    if len(entry.frames) > frames:
+        data["frames"] = entry.frames[:frames]
+        data["omittedFrames"] = entry.omitted_frames + len(entry.frames) - frames
+        if not frames:
+            del data["frames"]
+    return data
+
+
+async def read_editor_log_resource(uri: str) -> str:
+    """
+    Read editor log entries.
+
+    Args:
+        uri: Resource URI (e.g., "unity://editor-log?severity=error&cursor=120")
+
+    Returns:
+        JSON with the matching entries and a cursor for the next read
+    """
+    parts = urlsplit(uri)
+    if f"{parts.scheme}://{parts.netloc}{parts.path.rstrip('/')}" != EDITOR_LOG_URI:
+        raise ValueError(f"Unknown resource URI: {uri}")
+
+    query = parse_qs(parts.query)
+    severities = _parse_severities(_param(query, "severity"))
+    since = _parse_number(query, "since", float)
+    cursor = _parse_number(query, "cursor", int)
+    limit = _parse_number(query, "limit", int)
+    limit = DEFAULT_LIMIT if limit is None else min(limit, MAX_LIMIT)
+    frames = _parse_number(query, "frames", int)
+    frames = DEFAULT_FRAMES if frames is None else frames
+
+    pattern = _param(query, "pattern")
+    regex = _compile_pattern(pattern) if pattern is not None else None
+    source = _param(query, "file")
+    source = source.replace("\\", "/").strip("/") if source is not None else None
+
+    def matches(entry: LogEntry) -> bool:
+        if source is not None and not _same_file(entry.file, source):
+            return False
+        return regex is None or regex.search(entry.message) is not None
+
+    if not editor_log_watcher.watching:
+        # Nothing keeps the log current in the background; catch up now
+        await editor_log_watcher.refresh()
+
+    index = editor_log_watcher.entries
+    entries, more = index.query(
+        severities,
+        after=cursor,
+        since=since,
+        predicate=matches if source is not None or regex is not None else None,
+        limit=limit,
+    )
+    # A follow-up continues after the last entry returned if some were left
+    # out, otherwise after everything seen so far
+    next_cursor = entries[-1].sequence if more and cursor is not None and entries else index.sequence
+
+    result = {
+        "source": str(editor_log_watcher.source_path),
+        "cursor": next_cursor,
+        "hasMore": more,
+        "returned": len(entries),
+        "stored": index.counts(),
+        "entries": [_entry_dict(entry, frames) for entry in entries],
+    }
+    return json.dumps(result, indent=2, ensure_ascii=False)
@@ -6,7 +6,18 @@ from __future__ import annotations
 
 from mcp.server import Server
 from mcp import types as mcp_types
-from resources.batch_queue import get_batch_queue_resources, read_batch_queue_resource
+from resources.batch_queue import (
+    get_batch_queue_resource_templates,
+    get_batch_queue_resources,
+    read_batch_queue_resource,
+)
+from resources.blob_resources import get_blob_resource_templates, read_blob_resource
+from resources.editor_log import (
+    get_editor_log_resource_templates,
+    get_editor_log_resources,
+    read_editor_log_resource,
+)
+from resources.server_stats import get_server_stats_resources, read_server_stats_resource
 
 
 def register_resources(server: Server) -> None:
@@ -21,13 +32,38 @@ def register_resources(server: Server) -> None:
         """List all available resources."""
         resources = []
         resources.extend(get_batch_queue_resources())
+        resources.extend(get_server_stats_resources())
+        resources.extend(get_editor_log_resources())
         return resources
     
+    @server.list_resource_templates()
+    async def list_resource_templates() -> list[mcp_types.ResourceTemplate]:
+        """List parameterized resources."""
+        templates = []
+        templates.extend(get_batch_queue_resource_templates())
+        templates.extend(get_blob_resource_templates())
+        templates.extend(get_editor_log_resource_templates())
+        return templates
+    
     @server.read_resource()
     async def read_resource(uri: str) -> str:
         """Read a resource by URI."""
+        uri = str(uri)
+        
         # Batch queue resources
         if uri.startswith("batch://"):
             return await read_batch_queue_resource(uri)
         
+        # Server statistics
+        if uri.startswith("server://"):
+            return await read_server_stats_resource(uri)
+        
+        # Unity Editor log
+        if uri.startswith("unity://editor-log"):
+            return await read_editor_log_resource(uri)
+        
+        # Offloaded tool results
+        if uri.startswith("blob://"):
+            return await read_blob_resource(uri)
+        
         raise ValueError(f"Unknown resource URI: {uri}")
@@ -0,0 +1,50 @@
+"""
+Resource for MCP server runtime statistics.
+
+Reports how well the server-side optimizations are working: inspect
+micro-batching, update coalescing, predictive prefetch, cursor pagination
+and the blob store.
+"""
+
+from __future__ import annotations
+
+import json
+
+from mcp.types import Resource
+
+from services.blob_store import blob_store
+from services.cursor_store import cursor_store
+from services.fair_scheduler import batch_scheduler
+from services.micro_batcher import inspect_batcher
+from services.write_coalescer import update_coalescer
+from tools.prefetch import prefetcher
+
+SERVER_STATS_URI = "server://stats"
+
+
+def get_server_stats_resources() -> list[Resource]:
+    """Get server statistics resource definitions."""
+    return [
+        Resource(
+            uri=SERVER_STATS_URI,
+            name="Server Statistics",
+            description="Inspect micro-batching batch sizes, update coalescing, prefetch hit rate, cursor store and blob store usage",
+            mimeType="application/json",
+        )
+    ]
+
+
+async def read_server_stats_resource(uri: str) -> str:
+    """Read the server statistics resource."""
+    if uri != SERVER_STATS_URI:
+        raise ValueError(f"Unknown resource URI: {uri}")
+
+    stats = {
+        "inspectBatching": inspect_batcher.get_stats(),
+        "updateCoalescing": update_coalescer.get_stats(),
+        "prefetch": prefetcher.get_stats(),
+        "batchScheduler": batch_scheduler.get_stats(),
+        "cursors": cursor_store.get_stats(),
+        "blobs": blob_store.get_stats(),
+    }
+    return json.dumps(stats, indent=2, ensure_ascii=False)
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from config.env import env
+from logger import logger
+
+BLOB_URI_SCHEME = "blob://"
+
+_DIGEST_PATTERN = re.compile(r"[0-9a-f]{64}")
+
+
+def blob_uri(digest: str) -> str:
+    return f"{BLOB_URI_SCHEME}{digest}"
+
+
+class BlobStore:
+    """
+    Content-addressed, disk-backed store for oversized tool results.
+
+    Blobs are keyed by the SHA-256 of their content, so storing the same
+    result twice costs nothing. Least recently used blobs are deleted once the
+    directory would grow past ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        max_bytes: int | None = None,
+        threshold_bytes: int | None = None,
+    ) -> None:
+        self._root = root or env.blob_store_dir
+        self._max_bytes = max_bytes if max_bytes is not None else env.blob_store_max_bytes
+        self.threshold_bytes = (
+            threshold_bytes if threshold_bytes is not None else env.blob_threshold_bytes
+        )
+        self._index: OrderedDict[str, int] | None = None
+        self._total_bytes = 0
+
+    def should_offload(self, size_bytes: int) -> bool:
+        return self.threshold_bytes > 0 and size_bytes > self.threshold_bytes
+
+    def put(self, data: bytes) -> str:
+        """Store ``data`` and return its content hash."""
+        digest = hashlib.sha256(data).hexdigest()
+        index = self._load_index()
+        if digest in index:
+            index.move_to_end(digest)
+            return digest
+
+        self._evict_until_fits(len(data))
+        path = self._path(digest)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            self._root.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.error("Failed to write blob %s: %s", digest, exc)
+            raise
+        index[digest] = len(data)
+        self._total_bytes += len(data)
+        return digest
+
+    def read(self, digest: str, offset: int = 0, length: int | None = None) -> bytes:
+        """Read a blob, optionally only ``length`` bytes starting at ``offset``."""
+        index = self._load_index()
+        if not _DIGEST_PATTERN.fullmatch(digest) or digest not in index:
+            raise KeyError(digest)
+        index.move_to_end(digest)
+
+        path = self._path(digest)
+        try:
+            # Keep the on-disk order in sync so LRU survives restarts
+            os.utime(path)
+        except OSError:
+            pass
+        with path.open("rb") as handle:
+            if offset:
+                handle.seek(offset)
+            return handle.read() if length is None else handle.read(length)
+
+    def size_of(self, digest: str) -> int | None:
+        return self._load_index().get(digest)
+
+    def get_stats(self) -> dict[str, Any]:
+        index = self._load_index()
+        return {
+            "blobs": len(index),
+            "bytes": self._total_bytes,
+            "maxBytes": self._max_bytes,
+            "thresholdBytes": self.threshold_bytes,
+            "directory": str(self._root),
+        }
+
+    def _path(self, digest: str) -> Path:
+        return self._root / digest
+
+    def _load_index(self) -> OrderedDict[str, int]:
+        if self._index is not None:
+            return self._index
+
+        # Rebuild the LRU order from the blobs left by previous runs (oldest first)
+        entries: list[tuple[float, str, int]] = []
+        if self._root.exists():
+            for path in self._root.iterdir():
+                if path.suffix or not path.is_file():
+                    continue
+                try:
+                    stat_result = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat_result.st_mtime, path.name, stat_result.st_size))
+        entries.sort()
+
+        self._index = OrderedDict((name, size) for _, name, size in entries)
+        self._total_bytes = sum(size for _, _, size in entries)
+        return self._index
+
+    def _evict_until_fits(self, size_bytes: int) -> None:
+        index = self._load_index()
+        while index and self._total_bytes + size_bytes > self._max_bytes:
+            digest, size = index.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                self._path(digest).unlink()
+            except OSError as exc:
+                logger.warning("Failed to delete evicted blob %s: %s", digest, exc)
+
+
+blob_store = BlobStore()
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+from uuid import uuid4
+
+from config.env import env
+from logger import logger
+
+
+@dataclass
+class _CursorEntry:
+    tool_name: str
+    list_key: str
+    envelope: dict[str, Any]
+    items: list[Any]
+    page_size: int
+    size_bytes: int
+    expires_at: float
+
+
+class CursorStore:
+    """
+    Holds full list results on the server and hands them out page by page.
+
+    Entries expire ``ttl_seconds`` after their last access and the least
+    recently used entries are evicted once ``max_bytes`` would be exceeded,
+    so follow-up pages never trigger additional Unity work.
+    """
+
+    def __init__(self, ttl_seconds: float | None = None, max_bytes: int | None = None) -> None:
+        self._ttl_seconds = ttl_seconds if ttl_seconds is not None else env.cursor_ttl_seconds
+        self._max_bytes = max_bytes if max_bytes is not None else env.cursor_max_bytes
+        self._entries: OrderedDict[str, _CursorEntry] = OrderedDict()
+        self._total_bytes = 0
+
+    def open(
+        self,
+        tool_name: str,
+        response: dict[str, Any],
+        list_key: str,
+        page_size: int,
+    ) -> tuple[dict[str, Any], dict[str, Any]] | None:
+        """
+        Store a result and return its first page.
+
+        Returns None when the result fits into a single page or cannot be
+        held within the memory budget; the caller then returns it as is.
+        """
+        items = response.get(list_key)
+        if not isinstance(items, list) or len(items) <= page_size:
+            return None
+
+        size_bytes = len(json.dumps(items, ensure_ascii=False, separators=(",", ":")))
+        if size_bytes > self._max_bytes:
+            logger.warning(
+                "Result of %s (%d bytes) exceeds the cursor store budget (%d bytes); returning it unpaged",
+                tool_name,
+                size_bytes,
+                self._max_bytes,
+            )
+            return None
+
+        self._purge_expired()
+        self._evict_until_fits(size_bytes)
+
+        cursor_id = uuid4().hex
+        envelope = {key: value for key, value in response.items() if key != list_key}
+        self._entries[cursor_id] = _CursorEntry(
+            tool_name=tool_name,
+            list_key=list_key,
+            envelope=envelope,
+            items=items,
+            page_size=page_size,
+            size_bytes=size_bytes,
+            expires_at=time.monotonic() + self._ttl_seconds,
+        )
+        self._total_bytes += size_bytes
+        return self._page(cursor_id, 0, page_size)
+
+    def next_page(
+        self,
+        tool_name: str,
+        cursor: str,
+        page_size: int | None = None,
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Return the page addressed by ``cursor`` without contacting Unity."""
+        cursor_id, _, raw_offset = cursor.partition(":")
+        self._purge_expired()
+
+        entry = self._entries.get(cursor_id)
+        if entry is None:
+            raise RuntimeError(
+                f"Cursor '{cursor}' is unknown or has expired. Re-run the query without 'cursor'."
+            )
+        if entry.tool_name != tool_name:
+            raise RuntimeError(f"Cursor '{cursor}' belongs to tool '{entry.tool_name}', not '{tool_name}'.")
+
+        try:
+            offset = max(0, int(raw_offset or 0))
+        except ValueError:
+            raise RuntimeError(f"Malformed cursor: {cursor}") from None
+
+        entry.expires_at = time.monotonic() + self._ttl_seconds
+        self._entries.move_to_end(cursor_id)
+        return self._page(cursor_id, offset, page_size or entry.page_size)
+
+    def get_stats(self) -> dict[str, Any]:
+        self._purge_expired()
+        return {
+            "cursors": len(self._entries),
+            "bytes": self._total_bytes,
+            "maxBytes": self._max_bytes,
+            "ttlSeconds": self._ttl_seconds,
+        }
+
+    def _page(self, cursor_id: str, offset: int, page_size: int) -> tuple[dict[str, Any], dict[str, Any]]:
+        entry = self._entries[cursor_id]
+        end = offset + page_size
+        total = len(entry.items)
+        body = dict(entry.envelope)
+        body[entry.list_key] = entry.items[offset:end]
+        page = {
+            "listKey": entry.list_key,
+            "offset": offset,
+            "pageSize": page_size,
+            "total": total,
+            "hasMore": end < total,
+            "nextCursor": f"{cursor_id}:{end}" if end < total else None,
+        }
+        return body, page
+
+    def _remove(self, cursor_id: str) -> None:
+        entry = self._entries.pop(cursor_id, None)
+        if entry:
+            self._total_bytes -= entry.size_bytes
+
+    def _purge_expired(self) -> None:
+        now = time.monotonic()
+        for cursor_id in [key for key, entry in self._entries.items() if entry.expires_at <= now]:
+            self._remove(cursor_id)
+
+    def _evict_until_fits(self, size_bytes: int) -> None:
+        while self._entries and self._total_bytes + size_bytes > self._max_bytes:
+            oldest = next(iter(self._entries))
+            logger.debug("Evicting cursor %s to stay within the cursor store budget", oldest)
+            self._remove(oldest)
+
+
+cursor_store = CursorStore()
@@ -0,0 +1,330 @@
+"""
+Structured entries parsed from Unity ``Editor.log`` lines.
+
+Unity writes a log message followed by its stack frames and a blank line.
+Frames come in two shapes: ``UnityEngine.Debug:Log (object)`` /
+``Foo:Start () (at Assets/Foo.cs:10)`` for logged messages and
+``  at Foo.Start () [0x00001] in /path/Foo.cs:10`` for exceptions. C#
+compiler diagnostics are single lines of the form
+``Assets/Foo.cs(12,5): error CS0103: message``.
+
+``LogEntryParser`` groups lines into entries (message, severity, frames,
+source file and line), and ``LogEntryIndex`` deduplicates them by
+fingerprint: the severity, the message with numbers masked and the top
+frames, or the exact location and code for compiler diagnostics. A repeated
+entry only bumps its count and last-seen time, so an error logged every
+frame takes one slot. Each severity keeps its most recently seen entries up
+to a fixed capacity.
+
+A message is only complete once the next one (or a blank line) starts, which
+may be long after it was written. ``LogEntryParser.pending`` returns the
+open message so far; callers can index it provisionally and swap it for the
+complete entry with ``LogEntryIndex.replace`` if frames follow.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from heapq import merge
+from itertools import islice
+from typing import Any
+
+SEVERITIES = ("normal", "warning", "error")
+# Frames kept per entry; deeper frames are only counted
+MAX_FRAMES = 32
+# Frames that take part in the fingerprint
+FINGERPRINT_FRAMES = 3
+
+_COMPILER_MESSAGE = re.compile(
+    r"^\s*(?P<file>[^\s(][^(]*)\((?P<line>\d+),(?P<column>\d+)\): "
+    r"(?P<severity>error|warning) (?P<code>[A-Z]+\d+): (?P<message>.*?)\s*$"
+)
+_FRAME = re.compile(r"^\s+at \S|^[\w.`<>+$,/]+:[\w.`<>+$,\[\]]+ ?\(")
+_FRAME_LOCATION = re.compile(r"(?:\(at | in )(?P<file>[^<>]+?):(?P<line>\d+)\)?\s*$")
+# Location note Unity appends to some messages; the frames already carry it
+_FILENAME_NOTE = "(Filename: "
+_NUMBER = re.compile(r"\b(?:0x[0-9a-fA-F]+|\d+(?:\.\d+)?)\b")
+_DIAGNOSTIC = re.compile(r"\b(?P<severity>error|warning) [A-Z]+\d+:")
+# Frames of the Debug.Log* call that wrote the message
+_LOG_CALL_SEVERITY = (
+    ("UnityEngine.Debug:LogError", "error"),
+    ("UnityEngine.Debug:LogException", "error"),
+    ("UnityEngine.Debug:LogAssertion", "error"),
+    ("UnityEngine.Debug:LogWarning", "warning"),
+)
+
+
+def classify_line(line: str) -> str:
+    """Classify a Unity log line as 'error', 'warning', or 'normal'."""
+    line_lower = line.lower()
+    if any(marker in line_lower for marker in ["error:", "exception:", "assertion failed"]):
+        return "error"
+    if "warning:" in line_lower:
+        return "warning"
+    diagnostic = _DIAGNOSTIC.search(line)
+    if diagnostic:
+        return diagnostic.group("severity")
+    return "normal"
+
+
+@dataclass
+class LogEntry:
+    fingerprint: str
+    severity: str
+    message: str
+    frames: list[str] = field(default_factory=list)
+    file: str | None = None
+    line: int | None = None
+    column: int | None = None
+    code: str | None = None
+    # Frames beyond MAX_FRAMES
+    omitted_frames: int = 0
+    count: int = 1
+    first_seen: float = 0.0
+    last_seen: float = 0.0
+    # Position of the last sighting among all entries added to the index
+    sequence: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {
+            "fingerprint": self.fingerprint,
+            "severity": self.severity,
+            "message": self.message,
+            "count": self.count,
+            "firstSeen": self.first_seen,
+            "lastSeen": self.last_seen,
+        }
+        if self.file is not None:
+            data["file"] = self.file
+            data["line"] = self.line
+        if self.column is not None:
+            data["column"] = self.column
+        if self.code is not None:
+            data["code"] = self.code
+        if self.frames:
+            data["frames"] = self.frames
+        if self.omitted_frames:
+            data["omittedFrames"] = self.omitted_frames
+        return data
+
+
+def _fingerprint(*parts: str) -> str:
+    return hashlib.blake2b("\0".join(parts).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _compiler_entry(match: re.Match[str]) -> LogEntry:
+    file, line, column = match.group("file").strip(), int(match.group("line")), int(match.group("column"))
+    severity, code, message = match.group("severity"), match.group("code"), match.group("message")
+    return LogEntry(
+        fingerprint=_fingerprint(severity, code, file, str(line), str(column), message),
+        severity=severity,
+        message=message,
+        file=file,
+        line=line,
+        column=column,
+        code=code,
+    )
+
+
+def _logged_entry(message: str, frames: list[str], omitted: int) -> LogEntry:
+    severity = classify_line(message)
+    if frames and severity == "normal":
+        severity = next(
+            (value for prefix, value in _LOG_CALL_SEVERITY if frames[0].startswith(prefix)),
+            severity,
+        )
+    entry = LogEntry(
+        fingerprint=_fingerprint(
+            severity,
+            _NUMBER.sub("#", message),
+            *(_NUMBER.sub("#", frame) for frame in frames[:FINGERPRINT_FRAMES]),
+        ),
+        severity=severity,
+        message=message,
+        frames=frames,
+        omitted_frames=omitted,
+    )
+    # The first frame with a source file is where the message came from
+    for frame in frames:
+        location = _FRAME_LOCATION.search(frame)
+        if location:
+            entry.file, entry.line = location.group("file"), int(location.group("line"))
+            break
+    return entry
+
+
+class LogEntryParser:
+    """Groups log lines into entries; an entry is complete once the next one starts."""
+
+    def __init__(self) -> None:
+        self._message: str | None = None
+        self._frames: list[str] = []
+        self._omitted = 0
+
+    def feed(self, lines: list[str]) -> list[LogEntry]:
+        """Parse ``lines`` and return the entries they completed."""
+        finished: list[LogEntry] = []
+        for line in lines:
+            if not line.strip():
+                self._close(finished)
+                continue
+            if _FRAME.match(line):
+                # Frames before any message belong to an entry cut off by a tail read
+                if self._message is None:
+                    continue
+                if len(self._frames) < MAX_FRAMES:
+                    self._frames.append(line.strip())
+                else:
+                    self._omitted += 1
+                continue
+            if line.startswith(_FILENAME_NOTE):
+                continue
+            self._close(finished)
+            compiler = _COMPILER_MESSAGE.match(line)
+            if compiler:
+                finished.append(_compiler_entry(compiler))
+            else:
+                self._message = line.strip()
+        return finished
+
+    def pending(self) -> LogEntry | None:
+        """The entry for the message still waiting for frames, if any."""
+        if self._message is None:
+            return None
+        return _logged_entry(self._message, list(self._frames), self._omitted)
+
+    def reset(self) -> None:
+        self._message = None
+        self._frames = []
+        self._omitted = 0
+
+    def _close(self, finished: list[LogEntry]) -> None:
+        if self._message is None:
+            return
+        finished.append(_logged_entry(self._message, self._frames, self._omitted))
+        self.reset()
+
+
+class LogEntryIndex:
+    """Deduplicated entries per severity, least recently seen evicted first."""
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._entries: dict[str, OrderedDict[str, LogEntry]] = {
+            severity: OrderedDict() for severity in SEVERITIES
+        }
+        self._sequence = 0
+
+    def add(self, entry: LogEntry, seen_at: float | None = None) -> LogEntry:
+        """Record a sighting of ``entry``; returns the indexed entry."""
+        seen_at = time.time() if seen_at is None else seen_at
+        self._sequence += 1
+        entries = self._entries[entry.severity]
+        existing = entries.get(entry.fingerprint)
+        if existing is not None:
+            existing.count += 1
+            existing.last_seen = seen_at
+            existing.sequence = self._sequence
+            entries.move_to_end(entry.fingerprint)
+            return existing
+
+        entry.first_seen = entry.last_seen = seen_at
+        entry.sequence = self._sequence
+        entries[entry.fingerprint] = entry
+        if len(entries) > self._capacity:
+            entries.popitem(last=False)
+        return entry
+
+    def replace(self, previous: LogEntry, entry: LogEntry, seen_at: float | None = None) -> LogEntry:
+        """
+        Turn the last sighting of ``previous`` into one of ``entry``, e.g. a
+        message indexed before its frames arrived; returns the indexed entry.
+        """
+        entries = self._entries[previous.severity]
+        existing = entries.get(previous.fingerprint)
+        first_seen = None
+        if existing is not None:
+            if existing.count > 1:
+                existing.count -= 1
+            else:
+                first_seen = existing.first_seen
+                del entries[previous.fingerprint]
+        indexed = self.add(entry, seen_at)
+        if first_seen is not None and indexed.count == 1:
+            indexed.first_seen = first_seen
+        return indexed
+
+    def entries(self, severity: str | None = None, limit: int | None = None) -> list[LogEntry]:
+        """Entries of one or all severities, least recently seen first."""
+        severities = SEVERITIES if severity is None else (severity,)
+        selected = []
+        for name in severities:
+            values = self._entries[name].values()
+            if limit is None or limit >= len(values):
+                selected.append(list(values))
+            else:
+                newest = list(islice(reversed(values), max(limit, 0)))
+                newest.reverse()
+                selected.append(newest)
+        merged = list(merge(*selected, key=lambda entry: entry.sequence))
+        if limit is not None:
+            merged = merged[-limit:] if limit > 0 else []
+        return merged
+
+    def query(
+        self,
+        severities: Iterable[str] = SEVERITIES,
+        after: int | None = None,
+        since: float | None = None,
+        predicate: Callable[[LogEntry], bool] | None = None,
+        limit: int = 100,
+    ) -> tuple[list[LogEntry], bool]:
+        """
+        Entries matching ``predicate``, least recently seen first, and whether
+        more matched than ``limit``.
+
+        Without ``after`` the newest ``limit`` matches are returned. With it,
+        the oldest ``limit`` matches seen after that sequence, so a reader
+        can continue from the last sequence it got. Each severity is walked
+        from its newest entry and the walk stops at the first entry seen
+        before ``after`` or ``since``.
+        """
+        selected = []
+        more = False
+        for name in severities:
+            matches: list[LogEntry] = []
+            for entry in reversed(self._entries[name].values()):
+                if after is not None and entry.sequence <= after:
+                    break
+                if since is not None and entry.last_seen <= since:
+                    break
+                if predicate is not None and not predicate(entry):
+                    continue
+                if after is None and len(matches) == limit:
+                    more = True
+                    break
+                matches.append(entry)
+            matches.reverse()
+            selected.append(matches)
+        merged = list(merge(*selected, key=lambda entry: entry.sequence))
+        more = more or len(merged) > limit
+        if len(merged) > limit:
+            merged = merged[:limit] if after is not None else merged[len(merged) - limit:]
+        return merged, more
+
+    @property
+    def sequence(self) -> int:
+        """Sequence of the latest sighting; entries seen later have a higher one."""
+        return self._sequence
+
+    def counts(self) -> dict[str, int]:
+        return {severity: len(entries) for severity, entries in self._entries.items()}
+
+    def clear(self) -> None:
+        for entries in self._entries.values():
+            entries.clear()
@@ -1,24 +1,59 @@
+"""
+Tails the Unity ``Editor.log`` into an in-memory buffer of recent lines.
+
+The watcher remembers how far it has read and only reads the bytes appended
+since, so polling a log of hundreds of megabytes costs a ``stat`` and the new
+lines. Lines are classified once as they are read and kept in ring buffers:
+the last ``MAX_LINES`` lines in order plus one ring per severity, sized by
+``MCP_EDITOR_LOG_{NORMAL,WARNING,ERROR}_LINES`` so errors outlive ordinary
+noise. A snapshot copies at most ``limit`` lines per ring. The first read (and
+a read after a large burst) starts near the end of the file instead of at
+byte 0.
+A different file at the path (Unity rotates the log to ``Editor-prev.log`` on
+start) or a file shorter than the offset starts over. Bytes after the last
+newline are held back until the line is complete, so a multi-byte UTF-8
+character split across two writes is decoded whole.
+
+The same lines are also grouped into structured entries (message, stack
+frames, compiler error locations) deduplicated by fingerprint; see
+``services.editor_log_entries``. ``get_entries`` returns them. A message
+still open when a read ends on a line boundary is indexed right away and
+updated if frames follow, so a final single-line message shows up without
+waiting for the next one.
+
+On Linux the log's directory is watched with inotify and the log is read a
+debounce window (``MCP_EDITOR_LOG_DEBOUNCE_MS``) after it changes, so new
+lines show up within milliseconds and an idle log costs nothing. Elsewhere,
+or if the watch cannot be set up, the file is polled every ``poll_interval``.
+"""
+
 from __future__ import annotations
 
 import asyncio
 import contextlib
+import time
+from collections import deque
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
+from typing import BinaryIO
 
 from config.env import env
 from logger import logger
+from services.editor_log_entries import (
+    SEVERITIES,
+    LogEntry,
+    LogEntryIndex,
+    LogEntryParser,
+    classify_line,
+)
+from services.inotify import watch_directory
 
 MAX_LINES = 2000
-
-
-def _classify_log_line(line: str) -> str:
-    """Classify a Unity log line as 'error', 'warning', or 'normal'."""
-    line_lower = line.lower()
-    if any(marker in line_lower for marker in ["error:", "exception:", "assertion failed"]):
-        return "error"
-    if "warning:" in line_lower:
-        return "warning"
-    return "normal"
+# Appends larger than this are not read in full; only their last lines are kept
+MAX_INCREMENTAL_BYTES = 4 * 1024 * 1024
+# Block size used when searching backwards for the last MAX_LINES lines
+TAIL_BLOCK_BYTES = 64 * 1024
 
 
 @dataclass
@@ -31,13 +66,50 @@ class EditorLogSnapshot:
     error_lines: list[str]
 
 
+def _last(ring: deque[str], limit: int) -> list[str]:
+    """Copy the last ``limit`` entries of a ring without walking the rest."""
+    if limit >= len(ring):
+        return list(ring)
+    if limit <= 0:
+        return []
+    lines = list(islice(reversed(ring), limit))
+    lines.reverse()
+    return lines
+
+
 class EditorLogWatcher:
-    def __init__(self, explicit_path: Path | None = None, poll_interval: float = 2.0):
+    def __init__(
+        self,
+        explicit_path: Path | None = None,
+        poll_interval: float = 2.0,
+        capacities: dict[str, int] | None = None,
+        debounce: float | None = None,
+        max_entries: int | None = None,
+    ):
         self._target_path = explicit_path or env.unity_editor_log_path
         self._poll_interval = poll_interval
-        self._buffer: list[str] = []
+        self._debounce = env.editor_log_debounce_ms / 1000 if debounce is None else debounce
+        self._capacities = capacities or {
+            "normal": env.editor_log_normal_lines,
+            "warning": env.editor_log_warning_lines,
+            "error": env.editor_log_error_lines,
+        }
+        # Lines needed to fill every ring after a restart
+        self._tail_lines = max(MAX_LINES, *self._capacities.values())
+        self._lines: deque[str] = deque(maxlen=MAX_LINES)
+        self._by_severity: dict[str, deque[str]] = {
+            severity: deque(maxlen=self._capacities[severity]) for severity in SEVERITIES
+        }
+        self._parser = LogEntryParser()
+        self._entries = LogEntryIndex(env.editor_log_max_entries if max_entries is None else max_entries)
+        # Entry indexed for the parser's open message
+        self._shown: LogEntry | None = None
         self._updated_at: float = 0
-        self._last_mtime: float | None = None
+        # Read position in the file identified by (st_dev, st_ino)
+        self._file_id: tuple[int, int] | None = None
+        self._offset = 0
+        # Bytes of an unfinished last line
+        self._partial = b""
         self._task: asyncio.Task[None] | None = None
         self._lock = asyncio.Lock()
 
@@ -48,7 +120,7 @@ class EditorLogWatcher:
             return
 
         loop = asyncio.get_running_loop()
-        self._task = loop.create_task(self._poll_loop())
+        self._task = loop.create_task(self._watch_loop())
 
     async def stop(self) -> None:
         task = self._task
@@ -68,58 +140,139 @@ class EditorLogWatcher:
         except FileNotFoundError:
             logger.warning("Unity editor log not found: %s", path)
             async with self._lock:
-                self._buffer = []
+                self._clear()
                 self._updated_at = 0
+                self._file_id = None
             return
         except OSError as exc:
             logger.warning("Failed to stat Unity editor log %s: %s", path, exc)
             return
 
-        if self._last_mtime is not None and stat_result.st_mtime <= self._last_mtime:
+        file_id = (stat_result.st_dev, stat_result.st_ino)
+        size = stat_result.st_size
+        restart = file_id != self._file_id or size < self._offset
+        if not restart and size == self._offset:
             return
 
         try:
-            # Unity Editor.log may contain mixed encodings; be forgiving
-            contents = path.read_text(encoding="utf-8", errors="replace")
+            with open(path, "rb") as stream:
+                if restart or size - self._offset > MAX_INCREMENTAL_BYTES:
+                    if not restart:
+                        logger.debug("Editor log grew by %d bytes; reading its tail only", size - self._offset)
+                    data, complete = _read_tail(stream, size, self._tail_lines)
+                    partial = b""
+                else:
+                    stream.seek(self._offset)
+                    data, complete = stream.read(size - self._offset), True
+                    partial = self._partial
         except OSError as exc:
             logger.warning("Failed to read Unity editor log %s: %s", path, exc)
             return
 
-        lines = contents.splitlines()
-        capped = lines[-MAX_LINES:]
+        data = partial + data
+        cut = data.rfind(b"\n") + 1
+        # Unity Editor.log may contain mixed encodings; be forgiving
+        lines = data[:cut].decode("utf-8", errors="replace").splitlines()
+        if not complete and lines:
+            # The tail started in the middle of a line
+            lines = lines[1:]
 
         async with self._lock:
-            self._buffer = capped
+            if restart:
+                self._clear()
+            self._partial = data[cut:]
+            self._ingest(lines[-self._tail_lines:], at_boundary=not self._partial)
+            self._file_id = file_id
+            self._offset = size
             self._updated_at = asyncio.get_event_loop().time()
-            self._last_mtime = stat_result.st_mtime
 
     def get_snapshot(self, limit: int = MAX_LINES) -> EditorLogSnapshot:
-        clamp = max(0, min(limit, MAX_LINES))
-        buffer = self._buffer[-clamp:] if clamp else []
-
-        # Classify log lines
-        normal_lines = []
-        warning_lines = []
-        error_lines = []
-
-        for line in buffer:
-            classification = _classify_log_line(line)
-            if classification == "error":
-                error_lines.append(line)
-            elif classification == "warning":
-                warning_lines.append(line)
-            else:
-                normal_lines.append(line)
-
+        """Return the last ``limit`` lines overall and of each severity."""
         return EditorLogSnapshot(
             updated_at=self._updated_at,
-            lines=list(buffer),
+            lines=_last(self._lines, limit),
             source_path=str(self._target_path),
-            normal_lines=normal_lines,
-            warning_lines=warning_lines,
-            error_lines=error_lines,
+            normal_lines=_last(self._by_severity["normal"], limit),
+            warning_lines=_last(self._by_severity["warning"], limit),
+            error_lines=_last(self._by_severity["error"], limit),
         )
 
+    def get_entries(self, severity: str | None = None, limit: int | None = None) -> list[LogEntry]:
+        """Return deduplicated log entries, least recently seen first."""
+        return self._entries.entries(severity, limit)
+
+    @property
+    def entries(self) -> LogEntryIndex:
+        return self._entries
+
+    @property
+    def source_path(self) -> Path:
+        return Path(self._target_path)
+
+    @property
+    def watching(self) -> bool:
+        """Whether the log is kept up to date in the background."""
+        return self._task is not None
+
+    def _ingest(self, lines: list[str], at_boundary: bool = False) -> None:
+        self._lines.extend(lines)
+        rings = self._by_severity
+        for line in lines:
+            rings[classify_line(line)].append(line)
+        now = time.time()
+        finished = self._parser.feed(lines)
+        shown, self._shown = self._shown, None
+        if shown is not None:
+            # The open message shown after the last read completes first or is still open
+            still_open = not finished
+            current = self._parser.pending() if still_open else finished.pop(0)
+            if current is not None and not _same_entry(current, shown):
+                self._entries.replace(shown, current, now)
+            if still_open:
+                self._shown = current
+        for entry in finished:
+            self._entries.add(entry, now)
+        if self._shown is None and at_boundary:
+            pending = self._parser.pending()
+            if pending is not None:
+                self._entries.add(pending, now)
+                self._shown = pending
+
+    def _clear(self) -> None:
+        self._lines.clear()
+        for ring in self._by_severity.values():
+            ring.clear()
+        self._parser.reset()
+        self._entries.clear()
+        self._shown = None
+
+    async def _watch_loop(self) -> None:
+        path = Path(self._target_path)
+        changed = asyncio.Event()
+        watch = watch_directory(path.parent, {path.name}, changed.set)
+        if watch is None:
+            logger.debug("inotify unavailable; polling %s every %.1fs", path, self._poll_interval)
+            await self._poll_loop()
+            return
+
+        # Catch up on anything written before the watch was in place
+        changed.set()
+        try:
+            while not watch.lost:
+                await changed.wait()
+                # Let a burst of writes land so they are read in one go
+                await asyncio.sleep(self._debounce)
+                changed.clear()
+                try:
+                    await self.refresh()
+                except Exception:  # pragma: no cover - defensive
+                    logger.exception("Editor log watcher crashed")
+        finally:
+            watch.close()
+
+        logger.warning("Lost the inotify watch on %s; polling instead", path.parent)
+        await self._poll_loop()
+
     async def _poll_loop(self) -> None:
         try:
             while True:
@@ -132,4 +285,35 @@ class EditorLogWatcher:
             raise
 
 
+def _same_entry(entry: LogEntry, other: LogEntry) -> bool:
+    return (
+        entry.fingerprint == other.fingerprint
+        and entry.frames == other.frames
+        and entry.omitted_frames == other.omitted_frames
+    )
+
+
+def _read_tail(stream: BinaryIO, size: int, lines: int = MAX_LINES) -> tuple[bytes, bool]:
+    """
+    Read the end of a file holding at least ``lines`` lines, or all of it.
+
+    Returns the bytes and whether they start at the beginning of a line.
+    """
+    blocks: list[bytes] = []
+    start = size
+    newlines = 0
+    while start > 0 and newlines <= lines:
+        block_start = max(0, start - TAIL_BLOCK_BYTES)
+        stream.seek(block_start)
+        block = stream.read(start - block_start)
+        blocks.append(block)
+        newlines += block.count(b"\n")
+        start = block_start
+    data = b"".join(reversed(blocks))
+    if start == 0:
+        return data, True
+    stream.seek(start - 1)
+    return data, stream.read(1) == b"\n"
+
+
 editor_log_watcher = EditorLogWatcher()
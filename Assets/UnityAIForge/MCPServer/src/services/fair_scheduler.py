@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import asyncio
+from collections import Counter, deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+
+class FairScheduler:
+    """
+    Round-robin turns for batch queues sharing the Unity bridge.
+
+    Each batch operation runs inside ``turn(queue_id)``. While one turn is
+    active, later requests wait per queue; when it ends the next turn goes to
+    the queue after the current one, so concurrent batches interleave one
+    operation at a time instead of one batch starving the others.
+    """
+
+    def __init__(self) -> None:
+        # Queue ids in round-robin order, each with its waiting requests
+        self._waiting: dict[str, deque[asyncio.Future[None]]] = {}
+        self._active: str | None = None
+        self._turns: Counter[str] = Counter()
+
+    @asynccontextmanager
+    async def turn(self, queue_id: str) -> AsyncIterator[None]:
+        if self._active is None and not self._waiting:
+            self._active = queue_id
+        else:
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            self._waiting.setdefault(queue_id, deque()).append(future)
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # The turn was granted just before the cancellation
+                    self._release()
+                else:
+                    self._forget(queue_id, future)
+                raise
+
+        self._turns[queue_id] += 1
+        try:
+            yield
+        finally:
+            self._release()
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "active": self._active,
+            "waiting": {queue_id: len(futures) for queue_id, futures in self._waiting.items()},
+            "turns": dict(self._turns),
+        }
+
+    def _forget(self, queue_id: str, future: asyncio.Future[None]) -> None:
+        futures = self._waiting.get(queue_id)
+        if futures is None:
+            return
+        if future in futures:
+            futures.remove(future)
+        if not futures:
+            del self._waiting[queue_id]
+
+    def _release(self) -> None:
+        while self._waiting:
+            queue_id = next(iter(self._waiting))
+            futures = self._waiting.pop(queue_id)
+            future = futures.popleft()
+            if futures:
+                # Back of the line until every other queue had its turn
+                self._waiting[queue_id] = futures
+            if not future.done():
+                self._active = queue_id
+                future.set_result(None)
+                return
+        self._active = None
+
+
+batch_scheduler = FairScheduler()
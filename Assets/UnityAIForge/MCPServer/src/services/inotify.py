@@ -0,0 +1,146 @@
+"""
+Change notification for files in one directory through Linux inotify.
+
+Bound through ctypes so it needs no extra dependency. The directory is watched
+rather than the file itself so a file that is deleted, renamed away or
+created later (log rotation) keeps being reported. Events are read from a
+non-blocking descriptor registered with the event loop, so nothing wakes up
+while the files are idle.
+
+``watch_directory`` returns None where inotify is unavailable (other
+platforms, a missing directory, exhausted watch limits); callers fall back to
+polling.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ctypes
+import os
+import struct
+import sys
+from collections.abc import Callable
+from pathlib import Path
+
+from logger import logger
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (
+    IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    | IN_DELETE_SELF | IN_MOVE_SELF
+)
+# The watched directory itself went away; its watch is gone for good
+LOST_MASK = IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED
+
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_BYTES = 64 * 1024
+
+_libc: ctypes.CDLL | None = None
+
+
+def _load_libc() -> ctypes.CDLL | None:
+    global _libc
+    if _libc is None and sys.platform.startswith("linux"):
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            libc.inotify_init1.argtypes = [ctypes.c_int]
+            libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        except (OSError, AttributeError):
+            return None
+        _libc = libc
+    return _libc
+
+
+class InotifyWatch:
+    """
+    Calls ``on_change`` from the event loop when one of ``names`` in the
+    watched directory changes, or when events were dropped and anything may
+    have changed. ``lost`` turns True once the directory itself is gone.
+    """
+
+    def __init__(
+        self,
+        fd: int,
+        loop: asyncio.AbstractEventLoop,
+        names: frozenset[str],
+        on_change: Callable[[], None],
+    ) -> None:
+        self._fd = fd
+        self._loop = loop
+        self._names = names
+        self._on_change = on_change
+        self.lost = False
+        loop.add_reader(fd, self._read_events)
+
+    def close(self) -> None:
+        if self._fd < 0:
+            return
+        self._loop.remove_reader(self._fd)
+        os.close(self._fd)
+        self._fd = -1
+
+    def _read_events(self) -> None:
+        changed = False
+        while True:
+            try:
+                data = os.read(self._fd, _READ_BYTES)
+            except BlockingIOError:
+                break
+            except OSError as exc:
+                logger.warning("Failed to read inotify events: %s", exc)
+                self.lost = changed = True
+                break
+            if not data:
+                break
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                _, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                start = offset + _EVENT_HEADER.size
+                offset = start + length
+                if mask & (LOST_MASK | IN_Q_OVERFLOW):
+                    self.lost = self.lost or bool(mask & LOST_MASK)
+                    changed = True
+                    continue
+                name = data[start:offset].rstrip(b"\0").decode("utf-8", errors="replace")
+                changed = changed or name in self._names
+        if changed:
+            self._on_change()
+
+
+def watch_directory(
+    directory: Path,
+    names: set[str] | frozenset[str],
+    on_change: Callable[[], None],
+) -> InotifyWatch | None:
+    """Watch ``names`` in ``directory``; returns None if inotify cannot be used."""
+    libc = _load_libc()
+    if libc is None:
+        return None
+
+    fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+    if fd < 0:
+        logger.debug("inotify_init1 failed: %s", os.strerror(ctypes.get_errno()))
+        return None
+    if libc.inotify_add_watch(fd, os.fsencode(directory), WATCH_MASK) < 0:
+        logger.debug("Cannot watch %s with inotify: %s", directory, os.strerror(ctypes.get_errno()))
+        os.close(fd)
+        return None
+    try:
+        return InotifyWatch(fd, asyncio.get_running_loop(), frozenset(names), on_change)
+    except (NotImplementedError, RuntimeError):
+        # Event loops without add_reader
+        os.close(fd)
+        return None
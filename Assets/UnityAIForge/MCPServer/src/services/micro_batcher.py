@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from config.env import env
+from logger import logger
+
+SendCommand = Callable[[str, dict[str, Any]], Awaitable[Any]]
+
+# Upper bounds of the batch-size histogram buckets reported in the stats
+_HISTOGRAM_BOUNDS = (1, 2, 4, 8, 16, 32, 64)
+
+
+@dataclass
+class _PendingBatch:
+    batch_operation: str
+    send: SendCommand
+    items: list[tuple[dict[str, Any], asyncio.Future[Any]]] = field(default_factory=list)
+    timer: asyncio.TimerHandle | None = None
+
+
+class MicroBatcher:
+    """
+    DataLoader-style collector for single-object bridge reads.
+
+    Compatible requests arriving within ``window_ms`` of the first one are
+    sent to Unity as one multi-target command (``targets`` holds each original
+    payload) and the per-target results are handed back to their callers, so
+    a burst of N inspects costs one round trip instead of N. A transport
+    error (timeout, disconnect) fails every caller of the batch; only a
+    response without one result per target is retried target by target.
+    """
+
+    def __init__(self, window_ms: int | None = None, max_batch_size: int | None = None) -> None:
+        self._window_seconds = (window_ms if window_ms is not None else env.inspect_batch_window_ms) / 1000
+        self._max_batch_size = max_batch_size if max_batch_size is not None else env.inspect_batch_max_size
+        self._pending: dict[tuple[str, str], _PendingBatch] = {}
+        self._sizes: Counter[int] = Counter()
+        self._fallbacks = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._window_seconds > 0 and self._max_batch_size > 1
+
+    async def submit(
+        self,
+        bridge_command: str,
+        batch_operation: str,
+        payload: dict[str, Any],
+        send: SendCommand,
+    ) -> Any:
+        """Queue ``payload`` and return its individual result once the batch completes."""
+        loop = asyncio.get_running_loop()
+        key = (bridge_command, batch_operation)
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = _PendingBatch(batch_operation=batch_operation, send=send)
+            batch.timer = loop.call_later(self._window_seconds, self._flush, key)
+            self._pending[key] = batch
+
+        future: asyncio.Future[Any] = loop.create_future()
+        batch.items.append((payload, future))
+        if len(batch.items) >= self._max_batch_size:
+            self._flush(key)
+        return await future
+
+    def get_stats(self) -> dict[str, Any]:
+        batches = sum(self._sizes.values())
+        requests = sum(size * count for size, count in self._sizes.items())
+        histogram: dict[str, int] = {}
+        lower = 1
+        for upper in _HISTOGRAM_BOUNDS:
+            label = str(upper) if lower == upper else f"{lower}-{upper}"
+            histogram[label] = sum(count for size, count in self._sizes.items() if lower <= size <= upper)
+            lower = upper + 1
+        histogram[f"{lower}+"] = sum(count for size, count in self._sizes.items() if size >= lower)
+
+        return {
+            "enabled": self.enabled,
+            "windowMs": round(self._window_seconds * 1000, 3),
+            "maxBatchSize": self._max_batch_size,
+            "requests": requests,
+            "roundTrips": batches,
+            "roundTripsSaved": requests - batches,
+            "averageBatchSize": round(requests / batches, 2) if batches else 0.0,
+            "largestBatch": max(self._sizes, default=0),
+            "batchSizeHistogram": histogram,
+            "fallbacks": self._fallbacks,
+        }
+
+    def _flush(self, key: tuple[str, str]) -> None:
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        asyncio.ensure_future(self._dispatch(key[0], batch))
+
+    async def _dispatch(self, bridge_command: str, batch: _PendingBatch) -> None:
+        items = batch.items
+        self._sizes[len(items)] += 1
+
+        if len(items) == 1:
+            payload, future = items[0]
+            await _resolve(future, batch.send(bridge_command, payload))
+            return
+
+        targets = [{key: value for key, value in payload.items() if key != "operation"} for payload, _ in items]
+        request: dict[str, Any] = {"operation": batch.batch_operation, "targets": targets}
+        timeouts = [payload["timeoutSeconds"] for payload, _ in items if isinstance(payload.get("timeoutSeconds"), int)]
+        if timeouts:
+            # The bridge call's own timeout is derived from this; honour the most patient caller
+            request["timeoutSeconds"] = max(timeouts)
+        try:
+            response = await batch.send(bridge_command, request)
+        except Exception as exc:
+            # Timeouts and disconnects would hit the individual requests just the same
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        results = response.get("results") if isinstance(response, dict) else None
+        if not isinstance(results, list) or len(results) != len(items):
+            # Older bridges without "targets" support: fall back to individual requests
+            self._fallbacks += 1
+            logger.warning(
+                "Batched %s %s of %d targets did not return one result per target; sending individually",
+                bridge_command,
+                batch.batch_operation,
+                len(items),
+            )
+            await asyncio.gather(
+                *(_resolve(future, batch.send(bridge_command, payload)) for payload, future in items)
+            )
+            return
+
+        for (_, future), result in zip(items, results, strict=True):
+            if not future.done():
+                future.set_result(result)
+
+
+async def _resolve(future: asyncio.Future[Any], call: Awaitable[Any]) -> None:
+    try:
+        result = await call
+    except Exception as exc:
+        if not future.done():
+            future.set_exception(exc)
+        return
+    if not future.done():
+        future.set_result(result)
+
+
+inspect_batcher = MicroBatcher()
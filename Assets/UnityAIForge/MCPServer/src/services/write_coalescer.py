@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from config.env import env
+from logger import logger
+
+SendCommand = Callable[[str, dict[str, Any]], Awaitable[Any]]
+
+MERGED_FIELD = "propertyChanges"
+
+
+def _target_key(payload: dict[str, Any]) -> str:
+    # Everything except the changes themselves identifies the target
+    return json.dumps(
+        {key: value for key, value in payload.items() if key != MERGED_FIELD},
+        sort_keys=True,
+        default=str,
+    )
+
+
+@dataclass
+class _PendingUpdate:
+    payload: dict[str, Any]
+    send: SendCommand
+    changes: dict[str, Any] = field(default_factory=dict)
+    futures: list[asyncio.Future[Any]] = field(default_factory=list)
+    overwritten: int = 0
+    timer: asyncio.TimerHandle | None = None
+
+
+class WriteCoalescer:
+    """
+    Last-write-wins merger for rapid updates of the same target.
+
+    Updates that opt in with ``coalesce`` and address the same target (every
+    argument except ``propertyChanges`` is equal) within ``window_ms`` of the
+    first one are merged key by key, later values replacing earlier ones, and
+    sent to Unity as one update. Every caller receives the response of that
+    single update, which reflects the final state.
+    """
+
+    def __init__(self, window_ms: int | None = None) -> None:
+        self._window_seconds = (window_ms if window_ms is not None else env.update_coalesce_window_ms) / 1000
+        self._pending: dict[tuple[str, str], _PendingUpdate] = {}
+        self._requests = 0
+        self._sent = 0
+        self._overwritten = 0
+        self._largest = 0
+        self._failures = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._window_seconds > 0
+
+    async def submit(self, bridge_command: str, payload: dict[str, Any], send: SendCommand) -> Any:
+        """Merge ``payload`` into the pending update of its target and return the final response."""
+        loop = asyncio.get_running_loop()
+        key = (bridge_command, _target_key(payload))
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = _PendingUpdate(payload=payload, send=send)
+            pending.timer = loop.call_later(self._window_seconds, self._flush, key)
+            self._pending[key] = pending
+
+        changes = payload.get(MERGED_FIELD) or {}
+        pending.overwritten += sum(1 for name in changes if name in pending.changes)
+        pending.changes.update(changes)
+
+        future: asyncio.Future[Any] = loop.create_future()
+        pending.futures.append(future)
+        self._requests += 1
+        return await future
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "windowMs": round(self._window_seconds * 1000, 3),
+            "requests": self._requests,
+            "updatesSent": self._sent,
+            "updatesMerged": self._requests - self._sent - self._pending_requests(),
+            "propertiesOverwritten": self._overwritten,
+            "largestMerge": self._largest,
+            "failures": self._failures,
+        }
+
+    def _pending_requests(self) -> int:
+        return sum(len(pending.futures) for pending in self._pending.values())
+
+    def _flush(self, key: tuple[str, str]) -> None:
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+        if pending.timer is not None:
+            pending.timer.cancel()
+        asyncio.ensure_future(self._dispatch(key[0], pending))
+
+    async def _dispatch(self, bridge_command: str, pending: _PendingUpdate) -> None:
+        merged = len(pending.futures)
+        self._sent += 1
+        self._overwritten += pending.overwritten
+        self._largest = max(self._largest, merged)
+        if merged > 1:
+            logger.debug(
+                "Coalesced %d %s updates into one (%d properties overwritten)",
+                merged,
+                bridge_command,
+                pending.overwritten,
+            )
+
+        try:
+            response = await pending.send(bridge_command, {**pending.payload, MERGED_FIELD: pending.changes})
+        except Exception as exc:
+            self._failures += 1
+            for future in pending.futures:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        if isinstance(response, dict):
+            response = {
+                **response,
+                "coalesced": {
+                    "mergedUpdates": merged,
+                    "propertiesOverwritten": pending.overwritten,
+                    "propertyChanges": pending.changes,
+                },
+            }
+        for future in pending.futures:
+            if not future.done():
+                future.set_result(response)
+
+
+update_coalescer = WriteCoalescer()
@@ -0,0 +1,441 @@
+"""
+Dependency-aware batch execution tool.
+
+Operations declare ``dependsOn`` IDs and may reference fields of earlier
+results with ``${<id>.<path>}`` placeholders. Every operation whose
+dependencies have succeeded is sent to Unity right away, up to
+``maxInFlight`` at a time, so independent work is pipelined instead of paying
+a full round trip per operation. A failure skips only the operations that
+depend on it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from mcp.types import Tool
+
+from logger import logger
+from tools.compile_barrier import compile_barrier
+from tools.executor import execute_tool
+from tools.progress import current_progress
+from tools.registry import tool_registry
+from tools.response_options import split_response_options
+
+DEFAULT_MAX_IN_FLIGHT = 8
+MAX_IN_FLIGHT_LIMIT = 32
+
+# ${opId.path.to.field}; list elements are addressed by index (${op.results.0.path}).
+# $${ is a literal ${ and never a reference.
+_REFERENCE_PATTERN = re.compile(r"(?<!\$)\$\{([A-Za-z0-9_\-]+)((?:\.[^.{}]+)*)\}")
+_ESCAPED_REFERENCE = "$${"
+# Arguments holding file text (scripts, JSON, shell); they are written verbatim
+LITERAL_ARGUMENTS = frozenset({"content"})
+
+
+@dataclass
+class _DagNode:
+    index: int
+    op_id: str
+    tool: str
+    arguments: dict[str, Any]
+    depends_on: list[str]
+    dependents: list[str] = field(default_factory=list)
+    status: str = "pending"
+    result: Any = None
+    error: str | None = None
+    skipped_because: str | None = None
+    ready_at: float | None = None
+    started_at: float | None = None
+    finished_at: float | None = None
+
+
+class BatchPlanError(ValueError):
+    """Raised when the operation graph is invalid."""
+
+
+def _collect_references(value: Any, found: set[str], top_level: bool = False) -> None:
+    if isinstance(value, str):
+        found.update(match.group(1) for match in _REFERENCE_PATTERN.finditer(value))
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            if not (top_level and key in LITERAL_ARGUMENTS):
+                _collect_references(item, found)
+    elif isinstance(value, list):
+        for item in value:
+            _collect_references(item, found)
+
+
+def _lookup(result: Any, path: str, reference: str) -> Any:
+    value = result
+    for part in [segment for segment in path.split(".") if segment]:
+        if isinstance(value, dict) and part in value:
+            value = value[part]
+        elif isinstance(value, list) and part.isdigit() and int(part) < len(value):
+            value = value[int(part)]
+        else:
+            raise KeyError(f"Reference '{reference}' could not be resolved at '{part}'")
+    return value
+
+
+def _resolve_references(value: Any, nodes: dict[str, _DagNode], top_level: bool = False) -> Any:
+    if isinstance(value, str):
+        whole = _REFERENCE_PATTERN.fullmatch(value)
+        if whole:
+            # A lone placeholder keeps the referenced value's type
+            return _lookup(nodes[whole.group(1)].result, whole.group(2), value)
+        return _REFERENCE_PATTERN.sub(
+            lambda match: str(_lookup(nodes[match.group(1)].result, match.group(2), match.group(0))),
+            value,
+        ).replace(_ESCAPED_REFERENCE, "${")
+    if isinstance(value, dict):
+        return {
+            key: item if top_level and key in LITERAL_ARGUMENTS else _resolve_references(item, nodes)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_resolve_references(item, nodes) for item in value]
+    return value
+
+
+def build_plan(operations: list[dict[str, Any]]) -> dict[str, _DagNode]:
+    """Validate the operations and build the dependency graph (in input order)."""
+    nodes: dict[str, _DagNode] = {}
+    for index, operation in enumerate(operations):
+        op_id = str(operation.get("id") or f"op{index}")
+        if op_id in nodes:
+            raise BatchPlanError(f"Duplicate operation id '{op_id}'")
+        tool_name = operation.get("tool")
+        if not tool_name or tool_name not in tool_registry:
+            raise BatchPlanError(f"Operation '{op_id}' uses unknown tool '{tool_name}'")
+
+        arguments = operation.get("arguments") or {}
+        references: set[str] = set()
+        _collect_references(arguments, references, top_level=True)
+        depends_on = list(dict.fromkeys([*(operation.get("dependsOn") or []), *sorted(references)]))
+        nodes[op_id] = _DagNode(
+            index=index,
+            op_id=op_id,
+            tool=tool_name,
+            arguments=arguments,
+            depends_on=depends_on,
+        )
+
+    for node in nodes.values():
+        for dependency in node.depends_on:
+            if dependency not in nodes:
+                raise BatchPlanError(f"Operation '{node.op_id}' depends on unknown id '{dependency}'")
+            if dependency == node.op_id:
+                raise BatchPlanError(f"Operation '{node.op_id}' depends on itself")
+            nodes[dependency].dependents.append(node.op_id)
+
+    # Kahn's algorithm to reject cycles before anything is sent to Unity
+    remaining = {op_id: len(node.depends_on) for op_id, node in nodes.items()}
+    queue = [op_id for op_id, count in remaining.items() if count == 0]
+    visited = 0
+    while queue:
+        op_id = queue.pop()
+        visited += 1
+        for dependent in nodes[op_id].dependents:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                queue.append(dependent)
+    if visited != len(nodes):
+        cyclic = sorted(op_id for op_id, count in remaining.items() if count > 0)
+        raise BatchPlanError(f"Dependency cycle between operations: {', '.join(cyclic)}")
+
+    return nodes
+
+
+def _is_failed_response(response: Any) -> bool:
+    return isinstance(response, dict) and response.get("success") is False
+
+
+async def _run_node(node: _DagNode, nodes: dict[str, _DagNode]) -> None:
+    spec = tool_registry.get(node.tool)
+    assert spec is not None
+    try:
+        arguments, _ = split_response_options(_resolve_references(node.arguments, nodes, top_level=True))
+        response = await execute_tool(spec, arguments)
+    except Exception as exc:
+        node.status = "failed"
+        node.error = str(exc)
+        return
+
+    node.result = response
+    if _is_failed_response(response):
+        node.status = "failed"
+        node.error = str(response.get("error") or response.get("message") or "Unknown error")
+    else:
+        node.status = "succeeded"
+
+
+def _skip_descendants(node: _DagNode, nodes: dict[str, _DagNode]) -> int:
+    skipped = 0
+    stack = list(node.dependents)
+    while stack:
+        dependent = nodes[stack.pop()]
+        if dependent.status != "pending":
+            continue
+        dependent.status = "skipped"
+        dependent.skipped_because = node.op_id
+        skipped += 1
+        stack.extend(dependent.dependents)
+    return skipped
+
+
+def _ms(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 2)
+
+
+def _timing_report(nodes: dict[str, _DagNode], total_seconds: float) -> dict[str, Any]:
+    executed = [node for node in nodes.values() if node.finished_at is not None]
+    sequential_seconds = sum(node.finished_at - node.started_at for node in executed)  # type: ignore[operator]
+
+    # Walk back from the last operation to finish through its latest-finishing dependency
+    critical_path: list[_DagNode] = []
+    current = max(executed, key=lambda node: node.finished_at or 0.0, default=None)
+    while current is not None:
+        critical_path.append(current)
+        predecessors = [nodes[dep] for dep in current.depends_on if nodes[dep].finished_at is not None]
+        current = max(predecessors, key=lambda node: node.finished_at or 0.0, default=None)
+    critical_path.reverse()
+
+    breakdown = [
+        {
+            "id": node.op_id,
+            "tool": node.tool,
+            "readyMs": _ms(node.ready_at),
+            "queuedMs": _ms((node.started_at or 0.0) - (node.ready_at or 0.0)),
+            "durationMs": _ms((node.finished_at or 0.0) - (node.started_at or 0.0)),
+            "endMs": _ms(node.finished_at),
+        }
+        for node in critical_path
+    ]
+
+    return {
+        "totalMs": _ms(total_seconds),
+        "sequentialMs": _ms(sequential_seconds),
+        "speedup": round(sequential_seconds / total_seconds, 2) if total_seconds > 0 else None,
+        "criticalPath": [node.op_id for node in critical_path],
+        "criticalPathMs": _ms(critical_path[-1].finished_at) if critical_path else 0.0,
+        "criticalPathBreakdown": breakdown,
+    }
+
+
+async def _schedule(nodes: dict[str, _DagNode], max_in_flight: int, fail_fast: bool) -> tuple[float, int]:
+    """Run the graph and return the elapsed seconds and the peak number of operations in flight."""
+    started = time.perf_counter()
+    waiting = {op_id: len(node.depends_on) for op_id, node in nodes.items()}
+    ready: list[tuple[int, str]] = []
+    for op_id, count in waiting.items():
+        if count == 0:
+            nodes[op_id].ready_at = 0.0
+            heapq.heappush(ready, (nodes[op_id].index, op_id))
+
+    running: dict[asyncio.Task[None], _DagNode] = {}
+    halted = False
+    max_observed_in_flight = 0
+    progress = current_progress()
+    settled = 0
+
+    while ready or running:
+        while ready and len(running) < max_in_flight and not halted:
+            _, op_id = heapq.heappop(ready)
+            node = nodes[op_id]
+            node.status = "running"
+            node.started_at = time.perf_counter() - started
+            running[asyncio.create_task(_run_node(node, nodes))] = node
+        max_observed_in_flight = max(max_observed_in_flight, len(running))
+
+        if not running:
+            break
+
+        done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+        now = time.perf_counter() - started
+        for task in done:
+            node = running.pop(task)
+            node.finished_at = now
+            settled += 1
+            if node.status == "succeeded":
+                for dependent_id in node.dependents:
+                    waiting[dependent_id] -= 1
+                    dependent = nodes[dependent_id]
+                    if waiting[dependent_id] == 0 and dependent.status == "pending":
+                        dependent.ready_at = now
+                        heapq.heappush(ready, (dependent.index, dependent_id))
+            else:
+                skipped = _skip_descendants(node, nodes)
+                settled += skipped
+                logger.error(
+                    "DAG operation '%s' failed: %s (%d dependent operation(s) skipped)",
+                    node.op_id,
+                    node.error,
+                    skipped,
+                )
+                if fail_fast:
+                    halted = True
+            if progress:
+                progress.report(settled, len(nodes), f"Operation '{node.op_id}' ({node.tool}) {node.status}")
+
+    return time.perf_counter() - started, max_observed_in_flight
+
+
+async def execute_batch_dag(
+    operations: list[dict[str, Any]],
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    fail_fast: bool = False,
+    defer_compilation: bool = True,
+) -> dict[str, Any]:
+    """
+    Execute operations as a dependency graph.
+
+    Args:
+        operations: Operations with ``tool``, ``arguments`` and optional ``id``
+            and ``dependsOn``.
+        max_in_flight: Maximum number of operations awaiting a Unity response.
+        fail_fast: If True, stop scheduling new operations after the first failure.
+        defer_compilation: If True, C# script writes are compiled once after
+            the last operation instead of after each write.
+
+    Returns:
+        Dict with per-operation results (in input order) and a timing report.
+    """
+    try:
+        nodes = build_plan(operations)
+    except BatchPlanError as exc:
+        return {"success": False, "error": str(exc)}
+
+    max_in_flight = max(1, min(max_in_flight, MAX_IN_FLIGHT_LIMIT))
+    logger.info("Starting DAG batch with %d operations (maxInFlight=%d)", len(nodes), max_in_flight)
+
+    if defer_compilation:
+        async with compile_barrier.scope("batch_dag"):
+            total_seconds, max_observed_in_flight = await _schedule(nodes, max_in_flight, fail_fast)
+    else:
+        total_seconds, max_observed_in_flight = await _schedule(nodes, max_in_flight, fail_fast)
+
+    results: list[dict[str, Any]] = []
+    counts = {"succeeded": 0, "failed": 0, "skipped": 0, "notExecuted": 0}
+    for node in sorted(nodes.values(), key=lambda item: item.index):
+        status = "notExecuted" if node.status == "pending" else node.status
+        counts[status] += 1
+        entry: dict[str, Any] = {"index": node.index, "id": node.op_id, "tool": node.tool, "status": status}
+        if node.depends_on:
+            entry["dependsOn"] = node.depends_on
+        if status == "succeeded":
+            entry["result"] = node.result
+        elif status == "failed":
+            entry["error"] = node.error
+        elif status == "skipped":
+            entry["skippedBecause"] = node.skipped_because
+        results.append(entry)
+
+    success = counts["succeeded"] == len(nodes)
+    return {
+        "success": success,
+        "message": (
+            f"All {len(nodes)} operations completed successfully."
+            if success
+            else f"{counts['failed']} failed, {counts['skipped']} skipped, "
+            f"{counts['notExecuted']} not executed of {len(nodes)} operations."
+        ),
+        "counts": counts,
+        "maxInFlight": max_in_flight,
+        "maxObservedInFlight": max_observed_in_flight,
+        "results": results,
+        "timing": _timing_report(nodes, total_seconds),
+    }
+
+
+TOOL = Tool(
+    name="unity_batch_dag_execute",
+    description="""Execute Unity operations as a dependency graph with pipelined dispatch.
+
+Each operation may declare an 'id' and 'dependsOn' (list of ids). Operations whose dependencies have succeeded are sent to Unity immediately, keeping up to 'maxInFlight' operations in flight, so independent work does not wait a full round trip per step.
+
+Arguments can reference results of earlier operations with '${<id>.<field path>}', e.g. '${player.gameObjectPath}'. A referenced id is added to 'dependsOn' automatically. A lone placeholder keeps the referenced value's type; placeholders inside longer strings are interpolated. Write '$${' for a literal '${'. The 'content' argument (file text) is never scanned for references.
+
+When an operation fails, only the operations depending on it (directly or transitively) are skipped; independent branches keep running unless 'failFast' is true. The response lists every operation's status in input order and a timing report with the critical path.
+
+C# script writes are compiled once at the end of the batch (see 'deferCompilation').
+
+Use unity_batch_sequential_execute instead when operations must run strictly in order or need resume support.""",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "operations": {
+                "type": "array",
+                "description": "Operations to execute. Each has 'tool', 'arguments' and optional 'id' and 'dependsOn'.",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "id": {
+                            "type": "string",
+                            "description": "Unique operation id (defaults to 'op<index>').",
+                        },
+                        "tool": {
+                            "type": "string",
+                            "description": "Tool name (e.g., 'unity_gameobject_crud', 'unity_component_crud')",
+                        },
+                        "arguments": {
+                            "type": "object",
+                            "description": "Tool arguments. Strings other than 'content' may contain '${<id>.<path>}' references ('$${' is a literal '${').",
+                        },
+                        "dependsOn": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Ids of operations that must succeed before this one runs.",
+                        },
+                    },
+                    "required": ["tool", "arguments"],
+                },
+            },
+            "maxInFlight": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": MAX_IN_FLIGHT_LIMIT,
+                "description": "Maximum number of operations awaiting a Unity response at once.",
+                "default": DEFAULT_MAX_IN_FLIGHT,
+            },
+            "failFast": {
+                "type": "boolean",
+                "description": "If true, stop scheduling new operations after the first failure.",
+                "default": False,
+            },
+            "deferCompilation": {
+                "type": "boolean",
+                "description": "If true, C# script writes return immediately and a single compilation is awaited after the batch; its result is attached to every script write. Set to false when a later operation needs the compiled type.",
+                "default": True,
+            },
+        },
+        "required": ["operations"],
+    },
+)
+
+
+async def run_batch_dag(arguments: dict[str, Any]) -> dict[str, Any]:
+    """Validate the tool arguments and run the DAG batch, returning the raw result."""
+    operations = arguments.get("operations") or []
+    if not operations:
+        return {"success": False, "error": "No operations provided. Specify 'operations' array."}
+
+    max_in_flight = arguments.get("maxInFlight", DEFAULT_MAX_IN_FLIGHT)
+    if isinstance(max_in_flight, bool) or not isinstance(max_in_flight, int) \
+            or not 1 <= max_in_flight <= MAX_IN_FLIGHT_LIMIT:
+        return {
+            "success": False,
+            "error": f"maxInFlight must be an integer between 1 and {MAX_IN_FLIGHT_LIMIT}.",
+        }
+
+    return await execute_batch_dag(
+        operations,
+        max_in_flight=max_in_flight,
+        fail_fast=arguments.get("failFast", False),
+        defer_compilation=arguments.get("deferCompilation", True),
+    )
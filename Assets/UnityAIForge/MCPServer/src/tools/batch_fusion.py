@@ -0,0 +1,233 @@
+"""
+Operation fusion for sequential batches.
+
+Agent-written batches are full of runs like twenty ``unity_component_crud``
+``add`` calls in a row or a series of ``unity_gameobject_crud`` deletes. The
+planner turns such runs of adjacent, identical operations into one bulk
+operation whose ``targets`` holds each original payload; Unity applies them
+one by one in order, stopping at the first failure when asked to, and returns
+one result per target. Every original operation therefore keeps its own
+result, error and index, and a run costs one round trip instead of N.
+
+Bridges without ``targets`` support on the bulk operations reject them as a
+whole (the bulk operation asks for its ``pattern`` or is unknown) without
+changing anything; the batch then sends the run's operations individually and
+stops fusing until the bridge reconnects. Any other failure of a fused step
+(a timeout, a lost connection, a malformed response) may have come after Unity
+applied part of the run, so its outcome is unknown: neither failing the
+operations nor sending them again is safe, and the batch stops there.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from bridge.bridge_manager import BridgeCommandError, bridge_manager
+from logger import logger
+from tools.registry import tool_registry
+
+# Single-object operations and the bulk operation accepting ``targets`` they fuse into
+FUSIBLE_OPERATIONS: dict[str, dict[str, str]] = {
+    "unity_component_crud": {
+        "add": "addMultiple",
+        "remove": "removeMultiple",
+        "update": "updateMultiple",
+        "inspect": "inspectMultiple",
+    },
+    "unity_gameobject_crud": {
+        "delete": "deleteMultiple",
+        "inspect": "inspectMultiple",
+    },
+}
+# Keeps a single bulk operation from blocking the editor for too long
+MAX_FUSED_TARGETS = 50
+
+# Arguments that only steer the server and are never sent to Unity per target
+_SERVER_ONLY_ARGUMENTS = frozenset({"coalesce"})
+
+# Errors of bulk operations on bridges that predate ``targets``
+_TARGETS_UNSUPPORTED = re.compile(r"pattern parameter is required|Unknown (?:\w+ )?operation", re.IGNORECASE)
+
+# None until a fused operation succeeds or is rejected by the connected bridge
+_bridge_accepts_targets: bool | None = None
+
+
+class FusedOutcomeUnknown(RuntimeError):
+    """A fused step failed in a way that leaves open which of its operations Unity applied."""
+
+
+def _reset_bridge_support() -> None:
+    global _bridge_accepts_targets
+    # A reconnect may be a different (e.g. updated) bridge
+    _bridge_accepts_targets = None
+
+
+bridge_manager.on("connected", _reset_bridge_support)
+
+
+@dataclass
+class BatchStep:
+    """One round trip of a batch: a single operation or a fused run of them."""
+
+    index: int
+    operations: list[dict[str, Any]]
+    # Byte offset after each operation (streamed batches)
+    offsets: list[int]
+    error: str | None = None
+    skipped: bool = False
+    bulk_operation: str | None = None
+    _arguments: dict[str, Any] | None = field(default=None, repr=False)
+
+    @property
+    def tool(self) -> str | None:
+        return self.operations[0].get("tool") if self.operations else None
+
+    @property
+    def fused(self) -> bool:
+        return self.bulk_operation is not None
+
+    def request(self, stop_on_error: bool) -> tuple[str, dict[str, Any]]:
+        """Return the tool name and arguments to send for this step."""
+        if not self.fused:
+            return self.tool, self.operations[0].get("arguments", {})
+        if self._arguments is None:
+            targets = [
+                {
+                    key: value
+                    for key, value in operation.get("arguments", {}).items()
+                    if key != "operation" and key not in _SERVER_ONLY_ARGUMENTS
+                }
+                for operation in self.operations
+            ]
+            self._arguments = {"operation": self.bulk_operation, "targets": targets, "stopOnError": stop_on_error}
+        return self.tool, self._arguments
+
+
+def fusion_confirmed() -> bool:
+    """Return True once the bridge has accepted a fused operation."""
+    return _bridge_accepts_targets is True
+
+
+def _bulk_operation(operation: dict[str, Any]) -> str | None:
+    tool_name = operation.get("tool")
+    arguments = operation.get("arguments")
+    if not isinstance(arguments, dict):
+        return None
+    bulk = FUSIBLE_OPERATIONS.get(tool_name, {}).get(arguments.get("operation"))
+    if bulk is None:
+        return None
+    spec = tool_registry.get(tool_name)
+    # Hooks and custom handlers expect to see every call on its own
+    if spec is None or spec.handler is not None or spec.pre_hooks or spec.post_hooks:
+        return None
+    return bulk
+
+
+def plan_steps(
+    pending: Iterable[tuple[dict[str, Any] | None, str | None, int]],
+    start_index: int,
+    skip: set[int],
+    fuse: bool = True,
+) -> Iterator[BatchStep]:
+    """
+    Group pending ``(operation, parse error, next offset)`` items into steps.
+
+    Adjacent operations with the same tool and operation are fused while
+    ``fuse`` is set and the bridge has not rejected fusion. Operations in
+    ``skip`` (already executed) and invalid lines always get a step of their own.
+    """
+    index = start_index
+    run: BatchStep | None = None
+    run_bulk: str | None = None
+
+    def close(step: BatchStep, bulk: str) -> BatchStep:
+        if len(step.operations) > 1:
+            step.bulk_operation = bulk
+        return step
+
+    for operation, error, next_offset in pending:
+        bulk = None
+        if error is None and index not in skip and fuse and _bridge_accepts_targets is not False:
+            bulk = _bulk_operation(operation)
+
+        if run is not None:
+            if bulk == run_bulk and operation.get("tool") == run.tool and len(run.operations) < MAX_FUSED_TARGETS:
+                run.operations.append(operation)
+                run.offsets.append(next_offset)
+                index += 1
+                continue
+            yield close(run, run_bulk)
+            run = None
+
+        if bulk is not None:
+            # Start a run; it stays a plain operation unless another one joins
+            run = BatchStep(index, [operation], [next_offset])
+            run_bulk = bulk
+        elif error is not None:
+            yield BatchStep(index, [], [next_offset], error=error)
+        else:
+            yield BatchStep(index, [operation], [next_offset], skipped=index in skip)
+        index += 1
+
+    if run is not None:
+        yield close(run, run_bulk)
+
+
+def split_fused_response(step: BatchStep, response: Any, stop_on_error: bool) -> list[Any] | None:
+    """
+    Return the per-operation responses of a fused step, or None if the bridge
+    does not support ``targets`` (nothing was applied) and the operations must
+    be sent one by one. Raises FusedOutcomeUnknown for any other unexpected
+    response.
+    """
+    global _bridge_accepts_targets
+    results = response.get("results") if isinstance(response, dict) and response.get("success") else None
+    count = len(step.operations)
+    valid = isinstance(results, list) and (
+        len(results) == count
+        # Unity stops at the first failing target when asked to
+        or (stop_on_error and 0 < len(results) < count and not _succeeded(results[-1]))
+    )
+    if valid:
+        _bridge_accepts_targets = True
+        return results
+    error = response.get("error") if isinstance(response, dict) else None
+    if isinstance(error, str) and _rejects_targets(step, error):
+        return None
+    raise FusedOutcomeUnknown(
+        f"Unexpected response to fused {step.tool} {step.bulk_operation}: {error or response!r}"
+    )
+
+
+def fused_step_rejected(step: BatchStep, exc: BaseException) -> bool:
+    """
+    Return True if ``exc`` raised by sending a fused step means the bridge does
+    not support ``targets``; nothing was applied and the operations must be
+    sent one by one.
+    """
+    # Bridge tool errors are wrapped by the executor
+    while exc is not None and not isinstance(exc, BridgeCommandError):
+        exc = exc.__cause__
+    return exc is not None and _rejects_targets(step, str(exc))
+
+
+def _rejects_targets(step: BatchStep, error: str) -> bool:
+    global _bridge_accepts_targets
+    if _bridge_accepts_targets is True or not _TARGETS_UNSUPPORTED.search(error):
+        return False
+    if _bridge_accepts_targets is None:
+        logger.warning(
+            "Fused %s %s was rejected (%s); sending operations individually until the bridge reconnects",
+            step.tool,
+            step.bulk_operation,
+            error,
+        )
+    _bridge_accepts_targets = False
+    return True
+
+
+def _succeeded(result: Any) -> bool:
+    return isinstance(result, dict) and bool(result.get("success"))
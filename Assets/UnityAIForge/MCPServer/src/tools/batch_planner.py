@@ -0,0 +1,262 @@
+"""
+Cost-aware ordering of batch operations around compiles and imports.
+
+Every C# script write costs a compilation and domain reload, and every other
+asset write through ``unity_asset_crud`` costs an AssetDatabase refresh. A
+batch that interleaves them with scene edits pays for each one separately,
+and deferring them all to the end of the batch breaks operations that need a
+new script's type or a freshly written asset.
+
+The planner reads what each operation reads and writes (GameObject roots,
+asset paths, type names) and gives every operation a level: the number of
+refreshes that must happen before it. An operation that uses the result of
+a deferred write is one level above it; everything else keeps the level of
+what it depends on. Each level runs its other operations first, then its
+asset writes with the refresh deferred, then one ``unity_compile_barrier``
+``flush`` that imports and compiles them together. Dependent operations thus
+keep their order and the batch needs as many refreshes as the longest chain
+of write -> use -> write, usually one.
+
+Operations the planner cannot model (unknown tools, bulk operations with
+patterns) are treated as touching the whole scene and every asset, but not
+scripts unless they name a type.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from pathlib import PurePosixPath
+from typing import Any
+
+from tools.compile_barrier import compile_barrier, is_script_write
+
+# Refresh points inserted after each group of deferred asset writes
+FLUSH_OPERATION: dict[str, Any] = {"tool": "unity_compile_barrier", "arguments": {"operation": "flush"}}
+# Cost model for the estimate; a measured compilation replaces the default
+ESTIMATED_COMPILE_SECONDS = 10.0
+ESTIMATED_REFRESH_SECONDS = 0.5
+
+# Arguments naming a C# type that a script write may define
+TYPE_ARGUMENTS = ("componentType", "typeName")
+DEFERRABLE_ASSET_OPERATIONS = frozenset({"create", "update", "delete"})
+
+WILDCARD = "*"
+Key = tuple[str, str]
+_EVERYTHING: Key = (WILDCARD, WILDCARD)
+
+
+def _type_key(name: str) -> Key:
+    # Scripts define their type under the file name; callers may qualify it
+    return ("type", name.rsplit(".", 1)[-1])
+
+
+def _object_key(path: Any) -> Key:
+    if not isinstance(path, str) or not path.strip("/") or "${" in path:
+        return ("object", WILDCARD)
+    # Renames and moves touch the whole subtree, so conflicts are tracked per root
+    return ("object", path.strip().strip("/").split("/")[0])
+
+
+def _asset_key(path: Any) -> Key:
+    if not isinstance(path, str) or not path or "${" in path:
+        return ("asset", WILDCARD)
+    return ("asset", path.strip().strip("/"))
+
+
+def _type_reads(arguments: dict[str, Any]) -> set[Key]:
+    return {
+        _type_key(arguments[key])
+        for key in TYPE_ARGUMENTS
+        if isinstance(arguments.get(key), str) and arguments[key]
+    }
+
+
+def operation_effects(operation: dict[str, Any]) -> tuple[set[Key], set[Key], str | None]:
+    """
+    Return what an operation reads, what it writes and its deferrable kind:
+    ``"compile"`` for C# script writes, ``"import"`` for other asset writes,
+    otherwise None.
+    """
+    tool = operation.get("tool")
+    arguments = operation.get("arguments") or {}
+    name = arguments.get("operation")
+    reads = _type_reads(arguments)
+    writes: set[Key] = set()
+
+    if tool == "unity_asset_crud":
+        path = arguments.get("assetPath")
+        if name == "inspect":
+            return reads | {_asset_key(path)}, writes, None
+        if name in ("findMultiple", "inspectMultiple"):
+            return reads | {("asset", WILDCARD)}, writes, None
+        if name == "deleteMultiple":
+            return reads, {("asset", WILDCARD), ("type", WILDCARD)}, None
+        if name not in ("create", "update", "delete", "rename", "duplicate", "updateImporter"):
+            return reads, {_EVERYTHING}, None
+
+        writes.add(_asset_key(path))
+        destination = arguments.get("destinationPath")
+        if name in ("rename", "duplicate"):
+            writes.add(_asset_key(destination))
+        for script in (path, destination):
+            if isinstance(script, str) and script.lower().endswith(".cs"):
+                writes.add(_type_key(PurePosixPath(script).stem))
+        if name not in DEFERRABLE_ASSET_OPERATIONS or not isinstance(path, str) or "${" in path:
+            return reads, writes, None
+        return reads, writes, "compile" if is_script_write(arguments) else "import"
+
+    if tool in ("unity_gameobject_crud", "unity_component_crud"):
+        if name is None or name.endswith("Multiple"):
+            # Pattern based bulk operations can touch any GameObject
+            keys = {("object", WILDCARD)}
+        else:
+            keys = {_object_key(arguments.get("gameObjectPath") or arguments.get("name"))}
+            if arguments.get("parentPath"):
+                keys.add(_object_key(arguments["parentPath"]))
+        if name in ("inspect", "inspectMultiple", "findMultiple"):
+            return reads | keys, writes, None
+        return reads, keys, None
+
+    if tool == "unity_compile_barrier":
+        return reads, {_EVERYTHING}, None
+
+    # Anything else may change the scene and assets (or load another scene)
+    return reads, {("object", WILDCARD), ("asset", WILDCARD)}, None
+
+
+def _raise(target: list[int], values: Iterable[int]) -> None:
+    """Raise each entry of ``target`` to the matching value if that is higher."""
+    for position, value in enumerate(values):
+        if value > target[position]:
+            target[position] = value
+
+
+class _AccessIndex:
+    """Highest levels recorded per key, with wildcard lookups in both directions."""
+
+    def __init__(self) -> None:
+        self._exact: dict[Key, list[int]] = {}
+        self._namespace: dict[str, list[int]] = {}
+        self._namespace_wildcard: dict[str, list[int]] = {}
+        self._all = [-1, -1]
+        self._all_wildcard = [-1, -1]
+
+    def add(self, key: Key, levels: tuple[int, int]) -> None:
+        namespace, name = key
+        _raise(self._all, levels)
+        if namespace == WILDCARD:
+            _raise(self._all_wildcard, levels)
+            return
+        _raise(self._namespace.setdefault(namespace, [-1, -1]), levels)
+        if name == WILDCARD:
+            _raise(self._namespace_wildcard.setdefault(namespace, [-1, -1]), levels)
+        else:
+            _raise(self._exact.setdefault(key, [-1, -1]), levels)
+
+    def lookup(self, key: Key) -> list[int]:
+        namespace, name = key
+        if namespace == WILDCARD:
+            return self._all
+        found = list(self._all_wildcard)
+        if name == WILDCARD:
+            _raise(found, self._namespace.get(namespace, ()))
+        else:
+            _raise(found, self._exact.get(key, ()))
+            _raise(found, self._namespace_wildcard.get(namespace, ()))
+        return found
+
+
+def plan_batch(
+    operations: list[dict[str, Any]],
+    defer_compilation: bool = True,
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """
+    Reorder ``operations`` so deferred asset writes share refreshes.
+
+    Returns the planned operations (with flush operations inserted and
+    ``deferRefresh`` set on non-script asset writes) and a report with the
+    original index of every planned operation and the estimated time saved.
+    """
+    writes = _AccessIndex()
+    reads = _AccessIndex()
+    levels: list[int] = []
+    kinds: list[str | None] = []
+
+    for operation in operations:
+        op_reads, op_writes, kind = operation_effects(operation)
+        # Index 0: level of a conflicting operation; 1: the same plus one if it was
+        # a deferred write, which only a later refresh makes visible
+        dependency = [-1, -1]
+        for key in op_reads:
+            _raise(dependency, writes.lookup(key))
+        for key in op_writes:
+            _raise(dependency, writes.lookup(key))
+            _raise(dependency, reads.lookup(key))
+        level = max(dependency[0] if kind else dependency[1], 0)
+        contribution = (level, level + 1 if kind else level)
+        for key in op_reads:
+            reads.add(key, contribution)
+        for key in op_writes:
+            writes.add(key, contribution)
+        levels.append(level)
+        kinds.append(kind)
+
+    planned: list[dict[str, Any]] = []
+    order: list[int | None] = []
+    groups: list[set[str]] = []
+    for level in range(max(levels, default=-1) + 1):
+        members = [index for index, value in enumerate(levels) if value == level]
+        deferred = [index for index in members if kinds[index]]
+        for index in members:
+            if not kinds[index]:
+                planned.append(operations[index])
+                order.append(index)
+        for index in deferred:
+            operation = operations[index]
+            if kinds[index] == "import":
+                operation = {**operation, "arguments": {**operation.get("arguments", {}), "deferRefresh": True}}
+            planned.append(operation)
+            order.append(index)
+        if deferred:
+            planned.append(FLUSH_OPERATION)
+            order.append(None)
+            groups.append({kinds[index] for index in deferred})
+
+    return planned, _report(order, kinds, groups, defer_compilation)
+
+
+def _report(
+    order: list[int | None],
+    kinds: list[str | None],
+    groups: list[set[str]],
+    defer_compilation: bool,
+) -> dict[str, Any]:
+    scripts = kinds.count("compile")
+    imports = kinds.count("import")
+    compile_seconds = compile_barrier.last_compile_seconds or ESTIMATED_COMPILE_SECONDS
+
+    # Without the planner each asset write refreshes on its own; script writes
+    # compile once at the end of the batch when deferred, otherwise each time
+    compiles_before = (1 if scripts else 0) if defer_compilation else scripts
+    compiles_after = sum(1 for kinds_in_group in groups if "compile" in kinds_in_group)
+    refreshes_before = imports
+    refreshes_after = len(groups) - compiles_after
+    before = compiles_before * compile_seconds + refreshes_before * ESTIMATED_REFRESH_SECONDS
+    after = compiles_after * compile_seconds + refreshes_after * ESTIMATED_REFRESH_SECONDS
+
+    originals = [index for index in order if index is not None]
+    report: dict[str, Any] = {
+        "reordered": originals != sorted(originals),
+        "operations": len(originals),
+        "scriptWrites": scripts,
+        "assetWrites": imports,
+        "refreshPoints": len(groups),
+        "compiles": {"before": compiles_before, "after": compiles_after},
+        "refreshes": {"before": refreshes_before, "after": refreshes_after},
+        "estimatedSecondsSaved": round(before - after, 1),
+        "compileSecondsAssumed": round(compile_seconds, 1),
+    }
+    if report["reordered"] or groups:
+        # Planned position -> original index (None for inserted flushes)
+        report["order"] = order
+    return report
@@ -0,0 +1,260 @@
+"""
+Per-operation timing profile of sequential batches.
+
+Every executed operation appends one record to the queue's profile file next
+to its state: when it entered the send window, when its command was written
+to the bridge, when Unity started running it (its result's ``executionMs``
+before completion), when the result arrived, plus request/response sizes.
+A fresh batch starts a new profile and a resumed one appends to it, so the
+profile covers the whole batch across restarts.
+
+``build_report`` aggregates the records by tool/operation and attributes the
+wall-clock time of every run to the operations on its critical path: results
+are processed strictly in order, so the time between two processed results
+belongs to the later one. ``build_chrome_trace`` exports the same records as
+Chrome trace-event JSON (chrome://tracing, Perfetto).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import IO, Any
+
+from logger import logger
+
+# Operations listed as the slowest in a report
+SLOWEST_COUNT = 10
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 2)
+
+
+def _ends_with_newline(path: Path) -> bool:
+    with open(path, "rb") as stream:
+        stream.seek(-1, os.SEEK_END)
+        return stream.read(1) == b"\n"
+
+
+class BatchProfiler:
+    """Appends the timing records of one batch run to a profile file."""
+
+    def __init__(self, path: Path, fresh: bool, queue_id: str, pipeline_depth: int = 1) -> None:
+        self._path = path
+        self._stream: IO[str] | None = None
+        self._last_processed = time.time()
+        try:
+            self._stream = open(path, "w" if fresh else "a", encoding="utf-8")
+            if self._stream.tell() and not _ends_with_newline(path):
+                # Append after a line torn by a crash instead of onto it
+                self._stream.write("\n")
+        except OSError as exc:
+            logger.error("Failed to open batch profile %s: %s", path, exc)
+            return
+        self._write({
+            "event": "run",
+            "queue_id": queue_id,
+            "startedAt": self._last_processed,
+            "pipelineDepth": pipeline_depth,
+        })
+
+    def record(
+        self,
+        index: int,
+        operation: dict[str, Any],
+        enqueued_at: float,
+        started_at: float,
+        traces: list[dict[str, Any]],
+        success: bool,
+        fused: int = 1,
+        step: int | None = None,
+    ) -> None:
+        """
+        Record one operation once its result has been processed.
+
+        ``traces`` are the bridge command records of its step (see
+        ``bridge.bridge_manager.command_trace``); ``fused`` is the number of
+        operations that shared them.
+        """
+        now = time.time()
+        sent = [trace for trace in traces if "sentAt" in trace]
+        completed = [trace for trace in traces if "completedAt" in trace]
+        unity = [trace.get("unity") or {} for trace in completed]
+        record: dict[str, Any] = {
+            "index": index,
+            "step": index if step is None else step,
+            "tool": operation.get("tool"),
+            "operation": (operation.get("arguments") or {}).get("operation"),
+            "success": success,
+            "enqueuedAt": enqueued_at,
+            "sentAt": sent[0]["sentAt"] if sent else started_at,
+            "completedAt": max((trace["completedAt"] for trace in completed), default=now),
+            "processedAt": now,
+            # Wall clock since the previous result was processed: results are
+            # processed in order, so this operation was the one being waited for
+            "criticalMs": _ms(now - self._last_processed),
+            "commands": len(traces),
+            "requestBytes": sum(trace.get("requestBytes", 0) for trace in traces),
+            "responseBytes": sum(trace.get("responseBytes", 0) for trace in completed),
+        }
+        if unity and any(unity):
+            record["unityQueuedMs"] = round(sum(item.get("queuedMs", 0) for item in unity), 2)
+            record["unityExecutionMs"] = round(sum(item.get("executionMs", 0) for item in unity), 2)
+        if fused > 1:
+            record["fused"] = fused
+        self._last_processed = now
+        self._write(record)
+
+    def close(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def _write(self, record: dict[str, Any]) -> None:
+        if self._stream is None:
+            return
+        try:
+            self._stream.write(json.dumps(record, separators=(",", ":")) + "\n")
+            self._stream.flush()
+        except OSError as exc:
+            logger.error("Failed to write batch profile record: %s", exc)
+
+
+def load_records(path: Path) -> list[dict[str, Any]]:
+    """Read a profile file; lines torn by a crash are skipped."""
+    records = []
+    try:
+        with open(path, encoding="utf-8") as stream:
+            for line in stream:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    # A resumed batch appends after it, so keep reading
+                    continue
+    except FileNotFoundError:
+        pass
+    return records
+
+
+def _operations(records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [record for record in records if "index" in record]
+
+
+def _share(record: dict[str, Any]) -> float:
+    # Fused operations split the time of their shared round trip
+    return 1 / record.get("fused", 1)
+
+
+def build_report(records: list[dict[str, Any]]) -> dict[str, Any]:
+    """Aggregate profile records by tool/operation and list the slowest operations."""
+    operations = _operations(records)
+    runs = [record for record in records if record.get("event") == "run"]
+
+    groups: dict[str, dict[str, Any]] = defaultdict(lambda: {
+        "count": 0, "criticalMs": 0.0, "latencyMs": 0.0, "maxLatencyMs": 0.0,
+        "unityExecutionMs": 0.0, "requestBytes": 0, "responseBytes": 0, "failures": 0,
+    })
+    breakdown = {"serverWaitMs": 0.0, "transportMs": 0.0, "unityQueuedMs": 0.0, "unityExecutionMs": 0.0}
+    for record in operations:
+        share = _share(record)
+        latency = (record["completedAt"] - record["sentAt"]) * 1000
+        unity_queued = record.get("unityQueuedMs", 0.0)
+        unity_execution = record.get("unityExecutionMs", 0.0)
+
+        key = f"{record['tool']}:{record['operation']}" if record.get("operation") else str(record["tool"])
+        group = groups[key]
+        group["count"] += 1
+        group["criticalMs"] += record["criticalMs"]
+        group["latencyMs"] += latency * share
+        group["maxLatencyMs"] = max(group["maxLatencyMs"], latency)
+        group["unityExecutionMs"] += unity_execution * share
+        group["requestBytes"] += round(record["requestBytes"] * share)
+        group["responseBytes"] += round(record["responseBytes"] * share)
+        group["failures"] += 0 if record["success"] else 1
+
+        breakdown["serverWaitMs"] += (record["sentAt"] - record["enqueuedAt"]) * 1000 * share
+        breakdown["unityQueuedMs"] += unity_queued * share
+        breakdown["unityExecutionMs"] += unity_execution * share
+        breakdown["transportMs"] += max(latency - unity_queued - unity_execution, 0.0) * share
+
+    by_operation = [
+        {
+            "operation": key,
+            **{name: round(value, 2) if isinstance(value, float) else value for name, value in group.items()},
+            "meanLatencyMs": round(group["latencyMs"] / group["count"], 2),
+        }
+        for key, group in groups.items()
+    ]
+    by_operation.sort(key=lambda item: item["criticalMs"], reverse=True)
+
+    slowest = sorted(operations, key=lambda record: record["completedAt"] - record["sentAt"], reverse=True)
+    critical_ms = sum(record["criticalMs"] for record in operations)
+    return {
+        "runs": len(runs),
+        "operations": len(operations),
+        "failures": sum(1 for record in operations if not record["success"]),
+        "criticalPathMs": round(critical_ms, 2),
+        "timeBreakdown": {name: round(value, 2) for name, value in breakdown.items()},
+        "byOperation": by_operation,
+        "slowest": [
+            {
+                "index": record["index"],
+                "tool": record["tool"],
+                "operation": record.get("operation"),
+                "latencyMs": _ms(record["completedAt"] - record["sentAt"]),
+                "unityExecutionMs": record.get("unityExecutionMs"),
+                "responseBytes": record["responseBytes"],
+                "success": record["success"],
+            }
+            for record in slowest[:SLOWEST_COUNT]
+        ],
+    }
+
+
+def build_chrome_trace(records: list[dict[str, Any]], name: str = "batch") -> dict[str, Any]:
+    """Export profile records as Chrome trace-event JSON."""
+    operations = _operations(records)
+    origin = min((record["enqueuedAt"] for record in operations), default=0.0)
+
+    def us(timestamp: float) -> int:
+        return round((timestamp - origin) * 1_000_000)
+
+    events: list[dict[str, Any]] = [{"ph": "M", "pid": 1, "name": "process_name", "args": {"name": name}}]
+    # Steps (fused operations share one) laid out on the fewest non-overlapping lanes
+    steps: dict[int, list[dict[str, Any]]] = defaultdict(list)
+    for record in operations:
+        steps[record["step"]].append(record)
+    lane_ends: list[float] = []
+    for step in sorted(steps.values(), key=lambda members: members[0]["enqueuedAt"]):
+        first = step[0]
+        lane = next((number for number, end in enumerate(lane_ends) if end <= first["enqueuedAt"]), len(lane_ends))
+        if lane == len(lane_ends):
+            lane_ends.append(0.0)
+            events.append({"ph": "M", "pid": 1, "tid": lane + 1, "name": "thread_name", "args": {"name": f"slot {lane + 1}"}})
+        lane_ends[lane] = first["processedAt"]
+
+        label = f"{first['tool']}:{first['operation']}" if first.get("operation") else str(first["tool"])
+        if len(step) > 1:
+            label += f" x{len(step)}"
+        args = {
+            "indices": [record["index"] for record in step],
+            "success": all(record["success"] for record in step),
+            "requestBytes": first["requestBytes"],
+            "responseBytes": first["responseBytes"],
+        }
+        span = {"pid": 1, "tid": lane + 1, "ph": "X"}
+        if first["sentAt"] > first["enqueuedAt"]:
+            events.append({**span, "name": "waiting to send", "cat": "server",
+                           "ts": us(first["enqueuedAt"]), "dur": us(first["sentAt"]) - us(first["enqueuedAt"])})
+        events.append({**span, "name": label, "cat": "bridge", "ts": us(first["sentAt"]),
+                       "dur": max(us(first["completedAt"]) - us(first["sentAt"]), 1), "args": args})
+        if first.get("unityExecutionMs"):
+            # Unity only reports durations; place its execution right before the result
+            execution = round(first["unityExecutionMs"] * 1000)
+            events.append({**span, "name": f"unity {label}", "cat": "unity",
+                           "ts": us(first["completedAt"]) - execution, "dur": execution})
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
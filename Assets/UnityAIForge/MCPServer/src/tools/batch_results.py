@@ -0,0 +1,165 @@
+"""
+Result retention for sequential batches.
+
+A long batch can produce far more result data than fits in one response. The
+retention policy decides what the response keeps: ``all`` results, the
+``last`` N results and errors, the last N ``errors`` only, or just a
+``summary`` of counts. With any policy but ``all`` every result is also
+spilled, one JSON line per operation, to a per-run file that clients page
+through with the ``batch://results/{runId}`` resource. Memory and response
+size therefore stay bounded however many operations run.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import uuid
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any
+
+from logger import logger
+
+RESULT_RETENTION_MODES = ("all", "last", "errors", "summary")
+DEFAULT_RESULT_LIMIT = 20
+MAX_RESULT_LIMIT = 1000
+# Spill files live next to the batch queue state
+RESULTS_DIR = Path(__file__).parent.parent.parent / ".batch_results"
+# Older spill files are deleted when a new run starts
+RESULT_FILES_KEPT = 20
+RESULTS_URI_PREFIX = "batch://results/"
+
+_RUN_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,128}$")
+
+
+def results_uri(run_id: str) -> str:
+    return f"{RESULTS_URI_PREFIX}{run_id}"
+
+
+def _results_path(run_id: str) -> Path:
+    if not _RUN_ID_PATTERN.match(run_id):
+        raise ValueError(f"Invalid batch run id: {run_id}")
+    return RESULTS_DIR / f"{run_id}.jsonl"
+
+
+def _result_files() -> list[Path]:
+    """Return the spill files, most recently written first."""
+    try:
+        return sorted(RESULTS_DIR.glob("*.jsonl"), key=lambda path: path.stat().st_mtime, reverse=True)
+    except OSError:
+        return []
+
+
+def _prune_result_files(keep: int) -> None:
+    for path in _result_files()[keep:]:
+        try:
+            path.unlink()
+        except OSError as exc:
+            logger.warning("Failed to delete batch result file %s: %s", path, exc)
+
+
+class BatchResults:
+    """Collects the results of one batch run according to a retention policy."""
+
+    def __init__(self, queue_id: str, mode: str = "all", limit: int = DEFAULT_RESULT_LIMIT) -> None:
+        if mode not in RESULT_RETENTION_MODES:
+            raise ValueError(f"result_retention must be one of {', '.join(RESULT_RETENTION_MODES)}: {mode}")
+        self.mode = mode
+        self.limit = limit
+        self.completed_count = 0
+        self.error_count = 0
+        self.run_id: str | None = None
+        self._spill: IO[str] | None = None
+        if mode == "all":
+            self.completed: list[dict[str, Any]] | deque[dict[str, Any]] = []
+            self.errors: list[dict[str, Any]] | deque[dict[str, Any]] = []
+            return
+
+        self.completed = deque(maxlen=limit if mode == "last" else 0)
+        self.errors = deque(maxlen=0 if mode == "summary" else limit)
+        stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+        self.run_id = f"{queue_id}-{stamp}-{uuid.uuid4().hex[:6]}"
+        try:
+            RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+            _prune_result_files(RESULT_FILES_KEPT - 1)
+            self._spill = open(_results_path(self.run_id), "w", encoding="utf-8")
+        except OSError as exc:
+            # Results are still counted; only the full record is lost
+            logger.error("Failed to create batch result file for %s: %s", self.run_id, exc)
+            self.run_id = None
+
+    def add_completed(self, entry: dict[str, Any]) -> None:
+        self.completed_count += 1
+        self.completed.append(entry)
+        self._write(entry)
+
+    def add_error(self, entry: dict[str, Any]) -> None:
+        self.error_count += 1
+        self.errors.append(entry)
+        self._write({**entry, "success": False})
+
+    def close(self) -> None:
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+    def to_response(self) -> dict[str, Any]:
+        """Return the retained results plus, when spilled, where to find all of them."""
+        response: dict[str, Any] = {
+            "completed": list(self.completed),
+            "errors": list(self.errors),
+        }
+        if self.mode == "all":
+            return response
+        response.update({
+            "result_retention": self.mode,
+            "completed_count": self.completed_count,
+            "error_count": self.error_count,
+        })
+        if self.run_id is not None:
+            response["results_uri"] = results_uri(self.run_id)
+            response["note"] = f"The response keeps '{self.mode}' results only; every result is in results_uri."
+        return response
+
+    def _write(self, entry: dict[str, Any]) -> None:
+        if self._spill is None:
+            return
+        try:
+            self._spill.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":"), default=str) + "\n")
+        except (OSError, TypeError, ValueError) as exc:
+            logger.error("Failed to spill batch result %s: %s", entry.get("index"), exc)
+
+
+def list_result_runs() -> list[str]:
+    """Return the run ids with a spill file, most recent first."""
+    return [path.stem for path in _result_files()]
+
+
+def read_results(run_id: str, offset: int = 0, limit: int = 100) -> dict[str, Any]:
+    """Read up to ``limit`` spilled results of a run starting at result ``offset``."""
+    path = _results_path(run_id)
+    if not path.is_file():
+        raise ValueError(f"Batch results not found or pruned: {results_uri(run_id)}")
+    limit = max(1, min(limit, MAX_RESULT_LIMIT))
+
+    results = []
+    has_more = False
+    with open(path, encoding="utf-8") as stream:
+        for position, line in enumerate(stream):
+            if position < offset:
+                continue
+            if len(results) == limit:
+                has_more = True
+                break
+            try:
+                results.append(json.loads(line))
+            except ValueError:
+                # Last line of a run that is still writing
+                break
+
+    data: dict[str, Any] = {"run_id": run_id, "offset": offset, "count": len(results), "results": results}
+    if has_more:
+        data["next_offset"] = offset + len(results)
+    return data
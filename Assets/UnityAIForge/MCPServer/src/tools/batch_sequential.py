@@ -2,109 +2,434 @@
 Sequential batch execution tool with resume capability.
 
 Executes operations sequentially, stops on error, and allows resuming from the failed point.
+
+The queue is persisted as a snapshot (operations and counters, written
+atomically) plus an append-only JSONL journal of progress and error events,
+so each executed operation costs one short append instead of rewriting the
+whole operations list. The journal is folded into the snapshot when the
+batch starts or finishes and whenever it grows past JOURNAL_COMPACT_BYTES;
+loading replays it on top of the snapshot. Events carry the batch's
+``started_at`` and only events of the snapshot's batch are replayed.
+
+Operations can also be streamed from a JSONL file under the project root
+(``operations_file``). The file is read one line at a time, progress is
+tracked as a byte offset and only a bounded tail of results is returned, so
+batches of 100k operations neither bloat the MCP message nor the server.
+
+Batches run in named queues, each with its own snapshot and journal, so
+concurrent clients do not overwrite each other's resume state. The queue is
+the caller's ``queue_id``, otherwise the MCP connection's session queue
+(WebSocket transport) or ``default``. Operations of concurrently running
+queues take round-robin turns on the bridge. A running queue holds a lock
+file next to its state, so stdio clients, which each start their own server
+process, cannot run the same queue at once either.
+
+Every executed operation is timed (see tools.batch_profile) into a profile
+file next to the queue state, readable as the batch://queue/{id}/profile
+resource.
 """
 
+import asyncio
+import contextvars
 import json
 import logging
+import os
+import re
+import time
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Deque, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 
-from mcp.types import Tool, TextContent
-from bridge.bridge_manager import BridgeManager
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from mcp.types import Tool
+from bridge.bridge_manager import BridgeManager, command_trace
+from services.fair_scheduler import batch_scheduler
+from tools.batch_fusion import BatchStep, fused_step_rejected, fusion_confirmed, plan_steps, split_fused_response
+from tools.batch_planner import plan_batch
+from tools.batch_profile import BatchProfiler
+from tools.batch_results import DEFAULT_RESULT_LIMIT, MAX_RESULT_LIMIT, RESULT_RETENTION_MODES, BatchResults
+from tools.compile_barrier import compile_barrier
+from tools.dry_run import validate_operations, validate_operations_file
+from tools.executor import execute_tool
+from tools.operation_stream import iter_operations_file, resolve_operations_file
+from tools.progress import current_progress
+from tools.registry import tool_registry
 
 logger = logging.getLogger(__name__)
 
-# State file to persist queue
+# State file to persist the default queue; named queues use ".batch_queue_state.<id>.json"
 STATE_FILE = Path(__file__).parent.parent.parent / ".batch_queue_state.json"
+# Progress/error events appended since the last snapshot
+JOURNAL_FILE = STATE_FILE.with_suffix(".journal.jsonl")
+DEFAULT_QUEUE_ID = "default"
+QUEUE_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+# Journal size that triggers folding it into a fresh snapshot
+JOURNAL_COMPACT_BYTES = 1024 * 1024
+# Upper bound for pipeline_depth (operations in flight at once)
+MAX_PIPELINE_DEPTH = 32
+# Timing of a step: [entered the window, sent (epoch seconds), bridge command records]
+StepTiming = List[Any]
+
+# Queue used when the caller passes no queue_id; set per MCP connection
+session_queue_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "batch_session_queue_id", default=None
+)
+
+
+def _state_paths(queue_id: str) -> Tuple[Path, Path]:
+    if queue_id == DEFAULT_QUEUE_ID:
+        return STATE_FILE, JOURNAL_FILE
+    state_file = STATE_FILE.with_name(f".batch_queue_state.{queue_id}.json")
+    return state_file, state_file.with_suffix(".journal.jsonl")
+
+
+def _lock_path(queue_id: str) -> Path:
+    return _state_paths(queue_id)[0].with_suffix(".lock")
+
+
+class QueueLock:
+    """Exclusive lock on a queue, shared by every server process of the project."""
+    
+    def __init__(self, queue_id: str):
+        self.path = _lock_path(queue_id)
+        self._file: Optional[IO[bytes]] = None
+    
+    def acquire(self) -> bool:
+        """Take the lock without waiting; returns False if another process holds it."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lock_file = open(self.path, 'a+b')
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            lock_file.close()
+            return False
+        self._file = lock_file
+        return True
+    
+    def release(self):
+        if self._file is None:
+            return
+        try:
+            if fcntl is None:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        except OSError:
+            pass
+        # Closing the file releases a flock; the file itself stays for the next run
+        self._file.close()
+        self._file = None
+
+
+def profile_path(queue_id: str) -> Path:
+    """Return the timing profile of a queue's batch; it outlives the cleared state."""
+    return _state_paths(queue_id)[0].with_suffix(".profile.jsonl")
+
+
+def profile_uri(queue_id: str) -> str:
+    if queue_id == DEFAULT_QUEUE_ID:
+        return "batch://queue/profile"
+    return f"batch://queue/{queue_id}/profile"
+
 
 class BatchQueueState:
-    """Manages the state of the batch queue."""
+    """Manages the state of one batch queue."""
     
-    def __init__(self):
+    def __init__(self, queue_id: str = DEFAULT_QUEUE_ID):
+        self.queue_id = queue_id
         self.operations: List[Dict[str, Any]] = []
+        self.operations_file: Optional[str] = None
+        self.byte_offset: int = 0
         self.current_index: int = 0
         self.last_error: Optional[str] = None
         self.last_error_index: Optional[int] = None
+        # Indices past current_index that already succeeded in a pipelined run
+        self.executed_ahead: List[int] = []
         self.started_at: Optional[str] = None
         self.last_updated: Optional[str] = None
+        self._journal: Optional[IO[str]] = None
+        self._journal_bytes: int = 0
         
     def to_dict(self) -> Dict[str, Any]:
         """Convert state to dictionary."""
-        return {
+        data = {
+            "queue_id": self.queue_id,
             "operations": self.operations,
             "current_index": self.current_index,
             "last_error": self.last_error,
             "last_error_index": self.last_error_index,
+            "executed_ahead": self.executed_ahead,
             "started_at": self.started_at,
             "last_updated": self.last_updated,
             "remaining_count": len(self.operations) - self.current_index,
             "completed_count": self.current_index,
             "total_count": len(self.operations)
         }
+        if self.operations_file:
+            # The operation count of a streamed file is unknown until it has been read
+            file_bytes = self._file_bytes()
+            data.update({
+                "operations_file": self.operations_file,
+                "byte_offset": self.byte_offset,
+                "file_bytes": file_bytes,
+                "remaining_bytes": max(file_bytes - self.byte_offset, 0),
+                "remaining_count": None,
+                "total_count": None
+            })
+        return data
+    
+    def _file_bytes(self) -> int:
+        try:
+            return os.path.getsize(self.operations_file)
+        except OSError:
+            return 0
+    
+    def has_source(self) -> bool:
+        """Return True if a batch (inline or streamed) is loaded."""
+        return bool(self.operations or self.operations_file)
+    
+    def has_remaining(self) -> bool:
+        if self.operations_file:
+            return self.next_operation() is not None
+        return self.current_index < len(self.operations)
+    
+    def next_operation(self) -> Optional[Dict[str, Any]]:
+        """Return the operation that runs next, if any."""
+        if self.operations_file:
+            try:
+                for item in iter_operations_file(Path(self.operations_file), self.byte_offset):
+                    return item.operation
+            except OSError:
+                pass
+            return None
+        if self.current_index < len(self.operations):
+            return self.operations[self.current_index]
+        return None
+    
+    def pending(self) -> Iterator[Tuple[Optional[Dict[str, Any]], Optional[str], int]]:
+        """Yield (operation, parse error, byte offset after it) from the current position."""
+        if self.operations_file:
+            for item in iter_operations_file(Path(self.operations_file), self.byte_offset):
+                yield item.operation, item.error, item.end
+            return
+        for operation in self.operations[self.current_index:]:
+            yield operation, None, 0
+    
+    @property
+    def state_file(self) -> Path:
+        return _state_paths(self.queue_id)[0]
+    
+    @property
+    def journal_file(self) -> Path:
+        return _state_paths(self.queue_id)[1]
     
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'BatchQueueState':
+    def from_dict(cls, data: Dict[str, Any], queue_id: str = DEFAULT_QUEUE_ID) -> 'BatchQueueState':
         """Create state from dictionary."""
-        state = cls()
+        state = cls(queue_id)
         state.operations = data.get("operations", [])
+        state.operations_file = data.get("operations_file")
+        state.byte_offset = data.get("byte_offset", 0)
         state.current_index = data.get("current_index", 0)
         state.last_error = data.get("last_error")
         state.last_error_index = data.get("last_error_index")
+        state.executed_ahead = data.get("executed_ahead", [])
         state.started_at = data.get("started_at")
         state.last_updated = data.get("last_updated")
         return state
     
     def save(self):
-        """Save state to file."""
+        """Write a full snapshot and truncate the journal (compaction)."""
         try:
-            STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-            with open(STATE_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
-            logger.info(f"Batch queue state saved: {self.current_index}/{len(self.operations)}")
+            state_file = self.state_file
+            state_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = state_file.with_suffix(".json.tmp")
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(self.to_dict(), f, ensure_ascii=False, separators=(",", ":"))
+            # Atomic replace: a crash leaves either the old or the new snapshot
+            os.replace(temp_file, state_file)
+            self._close_journal()
+            if self.journal_file.exists():
+                self.journal_file.unlink()
+            logger.info(f"Batch queue '{self.queue_id}' state saved: {self.current_index}/{len(self.operations)}")
         except Exception as e:
             logger.error(f"Failed to save batch queue state: {e}")
     
+    def record_progress(self):
+        """Journal that the operation before current_index has finished."""
+        self._append({"event": "progress", "current_index": self.current_index, "byte_offset": self.byte_offset})
+    
+    def record_error(self):
+        """Journal the last error."""
+        self._append({"event": "error", "last_error": self.last_error, "last_error_index": self.last_error_index})
+    
+    def _append(self, event: Dict[str, Any]):
+        self.last_updated = datetime.utcnow().isoformat()
+        event["last_updated"] = self.last_updated
+        # The batch the event belongs to; a journal left over from the previous
+        # batch (crash between snapshot replace and journal unlink) is ignored
+        event["run"] = self.started_at
+        if not self.state_file.exists():
+            # Events are only meaningful on top of a snapshot
+            self.save()
+            return
+        try:
+            if self._journal is None:
+                self._journal = open(self.journal_file, 'a', encoding='utf-8')
+                self._journal_bytes = self._journal.tell()
+            line = json.dumps(event, ensure_ascii=False, separators=(",", ":")) + "\n"
+            self._journal.write(line)
+            self._journal.flush()
+            self._journal_bytes += len(line)
+        except Exception as e:
+            logger.error(f"Failed to journal batch queue event: {e}")
+            return
+        if self._journal_bytes >= JOURNAL_COMPACT_BYTES:
+            self.save()
+    
+    def _replay(self, event: Dict[str, Any]) -> bool:
+        """Apply a journal event; returns False if it belongs to another batch."""
+        if event.get("run", self.started_at) != self.started_at:
+            return False
+        self.last_updated = event.get("last_updated", self.last_updated)
+        if event.get("event") == "progress":
+            self.current_index = event["current_index"]
+            self.byte_offset = event.get("byte_offset", self.byte_offset)
+        elif event.get("event") == "error":
+            self.last_error = event.get("last_error")
+            self.last_error_index = event.get("last_error_index")
+        return True
+    
+    def _close_journal(self):
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        self._journal_bytes = 0
+    
     @classmethod
-    def load(cls) -> 'BatchQueueState':
-        """Load state from file."""
+    def load(cls, queue_id: str = DEFAULT_QUEUE_ID) -> 'BatchQueueState':
+        """Load the snapshot and replay the journal on top of it."""
+        state_file, journal_file = _state_paths(queue_id)
         try:
-            if STATE_FILE.exists():
-                with open(STATE_FILE, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                logger.info(f"Batch queue state loaded: {data.get('current_index', 0)}/{data.get('total_count', 0)}")
-                return cls.from_dict(data)
+            if state_file.exists():
+                with open(state_file, encoding='utf-8') as f:
+                    state = cls.from_dict(json.load(f), queue_id)
+                replayed = 0
+                stale = 0
+                torn = False
+                if journal_file.exists():
+                    with open(journal_file, encoding='utf-8') as f:
+                        for line in f:
+                            try:
+                                applied = state._replay(json.loads(line))
+                            except (ValueError, KeyError):
+                                # Torn final line from a crash mid-append
+                                logger.warning("Ignoring incomplete batch queue journal entry")
+                                torn = True
+                                break
+                            if applied:
+                                replayed += 1
+                            else:
+                                stale += 1
+                if stale:
+                    logger.warning(f"Ignored {stale} batch queue journal event(s) of a previous batch")
+                # Compact even when nothing applied, so new events are not appended after a torn line
+                if replayed or stale or torn:
+                    state.save()
+                logger.info(
+                    f"Batch queue '{queue_id}' state loaded: {state.current_index}/{len(state.operations)} "
+                    f"({replayed} journal event(s) replayed)"
+                )
+                return state
         except Exception as e:
             logger.error(f"Failed to load batch queue state: {e}")
-        return cls()
+        return cls(queue_id)
     
     def clear(self):
         """Clear the state."""
         self.operations = []
+        self.operations_file = None
+        self.byte_offset = 0
         self.current_index = 0
         self.last_error = None
         self.last_error_index = None
+        self.executed_ahead = []
         self.started_at = None
         self.last_updated = None
-        if STATE_FILE.exists():
-            STATE_FILE.unlink()
-        logger.info("Batch queue state cleared")
+        self._close_journal()
+        for path in _state_paths(self.queue_id):
+            if path.exists():
+                path.unlink()
+        logger.info(f"Batch queue '{self.queue_id}' state cleared")
+
+
+# Loaded queues by id
+_queues: Dict[str, BatchQueueState] = {}
+# Queues with a batch currently executing
+_running: set = set()
+
 
+def resolve_queue_id(queue_id: Optional[str] = None) -> str:
+    """Return the queue for a call: explicit id, the connection's session queue, or the default."""
+    queue_id = queue_id or session_queue_id.get() or DEFAULT_QUEUE_ID
+    if not QUEUE_ID_PATTERN.match(queue_id):
+        raise ValueError(f"Invalid queue_id '{queue_id}'. Use 1-64 letters, digits, '_' or '-'.")
+    return queue_id
 
-# Global state instance
-_batch_state = BatchQueueState.load()
 
+def get_batch_state(queue_id: str = DEFAULT_QUEUE_ID) -> BatchQueueState:
+    """Get the state of a batch queue, loading it from disk on first use."""
+    state = _queues.get(queue_id)
+    if state is None:
+        state = BatchQueueState.load(queue_id)
+        _queues[queue_id] = state
+    return state
 
-def get_batch_state() -> BatchQueueState:
-    """Get the current batch state."""
-    return _batch_state
+
+def is_queue_running(queue_id: str) -> bool:
+    """Return True if the queue runs in this or another server process."""
+    if queue_id in _running:
+        return True
+    if not _lock_path(queue_id).exists():
+        return False
+    lock = QueueLock(queue_id)
+    if not lock.acquire():
+        return True
+    lock.release()
+    return False
+
+
+def list_queue_ids() -> List[str]:
+    """Return the default queue plus every queue that is running or has saved state."""
+    queue_ids = {DEFAULT_QUEUE_ID, *_running}
+    for path in STATE_FILE.parent.glob(".batch_queue_state.*.json"):
+        queue_id = path.name[len(".batch_queue_state."):-len(".json")]
+        if QUEUE_ID_PATTERN.match(queue_id):
+            queue_ids.add(queue_id)
+    return sorted(queue_ids)
 
 
 async def execute_batch_sequential(
     bridge_client: BridgeManager,
     operations: List[Dict[str, Any]],
     resume: bool = False,
-    stop_on_error: bool = True
+    stop_on_error: bool = True,
+    defer_compilation: bool = True,
+    operations_file: Optional[str] = None,
+    queue_id: str = DEFAULT_QUEUE_ID,
+    pipeline_depth: int = 1,
+    result_retention: Optional[str] = None,
+    result_limit: int = DEFAULT_RESULT_LIMIT,
+    fuse_operations: bool = True
 ) -> Dict[str, Any]:
     """
     Execute operations sequentially with resume capability.
@@ -116,118 +441,441 @@ async def execute_batch_sequential(
                    - arguments: Tool arguments as dict
         resume: If True, resume from previous error point. If False, start fresh.
         stop_on_error: If True, stop on first error. If False, continue (not recommended for sequential).
+        defer_compilation: If True, C# script writes are compiled once when the batch ends.
+        operations_file: Resolved JSONL file to stream operations from instead of ``operations``.
+        queue_id: Queue whose saved state is used and updated.
+        pipeline_depth: Operations kept in flight at once. Results are still
+                        processed in order; 1 waits for each result before sending the next.
+        result_retention: Results kept in the response ("all", "last", "errors" or "summary").
+                          Defaults to "last" for streamed batches and "all" otherwise; every
+                          mode but "all" spills all results to a file.
+        result_limit: Results/errors kept by the "last" and "errors" modes.
+        fuse_operations: If True, runs of adjacent identical component/GameObject operations
+                         are sent as one bulk operation (see tools.batch_fusion).
     
     Returns:
         Dict with execution results and status
     """
-    global _batch_state
+    if queue_id in _running:
+        return {
+            "success": False,
+            "queue_id": queue_id,
+            "error": f"Batch queue '{queue_id}' is already running. Use another queue_id or wait for it to finish."
+        }
+    
+    lock = QueueLock(queue_id)
+    if not lock.acquire():
+        return {
+            "success": False,
+            "queue_id": queue_id,
+            "error": f"Batch queue '{queue_id}' is running in another MCP server process. Use another queue_id or wait for it to finish."
+        }
     
+    # Another process may have run or cleared the queue since it was loaded here
+    cached = _queues.pop(queue_id, None)
+    if cached is not None:
+        cached._close_journal()
+    state = get_batch_state(queue_id)
+    _running.add(queue_id)
+    try:
+        if not defer_compilation:
+            return await _execute_operations(
+                bridge_client, state, operations, resume, stop_on_error, operations_file, pipeline_depth,
+                result_retention, result_limit, fuse_operations
+            )
+        
+        async with compile_barrier.scope("batch_sequential"):
+            return await _execute_operations(
+                bridge_client, state, operations, resume, stop_on_error, operations_file, pipeline_depth,
+                result_retention, result_limit, fuse_operations
+            )
+    finally:
+        _running.discard(queue_id)
+        lock.release()
+        if queue_id != DEFAULT_QUEUE_ID and not state.has_source():
+            # Finished named queues have no state left to keep in memory
+            _queues.pop(queue_id, None)
+
+
+async def _send_operation(
+    bridge_client: BridgeManager,
+    tool_name: str,
+    arguments: Dict[str, Any],
+    batching: bool = True
+) -> Any:
+    spec = tool_registry.get(tool_name)
+    if spec is not None and (spec.bridge_command or spec.handler is not None):
+        # Registered tools keep their hooks (e.g. the compile barrier) and
+        # server-side handlers (e.g. the barrier flush inserted by the planner)
+        return await execute_tool(spec, arguments, batching=batching)
+    return await bridge_client.send_command(tool_name, arguments)
+
+
+def _can_pipeline(tool_name: str) -> bool:
+    """Return True if the operation may be sent while earlier ones are still in flight."""
+    spec = tool_registry.get(tool_name)
+    if spec is None:
+        return True
+    # Custom handlers may await before sending and post hooks (e.g. waiting for
+    # a script compile) must see Unity settle, so those operations run alone
+    return spec.handler is None and not spec.post_hooks
+
+
+async def _execute_operations(
+    bridge_client: BridgeManager,
+    state: BatchQueueState,
+    operations: List[Dict[str, Any]],
+    resume: bool,
+    stop_on_error: bool,
+    operations_file: Optional[str] = None,
+    pipeline_depth: int = 1,
+    result_retention: Optional[str] = None,
+    result_limit: int = DEFAULT_RESULT_LIMIT,
+    fuse_operations: bool = True
+) -> Dict[str, Any]:
     current_time = datetime.utcnow().isoformat()
     
     # Initialize or resume
-    if not resume or not _batch_state.operations:
+    fresh = not resume or not state.has_source()
+    if fresh:
         # Start fresh
-        _batch_state.operations = operations
-        _batch_state.current_index = 0
-        _batch_state.last_error = None
-        _batch_state.last_error_index = None
-        _batch_state.started_at = current_time
-        logger.info(f"Starting new batch execution with {len(operations)} operations")
+        state.operations = [] if operations_file else operations
+        state.operations_file = operations_file
+        state.byte_offset = 0
+        state.current_index = 0
+        state.last_error = None
+        state.last_error_index = None
+        state.executed_ahead = []
+        state.started_at = current_time
+        if operations_file:
+            logger.info(f"Starting new batch execution in queue '{state.queue_id}' streamed from {operations_file}")
+        else:
+            logger.info(f"Starting new batch execution in queue '{state.queue_id}' with {len(operations)} operations")
+    elif state.operations_file:
+        logger.info(f"Resuming queue '{state.queue_id}' from byte {state.byte_offset} of {state.operations_file}")
     else:
         # Resume from saved state
-        logger.info(f"Resuming batch execution from operation {_batch_state.current_index}/{len(_batch_state.operations)}")
+        logger.info(f"Resuming queue '{state.queue_id}' from operation {state.current_index}/{len(state.operations)}")
     
-    _batch_state.last_updated = current_time
-    _batch_state.save()
+    state.last_updated = current_time
+    state.save()
     
-    results = []
-    errors = []
+    streamed = state.operations_file is not None
+    # Streamed batches only keep the most recent results unless asked otherwise
+    retained = BatchResults(state.queue_id, result_retention or ("last" if streamed else "all"), result_limit)
+    progress = current_progress()
+    if streamed:
+        total = state.to_dict()["file_bytes"]
+    else:
+        total = len(state.operations)
+    # Operations a previous pipelined run already executed past its failure
+    executed_ahead = {idx for idx in state.executed_ahead if idx >= state.current_index}
+    # A fresh batch starts a new timing profile; a resumed one appends to it
+    profiler = BatchProfiler(profile_path(state.queue_id), fresh, state.queue_id, pipeline_depth)
     
-    # Execute operations sequentially
-    while _batch_state.current_index < len(_batch_state.operations):
-        idx = _batch_state.current_index
-        operation = _batch_state.operations[idx]
-        
-        tool_name = operation.get("tool")
-        arguments = operation.get("arguments", {})
-        
-        logger.info(f"Executing operation {idx + 1}/{len(_batch_state.operations)}: {tool_name}")
+    # Steps in send order, each with its in-flight task (None until it is next)
+    # and its timing: when it entered the window and its bridge command records
+    window: Deque[Tuple[BatchStep, Optional[asyncio.Future], StepTiming]] = deque()
+    fused_steps = 0
+    fused_operations = 0
+    
+    def fail(idx: int, tool_name: Optional[str], error_msg: str, exception: bool = False,
+             outcome_unknown: bool = False):
+        error = {"index": idx, "tool": tool_name, "error": error_msg}
+        if exception:
+            error["exception"] = True
+        if outcome_unknown:
+            error["outcome_unknown"] = True
+        retained.add_error(error)
+        state.last_error = error_msg
+        state.last_error_index = idx
+        state.record_error()
+    
+    def advance(next_offset: int):
+        state.current_index += 1
+        state.byte_offset = next_offset
+        state.record_progress()
+    
+    async def stopped(idx: int, reason: str, error_msg: str) -> Dict[str, Any]:
+        # Operations sent after the failed one cannot be recalled from Unity, so
+        # wait for them and remember the ones that succeeded: resume skips those
+        # and re-runs everything else from the failed operation on
+        executed_after_stop = []
+        while window:
+            step, task, timing = window.popleft()
+            if task is None:
+                continue
+            unknown = False
+            try:
+                response = await task
+                responses = [response]
+                if step.fused:
+                    # Rejected fused steps changed nothing
+                    responses = split_fused_response(step, response, stop_on_error) or []
+                outcomes = [
+                    (item, None if item.get("success") else item.get("error", "Unknown error"))
+                    for item in responses
+                ]
+            except Exception as e:
+                unknown = step.fused and not fused_step_rejected(step, e)
+                outcomes = [(None, str(e))] * len(step.operations)
+            for offset, (_, error) in enumerate(outcomes):
+                profile(step, offset, timing, error is None)
+                if error is None:
+                    executed_ahead.add(step.index + offset)
+                executed = {
+                    "index": step.index + offset,
+                    "tool": step.tool,
+                    "success": error is None,
+                    "error": error
+                }
+                if unknown:
+                    # Resume sends these again; Unity may have applied some of them
+                    executed["outcome_unknown"] = True
+                executed_after_stop.append(executed)
+        state.executed_ahead = sorted(executed_ahead)
+        state.save()
         
-        try:
-            # Send operation to Unity bridge
-            response = await bridge_client.send_command(tool_name, arguments)
+        result = {
+            "success": False,
+            "queue_id": state.queue_id,
+            "stopped_at_index": idx,
+            **retained.to_response(),
+            "message": f"Execution stopped at operation {idx + 1} due to {reason}. "
+                       f"Use resume=true with queue_id='{state.queue_id}' to continue.",
+            "last_error": error_msg
+        }
+        if executed_after_stop:
+            result["executed_after_stop"] = executed_after_stop
+        result["profile_uri"] = profile_uri(state.queue_id)
+        if fused_steps:
+            result["fusion"] = fusion_report()
+        if streamed:
+            result["stopped_at_byte"] = state.byte_offset
+        else:
+            result["remaining_operations"] = len(state.operations) - state.current_index
+        return result
+    
+    def fusion_report() -> Dict[str, Any]:
+        return {
+            "fused_steps": fused_steps,
+            "operations_fused": fused_operations,
+            "round_trips_saved": fused_operations - fused_steps
+        }
+    
+    def profile(step: BatchStep, offset: int, timing: StepTiming, success: bool):
+        enqueued_at, started_at, commands = timing
+        fused = len(step.operations) if step.fused else 1
+        profiler.record(
+            step.index + offset, step.operations[offset], enqueued_at, started_at, commands, success,
+            fused, step.index
+        )
+    
+    def runs_alone(entry: Tuple[BatchStep, Optional[asyncio.Future], StepTiming]) -> bool:
+        step, task, _ = entry
+        return task is None and step.error is None and not step.skipped
+    
+    async def send(step: BatchStep, timing: StepTiming) -> Any:
+        tool_name, arguments = step.request(stop_on_error)
+        # Concurrent queues take turns on the bridge one round trip at a time
+        async with batch_scheduler.turn(state.queue_id):
+            timing[1] = time.time()
+            token = command_trace.set(timing[2])
+            try:
+                return await _send_operation(bridge_client, tool_name, arguments, batching=not step.fused)
+            finally:
+                command_trace.reset(token)
+    
+    async def send_single(operation: Dict[str, Any], timing: StepTiming) -> Any:
+        async with batch_scheduler.turn(state.queue_id):
+            timing[1] = time.time()
+            token = command_trace.set(timing[2])
+            try:
+                return await _send_operation(bridge_client, operation.get("tool"), operation.get("arguments", {}))
+            finally:
+                command_trace.reset(token)
+    
+    steps = plan_steps(state.pending(), state.current_index, executed_ahead, fuse_operations)
+    exhausted = False
+    
+    try:
+        while True:
+            # Keep up to pipeline_depth steps in flight; a step that cannot be
+            # pipelined waits at the end of the window until it is next
+            while not exhausted and len(window) < pipeline_depth and not (window and runs_alone(window[-1])):
+                step = next(steps, None)
+                if step is None:
+                    exhausted = True
+                    break
+                task = None
+                now = time.time()
+                timing: StepTiming = [now, now, []]
+                if (step.error is None and not step.skipped and pipeline_depth > 1 and _can_pipeline(step.tool)
+                        and (not step.fused or fusion_confirmed())):
+                    tool_name, arguments = step.request(stop_on_error)
+                    # Concurrent queues take turns sending; the task reaches the
+                    # bridge's send lock before the turn ends, so order is kept
+                    async with batch_scheduler.turn(state.queue_id):
+                        timing[1] = time.time()
+                        # The task copies the context, so its commands are recorded in the timing
+                        token = command_trace.set(timing[2])
+                        try:
+                            task = asyncio.ensure_future(
+                                _send_operation(bridge_client, tool_name, arguments, batching=False)
+                            )
+                        finally:
+                            command_trace.reset(token)
+                        await asyncio.sleep(0)
+                window.append((step, task, timing))
             
-            if response.get("success"):
-                results.append({
-                    "index": idx,
-                    "tool": tool_name,
-                    "success": True,
-                    "result": response.get("result")
-                })
-                logger.info(f"Operation {idx + 1} completed successfully")
-            else:
-                # Operation failed
-                error_msg = response.get("error", "Unknown error")
-                errors.append({
-                    "index": idx,
-                    "tool": tool_name,
-                    "error": error_msg
-                })
-                _batch_state.last_error = error_msg
-                _batch_state.last_error_index = idx
-                logger.error(f"Operation {idx + 1} failed: {error_msg}")
-                
+            if not window:
+                break
+            step, task, timing = window.popleft()
+            idx = step.index
+            
+            if step.error is not None:
+                # A malformed line in a streamed file fails like an operation
+                fail(idx, None, step.error)
+                logger.error(f"Operation {idx + 1} is invalid: {step.error}")
                 if stop_on_error:
-                    _batch_state.save()
-                    return {
-                        "success": False,
-                        "stopped_at_index": idx,
-                        "completed": results,
-                        "errors": errors,
-                        "remaining_operations": len(_batch_state.operations) - _batch_state.current_index,
-                        "message": f"Execution stopped at operation {idx + 1} due to error. Use resume=true to continue.",
-                        "last_error": error_msg
-                    }
-        
-        except Exception as e:
-            error_msg = str(e)
-            errors.append({
-                "index": idx,
-                "tool": tool_name,
-                "error": error_msg,
-                "exception": True
-            })
-            _batch_state.last_error = error_msg
-            _batch_state.last_error_index = idx
-            logger.exception(f"Exception in operation {idx + 1}")
+                    return await stopped(idx, "an invalid line", step.error)
+                advance(step.offsets[0])
+                continue
             
-            if stop_on_error:
-                _batch_state.save()
-                return {
-                    "success": False,
-                    "stopped_at_index": idx,
-                    "completed": results,
-                    "errors": errors,
-                    "remaining_operations": len(_batch_state.operations) - _batch_state.current_index,
-                    "message": f"Execution stopped at operation {idx + 1} due to exception. Use resume=true to continue.",
-                    "last_error": error_msg
-                }
-        
-        # Move to next operation
-        _batch_state.current_index += 1
-        _batch_state.save()
+            tool_name = step.tool
+            
+            if step.skipped:
+                # Sent and succeeded before the previous run stopped
+                executed_ahead.discard(idx)
+                retained.add_completed({"index": idx, "tool": tool_name, "success": True, "skipped": "already executed"})
+                logger.info(f"Operation {idx + 1} already executed before the batch stopped; skipping")
+                advance(step.offsets[0])
+                continue
+            
+            count = len(step.operations)
+            label = f"{idx + 1}" if count == 1 else f"{idx + 1}-{idx + count} (fused into {step.bulk_operation})"
+            if streamed:
+                logger.debug(f"Executing operation {label} (byte {state.byte_offset}): {tool_name}")
+                if progress:
+                    progress.report(state.byte_offset, total, f"Executing operation {label}: {tool_name}")
+            else:
+                logger.info(f"Executing operation {label}/{len(state.operations)}: {tool_name}")
+                if progress:
+                    progress.report(idx, total, f"Executing operation {label}/{total}: {tool_name}")
+            
+            # One response per operation of the step; None sends them one by one
+            responses: Optional[List[Any]] = None
+            send_error: Optional[Exception] = None
+            try:
+                response = await task if task is not None else await send(step, timing)
+                if not step.fused:
+                    responses = [response]
+                else:
+                    responses = split_fused_response(step, response, stop_on_error)
+                    if responses is not None:
+                        fused_steps += 1
+                        fused_operations += count
+            except Exception as e:
+                if not step.fused or not fused_step_rejected(step, e):
+                    send_error = e
+            
+            if send_error is not None and step.fused:
+                # Unity may have applied any part of the run before the send
+                # failed, so failing the operations (or, on resume, sending
+                # them again) could duplicate their effects: stop here
+                for offset in range(count):
+                    profile(step, offset, timing, False)
+                error_msg = (
+                    f"Outcome of fused operations {idx + 1}-{idx + count} is unknown "
+                    f"({send_error}); Unity may have applied some of them"
+                )
+                fail(idx, tool_name, error_msg, exception=True, outcome_unknown=True)
+                logger.error(error_msg)
+                result = await stopped(idx, "a fused step with unknown outcome", error_msg)
+                result["outcome_unknown"] = list(range(idx, idx + count))
+                result["message"] += (
+                    f" Check the results of operations {idx + 1}-{idx + count} in Unity first:"
+                    " resume sends them again."
+                )
+                return result
+            
+            for offset, operation in enumerate(step.operations):
+                idx = step.index + offset
+                next_offset = step.offsets[offset]
+                try:
+                    if send_error is not None:
+                        raise send_error
+                    if responses is not None:
+                        response = responses[offset]
+                        profile(step, offset, timing, bool(response.get("success")))
+                    else:
+                        # Sent on its own after the bridge rejected the fused step
+                        single: StepTiming = [time.time(), 0.0, []]
+                        response = await send_single(operation, single)
+                        profiler.record(idx, operation, single[0], single[1], single[2], bool(response.get("success")))
+                    
+                    if response.get("success"):
+                        completed = {
+                            "index": idx,
+                            "tool": tool_name,
+                            "success": True,
+                            "result": response.get("result")
+                        }
+                        if "compilation" in response:
+                            completed["compilation"] = response["compilation"]
+                        retained.add_completed(completed)
+                        logger.info(f"Operation {idx + 1} completed successfully")
+                        if progress:
+                            if streamed:
+                                progress.report(next_offset, total, f"Operation {idx + 1} completed: {tool_name}")
+                            else:
+                                progress.report(idx + 1, total, f"Operation {idx + 1}/{total} completed: {tool_name}")
+                    else:
+                        # Operation failed
+                        error_msg = response.get("error", "Unknown error")
+                        fail(idx, tool_name, error_msg)
+                        logger.error(f"Operation {idx + 1} failed: {error_msg}")
+                        
+                        if stop_on_error:
+                            return await stopped(idx, "error", error_msg)
+                
+                except Exception as e:
+                    if send_error is not None:
+                        profile(step, offset, timing, False)
+                    error_msg = str(e)
+                    fail(idx, tool_name, error_msg, exception=True)
+                    logger.exception(f"Exception in operation {idx + 1}")
+                    
+                    if stop_on_error:
+                        return await stopped(idx, "exception", error_msg)
+                
+                # Move to next operation
+                advance(next_offset)
+    finally:
+        retained.close()
+        profiler.close()
+        # Only reached with tasks left when the batch itself was cancelled
+        for _, task in window:
+            if task is not None:
+                task.cancel()
     
     # All operations completed
-    _batch_state.clear()
-    
-    return {
-        "success": len(errors) == 0,
-        "completed": results,
-        "errors": errors,
-        "total_operations": len(operations),
-        "message": f"All {len(operations)} operations completed successfully." if len(errors) == 0 
-                  else f"Completed with {len(errors)} error(s)."
+    total_operations = state.current_index
+    state.clear()
+    
+    error_count = retained.error_count
+    result = {
+        "success": error_count == 0,
+        "queue_id": state.queue_id,
+        **retained.to_response(),
+        "total_operations": total_operations,
+        "message": f"All {total_operations} operations completed successfully." if error_count == 0
+                  else f"Completed with {error_count} error(s).",
+        "profile_uri": profile_uri(state.queue_id)
     }
+    if fused_steps:
+        result["fusion"] = fusion_report()
+    return result
 
 
 # Tool definition
@@ -241,7 +889,16 @@ Key features:
 - Sequential execution (one operation at a time)
 - Stops on first error
 - Saves remaining operations for resume
-- Check remaining operations via unity_batch_queue_status resource
+- Check remaining operations via the batch://queue/status (default queue) or batch://queue/{queue_id}/status resource
+- Named queues (queue_id) keep separate resume state; concurrent queues interleave fairly on the bridge
+- C# script writes are compiled once at the end of the batch (see defer_compilation)
+- Optional pre-flight check of all references before the first operation runs (see preflight)
+- Huge batches can be streamed from a JSONL file under the project root (see operations_file)
+- Optional pipelining keeps several operations in flight to hide round-trip latency (see pipeline_depth)
+- Runs of adjacent identical component/GameObject operations are fused into one round trip (see fuse_operations)
+- Optional planner groups script writes and asset imports into as few compilations/refreshes as dependencies allow (see plan_operations)
+- Bounded responses for long batches: keep only the last results, errors or a summary and page through the full results via batch://results/{run_id} (see result_retention)
+- Per-operation timing profile (send/Unity/completion times, payload sizes) aggregated by tool/operation with the slowest operations, or as a Chrome trace, via the profile_uri resource
 
 Use cases:
 - Multi-step scene setup that might fail midway
@@ -269,6 +926,14 @@ Use cases:
                     "required": ["tool", "arguments"]
                 }
             },
+            "operations_file": {
+                "type": "string",
+                "description": "Path (relative to the Unity project root) of a JSONL file with one {\"tool\", \"arguments\"} operation per line. Used instead of 'operations' for very large batches: the file is streamed line by line, progress is tracked by byte offset and only the last results are returned."
+            },
+            "queue_id": {
+                "type": "string",
+                "description": "Name of the batch queue (letters, digits, '_' or '-'). Each queue keeps its own resume state, so concurrent clients or agents should use different queues. Defaults to the connection's session queue on WebSocket, otherwise 'default'. Pass the same queue_id with resume=true."
+            },
             "resume": {
                 "type": "boolean",
                 "description": "If true, resume from previous failure point. If false, start fresh (clears saved queue).",
@@ -278,6 +943,45 @@ Use cases:
                 "type": "boolean",
                 "description": "If true, stop on first error. If false, continue (not recommended for sequential workflows).",
                 "default": True
+            },
+            "preflight": {
+                "type": "boolean",
+                "description": "If true, validate GameObject paths, component types and asset paths of all operations against the cached scene state first and execute nothing if any reference is definitely wrong. GameObjects missing from a cache older than the last write, or with several scenes loaded, are only warnings.",
+                "default": False
+            },
+            "pipeline_depth": {
+                "type": "integer",
+                "description": "Number of operations sent ahead without waiting for earlier results (1 = wait for each result). Unity runs them in order and results are processed in order. With stop_on_error, operations already sent after a failure still run in Unity; they are reported in 'executed_after_stop' and skipped on resume if they succeeded. Script operations that wait for compilation are never pipelined.",
+                "default": 1,
+                "minimum": 1,
+                "maximum": MAX_PIPELINE_DEPTH
+            },
+            "result_retention": {
+                "type": "string",
+                "enum": list(RESULT_RETENTION_MODES),
+                "description": "Which results the response keeps: 'all', the 'last' result_limit results and errors, the last result_limit 'errors' only, or a 'summary' of counts. Every mode except 'all' writes every result to a file readable as the batch://results/{run_id} resource (returned as results_uri). Defaults to 'last' for operations_file and 'all' otherwise."
+            },
+            "result_limit": {
+                "type": "integer",
+                "description": "Number of results/errors kept by the 'last' and 'errors' retention modes.",
+                "default": DEFAULT_RESULT_LIMIT,
+                "minimum": 1,
+                "maximum": MAX_RESULT_LIMIT
+            },
+            "fuse_operations": {
+                "type": "boolean",
+                "description": "If true, runs of adjacent operations with the same tool and operation (unity_component_crud add/remove/update/inspect, unity_gameobject_crud delete/inspect) are sent to Unity as one bulk operation. Results, errors and resume indices still refer to the original operations; the response's 'fusion' block reports the round trips saved. If a fused step fails without per-operation results (e.g. a timeout), Unity may have applied part of it: the batch stops even with stop_on_error=false and lists those operations in 'outcome_unknown'.",
+                "default": True
+            },
+            "plan_operations": {
+                "type": "boolean",
+                "description": "If true, reorder the operations so C# script writes and other unity_asset_crud writes share as few refreshes/compilations as possible: dependencies between operations (GameObjects, asset paths, component/ScriptableObject types) keep their order, writes are grouped with the refresh deferred and a unity_compile_barrier 'flush' operation is inserted before the first operation that needs them. The response's 'plan' block maps planned to original indices ('order') and estimates the time saved. Not available with operations_file.",
+                "default": False
+            },
+            "defer_compilation": {
+                "type": "boolean",
+                "description": "If true, C# script writes return immediately and one compilation is awaited when the batch ends. Set to false when a later operation needs the compiled type.",
+                "default": True
             }
         },
         "required": []
@@ -285,32 +989,111 @@ Use cases:
 )
 
 
-async def handle_batch_sequential(arguments: Dict[str, Any], bridge_client: BridgeManager) -> List[TextContent]:
-    """Handle the unity_batch_sequential_execute tool call."""
+async def run_batch_sequential(arguments: Dict[str, Any], bridge_client: BridgeManager) -> Dict[str, Any]:
+    """Validate the tool arguments and run the batch, returning the raw result."""
     operations = arguments.get("operations", [])
+    operations_file = arguments.get("operations_file")
     resume = arguments.get("resume", False)
+    try:
+        queue_id = resolve_queue_id(arguments.get("queue_id"))
+    except ValueError as e:
+        return {"success": False, "error": str(e)}
     stop_on_error = arguments.get("stop_on_error", True)
+    defer_compilation = arguments.get("defer_compilation", True)
+    preflight = arguments.get("preflight", False)
+    fuse_operations = arguments.get("fuse_operations", True)
+    plan_operations = arguments.get("plan_operations", False)
+    pipeline_depth = arguments.get("pipeline_depth", 1)
+    if isinstance(pipeline_depth, bool) or not isinstance(pipeline_depth, int) \
+            or not 1 <= pipeline_depth <= MAX_PIPELINE_DEPTH:
+        return {
+            "success": False,
+            "error": f"pipeline_depth must be an integer between 1 and {MAX_PIPELINE_DEPTH}."
+        }
+    result_retention = arguments.get("result_retention")
+    if result_retention is not None and result_retention not in RESULT_RETENTION_MODES:
+        return {
+            "success": False,
+            "error": f"result_retention must be one of: {', '.join(RESULT_RETENTION_MODES)}."
+        }
+    result_limit = arguments.get("result_limit", DEFAULT_RESULT_LIMIT)
+    if isinstance(result_limit, bool) or not isinstance(result_limit, int) \
+            or not 1 <= result_limit <= MAX_RESULT_LIMIT:
+        return {
+            "success": False,
+            "error": f"result_limit must be an integer between 1 and {MAX_RESULT_LIMIT}."
+        }
     
     # Validate operations
-    if not resume and not operations:
-        return [TextContent(
-            type="text",
-            text=json.dumps({
+    if operations and operations_file:
+        return {
+            "success": False,
+            "error": "Specify either 'operations' or 'operations_file', not both."
+        }
+    
+    if not resume and not operations and not operations_file:
+        return {
+            "success": False,
+            "error": "No operations provided. Specify 'operations' array, 'operations_file' or set 'resume' to true."
+        }
+    
+    # resume=true on a queue without a saved batch starts the given one
+    starts_fresh = not resume or not get_batch_state(queue_id).has_source()
+    if starts_fresh and not operations and not operations_file:
+        return {
+            "success": False,
+            "queue_id": queue_id,
+            "error": f"Batch queue '{queue_id}' has no saved batch to resume. Specify 'operations' or 'operations_file'."
+        }
+    
+    plan = None
+    if plan_operations and starts_fresh:
+        if operations_file:
+            return {
+                "success": False,
+                "error": "plan_operations needs the whole batch up front; it cannot be used with 'operations_file'."
+            }
+        operations, plan = plan_batch(operations, defer_compilation)
+        # The inserted flush operations need the batch's compile barrier
+        defer_compilation = True
+    
+    resolved_file = None
+    if operations_file and starts_fresh:
+        try:
+            resolved_file = str(resolve_operations_file(operations_file))
+        except ValueError as e:
+            return {"success": False, "error": str(e)}
+    
+    # Check every reference locally before the first round trip
+    if preflight and starts_fresh:
+        if resolved_file:
+            report = validate_operations_file(Path(resolved_file))
+        else:
+            report = validate_operations(operations)
+        if not report["valid"]:
+            return {
                 "success": False,
-                "error": "No operations provided. Specify 'operations' array or set 'resume' to true."
-            }, indent=2)
-        )]
+                "error": f"Pre-flight validation found {report['errorCount']} error(s)",
+                "message": f"Pre-flight validation found {report['errorCount']} error(s); no operation was executed. "
+                           "Fix the listed problems or set preflight=false if the cached scene state is stale.",
+                "preflight": report
+            }
     
     # Execute batch
     result = await execute_batch_sequential(
         bridge_client=bridge_client,
         operations=operations,
         resume=resume,
-        stop_on_error=stop_on_error
+        stop_on_error=stop_on_error,
+        defer_compilation=defer_compilation,
+        operations_file=resolved_file,
+        queue_id=queue_id,
+        pipeline_depth=pipeline_depth,
+        result_retention=result_retention,
+        result_limit=result_limit,
+        fuse_operations=fuse_operations
     )
-    
-    return [TextContent(
-        type="text",
-        text=json.dumps(result, indent=2, ensure_ascii=False)
-    )]
+    if plan is not None:
+        result["plan"] = plan
+    return result
 
@@ -0,0 +1,268 @@
+"""
+Built-in Unity-AI-Forge tool table.
+
+Maps every MCP tool to the Unity bridge command it forwards to, its schema
+factory and any handler hooks.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from bridge.bridge_manager import bridge_manager
+from logger import logger
+from tools import schemas
+from tools.batch_dag import TOOL as batch_dag_tool
+from tools.batch_dag import run_batch_dag
+from tools.batch_sequential import TOOL as batch_sequential_tool
+from tools.batch_sequential import run_batch_sequential
+from tools.compile_barrier import (
+    compile_barrier,
+    handle_compile_barrier,
+    is_script_write,
+    wait_for_compilation,
+)
+from tools.dry_run import (
+    validate_asset,
+    validate_batch_arguments,
+    validate_component,
+    validate_game_object,
+)
+from tools.executor import ensure_bridge_connected
+from tools.registry import ToolRegistry, ToolSpec
+
+
+async def _handle_ping(arguments: dict[str, Any]) -> dict[str, Any]:
+    ensure_bridge_connected()
+    heartbeat = bridge_manager.get_last_heartbeat()
+    bridge_response = await bridge_manager.send_command("pingUnityEditor", {})
+    return {
+        "connected": True,
+        "lastHeartbeatAt": heartbeat,
+        "bridgeResponse": bridge_response,
+    }
+
+
+async def _handle_batch_sequential(arguments: dict[str, Any]) -> dict[str, Any]:
+    # Batch execution drives the bridge itself, one operation at a time
+    return await run_batch_sequential(arguments, bridge_manager)
+
+
+async def _await_script_compilation(arguments: dict[str, Any], response: Any) -> Any:
+    """Wait for Unity to recompile after a C# script was written and attach the result."""
+    if not is_script_write(arguments):
+        return response
+
+    deferred = compile_barrier.defer(arguments, response)
+    if deferred is not None:
+        return deferred
+
+    logger.info(
+        "C# script %s operation '%s' detected - waiting for compilation to complete...",
+        arguments.get("assetPath"),
+        arguments.get("operation"),
+    )
+
+    try:
+        # Wait for compilation with extended timeout (60 seconds)
+        compilation_result = await wait_for_compilation(timeout_seconds=60)
+    except TimeoutError as exc:
+        logger.warning("Compilation wait timed out: %s", exc)
+        # Don't fail the operation, just log the timeout
+        return response
+    except Exception as exc:
+        logger.warning("Error while waiting for compilation: %s", exc)
+        # Don't fail the operation, just log the error
+        return response
+
+    logger.info(
+        "Compilation completed: success=%s, errors=%s, elapsed=%ss",
+        compilation_result.get("success"),
+        compilation_result.get("errorCount", 0),
+        compilation_result.get("elapsedSeconds", 0),
+    )
+
+    if isinstance(response, dict):
+        return {**response, "compilation": compilation_result}
+    return {"result": response, "compilation": compilation_result}
+
+
+BUILTIN_TOOLS: tuple[ToolSpec, ...] = (
+    ToolSpec(
+        name="unity_ping",
+        description="Verify bridge connectivity and return the latest heartbeat information.",
+        schema_factory=schemas.ping_schema,
+        handler=_handle_ping,
+        read_only=True,
+    ),
+    ToolSpec(
+        name=batch_sequential_tool.name,
+        description=batch_sequential_tool.description or "",
+        schema_factory=lambda: batch_sequential_tool.inputSchema,
+        handler=_handle_batch_sequential,
+        validator=validate_batch_arguments,
+    ),
+    ToolSpec(
+        name=batch_dag_tool.name,
+        description=batch_dag_tool.description or "",
+        schema_factory=lambda: batch_dag_tool.inputSchema,
+        handler=run_batch_dag,
+        validator=validate_batch_arguments,
+    ),
+    ToolSpec(
+        name="unity_compile_barrier",
+        description="Coalesce C# script compilation across several unity_asset_crud calls. 'begin' opens a barrier: .cs create/update/delete operations are written without refreshing the AssetDatabase and return immediately. 'end' refreshes once, waits for a single compilation and returns its result (also attached to every deferred write). 'flush' does the same but keeps the barrier open. 'status' reports pending writes. A barrier only affects the session that opened it and is ended automatically when that client disconnects or after MCP_COMPILE_BARRIER_TTL_SECONDS (default 600). Batch tools apply a barrier automatically.",
+        schema_factory=schemas.compile_barrier_schema,
+        handler=handle_compile_barrier,
+    ),
+    ToolSpec(
+        name="unity_scene_crud",
+        description="Comprehensive Unity scene management: create/load/save/delete/duplicate scenes, inspect scene hierarchy with optional component filtering, manage build settings (add/remove/reorder scenes). Use 'inspect' operation with 'includeHierarchy=true' to get scene context before making changes. Supports additive scene loading and build configuration operations.",
+        schema_factory=schemas.scene_manage_schema,
+        bridge_command="sceneManage",
+        paged_operations={"inspect": "hierarchy", "listBuildSettings": "scenes"},
+    ),
+    ToolSpec(
+        name="unity_gameobject_crud",
+        description="Full GameObject lifecycle management: create (with templates like Cube/Sphere/Player/Enemy), delete, move (reparent), rename, duplicate, update (tag/layer/active/static), inspect (with optional component details), and batch operations (findMultiple/deleteMultiple/inspectMultiple with pattern matching). Use templates for fastest creation with proper components. Supports regex pattern matching for batch operations.",
+        schema_factory=schemas.game_object_manage_schema,
+        bridge_command="gameObjectManage",
+        paged_operations={"findMultiple": "results", "inspectMultiple": "results"},
+        batched_operations={"inspect": "inspectMultiple"},
+        validator=validate_game_object,
+    ),
+    ToolSpec(
+        name="unity_component_crud",
+        description="Complete component management with batch operations: add/remove/update/inspect components on GameObjects. Update supports complex property changes including nested objects and asset references. Inspect supports fast existence checks (includeProperties=false, 10x faster) and property filtering for specific fields. Batch operations (addMultiple/removeMultiple/updateMultiple/inspectMultiple) support pattern matching with maxResults safety limits. Essential for configuring GameObject behavior.",
+        schema_factory=schemas.component_manage_schema,
+        bridge_command="componentManage",
+        paged_operations={"inspectMultiple": "results"},
+        batched_operations={"inspect": "inspectMultiple"},
+        coalesced_operations=frozenset({"update"}),
+        validator=validate_component,
+    ),
+    ToolSpec(
+        name="unity_asset_crud",
+        description="Comprehensive asset file management under Assets/ folder: create (any file type including C# scripts, JSON, text), update (modify file contents), delete, rename, duplicate, inspect (view properties and content), updateImporter (modify asset import settings), and batch operations (findMultiple/deleteMultiple/inspectMultiple with pattern matching). Essential for managing scripts, textures, audio, data files, and all Unity assets. Use with unity_script_template_generate for creating properly structured C# scripts.",
+        schema_factory=schemas.asset_manage_schema,
+        bridge_command="assetManage",
+        paged_operations={"findMultiple": "results", "inspectMultiple": "results"},
+        pre_hooks=(compile_barrier.prepare_arguments,),
+        post_hooks=(_await_script_compilation,),
+        validator=validate_asset,
+    ),
+    ToolSpec(
+        name="unity_scriptableObject_crud",
+        description="ScriptableObject asset management: create new instances from type name, inspect/update properties, delete, duplicate, list all instances, or find by type. ScriptableObjects are Unity's data container assets perfect for game configuration (stats, settings, levels). Use 'create' to instantiate from existing type, 'update' to modify properties, 'list' to see all instances, 'findByType' to search by class name. Supports property filtering and batch operations.",
+        schema_factory=schemas.scriptable_object_manage_schema,
+        bridge_command="scriptableObjectManage",
+        paged_operations={"list": "results", "findByType": "results"},
+    ),
+    ToolSpec(
+        name="unity_prefab_crud",
+        description="Complete prefab workflow management: create prefabs from scene GameObjects, update existing prefabs, inspect prefab contents and overrides, instantiate prefabs into scenes with custom position/rotation, unpack prefab instances (completely or outermost only), apply instance overrides back to prefab, or revert instance changes. Essential for creating reusable game objects (enemies, pickups, UI elements, buildings). Use 'create' to save GameObjects as prefabs, 'instantiate' to spawn prefab instances, 'applyOverrides' to update prefab from modified instance.",
+        schema_factory=schemas.prefab_manage_schema,
+        bridge_command="prefabManage",
+    ),
+    ToolSpec(
+        name="unity_vector_sprite_convert",
+        description="Vector and primitive to sprite conversion: generate 2D sprites from primitives (square/circle/triangle/polygon with custom sides), import SVG vector files to sprites, convert existing textures to sprite assets with custom import settings, or create solid color sprites. Supports custom dimensions (width/height in pixels), RGBA colors (0-1 range), pixels per unit (sprite scale), and sprite modes (single/multiple for sprite sheets). Perfect for procedural sprite generation, prototyping without art assets, UI element creation, and SVG integration. Outputs ready-to-use sprite assets.",
+        schema_factory=schemas.vector_sprite_convert_schema,
+        bridge_command="vectorSpriteConvert",
+    ),
+    ToolSpec(
+        name="unity_projectSettings_crud",
+        description="Unity Project Settings management: read/write/list settings across 8 categories (player: build settings & configurations, quality: quality levels & graphics, time: time scale & fixed timestep, physics: 3D gravity & collision settings, physics2d: 2D gravity & collision settings, audio: volume & DSP buffer, editor: serialization & asset pipeline, tagsLayers: custom tags, layers & sorting layers). Build Settings operations: addSceneToBuild (add scene to build with optional index), removeSceneFromBuild (remove by path or index), listBuildScenes (view all build scenes), reorderBuildScenes (change scene order), setBuildSceneEnabled (enable/disable scene). Use 'list' to see available properties per category, 'read' to get specific property value, 'write' to modify settings. Essential for configuring project-wide settings, 2D/3D physics parameters, quality presets, sorting layers, and build configurations.",
+        schema_factory=schemas.project_settings_manage_schema,
+        bridge_command="projectSettingsManage",
+        paged_operations={"listBuildScenes": "scenes"},
+    ),
+    ToolSpec(
+        name="unity_transform_batch",
+        description="Mid-level batch transform operations: arrange multiple GameObjects in patterns (arrangeCircle: circular formation, arrangeLine: linear spacing, createMenuList: vertical/horizontal menu layout from prefabs), rename objects sequentially (Item_01, Item_02) or from custom name lists, all in local or world space. Supports custom center points, radius, spacing, angles, and planes (XY/XZ/YZ). Perfect for organizing level objects, UI elements, menu items, and creating structured layouts without manual positioning.",
+        schema_factory=schemas.transform_batch_schema,
+        bridge_command="transformBatch",
+    ),
+    ToolSpec(
+        name="unity_rectTransform_batch",
+        description="Mid-level batch UI RectTransform operations: set anchors (topLeft/middleCenter/stretchAll, 16 presets), pivot points, size delta, anchored position for multiple UI elements simultaneously. Supports alignment to parent edges, horizontal/vertical distribution with custom spacing, and size matching (width/height/both) from source element. Essential for precise UI layout control, responsive design setup, and batch UI element positioning. Use for aligning panels, distributing buttons, matching UI element sizes, and creating consistent layouts.",
+        schema_factory=schemas.rect_transform_batch_schema,
+        bridge_command="rectTransformBatch",
+    ),
+    ToolSpec(
+        name="unity_physics_bundle",
+        description="Mid-level physics setup: apply complete physics presets (dynamic: movable with physics, kinematic: movable without physics, static: immovable, character: player/NPC, platformer: 2D side-scrolling, topDown: 2D top-down, vehicle: car physics, projectile: bullets/arrows) or update individual Rigidbody/Collider properties. Automatically adds Rigidbody2D/Rigidbody + Collider (box/sphere/capsule/circle) with appropriate settings. Supports 2D and 3D physics, constraints (freeze position/rotation), collision detection modes (discrete/continuous), and physics materials. Perfect for rapid physics prototyping.",
+        schema_factory=schemas.physics_bundle_schema,
+        bridge_command="physicsBundle",
+    ),
+    ToolSpec(
+        name="unity_camera_rig",
+        description="Mid-level camera rig creation: create complete camera systems with single commands (follow: smooth following camera, orbit: rotate around target, splitScreen: multiplayer viewports, fixed: static camera, dolly: cinematic rail camera). Automatically configures Camera component, target tracking, follow smoothing, orbit distance, field of view, orthographic/perspective mode, and split-screen viewports. Perfect for quickly setting up player cameras, cinematic cameras, or multiplayer camera systems without manual rigging.",
+        schema_factory=schemas.camera_rig_schema,
+        bridge_command="cameraRig",
+    ),
+    ToolSpec(
+        name="unity_ui_foundation",
+        description="Mid-level UI foundation for UGUI: create complete UI elements with single commands (Canvas with EventSystem, Panel with Image, Button with Text child, Text with styling, Image with sprite support, InputField with placeholder). Supports render modes (screenSpaceOverlay/screenSpaceCamera/worldSpace), anchor presets (topLeft/middleCenter/stretchAll, etc.), automatic sizing, and color configuration. Perfect for rapid UI prototyping. Use for basic UI setup, then customize with unity_component_crud if needed.",
+        schema_factory=schemas.ui_foundation_schema,
+        bridge_command="uiFoundation",
+    ),
+    ToolSpec(
+        name="unity_audio_source_bundle",
+        description="Mid-level audio source setup: create and configure AudioSource components with presets (music: looping background music with lower priority, sfx: one-shot sound effects with high priority, ambient: looping environmental sounds, voice: dialogue with high priority, ui: button clicks/menu sounds). Automatically configures volume, pitch, loop, playOnAwake, spatialBlend (2D/3D), min/max distance for 3D audio, priority (0-256), and audio mixer group routing. Perfect for quickly setting up game audio without manual AudioSource configuration.",
+        schema_factory=schemas.audio_source_bundle_schema,
+        bridge_command="audioSourceBundle",
+    ),
+    ToolSpec(
+        name="unity_input_profile",
+        description="Mid-level input system setup: create PlayerInput component with New Input System, configure action maps (player: move/jump/fire, ui: navigate/submit/cancel, vehicle: accelerate/brake/steer), set up notification behaviors (sendMessages/broadcastMessages/invokeUnityEvents/invokeCSharpEvents), and define custom actions with bindings. Automatically generates or uses existing InputActions assets. Essential for setting up player input handling with Unity's modern Input System. Use presets for quick setup or 'custom' for full control.",
+        schema_factory=schemas.input_profile_schema,
+        bridge_command="inputProfile",
+    ),
+    ToolSpec(
+        name="unity_character_controller_bundle",
+        description="Mid-level CharacterController setup: apply CharacterController component with presets optimized for different character types (fps: 1.8m height for first-person, tps: 2.0m for third-person, platformer: 1.0m for platformers, child: 0.5m for small characters, large: 3.0m for large characters, narrow: thin capsule for tight spaces, custom: full manual control). Automatically configures capsule radius, height, center offset, slope limit (max climbable angle), step offset (max stair height), skin width (collision padding), and minimum move distance. Perfect for 3D character setup without manual physics configuration.",
+        schema_factory=schemas.character_controller_bundle_schema,
+        bridge_command="characterControllerBundle",
+    ),
+    ToolSpec(
+        name="unity_gamekit_actor",
+        description="High-level GameKit Actor: create game actors with controller-behavior separation. Choose from 8 behavior profiles (2dLinear/2dPhysics/2dTileGrid/graphNode/splineMovement/3dCharacterController/3dPhysics/3dNavMesh) and 4 control modes (directController for player input via New Input System or legacy, aiAutonomous for AI patrol/follow/wander, uiCommand for UI button control, scriptTriggerOnly for event-driven). Actors relay input to behaviors via UnityEvents (OnMoveInput/OnJumpInput/OnActionInput/OnLookInput). Perfect for players, NPCs, enemies, and interactive characters.",
+        schema_factory=schemas.gamekit_actor_schema,
+        bridge_command="gamekitActor",
+    ),
+    ToolSpec(
+        name="unity_gamekit_manager",
+        description="High-level GameKit Manager: create centralized game system managers for turn-based games (TurnManager), real-time coordination (RealtimeManager), resource/economy management (ResourceManager with Machinations support), global events (EventHub), or finite state machines (StateManager). Supports persistence (DontDestroyOnLoad), state export/import for save/load systems, and integration with GameKitUICommand for UI control. Essential for managing game-wide state, resources (health/mana/gold), turn phases, and game flow.",
+        schema_factory=schemas.gamekit_manager_schema,
+        bridge_command="gamekitManager",
+    ),
+    ToolSpec(
+        name="unity_gamekit_interaction",
+        description="High-level GameKit Interaction: create trigger-based interactions with declarative actions. Choose from 5 trigger types (collision/trigger/raycast/proximity/input) and 5 action types (spawnPrefab/destroyObject/playSound/sendMessage/changeScene). Add conditions (tag/layer/distance/custom) for filtering. Perfect for collectibles, doors, switches, treasure chests, and interactive objects. No scripting required - define complete interactions declaratively.",
+        schema_factory=schemas.gamekit_interaction_schema,
+        bridge_command="gamekitInteraction",
+    ),
+    ToolSpec(
+        name="unity_gamekit_ui_command",
+        description="High-level GameKit UI Command: create command panels with buttons that send commands to GameKitActors (move/jump/action) or GameKitManagers (resources/state/turn/scene). Supports both actor control and manager control via targetType parameter.",
+        schema_factory=schemas.gamekit_ui_command_schema,
+        bridge_command="gamekitUICommand",
+    ),
+    ToolSpec(
+        name="unity_gamekit_machinations",
+        description="High-level GameKit Machinations: create and manage Machinations diagram assets for economic systems. Define resource pools, flows (automatic generation/consumption), converters (resource transformation), and triggers (threshold events). Apply diagrams to ResourceManagers or export current manager state to assets.",
+        schema_factory=schemas.gamekit_machinations_schema,
+        bridge_command="gamekitMachinations",
+    ),
+    ToolSpec(
+        name="unity_gamekit_sceneflow",
+        description="High-level GameKit SceneFlow: manage scene transitions with granular control. Use 'create' to initialize, then 'addScene' to add individual scenes with load modes and shared scenes. Use 'addTransition' to define state machine transitions between scenes. Use 'removeScene'/'removeTransition' to modify flow. Each scene can have its own transitions - same trigger can lead to different destinations per scene. Perfect for level progression, menu systems, and complex scene workflows.",
+        schema_factory=schemas.gamekit_sceneflow_schema,
+        bridge_command="gamekitSceneFlow",
+    ),
+)
+
+
+def register_builtin_tools(registry: ToolRegistry) -> None:
+    registry.register_many(BUILTIN_TOOLS)
@@ -0,0 +1,366 @@
+"""
+Compile barrier for C# script writes.
+
+Outside a barrier every ``.cs`` create/update/delete waits for its own
+compilation. Inside a barrier scope (a batch, or an explicit
+``unity_compile_barrier`` begin/end pair) script writes are sent with
+``deferRefresh`` so Unity leaves the AssetDatabase untouched and the tool
+returns immediately. When the scope closes a single refresh is issued, one
+compilation is awaited and its result is attached to every deferred write.
+A ``flush`` does the same without closing the scope, so a batch can compile
+the scripts written so far before operations that use their types. Other
+asset writes sent with ``deferRefresh`` inside a scope (see tools.batch_planner)
+are recorded as pending imports, and closing the scope refreshes for them too.
+
+An explicit barrier belongs to the client session that opened it
+(``barrier_session``, set per connection): other sessions keep compiling
+their writes. It is closed and flushed when its session disconnects or
+``MCP_COMPILE_BARRIER_TTL_SECONDS`` after it was opened, whichever is first.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from bridge.bridge_manager import bridge_manager
+from config.env import env
+from logger import logger
+from tools.executor import call_bridge_tool
+from tools.progress import current_progress
+
+SCRIPT_WRITE_OPERATIONS = frozenset({"create", "update", "delete"})
+
+DEFAULT_COMPILE_TIMEOUT_SECONDS = 60
+
+
+def is_script_write(arguments: dict[str, Any]) -> bool:
+    """Return True if an asset operation creates, updates or deletes a C# script."""
+    asset_path = arguments.get("assetPath") or ""
+    return (
+        arguments.get("operation") in SCRIPT_WRITE_OPERATIONS
+        and asset_path.lower().endswith(".cs")
+    )
+
+
+async def wait_for_compilation(timeout_seconds: int = DEFAULT_COMPILE_TIMEOUT_SECONDS) -> dict[str, Any]:
+    """Wait for the next compilation, forwarding ``compilation:progress`` to the MCP client."""
+    reporter = current_progress()
+    if reporter is None:
+        return await bridge_manager.await_compilation(timeout_seconds=timeout_seconds)
+
+    def forward(message: dict[str, Any]) -> None:
+        reporter.heartbeat(
+            f"Compiling scripts ({message.get('status', 'compiling')}, "
+            f"{message.get('elapsedSeconds', 0)}s elapsed)"
+        )
+
+    reporter.heartbeat("Waiting for script compilation")
+    bridge_manager.on("compilationProgress", forward)
+    try:
+        return await bridge_manager.await_compilation(timeout_seconds=timeout_seconds)
+    finally:
+        bridge_manager.off("compilationProgress", forward)
+
+
+@dataclass
+class _BarrierScope:
+    label: str
+    opened_at: float = field(default_factory=time.time)
+    # Per-operation "compilation" dicts, filled in place once the barrier closes
+    deferred: list[dict[str, Any]] = field(default_factory=list)
+    asset_paths: list[str] = field(default_factory=list)
+    # Non-script assets written with deferRefresh and not imported yet
+    pending_imports: list[str] = field(default_factory=list)
+    expires_at: float | None = None
+
+
+_current_scope: contextvars.ContextVar[_BarrierScope | None] = contextvars.ContextVar(
+    "compile_barrier_scope", default=None
+)
+# Client session owning explicit barriers; stdio serves a single client per process
+barrier_session: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "compile_barrier_session", default="default"
+)
+
+
+class CompileBarrier:
+    def __init__(self) -> None:
+        self._explicit: dict[str, _BarrierScope] = {}
+        self._expiry: dict[str, asyncio.TimerHandle] = {}
+        self._closing: set[asyncio.Task[Any]] = set()
+        # Duration of the last awaited compilation, used for cost estimates
+        self.last_compile_seconds: float | None = None
+
+    def active_scope(self) -> _BarrierScope | None:
+        """Return the scope of the running batch, or the barrier this session opened."""
+        return _current_scope.get() or self._explicit.get(barrier_session.get())
+
+    def prepare_arguments(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """
+        Pre hook: ask Unity not to refresh after a script write inside a
+        barrier, and record other writes already sent with ``deferRefresh``.
+        """
+        scope = self.active_scope()
+        if scope is None:
+            return arguments
+        if is_script_write(arguments):
+            return {**arguments, "deferRefresh": True}
+        if arguments.get("deferRefresh"):
+            scope.pending_imports.append(arguments.get("assetPath", ""))
+        return arguments
+
+    def defer(self, arguments: dict[str, Any], response: Any) -> Any | None:
+        """
+        Acknowledge a script write inside a barrier.
+
+        Returns the response with a placeholder ``compilation`` entry, or None
+        when no barrier is active and the caller has to wait itself.
+        """
+        scope = self.active_scope()
+        if scope is None:
+            return None
+
+        placeholder: dict[str, Any] = {
+            "deferred": True,
+            "barrier": scope.label,
+            "message": "Compilation deferred until the compile barrier closes.",
+        }
+        scope.deferred.append(placeholder)
+        scope.asset_paths.append(arguments.get("assetPath", ""))
+        logger.info(
+            "C# script %s operation '%s' deferred by compile barrier '%s' (%d pending)",
+            arguments.get("assetPath"),
+            arguments.get("operation"),
+            scope.label,
+            len(scope.deferred),
+        )
+
+        if isinstance(response, dict):
+            return {**response, "compilation": placeholder}
+        return {"result": response, "compilation": placeholder}
+
+    @asynccontextmanager
+    async def scope(
+        self,
+        label: str,
+        timeout_seconds: int = DEFAULT_COMPILE_TIMEOUT_SECONDS,
+    ) -> AsyncIterator[_BarrierScope]:
+        """
+        Defer script compilation until the block exits.
+
+        Nested scopes join the enclosing one so that only the outermost
+        scope refreshes and waits.
+        """
+        outer = self.active_scope()
+        if outer is not None:
+            yield outer
+            return
+
+        scope = _BarrierScope(label=label)
+        token = _current_scope.set(scope)
+        try:
+            yield scope
+        finally:
+            _current_scope.reset(token)
+            await self.flush(scope, timeout_seconds)
+
+    def begin(self, label: str = "explicit") -> dict[str, Any]:
+        session = barrier_session.get()
+        existing = self._explicit.get(session)
+        if existing is not None:
+            return {
+                "success": False,
+                "error": f"Compile barrier '{existing.label}' is already open. Call 'end' first.",
+            }
+        scope = _BarrierScope(label=label)
+        self._explicit[session] = scope
+        response: dict[str, Any] = {
+            "success": True,
+            "barrier": label,
+            "message": "Compile barrier opened. C# script writes are acknowledged without compiling until 'end'.",
+        }
+        ttl = env.compile_barrier_ttl_seconds
+        if ttl:
+            scope.expires_at = scope.opened_at + ttl
+            self._expiry[session] = asyncio.get_running_loop().call_later(ttl, self._expire, session, scope)
+            response["expiresInSeconds"] = ttl
+        return response
+
+    async def end(self, timeout_seconds: int = DEFAULT_COMPILE_TIMEOUT_SECONDS) -> dict[str, Any]:
+        result = await self.close_session(barrier_session.get(), timeout_seconds)
+        if result is None:
+            return {"success": False, "error": "No compile barrier is open."}
+        return result
+
+    async def close_session(
+        self,
+        session: str,
+        timeout_seconds: int = DEFAULT_COMPILE_TIMEOUT_SECONDS,
+    ) -> dict[str, Any] | None:
+        """Close and flush the explicit barrier of ``session``; None if it has none."""
+        scope = self._explicit.pop(session, None)
+        expiry = self._expiry.pop(session, None)
+        if expiry is not None:
+            expiry.cancel()
+        if scope is None:
+            return None
+
+        pending_imports = list(scope.pending_imports)
+        compilation = await self.flush(scope, timeout_seconds)
+        return {
+            "success": True,
+            "barrier": scope.label,
+            "deferredWrites": len(scope.deferred),
+            "assetPaths": scope.asset_paths,
+            "importedAssets": pending_imports,
+            "compilation": compilation,
+        }
+
+    def status(self) -> dict[str, Any]:
+        scope = self.active_scope()
+        if scope is None:
+            return {"success": True, "open": False}
+        status = {
+            "success": True,
+            "open": True,
+            "barrier": scope.label,
+            "openedAt": scope.opened_at,
+            "deferredWrites": len(scope.deferred),
+            "assetPaths": scope.asset_paths,
+            "pendingImports": scope.pending_imports,
+        }
+        if scope.expires_at is not None:
+            status["expiresAt"] = scope.expires_at
+        return status
+
+    def _expire(self, session: str, scope: _BarrierScope) -> None:
+        if self._explicit.get(session) is not scope:
+            return
+        logger.warning(
+            "Compile barrier '%s' was not ended within %ss; closing it",
+            scope.label,
+            env.compile_barrier_ttl_seconds,
+        )
+        task = asyncio.ensure_future(self.close_session(session))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def flush(self, scope: _BarrierScope, timeout_seconds: int) -> dict[str, Any] | None:
+        """
+        Refresh once, wait for one compilation and attach it to every deferred
+        write. Also refreshes when only non-script imports are pending.
+        """
+        if not scope.deferred and not scope.pending_imports:
+            return None
+
+        logger.info(
+            "Compile barrier '%s' closing - refreshing %d deferred script write(s) and %d pending import(s)",
+            scope.label,
+            len(scope.deferred),
+            len(scope.pending_imports),
+        )
+        scope.pending_imports = []
+        result = await self._refresh_and_wait(timeout_seconds)
+        _attach(scope.deferred, result)
+        return result
+
+    async def flush_active(self, timeout_seconds: int = DEFAULT_COMPILE_TIMEOUT_SECONDS) -> dict[str, Any]:
+        """
+        Refresh now and wait for the writes deferred so far, keeping the barrier open.
+
+        The refresh runs even without deferred scripts, so other assets written
+        with ``deferRefresh`` are imported as well.
+        """
+        scope = self.active_scope()
+        if scope is None:
+            return {"success": False, "error": "No compile barrier is open."}
+
+        deferred, scope.deferred = scope.deferred, []
+        asset_paths, scope.asset_paths = scope.asset_paths, []
+        pending_imports, scope.pending_imports = scope.pending_imports, []
+        logger.info(
+            "Compile barrier '%s' flushing - refreshing %d deferred script write(s) and %d pending import(s)",
+            scope.label,
+            len(deferred),
+            len(pending_imports),
+        )
+        result = await self._refresh_and_wait(timeout_seconds)
+        _attach(deferred, result)
+        return {
+            "success": True,
+            "barrier": scope.label,
+            "deferredWrites": len(deferred),
+            "assetPaths": asset_paths,
+            "importedAssets": pending_imports,
+            "compilation": result,
+        }
+
+    async def _refresh_and_wait(self, timeout_seconds: int) -> dict[str, Any]:
+        # Register the waiter before refreshing so a fast compilation is not missed
+        waiter = asyncio.ensure_future(wait_for_compilation(timeout_seconds))
+        await asyncio.sleep(0)
+
+        try:
+            refresh = await call_bridge_tool("assetManage", {"operation": "refresh"})
+        except Exception as exc:
+            waiter.cancel()
+            logger.warning("AssetDatabase refresh failed: %s", exc)
+            return {"success": False, "completed": False, "message": f"AssetDatabase refresh failed: {exc}"}
+
+        if isinstance(refresh, dict) and refresh.get("compiling") is False:
+            waiter.cancel()
+            return {
+                "success": True,
+                "completed": True,
+                "compiled": False,
+                "message": "AssetDatabase refreshed; no compilation was required.",
+            }
+
+        try:
+            result = await waiter
+        except TimeoutError as exc:
+            logger.warning("Compilation wait timed out: %s", exc)
+            return {"success": False, "completed": False, "timedOut": True, "message": str(exc)}
+        except Exception as exc:
+            logger.warning("Error while waiting for compilation: %s", exc)
+            return {"success": False, "completed": False, "message": str(exc)}
+
+        logger.info(
+            "Compilation completed: success=%s, errors=%s, elapsed=%ss",
+            result.get("success"),
+            result.get("errorCount", 0),
+            result.get("elapsedSeconds", 0),
+        )
+        if isinstance(result.get("elapsedSeconds"), (int, float)):
+            self.last_compile_seconds = float(result["elapsedSeconds"])
+        return result
+
+
+def _attach(deferred: list[dict[str, Any]], result: dict[str, Any]) -> None:
+    for placeholder in deferred:
+        placeholder.pop("message", None)
+        placeholder.update(result)
+        placeholder["deferred"] = True
+        placeholder["deferredWrites"] = len(deferred)
+
+
+compile_barrier = CompileBarrier()
+
+
+async def handle_compile_barrier(arguments: dict[str, Any]) -> dict[str, Any]:
+    operation = arguments.get("operation")
+    if operation == "begin":
+        return compile_barrier.begin(arguments.get("label") or "explicit")
+    if operation == "end":
+        return await compile_barrier.end(arguments.get("timeoutSeconds", DEFAULT_COMPILE_TIMEOUT_SECONDS))
+    if operation == "flush":
+        return await compile_barrier.flush_active(arguments.get("timeoutSeconds", DEFAULT_COMPILE_TIMEOUT_SECONDS))
+    if operation == "status":
+        return compile_barrier.status()
+    raise RuntimeError(f"Unknown compile barrier operation: {operation}")
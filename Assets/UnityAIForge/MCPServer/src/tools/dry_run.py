@@ -0,0 +1,439 @@
+"""
+Local dry-run validation of tool arguments.
+
+References to GameObjects, components and assets are checked against the
+``UnityContextPayload`` cached by the bridge and the project's ``Assets``
+folder, without contacting Unity. Operations are validated in order and
+their expected effects (created, renamed or deleted objects and assets) are
+applied to a scratch copy of the state, so a batch may reference objects
+created by earlier operations.
+
+The cached hierarchy only lists root GameObjects (with their components) and
+the names of their direct children. Deeper paths are therefore reported as
+unverified instead of wrong, and only definite problems are errors. The
+context is pushed every few seconds and only covers the active scene, so a
+GameObject or component missing from it is only an error while the context
+is newer than the last write and a single scene is loaded; otherwise it is
+reported as a warning.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from bridge.bridge_manager import bridge_manager
+from bridge.messages import UnityContextPayload
+from config.env import env
+from tools.operation_stream import iter_operations_file, resolve_operations_file
+from tools.registry import tool_registry
+
+EXISTS = "exists"
+MISSING = "missing"
+UNKNOWN = "unknown"
+# Missing from a cached context that may not reflect the editor any more
+UNVERIFIED = "unverified"
+
+# Arguments that name an existing GameObject / asset for tools without a dedicated validator
+GAME_OBJECT_ARGUMENTS = ("gameObjectPath", "parentPath", "sourceGameObjectPath", "canvasPath")
+ASSET_ARGUMENTS = (
+    "prefabPath",
+    "sourceAssetPath",
+    "texturePath",
+    "spritePath",
+    "audioClipPath",
+    "modelPath",
+    "svgPath",
+    "inputActionsAssetPath",
+)
+
+
+@dataclass(frozen=True)
+class DryRunIssue:
+    index: int | None
+    tool: str
+    argument: str
+    value: Any
+    severity: str
+    message: str
+
+    def to_dict(self) -> dict[str, Any]:
+        issue: dict[str, Any] = {
+            "tool": self.tool,
+            "argument": self.argument,
+            "value": self.value,
+            "severity": self.severity,
+            "message": self.message,
+        }
+        if self.index is not None:
+            issue = {"index": self.index, **issue}
+        return issue
+
+
+def _is_placeholder(value: str) -> bool:
+    # ${id.path} references of the DAG executor are resolved at run time
+    return "${" in value
+
+
+def _normalize(path: str) -> str:
+    return path.strip().strip("/")
+
+
+def _type_matches(actual: str, requested: str) -> bool:
+    return actual == requested or actual.endswith("." + requested) or requested.endswith("." + actual)
+
+
+class ValidationContext:
+    """Scratch copy of the cached editor state that validators query and update."""
+
+    def __init__(self, context: UnityContextPayload | None, project_root: Path | None) -> None:
+        self.context_available = context is not None and context.get("hierarchy") is not None
+        self.context_updated_at = context.get("updatedAt") if context else None
+        # The cache only proves absence if it postdates the last write and holds every loaded scene
+        last_write = bridge_manager.last_write_at
+        self.context_current = (
+            self.context_available
+            and (context or {}).get("loadedSceneCount") == 1
+            and (last_write is None or (self.context_updated_at or 0) / 1000 >= last_write)
+        )
+        self._absent = MISSING if self.context_current else UNVERIFIED
+
+        self._roots: dict[str, set[str]] = {}
+        self._children: dict[str, set[str]] = {}
+        hierarchy = (context or {}).get("hierarchy") or {}
+        for node in hierarchy.get("children") or []:
+            name = node.get("name", "")
+            self._roots[name] = {component.get("type", "") for component in node.get("components") or []}
+            self._children[name] = set(node.get("childNames") or [])
+
+        self._indexed_assets = {entry.get("path", "") for entry in (context or {}).get("assets") or []}
+        assets_dir = project_root / "Assets" if project_root else None
+        self._project_root = project_root if assets_dir and assets_dir.is_dir() else None
+
+        self._created_objects: set[str] = set()
+        self._deleted_objects: set[str] = set()
+        self._possible_names: set[str] = set()
+        self._added_components: dict[str, set[str]] = {}
+        self._removed_components: dict[str, set[str]] = {}
+        self._created_assets: set[str] = set()
+        self._deleted_assets: set[str] = set()
+
+        self.issues: list[DryRunIssue] = []
+        self.checked = 0
+        self.index: int | None = None
+        self.tool = ""
+
+    # -- state queries -------------------------------------------------
+
+    def object_state(self, path: str) -> str:
+        if _is_placeholder(path):
+            return UNKNOWN
+        path = _normalize(path)
+        segments = path.split("/")
+        prefixes = ["/".join(segments[: depth + 1]) for depth in range(len(segments))]
+
+        if any(prefix in self._deleted_objects for prefix in prefixes):
+            return MISSING
+        if path in self._created_objects:
+            return EXISTS
+        if any(prefix in self._created_objects for prefix in prefixes):
+            return UNKNOWN
+        if not self.context_available:
+            return UNKNOWN
+
+        root = segments[0]
+        if root not in self._roots:
+            return UNKNOWN if root in self._possible_names else self._absent
+        if len(segments) == 1:
+            return EXISTS
+        if segments[1] not in self._children[root]:
+            return UNKNOWN if segments[1] in self._possible_names else self._absent
+        return EXISTS if len(segments) == 2 else UNKNOWN
+
+    def component_state(self, path: str, component_type: str) -> str:
+        if _is_placeholder(path):
+            return UNKNOWN
+        path = _normalize(path)
+        if any(_type_matches(added, component_type) for added in self._added_components.get(path, ())):
+            return EXISTS
+        if any(_type_matches(removed, component_type) for removed in self._removed_components.get(path, ())):
+            return MISSING
+        if path in self._created_objects or path not in self._roots or not self.context_available:
+            return UNKNOWN
+        return EXISTS if any(_type_matches(actual, component_type) for actual in self._roots[path]) else self._absent
+
+    def asset_state(self, path: str) -> str:
+        if _is_placeholder(path):
+            return UNKNOWN
+        path = _normalize(path)
+        if path in self._deleted_assets:
+            return MISSING
+        if path in self._created_assets:
+            return EXISTS
+        if self._project_root is not None:
+            return EXISTS if (self._project_root / path).exists() else MISSING
+        return EXISTS if path in self._indexed_assets else UNKNOWN
+
+    # -- effects -------------------------------------------------------
+
+    def add_object(self, path: str) -> None:
+        path = _normalize(path)
+        self._deleted_objects.discard(path)
+        self._created_objects.add(path)
+        self.note_name(path.rsplit("/", 1)[-1])
+
+    def remove_object(self, path: str) -> None:
+        path = _normalize(path)
+        self._created_objects.discard(path)
+        self._deleted_objects.add(path)
+
+    def note_name(self, name: Any) -> None:
+        """Remember a name that an operation we cannot model may have created."""
+        if isinstance(name, str) and name:
+            self._possible_names.add(name)
+
+    def add_component(self, path: str, component_type: str) -> None:
+        path = _normalize(path)
+        self._removed_components.get(path, set()).discard(component_type)
+        self._added_components.setdefault(path, set()).add(component_type)
+
+    def remove_component(self, path: str, component_type: str) -> None:
+        path = _normalize(path)
+        self._added_components.get(path, set()).discard(component_type)
+        self._removed_components.setdefault(path, set()).add(component_type)
+
+    def add_asset(self, path: str) -> None:
+        path = _normalize(path)
+        self._deleted_assets.discard(path)
+        self._created_assets.add(path)
+
+    def remove_asset(self, path: str) -> None:
+        path = _normalize(path)
+        self._created_assets.discard(path)
+        self._deleted_assets.add(path)
+
+    # -- checks --------------------------------------------------------
+
+    def report(self, argument: str, value: Any, message: str, severity: str = "error") -> None:
+        self.issues.append(DryRunIssue(self.index, self.tool, argument, value, severity, message))
+
+    def require_object(self, arguments: dict[str, Any], key: str, severity: str = "error") -> str | None:
+        """Report a missing GameObject and return the path (or None if not given)."""
+        path = arguments.get(key)
+        if not isinstance(path, str) or not path:
+            return None
+        state = self.object_state(path)
+        if state == MISSING:
+            self.report(key, path, f"GameObject '{path}' does not exist in the active scene", severity)
+        elif state == UNVERIFIED:
+            self.report(key, path, f"GameObject '{path}' is not in the cached scene state; {self.stale_reason()}", "warning")
+        return path
+
+    def stale_reason(self) -> str:
+        if not self.context_current and bridge_manager.last_write_at is not None \
+                and (self.context_updated_at or 0) / 1000 < bridge_manager.last_write_at:
+            return "the cache predates the last write, so it may exist"
+        return "it may exist in another loaded scene"
+
+    def require_asset(self, arguments: dict[str, Any], key: str, severity: str = "error") -> str | None:
+        path = arguments.get(key)
+        if not isinstance(path, str) or not path:
+            return None
+        if self.asset_state(path) == MISSING:
+            self.report(key, path, f"Asset '{path}' does not exist", severity)
+        return path
+
+
+def validate_game_object(arguments: dict[str, Any], ctx: ValidationContext) -> None:
+    operation = arguments.get("operation")
+    name = arguments.get("name")
+    ctx.note_name(name)
+
+    if operation == "create":
+        parent = ctx.require_object(arguments, "parentPath")
+        leaf = name or arguments.get("template") or "GameObject"
+        ctx.add_object(f"{parent}/{leaf}" if parent else leaf)
+        return
+
+    if operation not in {"delete", "move", "rename", "update", "duplicate", "inspect"}:
+        return
+
+    path = ctx.require_object(arguments, "gameObjectPath")
+    if path is None:
+        ctx.report("gameObjectPath", None, f"'{operation}' requires gameObjectPath")
+        return
+
+    parent_of_path = path.rsplit("/", 1)[0] if "/" in path else ""
+    leaf = path.rsplit("/", 1)[-1]
+    if operation == "delete":
+        ctx.remove_object(path)
+    elif operation == "rename" and name:
+        ctx.remove_object(path)
+        ctx.add_object(f"{parent_of_path}/{name}" if parent_of_path else name)
+    elif operation == "move":
+        parent = ctx.require_object(arguments, "parentPath")
+        ctx.remove_object(path)
+        ctx.add_object(f"{parent}/{leaf}" if parent else leaf)
+    elif operation == "duplicate":
+        ctx.note_name(f"{leaf}(Clone)")
+        ctx.note_name(f"{leaf} (1)")
+
+
+def validate_component(arguments: dict[str, Any], ctx: ValidationContext) -> None:
+    operation = arguments.get("operation")
+    if operation not in {"add", "remove", "update", "inspect"}:
+        return
+
+    path = ctx.require_object(arguments, "gameObjectPath")
+    component_type = arguments.get("componentType")
+    if path is None or not component_type or ctx.object_state(path) == MISSING:
+        return
+
+    if operation == "add":
+        ctx.add_component(path, component_type)
+        return
+
+    state = ctx.component_state(path, component_type)
+    if state == MISSING:
+        ctx.report(
+            "componentType",
+            component_type,
+            f"Component '{component_type}' is not attached to GameObject '{path}'",
+        )
+    elif state == UNVERIFIED:
+        ctx.report(
+            "componentType",
+            component_type,
+            f"Component '{component_type}' is not attached to GameObject '{path}' in the cached scene state; "
+            f"{ctx.stale_reason()}",
+            "warning",
+        )
+    if operation == "remove":
+        ctx.remove_component(path, component_type)
+
+
+def validate_asset(arguments: dict[str, Any], ctx: ValidationContext) -> None:
+    operation = arguments.get("operation")
+    path = arguments.get("assetPath")
+    if not isinstance(path, str) or not path:
+        return
+
+    if operation == "create":
+        if ctx.asset_state(path) == EXISTS:
+            ctx.report("assetPath", path, f"Asset '{path}' already exists")
+        ctx.add_asset(path)
+        return
+
+    if operation not in {"update", "updateImporter", "delete", "rename", "duplicate", "inspect"}:
+        return
+
+    ctx.require_asset(arguments, "assetPath")
+    destination = arguments.get("destinationPath")
+    if operation == "delete":
+        ctx.remove_asset(path)
+    elif operation == "rename" and destination:
+        ctx.remove_asset(path)
+        ctx.add_asset(destination)
+    elif operation == "duplicate" and destination:
+        ctx.add_asset(destination)
+
+
+def validate_generic(arguments: dict[str, Any], ctx: ValidationContext) -> None:
+    """Fallback for tools without a validator: unresolved references are warnings."""
+    ctx.note_name(arguments.get("name"))
+    for key in GAME_OBJECT_ARGUMENTS:
+        ctx.require_object(arguments, key, severity="warning")
+    for key in ASSET_ARGUMENTS:
+        ctx.require_asset(arguments, key, severity="warning")
+
+
+def new_validation_context() -> ValidationContext:
+    return ValidationContext(bridge_manager.get_context(), env.unity_project_root)
+
+
+def validate_arguments(
+    ctx: ValidationContext,
+    tool_name: str,
+    arguments: dict[str, Any],
+    index: int | None = None,
+) -> None:
+    """Validate one call and apply its expected effects to ``ctx``."""
+    ctx.checked += 1
+    ctx.index = index
+    ctx.tool = tool_name
+    spec = tool_registry.get(tool_name)
+    if spec is None:
+        ctx.report("tool", tool_name, f"Unknown tool '{tool_name}'")
+        return
+    (spec.validator or validate_generic)(arguments, ctx)
+
+
+def validate_call(tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+    """Validate a single tool call and return a dry-run report."""
+    ctx = new_validation_context()
+    validate_arguments(ctx, tool_name, arguments)
+    return build_report(ctx)
+
+
+def validate_operations(operations: Iterable[dict[str, Any]]) -> dict[str, Any]:
+    """Validate batch operations in order and return a dry-run report."""
+    ctx = new_validation_context()
+    for index, operation in enumerate(operations):
+        validate_arguments(ctx, operation.get("tool", ""), operation.get("arguments") or {}, index)
+    return build_report(ctx)
+
+
+def validate_operations_file(path: Path) -> dict[str, Any]:
+    """Validate the operations of a JSONL file line by line and return a dry-run report."""
+    ctx = new_validation_context()
+    _validate_file(ctx, path)
+    return build_report(ctx)
+
+
+def _validate_file(ctx: ValidationContext, path: Path) -> None:
+    for index, item in enumerate(iter_operations_file(path)):
+        if item.operation is None:
+            ctx.checked += 1
+            ctx.index = index
+            ctx.tool = ""
+            ctx.report("operations_file", str(path), item.error or "Invalid operation")
+            continue
+        validate_arguments(ctx, item.operation["tool"], item.operation.get("arguments") or {}, index)
+
+
+def build_report(ctx: ValidationContext) -> dict[str, Any]:
+    errors = [issue for issue in ctx.issues if issue.severity == "error"]
+    warnings = [issue for issue in ctx.issues if issue.severity != "error"]
+    context_info: dict[str, Any] = {"available": ctx.context_available, "current": ctx.context_current}
+    if ctx.context_updated_at:
+        context_info["updatedAt"] = ctx.context_updated_at
+        context_info["ageSeconds"] = round(time.time() - ctx.context_updated_at / 1000, 1)
+
+    return {
+        "success": True,
+        "dryRun": True,
+        "valid": not errors,
+        "checked": ctx.checked,
+        "errorCount": len(errors),
+        "warningCount": len(warnings),
+        "issues": [issue.to_dict() for issue in ctx.issues],
+        "context": context_info,
+    }
+
+
+def validate_batch_arguments(arguments: dict[str, Any], ctx: ValidationContext) -> None:
+    """Validator for the batch tools: validate every nested operation in order."""
+    # Count the nested operations instead of the batch call itself
+    ctx.checked -= 1
+    for index, operation in enumerate(arguments.get("operations") or []):
+        validate_arguments(ctx, operation.get("tool", ""), operation.get("arguments") or {}, index)
+
+    operations_file = arguments.get("operations_file")
+    if operations_file:
+        try:
+            _validate_file(ctx, resolve_operations_file(operations_file))
+        except ValueError as exc:
+            ctx.report("operations_file", operations_file, str(exc))
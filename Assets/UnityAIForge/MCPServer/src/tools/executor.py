@@ -0,0 +1,75 @@
+"""
+Raw tool execution shared by the MCP dispatcher and the batch executors.
+
+``execute_tool`` runs a registered tool (pre hooks, custom handler or bridge
+command, post hooks) and returns the unrendered result, so batch executors
+can inspect ``success`` flags and read fields of earlier results.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from bridge.bridge_manager import bridge_manager
+from services.micro_batcher import inspect_batcher
+from services.write_coalescer import update_coalescer
+from tools.registry import ToolSpec
+
+
+def ensure_bridge_connected() -> None:
+    if not bridge_manager.is_connected():
+        raise RuntimeError(
+            "Unity bridge is not connected. In the Unity Editor choose Tools/MCP Assistant to start the bridge."
+        )
+
+
+async def call_bridge_tool(tool_name: str, payload: dict[str, Any]) -> Any:
+    ensure_bridge_connected()
+
+    timeout_ms = 45_000
+    if "timeoutSeconds" in payload:
+        unity_timeout = payload["timeoutSeconds"]
+        timeout_ms = (unity_timeout + 20) * 1000
+
+    try:
+        return await bridge_manager.send_command(tool_name, payload, timeout_ms=timeout_ms)
+    except Exception as exc:  # pragma: no cover - surface bridge errors to client
+        raise RuntimeError(f'Unity bridge tool "{tool_name}" failed: {exc}') from exc
+
+
+async def execute_tool(spec: ToolSpec, args: dict[str, Any], batching: bool = True) -> Any:
+    """
+    Run a tool and return its raw (unrendered) result.
+
+    With ``batching=False`` the command goes straight to the bridge instead of
+    waiting in the inspect micro-batcher or update coalescer, so callers that
+    pipeline commands keep their send order.
+    """
+    for pre_hook in spec.pre_hooks:
+        args = pre_hook(args)
+
+    coalesce = False
+    if "coalesce" in args and spec.coalesced_operations:
+        coalesce = bool(args["coalesce"]) and args.get("operation") in spec.coalesced_operations
+        args = {key: value for key, value in args.items() if key != "coalesce"}
+
+    if spec.handler is not None:
+        response = await spec.handler(args)
+    else:
+        assert spec.bridge_command is not None
+        batch_operation = spec.batched_operations.get(args.get("operation", ""))
+        try:
+            if batch_operation and batching and inspect_batcher.enabled:
+                response = await inspect_batcher.submit(spec.bridge_command, batch_operation, args, call_bridge_tool)
+            elif coalesce and batching and update_coalescer.enabled:
+                response = await update_coalescer.submit(spec.bridge_command, args, call_bridge_tool)
+            else:
+                response = await call_bridge_tool(spec.bridge_command, args)
+        finally:
+            # Even a failed write may have been applied
+            if not spec.is_read(args):
+                bridge_manager.note_write()
+
+    for hook in spec.post_hooks:
+        response = await hook(args, response)
+    return response
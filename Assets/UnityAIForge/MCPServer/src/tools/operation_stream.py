@@ -0,0 +1,64 @@
+"""
+Batch operations streamed from a JSONL file.
+
+Each non-blank line of the file holds one ``{"tool": ..., "arguments": ...}``
+operation. Files are read one line at a time from a byte offset, so a batch
+of any length keeps memory bounded and can resume exactly where it stopped.
+Only files inside the Unity project root are accepted.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from config.env import env
+
+
+@dataclass(frozen=True)
+class StreamedOperation:
+    # Byte offsets of the line and of the line after it
+    start: int
+    end: int
+    operation: dict[str, Any] | None
+    error: str | None = None
+
+
+def resolve_operations_file(path: str) -> Path:
+    """Resolve ``path`` against the project root and make sure it stays inside it."""
+    root = env.unity_project_root.resolve()
+    candidate = Path(path)
+    if not candidate.is_absolute():
+        candidate = root / candidate
+    candidate = candidate.resolve()
+    if not candidate.is_relative_to(root):
+        raise ValueError(f"operations_file must be inside the Unity project root ({root}): {path}")
+    if not candidate.is_file():
+        raise ValueError(f"operations_file not found: {path}")
+    return candidate
+
+
+def iter_operations_file(path: Path, offset: int = 0) -> Iterator[StreamedOperation]:
+    """Yield the operations of a JSONL file starting at byte ``offset``."""
+    with open(path, "rb") as stream:
+        stream.seek(offset)
+        while True:
+            start = stream.tell()
+            line = stream.readline()
+            if not line:
+                return
+            if not line.strip():
+                continue
+            end = stream.tell()
+            try:
+                operation = json.loads(line)
+            except ValueError as exc:
+                yield StreamedOperation(start, end, None, f"Invalid JSON at byte {start}: {exc}")
+                continue
+            if not isinstance(operation, dict) or not isinstance(operation.get("tool"), str):
+                yield StreamedOperation(start, end, None, f"Line at byte {start} is not an object with a 'tool' name")
+                continue
+            yield StreamedOperation(start, end, operation)
@@ -0,0 +1,248 @@
+"""
+Predictive prefetch of follow-up reads.
+
+Agent sessions are repetitive: an ``update`` is followed by an ``inspect`` of
+the same component, a scene ``load`` by a hierarchy inspect. The prefetcher
+learns first-order transition counts between ``tool:operation`` pairs from
+the calls it sees, together with how the follow-up's arguments relate to the
+previous call (copied value or constant). After a call completes and the
+bridge is idle, the most likely follow-up read is issued in the background
+and its result is cached for a short time. A matching call is then answered
+from the cache. A write made by a client call clears the cache, and a
+prefetched result is dropped when the bridge has recorded any write since it
+was issued (operations of batch tools, coalesced updates, raw bridge
+commands), so it never predates a change made through the server.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import json
+import time
+from collections import Counter, defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from bridge.bridge_manager import bridge_manager
+from config.env import env
+from logger import logger
+from tools.registry import ToolSpec, tool_registry
+
+Execute = Callable[[ToolSpec, dict[str, Any]], Awaitable[Any]]
+
+# A transition needs this many observations and this share of its source
+# state's traffic before it is prefetched.
+MIN_OBSERVATIONS = 3
+MIN_CONFIDENCE = 0.6
+
+_COPY = "$copy"
+
+# Result of a prefetch that raised; the real call is then sent normally
+_FAILED = object()
+
+
+def _state(spec: ToolSpec, args: dict[str, Any]) -> str:
+    operation = args.get("operation")
+    return f"{spec.name}:{operation}" if operation else spec.name
+
+
+def _cache_key(tool_name: str, args: dict[str, Any]) -> str:
+    return tool_name + json.dumps(args, sort_keys=True, default=str)
+
+
+def _template(previous: dict[str, Any], args: dict[str, Any]) -> str:
+    """Describe ``args`` as values copied from ``previous`` or constants."""
+    template: dict[str, Any] = {}
+    for key, value in args.items():
+        if previous.get(key) == value and key != "operation":
+            template[key] = {_COPY: key}
+            continue
+        source = next(
+            (name for name, item in previous.items() if name != "operation" and item == value and isinstance(item, str)),
+            None,
+        )
+        template[key] = {_COPY: source} if source else value
+    return json.dumps(template, sort_keys=True, default=str)
+
+
+def _instantiate(template: str, previous: dict[str, Any]) -> dict[str, Any] | None:
+    args: dict[str, Any] = {}
+    for key, value in json.loads(template).items():
+        if isinstance(value, dict) and _COPY in value:
+            if value[_COPY] not in previous:
+                return None
+            args[key] = previous[value[_COPY]]
+        else:
+            args[key] = value
+    return args
+
+
+@dataclass
+class _Entry:
+    task: asyncio.Task[Any]
+    generation: int
+    expires_at: float
+    # bridge_manager.last_write_at when the prefetch was issued
+    written_at: float | None
+
+
+class Prefetcher:
+    def __init__(self, budget_per_minute: int | None = None, ttl_ms: int | None = None) -> None:
+        self._budget = budget_per_minute if budget_per_minute is not None else env.prefetch_budget_per_minute
+        self._ttl_seconds = (ttl_ms if ttl_ms is not None else env.prefetch_ttl_ms) / 1000
+        self._tokens = float(self._budget)
+        self._refilled_at = time.monotonic()
+        self._transitions: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        self._templates: defaultdict[tuple[str, str], Counter[str]] = defaultdict(Counter)
+        self._last: tuple[str, dict[str, Any]] | None = None
+        self._cache: dict[str, _Entry] = {}
+        self._generation = 0
+        self._in_flight = 0
+        self._stats: Counter[str] = Counter()
+
+    @property
+    def enabled(self) -> bool:
+        return self._budget > 0 and self._ttl_seconds > 0
+
+    async def run(self, spec: ToolSpec, args: dict[str, Any], execute: Execute) -> Any:
+        """Execute a client call, serving it from the prefetch cache when possible."""
+        if not self.enabled:
+            return await execute(spec, args)
+
+        response = None
+        if spec.is_read(args):
+            response = await self._take(spec, args)
+        else:
+            self._invalidate()
+        if response is None:
+            response = await execute(spec, args)
+
+        state = _state(spec, args)
+        self._observe(state, args)
+        self._schedule(state, args, execute)
+        return response
+
+    def get_stats(self) -> dict[str, Any]:
+        issued = self._stats["issued"]
+        transitions = [
+            {"from": source, "to": target, "count": count, "probability": round(count / sum(targets.values()), 3)}
+            for source, targets in self._transitions.items()
+            for target, count in targets.items()
+        ]
+        transitions.sort(key=lambda item: item["count"], reverse=True)
+        return {
+            "enabled": self.enabled,
+            "budgetPerMinute": self._budget,
+            "ttlMs": round(self._ttl_seconds * 1000, 3),
+            "issued": issued,
+            "used": self._stats["used"],
+            "hitRate": round(self._stats["used"] / issued, 3) if issued else 0.0,
+            "expired": self._stats["expired"],
+            "invalidated": self._stats["invalidated"],
+            "failed": self._stats["failed"],
+            "skippedBusy": self._stats["skippedBusy"],
+            "skippedBudget": self._stats["skippedBudget"],
+            "cached": len(self._cache),
+            "topTransitions": transitions[:10],
+        }
+
+    async def _take(self, spec: ToolSpec, args: dict[str, Any]) -> Any | None:
+        self._expire()
+        entry = self._cache.pop(_cache_key(spec.name, args), None)
+        if entry is None:
+            return None
+        response = await entry.task
+        if response is _FAILED:
+            return None
+        if entry.generation != self._generation or entry.written_at != bridge_manager.last_write_at:
+            # A write landed after the prefetch was issued
+            self._stats["invalidated"] += 1
+            return None
+        self._stats["used"] += 1
+        return response
+
+    def _invalidate(self) -> None:
+        self._generation += 1
+        self._stats["invalidated"] += len(self._cache)
+        self._cache.clear()
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        for key in [key for key, entry in self._cache.items() if entry.expires_at <= now]:
+            self._stats["expired"] += 1
+            del self._cache[key]
+
+    def _observe(self, state: str, args: dict[str, Any]) -> None:
+        if self._last is not None:
+            previous_state, previous_args = self._last
+            self._transitions[previous_state][state] += 1
+            self._templates[(previous_state, state)][_template(previous_args, args)] += 1
+        self._last = (state, args)
+
+    def _predict(self, state: str, args: dict[str, Any]) -> tuple[ToolSpec, dict[str, Any]] | None:
+        targets = self._transitions.get(state)
+        if not targets:
+            return None
+        total = sum(targets.values())
+        target, count = targets.most_common(1)[0]
+        if total < MIN_OBSERVATIONS or count / total < MIN_CONFIDENCE:
+            return None
+
+        template, _ = self._templates[(state, target)].most_common(1)[0]
+        predicted = _instantiate(template, args)
+        spec = tool_registry.get(target.split(":", 1)[0])
+        if predicted is None or spec is None or spec.bridge_command is None or not spec.is_read(predicted):
+            return None
+        return spec, predicted
+
+    def _spend(self) -> bool:
+        now = time.monotonic()
+        self._tokens = min(float(self._budget), self._tokens + (now - self._refilled_at) * self._budget / 60)
+        self._refilled_at = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def _schedule(self, state: str, args: dict[str, Any], execute: Execute) -> None:
+        prediction = self._predict(state, args)
+        if prediction is None:
+            return
+        spec, predicted = prediction
+        key = _cache_key(spec.name, predicted)
+        if key in self._cache:
+            return
+        if self._in_flight or not bridge_manager.is_idle():
+            self._stats["skippedBusy"] += 1
+            return
+        if not self._spend():
+            self._stats["skippedBudget"] += 1
+            return
+
+        self._stats["issued"] += 1
+        # A fresh context keeps the triggering call's progress reporter and
+        # compile barrier scope away from the background read
+        task = contextvars.Context().run(asyncio.ensure_future, self._fetch(spec, predicted, execute))
+        self._cache[key] = _Entry(
+            task,
+            self._generation,
+            time.monotonic() + self._ttl_seconds,
+            bridge_manager.last_write_at,
+        )
+        logger.debug("Prefetching %s %s", spec.name, predicted.get("operation", ""))
+
+    async def _fetch(self, spec: ToolSpec, args: dict[str, Any], execute: Execute) -> Any:
+        self._in_flight += 1
+        try:
+            return await execute(spec, args)
+        except Exception as exc:
+            self._stats["failed"] += 1
+            logger.debug("Prefetch of %s failed: %s", spec.name, exc)
+            return _FAILED
+        finally:
+            self._in_flight -= 1
+
+
+prefetcher = Prefetcher()
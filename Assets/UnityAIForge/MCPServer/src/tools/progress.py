@@ -0,0 +1,109 @@
+"""
+MCP progress notifications for long-running tools.
+
+Clients opt in by sending ``_meta.progressToken`` with ``tools/call``. The
+dispatcher binds a ``ProgressReporter`` to the call; batch executors,
+compilation waits and paged results report through ``current_progress()``,
+which returns None when the client did not ask for progress.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import math
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from mcp.server import Server
+
+from logger import logger
+
+_current_reporter: contextvars.ContextVar[ProgressReporter | None] = contextvars.ContextVar(
+    "progress_reporter", default=None
+)
+
+
+class ProgressReporter:
+    """
+    Sends ``notifications/progress`` for a single request.
+
+    Progress must strictly increase, so values that would not advance it are
+    turned into heartbeats: they move halfway towards the next whole step,
+    which keeps later ``report(n, total)`` calls valid.
+    """
+
+    def __init__(self, session: Any, progress_token: str | int, request_id: str | None = None) -> None:
+        self._session = session
+        self._token = progress_token
+        self._request_id = request_id
+        self._last = 0.0
+        self._lock = asyncio.Lock()
+        self._pending: set[asyncio.Task[None]] = set()
+
+    @classmethod
+    def from_request(cls, server: Server) -> ProgressReporter | None:
+        try:
+            ctx = server.request_context
+        except LookupError:
+            return None
+        token = ctx.meta.progressToken if ctx.meta else None
+        if token is None:
+            return None
+        return cls(ctx.session, token, str(ctx.request_id))
+
+    def report(self, progress: float, total: float | None = None, message: str | None = None) -> None:
+        """Schedule a notification for ``progress`` out of ``total`` units."""
+        if progress <= self._last:
+            self.heartbeat(message, total)
+            return
+        self._last = progress
+        self._schedule(progress, total, message)
+
+    def heartbeat(self, message: str | None = None, total: float | None = None) -> None:
+        """Signal that work is still running without completing a step."""
+        next_step = math.floor(self._last) + 1
+        self._last += (next_step - self._last) / 2
+        self._schedule(self._last, total, message)
+
+    async def drain(self) -> None:
+        """Wait until every scheduled notification has been written."""
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+    def _schedule(self, progress: float, total: float | None, message: str | None) -> None:
+        task = asyncio.ensure_future(self._send(progress, total, message))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _send(self, progress: float, total: float | None, message: str | None) -> None:
+        # The lock is FIFO, so notifications leave in the order they were scheduled
+        async with self._lock:
+            try:
+                await self._session.send_progress_notification(
+                    self._token,
+                    progress,
+                    total=total,
+                    message=message,
+                    related_request_id=self._request_id,
+                )
+            except Exception as exc:  # pragma: no cover - the client may have gone away
+                logger.debug("Failed to send progress notification: %s", exc)
+
+
+def current_progress() -> ProgressReporter | None:
+    """Return the reporter of the running tool call, if the client requested progress."""
+    return _current_reporter.get()
+
+
+@asynccontextmanager
+async def bind_progress(reporter: ProgressReporter | None) -> AsyncIterator[ProgressReporter | None]:
+    """Make ``reporter`` current for the block and flush its notifications on exit."""
+    token = _current_reporter.set(reporter)
+    try:
+        yield reporter
+    finally:
+        _current_reporter.reset(token)
+        if reporter is not None:
+            await reporter.drain()
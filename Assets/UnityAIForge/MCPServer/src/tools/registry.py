@@ -0,0 +1,205 @@
+"""
+Declarative tool registry.
+
+Every MCP tool is described by a ``ToolSpec`` that maps the tool name to the
+Unity bridge command it forwards to, a lazily built input schema, optional
+handler hooks and the operations that only read editor state.  The dispatcher
+in ``register_tools`` looks tools up here instead of branching on their names,
+so additional tool packs can be plugged in through the
+``unity_ai_forge.tools`` entry point group.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from importlib.metadata import entry_points
+from typing import Any
+
+import mcp.types as types
+
+from logger import logger
+from tools.response_options import with_response_options
+
+ENTRY_POINT_GROUP = "unity_ai_forge.tools"
+
+# Operations that never modify the editor state, shared by most CRUD tools.
+DEFAULT_READ_OPERATIONS = frozenset(
+    {
+        "inspect",
+        "inspectMultiple",
+        "findMultiple",
+        "findByType",
+        "list",
+        "listBuildSettings",
+        "listBuildScenes",
+        "read",
+    }
+)
+
+SchemaFactory = Callable[[], dict[str, Any]]
+ToolHandler = Callable[[dict[str, Any]], Awaitable[Any]]
+PreHook = Callable[[dict[str, Any]], dict[str, Any]]
+PostHook = Callable[[dict[str, Any], Any], Awaitable[Any]]
+# (arguments, tools.dry_run.ValidationContext) -> None
+Validator = Callable[[dict[str, Any], Any], None]
+
+
+@dataclass
+class ToolSpec:
+    """Description of a single MCP tool.
+
+    Attributes:
+        name: MCP tool name exposed to clients (e.g. ``unity_scene_crud``).
+        description: Human readable tool description.
+        schema_factory: Callable returning the JSON input schema. Only invoked
+            the first time the schema is needed; the shared response options
+            (``fields``/``exclude``/``compact``) are added automatically.
+        bridge_command: Unity bridge command the tool forwards to. Tools
+            without a bridge command must provide ``handler``.
+        handler: Custom coroutine replacing the default bridge forwarding. It
+            returns the raw result, which is rendered like a bridge response.
+        pre_hooks: Callables applied in order to the arguments before the tool
+            runs, e.g. deferring the AssetDatabase refresh inside a compile
+            barrier.
+        post_hooks: Coroutines applied in order to the bridge response, e.g.
+            waiting for script compilation after a ``.cs`` write.
+        read_operations: ``operation`` values that only read editor state.
+        read_only: Marks the whole tool as read-only regardless of operation.
+        paged_operations: ``operation`` values whose result list (by key) can
+            be paged with ``pageSize``/``cursor``.
+        batched_operations: single-object ``operation`` values mapped to the
+            multi-target operation (accepting ``targets``) that concurrent
+            calls are micro-batched into.
+        coalesced_operations: ``operation`` values whose ``propertyChanges``
+            to the same target are merged when the caller passes ``coalesce``.
+        validator: Local dry-run check of the arguments against the cached
+            editor state (see ``tools.dry_run``). Tools without one get a
+            generic reference check.
+    """
+
+    name: str
+    description: str
+    schema_factory: SchemaFactory
+    bridge_command: str | None = None
+    handler: ToolHandler | None = None
+    pre_hooks: tuple[PreHook, ...] = ()
+    post_hooks: tuple[PostHook, ...] = ()
+    read_operations: frozenset[str] = DEFAULT_READ_OPERATIONS
+    read_only: bool = False
+    paged_operations: Mapping[str, str] = field(default_factory=dict)
+    batched_operations: Mapping[str, str] = field(default_factory=dict)
+    coalesced_operations: frozenset[str] = frozenset()
+    validator: Validator | None = None
+    _schema: dict[str, Any] | None = field(default=None, init=False, repr=False)
+    _tool: types.Tool | None = field(default=None, init=False, repr=False)
+
+    @property
+    def schema(self) -> dict[str, Any]:
+        if self._schema is None:
+            self._schema = with_response_options(self.schema_factory())
+        return self._schema
+
+    def to_tool(self) -> types.Tool:
+        if self._tool is None:
+            self._tool = types.Tool(
+                name=self.name,
+                description=self.description,
+                inputSchema=self.schema,
+            )
+        return self._tool
+
+    def is_read(self, arguments: dict[str, Any]) -> bool:
+        """Return True if the call only reads editor state."""
+        if self.read_only:
+            return True
+        return arguments.get("operation") in self.read_operations
+
+    def paged_list_key(self, arguments: dict[str, Any]) -> str | None:
+        """Return the key of the list that can be paged for this call, if any."""
+        return self.paged_operations.get(arguments.get("operation", ""))
+
+
+class ToolRegistry:
+    def __init__(self) -> None:
+        self._specs: dict[str, ToolSpec] = {}
+        self._bridge_commands: dict[str, str] = {}
+        self._tool_list: list[types.Tool] | None = None
+        self._entry_points_loaded = False
+
+    def register(self, spec: ToolSpec) -> None:
+        if spec.bridge_command is None and spec.handler is None:
+            raise ValueError(f"Tool '{spec.name}' needs a bridge command or a handler")
+        if spec.name in self._specs:
+            logger.warning("Tool '%s' registered twice; replacing previous definition", spec.name)
+        self._specs[spec.name] = spec
+        if spec.bridge_command:
+            self._bridge_commands[spec.name] = spec.bridge_command
+        self._tool_list = None
+
+    def register_many(self, specs: Iterable[ToolSpec]) -> None:
+        for spec in specs:
+            self.register(spec)
+
+    def get(self, name: str) -> ToolSpec | None:
+        return self._specs.get(name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._specs
+
+    def names(self) -> list[str]:
+        return list(self._specs)
+
+    def resolve_bridge_command(self, name: str) -> str:
+        """Map an MCP tool name to its bridge command.
+
+        Unknown names are returned unchanged so raw bridge commands
+        (e.g. ``gameObjectManage``) keep working.
+        """
+        return self._bridge_commands.get(name, name)
+
+    def is_read(self, name: str, arguments: dict[str, Any]) -> bool:
+        spec = self._specs.get(name)
+        return bool(spec and spec.is_read(arguments))
+
+    def list_tools(self) -> list[types.Tool]:
+        """Return the tool definitions, built once and reused afterwards."""
+        if self._tool_list is None:
+            self._tool_list = [spec.to_tool() for spec in self._specs.values()]
+        return self._tool_list
+
+    def load_entry_points(self, group: str = ENTRY_POINT_GROUP) -> None:
+        """Load third-party tool packs.
+
+        Each entry point may resolve to an iterable of ``ToolSpec`` or to a
+        callable that receives this registry and registers its own tools.
+        """
+        if self._entry_points_loaded:
+            return
+        self._entry_points_loaded = True
+
+        for entry_point in entry_points(group=group):
+            try:
+                target = entry_point.load()
+                if callable(target):
+                    target(self)
+                else:
+                    self.register_many(target)
+                logger.info("Loaded tool pack '%s'", entry_point.name)
+            except Exception:  # pragma: no cover - defensive
+                logger.exception("Failed to load tool pack '%s'", entry_point.name)
+
+
+tool_registry = ToolRegistry()
+
+__all__ = [
+    "DEFAULT_READ_OPERATIONS",
+    "ENTRY_POINT_GROUP",
+    "PostHook",
+    "PreHook",
+    "ToolHandler",
+    "ToolRegistry",
+    "ToolSpec",
+    "Validator",
+    "tool_registry",
+]
@@ -0,0 +1,189 @@
+"""
+Response shaping options shared by every tool.
+
+The options are consumed by the MCP server and never forwarded to Unity:
+
+- ``fields``: dotted paths to keep in the result (e.g. ``results.gameObjectPath``)
+- ``exclude``: dotted paths to drop from the result
+- ``compact``: emit JSON without indentation
+- ``pageSize`` / ``cursor``: page through large list results held on the server
+- ``inline``: never move oversized results to the blob store
+- ``dryRun``: validate the call against the cached editor state instead of running it
+- ``format``: ``columnar`` turns lists of objects into tables (see ``utils.columnar``)
+
+Results whose encoded size exceeds the blob threshold are written to the
+blob store and replaced by a short summary plus a ``blob://<sha256>``
+resource URI that clients read only when they need the full content.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import mcp.types as types
+
+from services.blob_store import blob_store, blob_uri
+from utils.columnar import encode_columnar
+from utils.json_utils import as_compact_json, as_pretty_json
+from utils.projection import project
+
+RESPONSE_OPTION_PROPERTIES: dict[str, Any] = {
+    "fields": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "Dotted result paths to keep (e.g. 'results.gameObjectPath'). Lists are traversed automatically.",
+    },
+    "exclude": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "Dotted result paths to drop from the response (e.g. 'results.properties').",
+    },
+    "compact": {
+        "type": "boolean",
+        "description": "Return minified JSON instead of indented JSON to reduce response size.",
+    },
+    "pageSize": {
+        "type": "integer",
+        "minimum": 1,
+        "description": "Split large list results (findMultiple/inspectMultiple/list/hierarchy) into pages of this size. The response carries 'page.nextCursor'.",
+    },
+    "cursor": {
+        "type": "string",
+        "description": "Cursor from a previous 'page.nextCursor'. Returns the next page from the server-side cache without re-running the query in Unity.",
+    },
+    "inline": {
+        "type": "boolean",
+        "description": "Always return the full result inline instead of a blob:// resource URI for oversized results.",
+    },
+    "dryRun": {
+        "type": "boolean",
+        "description": "Only check GameObject paths, component types and asset paths against the cached scene state and report every problem, without sending anything to Unity.",
+    },
+    "format": {
+        "type": "string",
+        "enum": ["rows", "columnar"],
+        "description": "'columnar' returns lists of objects (e.g. inspectMultiple/findMultiple results) as tables: column names once, nested objects as dotted columns, repeated strings interned. Much smaller for bulk results. Default 'rows'.",
+    },
+}
+
+# Longest string value copied verbatim into a blob summary.
+_SUMMARY_STRING_LIMIT = 200
+
+
+@dataclass(frozen=True)
+class ResponseOptions:
+    fields: tuple[str, ...] = ()
+    exclude: tuple[str, ...] = ()
+    compact: bool = False
+    page_size: int | None = None
+    cursor: str | None = None
+    inline: bool = False
+    dry_run: bool = False
+    columnar: bool = False
+
+    @property
+    def projects(self) -> bool:
+        return bool(self.fields or self.exclude)
+
+
+def with_response_options(schema: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of an object schema extended with the shared response options."""
+    if schema.get("type") != "object":
+        return schema
+    enriched = dict(schema)
+    enriched["properties"] = {**schema.get("properties", {}), **RESPONSE_OPTION_PROPERTIES}
+    return enriched
+
+
+def split_response_options(arguments: dict[str, Any]) -> tuple[dict[str, Any], ResponseOptions]:
+    """Separate the shared response options from the arguments sent to Unity."""
+    if not any(key in arguments for key in RESPONSE_OPTION_PROPERTIES):
+        return arguments, ResponseOptions()
+
+    page_size = arguments.get("pageSize")
+    if page_size is not None and (isinstance(page_size, bool) or not isinstance(page_size, int) or page_size < 1):
+        raise ValueError(f"pageSize must be a positive integer: {page_size!r}")
+
+    remaining = {key: value for key, value in arguments.items() if key not in RESPONSE_OPTION_PROPERTIES}
+    options = ResponseOptions(
+        fields=tuple(arguments.get("fields") or ()),
+        exclude=tuple(arguments.get("exclude") or ()),
+        compact=bool(arguments.get("compact", False)),
+        page_size=page_size,
+        cursor=arguments.get("cursor"),
+        inline=bool(arguments.get("inline", False)),
+        dry_run=bool(arguments.get("dryRun", False)),
+        columnar=arguments.get("format") == "columnar",
+    )
+    return remaining, options
+
+
+def _summarize(value: Any) -> Any:
+    if isinstance(value, list):
+        return f"[{len(value)} items]"
+    if isinstance(value, dict):
+        return {key: _summarize_field(item) for key, item in value.items()}
+    return _summarize_field(value)
+
+
+def _summarize_field(value: Any) -> Any:
+    if isinstance(value, list):
+        return f"[{len(value)} items]"
+    if isinstance(value, dict):
+        return f"{{{len(value)} keys}}"
+    if isinstance(value, str) and len(value) > _SUMMARY_STRING_LIMIT:
+        return value[:_SUMMARY_STRING_LIMIT] + "..."
+    return value
+
+
+def _offload(
+    response: Any,
+    data: bytes,
+    mime_type: str,
+    options: ResponseOptions,
+    page: dict[str, Any] | None,
+) -> list[types.Content]:
+    digest = blob_store.put(data)
+    envelope: dict[str, Any] = {
+        "offloaded": True,
+        "blobUri": blob_uri(digest),
+        "bytes": len(data),
+        "mimeType": mime_type,
+        "summary": _summarize(response),
+        "hint": "Read the blobUri resource for the full result. Append '?offset=<n>&length=<n>' for a byte range.",
+    }
+    if page is not None:
+        envelope["page"] = page
+    text = as_compact_json(envelope) if options.compact else as_pretty_json(envelope)
+    return [types.TextContent(type="text", text=text)]
+
+
+def render_response(
+    response: Any,
+    options: ResponseOptions,
+    page: dict[str, Any] | None = None,
+) -> list[types.Content]:
+    """Apply projection and encoding to a tool result.
+
+    Pagination metadata is attached after projection and columnar encoding so
+    that ``fields`` never hides the cursor needed to fetch the next page.
+    """
+    if isinstance(response, str):
+        text = response
+        mime_type = "text/plain"
+    else:
+        if options.projects:
+            response = project(response, options.fields, options.exclude)
+        payload = encode_columnar(response) if options.columnar else response
+        if page is not None and isinstance(payload, dict):
+            payload = {**payload, "page": page}
+        text = as_compact_json(payload) if options.compact else as_pretty_json(payload)
+        mime_type = "application/json"
+
+    if not options.inline:
+        data = text.encode("utf-8")
+        if blob_store.should_offload(len(data)):
+            return _offload(response, data, mime_type, options, page)
+
+    return [types.TextContent(type="text", text=text)]
@@ -0,0 +1,1150 @@
+"""
+Input schemas for the built-in Unity tools.
+
+Each schema is produced by a factory so that the registry only builds the
+dictionaries the first time a tool definition is requested.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def _schema_with_required(schema: dict[str, Any], required: list[str]) -> dict[str, Any]:
+    enriched = dict(schema)
+    enriched["required"] = required
+    enriched["additionalProperties"] = False
+    return enriched
+
+
+def ping_schema() -> dict[str, Any]:
+    return {
+        "type": "object",
+        "properties": {},
+        "additionalProperties": False,
+    }
+
+
+def compile_barrier_schema() -> dict[str, Any]:
+    return _schema_with_required(
+        {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": ["begin", "end", "flush", "status"],
+                    "description": "begin: defer C# compilation; end: refresh and wait for one compilation; flush: like end but keeps the barrier open; status: list pending writes.",
+                },
+                "label": {
+                    "type": "string",
+                    "description": "Optional barrier name reported in deferred results (begin only).",
+                },
+                "timeoutSeconds": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "description": "Maximum seconds to wait for the compilation (end/flush only, default 60).",
+                },
+            },
+        },
+        ["operation"],
+    )
+
+
+def scene_manage_schema() -> dict[str, Any]:
+    return _schema_with_required(
+        {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": [
+                        "create",
+                        "load",
+                        "save",
+                        "delete",
+                        "duplicate",
+                        "inspect",
+                        "listBuildSettings",
+                        "addToBuildSettings",
+                        "removeFromBuildSettings",
+                        "reorderBuildSettings",
+                        "setBuildSettingsEnabled",
+                    ],
+                },
+                "scenePath": {"type": "string"},
+                "newSceneName": {"type": "string"},
+                "additive": {"type": "boolean"},
+                "includeOpenScenes": {"type": "boolean"},
+                "includeHierarchy": {"type": "boolean"},
+                "includeComponents": {"type": "boolean"},
+                "filter": {"type": "string"},
+                "enabled": {"type": "boolean"},
+                "index": {"type": "integer"},
+                "fromIndex": {"type": "integer"},
+                "toIndex": {"type": "integer"},
+            },
+        },
+        ["operation"],
+    )
+
+
+def game_object_manage_schema() -> dict[str, Any]:
+    return _schema_with_required(
+        {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": [
+                        "create",
+                        "delete",
+                        "move",
+                        "rename",
+                        "update",
+                        "duplicate",
+                        "inspect",
+                        "findMultiple",
+                        "deleteMultiple",
+                        "inspectMultiple",
+                    ],
+                },
+                "gameObjectPath": {"type": "string"},
+                "parentPath": {"type": "string"},
+                "template": {"type": "string"},
+                "name": {"type": "string"},
+                "tag": {"type": "string"},
+                "layer": {"oneOf": [{"type": "integer"}, {"type": "string"}]},
+                "active": {"type": "boolean"},
+                "static": {"type": "boolean"},
+                "pattern": {"type": "string"},
+                "useRegex": {"type": "boolean"},
+                "includeComponents": {"type": "boolean"},
+                "maxResults": {"type": "integer"},
+            },
+        },
+        ["operation"],
+    )
+
+
+def component_manage_schema() -> dict[str, Any]:
+    return _schema_with_required(
+        {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": [
+                        "add",
+                        "remove",
+                        "update",
+                        "inspect",
+                        "addMultiple",
+                        "removeMultiple",
+                        "updateMultiple",
+                        "inspectMultiple",
+                    ],
+                },
+                "gameObjectPath": {"type": "string"},
+                "gameObjectGlobalObjectId": {"type": "string"},
+                "componentType": {"type": "string"},
+                "propertyChanges": {"type": "object", "additionalProperties": True},
+                "coalesce": {
+                    "type": "boolean",
+                    "description": "For 'update': merge this call with other coalescing updates of the same component arriving within a short window (last write wins per property) and send a single update to Unity. Every caller receives the final result.",
+                },
+                "applyDefaults": {"type": "boolean"},
+                "pattern": {"type": "string"},
+                "useRegex": {"type": "boolean"},
+                "includeProperties": {"type": "boolean"},
+                "propertyFilter": {"type": "array", "items": {"type": "string"}},
+                "maxResults": {"type": "integer"},
+                "stopOnError": {"type": "boolean"},
+            },
+        },
+        ["operation", "componentType"],
+    )
+
+
+def asset_manage_schema() -> dict[str, Any]:
+    return _schema_with_required(
+        {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": [
+                        "create",
+                        "update",
+                        "updateImporter",
+                        "delete",
+                        "rename",
+                        "duplicate",
+                        "inspect",
+                        "findMultiple",
+                        "deleteMultiple",
+                        "inspectMultiple",
+                    ],
+                },
+                "assetPath": {"type": "string"},
+                "assetGuid": {"type": "string"},
+                "content": {"type": "string"},
+                "destinationPath": {"type": "string"},
+                "propertyChanges": {"type": "object", "additionalProperties": True},
+                "pattern": {"type": "string"},
+                "useRegex": {"type": "boolean"},
+                "includeProperties": {"type": "boolean"},
+                "maxResults": {"type": "integer"},
+            },
+        },
+        ["operation"],
+    )
+
+
+def project_settings_manage_schema() -> dict[str, Any]:
+    return _schema_with_required(
+        {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": ["read", "write", "list", "addSceneToBuild", "removeSceneFromBuild", "listBuildScenes", "reorderBuildScenes", "setBuildSceneEnabled"],
+                },
+                "category": {
+                    "type": "string",
+                    "enum": ["player", "quality", "time", "physics", "physics2d", "audio", "editor", "tagsLayers"],
+                },
+                "property": {"type": "string"},
+                "value": {},
+                "scenePath": {"type": "string", "description": "Path to scene file for build settings operations"},
+                "index": {"type": "integer", "description": "Scene index for build settings operations"},
+                "fromIndex": {"type": "integer", "description": "Source index for reordering build scenes"},
+                "toIndex": {"type": "integer", "description": "Target index for reordering build scenes"},
+                "enabled": {"type": "boolean", "description": "Whether scene is enabled in build settings"},
+            },
+        },
+        ["operation"],
+    )
+
+
+def scriptable_object_manage_schema() -> dict[str, Any]:
+    return _schema_with_required(
+        {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": [
+                        "create",
+                        "inspect",
+                        "update",
+                        "delete",
+                        "duplicate",
+                        "list",
+                        "findByType",
+                    ],
+                },
+                "typeName": {"type": "string"},
+                "assetPath": {"type": "string"},
+                "assetGuid": {"type": "string"},
+                "properties": {"type": "object", "additionalProperties": True},
+                "includeProperties": {"type": "boolean"},
+                "propertyFilter": {"type": "array", "items": {"type": "string"}},
+                "searchPath": {"type": "string"},
+                "maxResults": {"type": "integer"},
+                "offset": {"type": "integer"},
+                "sourceAssetPath": {"type": "string"},
+                "sourceAssetGuid": {"type": "string"},
+                "destinationAssetPath": {"type": "string"},
+            },
+        },
+        ["operation"],
+    )
+
+
+def prefab_manage_schema() -> dict[str, Any]:
+    return _schema_with_required(
+        {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": [
+                        "create",
+                        "update",
+                        "inspect",
+                        "instantiate",
+                        "unpack",
+                        "applyOverrides",
+                        "revertOverrides",
+                    ],
+                    "description": "Prefab operation to perform.",
+                },
+                "gameObjectPath": {
+                    "type": "string",
+                    "description": "Hierarchy path of GameObject (for create/update/unpack operations).",
+                },
+                "prefabPath": {
+                    "type": "string",
+                    "description": "Asset path to prefab file (e.g., 'Assets/Prefabs/MyPrefab.prefab').",
+                },
+                "parentPath": {
+                    "type": "string",
+                    "description": "Parent GameObject path for instantiation.",
+                },
+                "position": {
+                    "type": "object",
+                    "properties": {
+                        "x": {"type": "number"},
+                        "y": {"type": "number"},
+                        "z": {"type": "number"},
+                    },
+                    "description": "Position for instantiated prefab.",
+                },
+                "rotation": {
+                    "type": "object",
+                    "properties": {
+                        "x": {"type": "number"},
+                        "y": {"type": "number"},
+                        "z": {"type": "number"},
+                    },
+                    "description": "Euler rotation for instantiated prefab.",
+                },
+                "unpackMode": {
+                    "type": "string",
+                    "enum": ["completely", "outermost"],
+                    "description": "Unpack mode: 'completely' or 'outermost'.",
+                },
+                "includeOverrides": {
+                    "type": "boolean",
+                    "description": "Include override information in inspect operation.",
+                },
+            },
+        },
+        ["operation"],
+    )
+
+
+def vector_sprite_convert_schema() -> dict[str, Any]:
+    return _schema_with_required(
+        {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": [
+                        "primitiveToSprite",
+                        "svgToSprite",
+                        "textureToSprite",
+                        "createColorSprite",
+                    ],
+                    "description": "Vector/sprite conversion operation.",
+                },
+                "primitiveType": {
+                    "type": "string",
+                    "enum": ["square", "circle", "triangle", "polygon"],
+                    "description": "Primitive shape type for sprite generation.",
+                },
+                "width": {
+                    "type": "integer",
+                    "description": "Width of generated sprite in pixels.",
+                },
+                "height": {
+                    "type": "integer",
+                    "description": "Height of generated sprite in pixels.",
+                },
+                "color": {
+                    "type": "object",
+                    "properties": {
+                        "r": {"type": "number", "minimum": 0, "maximum": 1},
+                        "g": {"type": "number", "minimum": 0, "maximum": 1},
+                        "b": {"type": "number", "minimum": 0, "maximum": 1},
+                        "a": {"type": "number", "minimum": 0, "maximum": 1},
+                    },
+                    "description": "RGBA color (0-1 range).",
+                },
+                "sides": {
+                    "type": "integer",
+                    "description": "Number of sides for polygon primitive.",
+                },
+                "svgPath": {
+                    "type": "string",
+                    "description": "Path to SVG file for conversion.",
+                },
+                "texturePath": {
+                    "type": "string",
+                    "description": "Path to texture file for sprite conversion.",
+                },
+                "outputPath": {
+                    "type": "string",
+                    "description": "Output path for generated sprite asset.",
+                },
+                "pixelsPerUnit": {
+                    "type": "number",
+                    "description": "Pixels per unit for sprite import settings.",
+                },
+                "spriteMode": {
+                    "type": "string",
+                    "enum": ["single", "multiple"],
+                    "description": "Sprite mode: 'single' or 'multiple'.",
+                },
+            },
+        },
+        ["operation"],
+    )
+
+
+def transform_batch_schema() -> dict[str, Any]:
+    return _schema_with_required(
+        {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": [
+                        "arrangeCircle",
+                        "arrangeLine",
+                        "renameSequential",
+                        "renameFromList",
+                        "createMenuList",
+                    ],
+                },
+                "gameObjectPaths": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Target GameObject hierarchy paths.",
+                },
+                "center": {
+                    "type": "object",
+                    "properties": {
+                        "x": {"type": "number"},
+                        "y": {"type": "number"},
+                        "z": {"type": "number"},
+                    },
+                },
+                "radius": {"type": "number"},
+                "startAngle": {"type": "number"},
+                "clockwise": {"type": "boolean"},
+                "plane": {"type": "string", "enum": ["XY", "XZ", "YZ"]},
+                "localSpace": {"type": "boolean"},
+                "startPosition": {
+                    "type": "object",
+                    "properties": {
+                        "x": {"type": "number"},
+                        "y": {"type": "number"},
+                        "z": {"type": "number"},
+                    },
+                },
+                "endPosition": {
+                    "type": "object",
+                    "properties": {
+                        "x": {"type": "number"},
+                        "y": {"type": "number"},
+                        "z": {"type": "number"},
+                    },
+                },
+                "spacing": {"type": "number"},
+                "baseName": {"type": "string"},
+                "startIndex": {"type": "integer"},
+                "padding": {"type": "integer"},
+                "names": {"type": "array", "items": {"type": "string"}},
+                "parentPath": {"type": "string"},
+                "prefabPath": {"type": "string"},
+                "axis": {"type": "string", "enum": ["horizontal", "vertical"]},
+                "offset": {"type": "number"},
+            },
+        },
+        ["operation"],
+    )
+
+
+def rect_transform_batch_schema() -> dict[str, Any]:
+    return _schema_with_required(
+        {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": [
+                        "setAnchors",
+                        "setPivot",
+                        "setSizeDelta",
+                        "setAnchoredPosition",
+                        "alignToParent",
+                        "distributeHorizontal",
+                        "distributeVertical",
+                        "matchSize",
+                    ],
+                },
+                "gameObjectPaths": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Target GameObject hierarchy paths (must have RectTransform).",
+                },
+                "anchorMin": {
+                    "type": "object",
+                    "properties": {
+                        "x": {"type": "number"},
+                        "y": {"type": "number"},
+                    },
+                },
+                "anchorMax": {
+                    "type": "object",
+                    "properties": {
+                        "x": {"type": "number"},
+                        "y": {"type": "number"},
+                    },
+                },
+                "pivot": {
+                    "type": "object",
+                    "properties": {
+                        "x": {"type": "number"},
+                        "y": {"type": "number"},
+                    },
+                },
+                "sizeDelta": {
+                    "type": "object",
+                    "properties": {
+                        "x": {"type": "number"},
+                        "y": {"type": "number"},
+                    },
+                },
+                "anchoredPosition": {
+                    "type": "object",
+                    "properties": {
+                        "x": {"type": "number"},
+                        "y": {"type": "number"},
+                    },
+                },
+                "preset": {
+                    "type": "string",
+                    "enum": [
+                        "topLeft",
+                        "topCenter",
+                        "topRight",
+                        "middleLeft",
+                        "middleCenter",
+                        "middleRight",
+                        "bottomLeft",
+                        "bottomCenter",
+                        "bottomRight",
+                        "stretchLeft",
+                        "stretchCenter",
+                        "stretchRight",
+                        "stretchTop",
+                        "stretchMiddle",
+                        "stretchBottom",
+                        "stretchAll",
+                    ],
+                },
+                "spacing": {"type": "number"},
+                "matchWidth": {"type": "boolean"},
+                "matchHeight": {"type": "boolean"},
+                "sourceGameObjectPath": {"type": "string"},
+            },
+        },
+        ["operation"],
+    )
+
+
+def physics_bundle_schema() -> dict[str, Any]:
+    return _schema_with_required(
+        {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": [
+                        "applyPreset2D",
+                        "applyPreset3D",
+                        "updateRigidbody2D",
+                        "updateRigidbody3D",
+                        "updateCollider2D",
+                        "updateCollider3D",
+                        "inspect",
+                    ],
+                },
+                "gameObjectPaths": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Target GameObject hierarchy paths.",
+                },
+                "preset": {
+                    "type": "string",
+                    "enum": [
+                        "dynamic",
+                        "kinematic",
+                        "static",
+                        "character",
+                        "platformer",
+                        "topDown",
+                        "vehicle",
+                        "projectile",
+                    ],
+                    "description": "Physics preset template.",
+                },
+                "colliderType": {
+                    "type": "string",
+                    "enum": ["box", "sphere", "capsule", "mesh", "circle", "polygon", "edge"],
+                    "description": "Collider type to add (2D: box/circle/polygon/edge, 3D: box/sphere/capsule/mesh).",
+                },
+                "isTrigger": {"type": "boolean"},
+                "rigidbodyType": {
+                    "type": "string",
+                    "enum": ["dynamic", "kinematic", "static"],
+                },
+                "mass": {"type": "number"},
+                "drag": {"type": "number"},
+                "angularDrag": {"type": "number"},
+                "gravityScale": {"type": "number"},
+                "useGravity": {"type": "boolean"},
+                "isKinematic": {"type": "boolean"},
+                "interpolate": {
+                    "type": "string",
+                    "enum": ["none", "interpolate", "extrapolate"],
+                },
+                "collisionDetection": {
+                    "type": "string",
+                    "enum": ["discrete", "continuous", "continuousDynamic", "continuousSpeculative"],
+                },
+                "constraints": {
+                    "type": "object",
+                    "properties": {
+                        "freezePositionX": {"type": "boolean"},
+                        "freezePositionY": {"type": "boolean"},
+                        "freezePositionZ": {"type": "boolean"},
+                        "freezeRotationX": {"type": "boolean"},
+                        "freezeRotationY": {"type": "boolean"},
+                        "freezeRotationZ": {"type": "boolean"},
+                    },
+                },
+                "size": {
+                    "type": "object",
+                    "properties": {
+                        "x": {"type": "number"},
+                        "y": {"type": "number"},
+                        "z": {"type": "number"},
+                    },
+                    "description": "Collider size (Vector2 for 2D, Vector3 for 3D).",
+                },
+                "center": {
+                    "type": "object",
+                    "properties": {
+                        "x": {"type": "number"},
+                        "y": {"type": "number"},
+                        "z": {"type": "number"},
+                    },
+                    "description": "Collider center offset.",
+                },
+                "radius": {"type": "number", "description": "Radius for sphere/circle/capsule colliders."},
+                "height": {"type": "number", "description": "Height for capsule colliders."},
+                "material": {"type": "string", "description": "Physics material asset path."},
+            },
+        },
+        ["operation"],
+    )
+
+
+def camera_rig_schema() -> dict[str, Any]:
+    return _schema_with_required(
+        {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": ["createRig", "updateRig", "inspect"],
+                },
+                "rigType": {
+                    "type": "string",
+                    "enum": ["follow", "orbit", "splitScreen", "fixed", "dolly"],
+                    "description": "Camera rig preset type.",
+                },
+                "parentPath": {"type": "string", "description": "Parent GameObject path for the rig."},
+                "rigName": {"type": "string", "description": "Name for the camera rig."},
+                "targetPath": {"type": "string", "description": "Target GameObject to follow/orbit."},
+                "offset": {
+                    "type": "object",
+                    "properties": {
+                        "x": {"type": "number"},
+                        "y": {"type": "number"},
+                        "z": {"type": "number"},
+                    },
+                    "description": "Camera offset from target.",
+                },
+                "distance": {"type": "number", "description": "Distance from target (for orbit)."},
+                "followSpeed": {"type": "number", "description": "Follow smoothing speed."},
+                "lookAtTarget": {"type": "boolean", "description": "Whether camera should look at target."},
+                "fieldOfView": {"type": "number", "description": "Camera field of view."},
+                "orthographic": {"type": "boolean", "description": "Use orthographic projection."},
+                "orthographicSize": {"type": "number", "description": "Orthographic camera size."},
+                "splitScreenIndex": {"type": "integer", "description": "Split screen viewport index (0-3)."},
+            },
+        },
+        ["operation"],
+    )
+
+
+def ui_foundation_schema() -> dict[str, Any]:
+    return _schema_with_required(
+        {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": ["createCanvas", "createPanel", "createButton", "createText", "createImage", "createInputField", "inspect"],
+                },
+                "parentPath": {"type": "string", "description": "Parent GameObject path."},
+                "name": {"type": "string", "description": "UI element name."},
+                "renderMode": {
+                    "type": "string",
+                    "enum": ["screenSpaceOverlay", "screenSpaceCamera", "worldSpace"],
+                    "description": "Canvas render mode.",
+                },
+                "sortingOrder": {"type": "integer", "description": "Canvas sorting order."},
+                "text": {"type": "string", "description": "Text content."},
+                "fontSize": {"type": "integer", "description": "Font size."},
+                "color": {
+                    "type": "object",
+                    "properties": {
+                        "r": {"type": "number"},
+                        "g": {"type": "number"},
+                        "b": {"type": "number"},
+                        "a": {"type": "number"},
+                    },
+                    "description": "Color (RGBA 0-1).",
+                },
+                "anchorPreset": {
+                    "type": "string",
+                    "enum": [
+                        "topLeft", "topCenter", "topRight",
+                        "middleLeft", "middleCenter", "middleRight",
+                        "bottomLeft", "bottomCenter", "bottomRight",
+                        "stretchAll",
+                    ],
+                    "description": "RectTransform anchor preset.",
+                },
+                "width": {"type": "number", "description": "Width of UI element."},
+                "height": {"type": "number", "description": "Height of UI element."},
+                "spritePath": {"type": "string", "description": "Sprite asset path for Image/Button."},
+                "placeholder": {"type": "string", "description": "Placeholder text for InputField."},
+            },
+        },
+        ["operation"],
+    )
+
+
+def audio_source_bundle_schema() -> dict[str, Any]:
+    return _schema_with_required(
+        {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": ["createAudioSource", "updateAudioSource", "inspect"],
+                },
+                "gameObjectPath": {"type": "string", "description": "Target GameObject path."},
+                "preset": {
+                    "type": "string",
+                    "enum": ["music", "sfx", "ambient", "voice", "ui", "custom"],
+                    "description": "Audio source preset type.",
+                },
+                "audioClipPath": {"type": "string", "description": "AudioClip asset path."},
+                "volume": {"type": "number", "description": "Volume (0-1)."},
+                "pitch": {"type": "number", "description": "Pitch (-3 to 3)."},
+                "loop": {"type": "boolean", "description": "Loop playback."},
+                "playOnAwake": {"type": "boolean", "description": "Play on awake."},
+                "spatialBlend": {"type": "number", "description": "2D/3D blend (0=2D, 1=3D)."},
+                "minDistance": {"type": "number", "description": "Min distance for 3D sound."},
+                "maxDistance": {"type": "number", "description": "Max distance for 3D sound."},
+                "priority": {"type": "integer", "description": "Priority (0-256, 0=highest)."},
+                "mixerGroupPath": {"type": "string", "description": "Audio mixer group asset path."},
+            },
+        },
+        ["operation"],
+    )
+
+
+def input_profile_schema() -> dict[str, Any]:
+    return _schema_with_required(
+        {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": ["createPlayerInput", "createInputActions", "inspect"],
+                },
+                "gameObjectPath": {"type": "string", "description": "Target GameObject path."},
+                "preset": {
+                    "type": "string",
+                    "enum": ["player", "ui", "vehicle", "custom"],
+                    "description": "Input profile preset type.",
+                },
+                "inputActionsAssetPath": {"type": "string", "description": "InputActions asset path."},
+                "defaultActionMap": {"type": "string", "description": "Default action map name."},
+                "notificationBehavior": {
+                    "type": "string",
+                    "enum": ["sendMessages", "broadcastMessages", "invokeUnityEvents", "invokeCSharpEvents"],
+                    "description": "Input notification behavior.",
+                },
+                "actions": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string"},
+                            "type": {"type": "string", "enum": ["button", "value", "passThrough"]},
+                            "binding": {"type": "string"},
+                        },
+                    },
+                    "description": "Custom action definitions.",
+                },
+            },
+        },
+        ["operation"],
+    )
+
+
+def character_controller_bundle_schema() -> dict[str, Any]:
+    return _schema_with_required(
+        {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": ["applyPreset", "update", "inspect"],
+                },
+                "gameObjectPath": {"type": "string", "description": "Target GameObject path."},
+                "gameObjectPaths": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Multiple GameObject paths for batch operations.",
+                },
+                "preset": {
+                    "type": "string",
+                    "enum": ["fps", "tps", "platformer", "child", "large", "narrow", "custom"],
+                    "description": "CharacterController preset type.",
+                },
+                "radius": {"type": "number", "description": "Capsule radius."},
+                "height": {"type": "number", "description": "Capsule height."},
+                "center": {
+                    "type": "object",
+                    "properties": {"x": {"type": "number"}, "y": {"type": "number"}, "z": {"type": "number"}},
+                    "description": "Center offset of the capsule.",
+                },
+                "slopeLimit": {"type": "number", "description": "Maximum slope angle in degrees."},
+                "stepOffset": {"type": "number", "description": "Maximum step height."},
+                "skinWidth": {"type": "number", "description": "Skin width for collision detection."},
+                "minMoveDistance": {"type": "number", "description": "Minimum move distance threshold."},
+            },
+        },
+        ["operation"],
+    )
+
+
+def gamekit_actor_schema() -> dict[str, Any]:
+    return _schema_with_required(
+        {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": ["create", "update", "inspect", "delete"],
+                    "description": "Actor operation.",
+                },
+                "actorId": {"type": "string", "description": "Unique actor identifier (used for targeting with UICommand and scripting)."},
+                "parentPath": {"type": "string", "description": "Parent GameObject path (optional, defaults to scene root)."},
+                "behaviorProfile": {
+                    "type": "string",
+                    "enum": ["2dLinear", "2dPhysics", "2dTileGrid", "graphNode", "splineMovement", "3dCharacterController", "3dPhysics", "3dNavMesh"],
+                    "description": "Movement behavior profile: '2dLinear' (simple 2D movement), '2dPhysics' (Rigidbody2D physics), '2dTileGrid' (grid-based movement for tactics/roguelikes), 'graphNode' (A* pathfinding, 2D/3D agnostic), 'splineMovement' (rail-based for 2.5D/rail shooters), '3dCharacterController' (CharacterController for FPS/TPS), '3dPhysics' (Rigidbody physics), '3dNavMesh' (NavMesh agent for RTS/strategy).",
+                },
+                "controlMode": {
+                    "type": "string",
+                    "enum": ["directController", "aiAutonomous", "uiCommand", "scriptTriggerOnly"],
+                    "description": "Input control mode: 'directController' (player input via New Input System or legacy), 'aiAutonomous' (AI-driven patrol/follow/wander), 'uiCommand' (controlled by UI buttons via GameKitUICommand), 'scriptTriggerOnly' (event-driven from scripts only).",
+                },
+                "position": {
+                    "type": "object",
+                    "properties": {"x": {"type": "number"}, "y": {"type": "number"}, "z": {"type": "number"}},
+                    "description": "Initial world position of the actor.",
+                },
+                "rotation": {
+                    "type": "object",
+                    "properties": {"x": {"type": "number"}, "y": {"type": "number"}, "z": {"type": "number"}},
+                    "description": "Initial euler rotation of the actor (optional).",
+                },
+                "spritePath": {"type": "string", "description": "Sprite asset path for 2D actors (e.g., 'Assets/Sprites/Player.png')."},
+                "modelPath": {"type": "string", "description": "Model prefab path for 3D actors (e.g., 'Assets/Models/Character.prefab')."},
+            },
+        },
+        ["operation"],
+    )
+
+
+def gamekit_manager_schema() -> dict[str, Any]:
+    return _schema_with_required(
+        {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": ["create", "update", "inspect", "delete", "exportState", "importState", "setFlowEnabled"],
+                    "description": "Manager operation.",
+                },
+                "managerId": {"type": "string", "description": "Unique manager identifier."},
+                "managerType": {
+                    "type": "string",
+                    "enum": ["turnBased", "realtime", "resourcePool", "eventHub", "stateManager"],
+                    "description": "Manager type: 'turnBased' for turn-based games, 'realtime' for real-time coordination, 'resourcePool' for resource/economy management, 'eventHub' for global events, 'stateManager' for finite state machines.",
+                },
+                "parentPath": {"type": "string", "description": "Parent GameObject path."},
+                "persistent": {"type": "boolean", "description": "DontDestroyOnLoad flag (survives scene changes)."},
+                "turnPhases": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Turn phase names for turn-based managers (e.g., ['PlayerTurn', 'EnemyTurn', 'ResolveEffects']).",
+                },
+                "resourceTypes": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Resource type names for resource pool managers (deprecated, use initialResources instead).",
+                },
+                "initialResources": {
+                    "type": "object",
+                    "additionalProperties": {"type": "number"},
+                    "description": "Initial resource amounts for resource pool managers (e.g., {'health': 100, 'mana': 50, 'gold': 1000}).",
+                },
+                "stateData": {
+                    "type": "object",
+                    "additionalProperties": True,
+                    "description": "State data for importState operation (JSON-serializable state from exportState).",
+                },
+                "flowId": {"type": "string", "description": "Flow identifier for setFlowEnabled operation."},
+                "enabled": {"type": "boolean", "description": "Enable/disable flow for setFlowEnabled operation."},
+            },
+        },
+        ["operation"],
+    )
+
+
+def gamekit_interaction_schema() -> dict[str, Any]:
+    return _schema_with_required(
+        {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": ["create", "update", "inspect", "delete"],
+                    "description": "Interaction operation.",
+                },
+                "interactionId": {"type": "string", "description": "Unique interaction identifier (e.g., 'GoldCoin', 'AutoDoor')."},
+                "parentPath": {"type": "string", "description": "Parent GameObject path (optional, creates new GameObject if not specified)."},
+                "triggerType": {
+                    "type": "string",
+                    "enum": ["collision", "trigger", "raycast", "proximity", "input"],
+                    "description": "Trigger detection type: 'collision' (OnCollisionEnter), 'trigger' (OnTriggerEnter), 'raycast' (ray hit detection), 'proximity' (distance-based), 'input' (key press).",
+                },
+                "triggerShape": {
+                    "type": "string",
+                    "enum": ["box", "sphere", "capsule"],
+                    "description": "Collider shape for collision/trigger types (ignored for other types).",
+                },
+                "triggerSize": {
+                    "type": "object",
+                    "properties": {"x": {"type": "number"}, "y": {"type": "number"}, "z": {"type": "number"}},
+                    "description": "Collider size/radius (Vector3 for box/capsule, x for sphere radius).",
+                },
+                "actions": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "type": {"type": "string", "enum": ["spawnPrefab", "destroyObject", "playSound", "sendMessage", "changeScene"], "description": "Action type to execute."},
+                            "target": {"type": "string", "description": "Target GameObject name/path or 'self' for the interaction GameObject."},
+                            "parameter": {"type": "string", "description": "Action parameter (prefab path, message name, scene name, etc.)."},
+                        },
+                    },
+                    "description": "Declarative actions to execute when trigger conditions are met (executed in order).",
+                },
+                "conditions": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "type": {"type": "string", "enum": ["tag", "layer", "distance", "custom"], "description": "Condition type."},
+                            "value": {"type": "string", "description": "Condition value (tag name, layer name/number, distance threshold, custom script)."},
+                        },
+                    },
+                    "description": "Conditions to check before executing actions (all conditions must pass, AND logic).",
+                },
+            },
+        },
+        ["operation"],
+    )
+
+
+def gamekit_ui_command_schema() -> dict[str, Any]:
+    return _schema_with_required(
+        {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": ["createCommandPanel", "addCommand", "inspect", "delete"],
+                },
+                "panelId": {"type": "string", "description": "Unique command panel identifier."},
+                "canvasPath": {"type": "string", "description": "Canvas GameObject path."},
+                "targetType": {
+                    "type": "string",
+                    "enum": ["actor", "manager"],
+                    "description": "Target type: 'actor' for GameKitActor or 'manager' for GameKitManager.",
+                },
+                "targetActorId": {"type": "string", "description": "Target actor ID (when targetType is 'actor')."},
+                "targetManagerId": {"type": "string", "description": "Target manager ID (when targetType is 'manager')."},
+                "commands": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string"},
+                            "label": {"type": "string"},
+                            "icon": {"type": "string"},
+                            "commandType": {
+                                "type": "string",
+                                "enum": ["move", "jump", "action", "look", "custom", "addResource", "setResource", "consumeResource", "changeState", "nextTurn", "triggerScene"],
+                                "description": "Command type: Actor commands (move/jump/action/look/custom) or Manager commands (addResource/setResource/consumeResource/changeState/nextTurn/triggerScene).",
+                            },
+                            "commandParameter": {"type": "string", "description": "Parameter for action/resource/state commands."},
+                            "resourceAmount": {"type": "number", "description": "Amount for resource commands (addResource/setResource/consumeResource)."},
+                            "moveDirection": {
+                                "type": "object",
+                                "properties": {"x": {"type": "number"}, "y": {"type": "number"}, "z": {"type": "number"}},
+                                "description": "Direction vector for move commands.",
+                            },
+                            "lookDirection": {
+                                "type": "object",
+                                "properties": {"x": {"type": "number"}, "y": {"type": "number"}},
+                                "description": "Direction vector for look commands.",
+                            },
+                        },
+                    },
+                    "description": "List of commands to create as buttons.",
+                },
+                "layout": {
+                    "type": "string",
+                    "enum": ["horizontal", "vertical", "grid"],
+                    "description": "Button layout style.",
+                },
+                "buttonSize": {
+                    "type": "object",
+                    "properties": {"width": {"type": "number"}, "height": {"type": "number"}},
+                },
+            },
+        },
+        ["operation"],
+    )
+
+
+def gamekit_machinations_schema() -> dict[str, Any]:
+    return _schema_with_required(
+        {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": ["create", "update", "inspect", "delete", "apply", "export"],
+                    "description": "Machinations asset operation.",
+                },
+                "diagramId": {"type": "string", "description": "Unique diagram identifier."},
+                "assetPath": {"type": "string", "description": "Path to Machinations asset file."},
+                "managerId": {"type": "string", "description": "Manager ID to apply/export diagram to/from."},
+                "resetExisting": {"type": "boolean", "description": "Reset existing resources when applying."},
+                "initialResources": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string"},
+                            "initialAmount": {"type": "number"},
+                            "minValue": {"type": "number"},
+                            "maxValue": {"type": "number"},
+                        },
+                    },
+                    "description": "Resource pool definitions.",
+                },
+                "flows": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "flowId": {"type": "string"},
+                            "resourceName": {"type": "string"},
+                            "ratePerSecond": {"type": "number"},
+                            "isSource": {"type": "boolean"},
+                            "enabledByDefault": {"type": "boolean"},
+                        },
+                    },
+                    "description": "Resource flow definitions (automatic generation/consumption).",
+                },
+                "converters": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "converterId": {"type": "string"},
+                            "fromResource": {"type": "string"},
+                            "toResource": {"type": "string"},
+                            "conversionRate": {"type": "number"},
+                            "inputCost": {"type": "number"},
+                            "enabledByDefault": {"type": "boolean"},
+                        },
+                    },
+                    "description": "Resource converter definitions (transform resources).",
+                },
+                "triggers": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "triggerName": {"type": "string"},
+                            "resourceName": {"type": "string"},
+                            "thresholdType": {"type": "string", "enum": ["above", "below", "equal", "notEqual"]},
+                            "thresholdValue": {"type": "number"},
+                            "enabledByDefault": {"type": "boolean"},
+                        },
+                    },
+                    "description": "Resource trigger definitions (threshold events).",
+                },
+            },
+        },
+        ["operation"],
+    )
+
+
+def gamekit_sceneflow_schema() -> dict[str, Any]:
+    return _schema_with_required(
+        {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": ["create", "inspect", "delete", "transition", "addScene", "removeScene", "updateScene", "addTransition", "removeTransition", "addSharedScene", "removeSharedScene"],
+                    "description": "SceneFlow operation: 'create' for initial setup, then use individual add/remove/update operations for granular control.",
+                },
+                "flowId": {"type": "string", "description": "Unique scene flow identifier (e.g., 'MainGameFlow')."},
+                "sceneName": {"type": "string", "description": "Scene name for single-scene operations (addScene, removeScene, updateScene, addSharedScene, removeSharedScene)."},
+                "scenePath": {"type": "string", "description": "Unity scene asset path (e.g., 'Assets/Scenes/Level1.unity') for addScene/updateScene."},
+                "loadMode": {"type": "string", "enum": ["single", "additive"], "description": "'single' unloads all scenes, 'additive' loads on top of existing (for addScene/updateScene)."},
+                "sharedScenePaths": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Array of shared scene paths to load with this scene (for addScene/updateScene), e.g., ['Assets/Scenes/UIOverlay.unity', 'Assets/Scenes/AudioManager.unity'].",
+                },
+                "sharedScenePath": {"type": "string", "description": "Single shared scene path for addSharedScene/removeSharedScene operations."},
+                "fromScene": {"type": "string", "description": "Source scene name for transition operations (addTransition/removeTransition)."},
+                "toScene": {"type": "string", "description": "Destination scene name for addTransition operation."},
+                "trigger": {"type": "string", "description": "Trigger name for transition operations (addTransition/removeTransition, e.g., 'startGame', 'levelComplete')."},
+                "triggerName": {"type": "string", "description": "Transition trigger name for 'transition' operation (runtime execution)."},
+            },
+        },
+        ["operation"],
+    )
@@ -0,0 +1,180 @@
+"""
+Columnar encoding for bulk list results.
+
+``inspectMultiple``, ``findMultiple`` and similar operations return lists of
+objects that repeat the same keys (and often the same values) for every row.
+``encode_columnar`` replaces such lists with a table that names each column
+once::
+
+    {
+        "encoding": "columnar",
+        "rowCount": 3,
+        "columns": ["path", "tag", "properties.position.x", "components"],
+        "values": [
+            ["A", "B", "C"],                                   # plain column
+            {"dict": ["Enemy", "Player"], "codes": [0, 0, 1]},  # interned strings
+            {"const": 0.0},                                    # same value in every row
+            {"lengths": [2, 0, 1], "table": {...}},            # nested list of objects
+        ],
+        "missing": {"tag": [2]}                                # rows without the key
+    }
+
+Nested objects are flattened into dotted column names, low-cardinality string
+columns are dictionary encoded and lists of objects inside a row become a
+child table plus per-row lengths. ``decode_columnar`` restores the original
+rows exactly.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+ENCODING = "columnar"
+
+# Shorter lists are left alone: the table header would outweigh the savings.
+MIN_ROWS = 2
+
+_MISSING = object()
+
+
+def _flatten(row: dict[str, Any], prefix: str, out: dict[str, Any]) -> None:
+    for key, value in row.items():
+        name = prefix + key
+        if isinstance(value, dict) and value and not any("." in sub for sub in value):
+            _flatten(value, name + ".", out)
+        else:
+            out[name] = value
+
+
+def _is_table(value: Any) -> bool:
+    return (
+        isinstance(value, list)
+        and len(value) >= MIN_ROWS
+        and all(isinstance(item, dict) for item in value)
+        and not any("." in key for item in value for key in item)
+    )
+
+
+def _is_object_list(value: Any) -> bool:
+    return isinstance(value, list) and all(isinstance(item, dict) for item in value)
+
+
+def _same_scalar(values: list[Any]) -> bool:
+    first = values[0]
+    if isinstance(first, (dict, list)):
+        return False
+    kind = type(first)
+    return all(type(value) is kind and value == first for value in values)
+
+
+def _encode_column(values: list[Any]) -> Any:
+    if not values:
+        return []
+    if _same_scalar(values):
+        return {"const": values[0]}
+
+    if all(value is None or isinstance(value, str) for value in values):
+        lookup: dict[Any, int] = {}
+        codes = [lookup.setdefault(value, len(lookup)) for value in values]
+        if len(lookup) * 2 <= len(values):
+            return {"dict": list(lookup), "codes": codes}
+        return values
+
+    # Lists of objects share one child table; empty lists only need a length
+    if any(value for value in values) and all(_is_object_list(value) for value in values):
+        children = [child for value in values for child in value]
+        if not any("." in key for child in children for key in child):
+            return {"lengths": [len(value) for value in values], "table": _encode_rows(children)}
+
+    return [encode_columnar(value) for value in values]
+
+
+def _encode_rows(rows: list[dict[str, Any]]) -> dict[str, Any]:
+    flat_rows: list[dict[str, Any]] = []
+    columns: dict[str, None] = {}
+    for row in rows:
+        flat: dict[str, Any] = {}
+        _flatten(row, "", flat)
+        flat_rows.append(flat)
+        columns.update(dict.fromkeys(flat))
+
+    values: list[Any] = []
+    missing: dict[str, list[int]] = {}
+    for column in columns:
+        present: list[Any] = []
+        for index, flat in enumerate(flat_rows):
+            value = flat.get(column, _MISSING)
+            if value is _MISSING:
+                missing.setdefault(column, []).append(index)
+            else:
+                present.append(value)
+        values.append(_encode_column(present))
+
+    table: dict[str, Any] = {
+        "encoding": ENCODING,
+        "rowCount": len(rows),
+        "columns": list(columns),
+        "values": values,
+    }
+    if missing:
+        table["missing"] = missing
+    return table
+
+
+def encode_columnar(value: Any) -> Any:
+    """Replace every list of objects inside ``value`` with a columnar table."""
+    if _is_table(value):
+        return _encode_rows(value)
+    if isinstance(value, dict):
+        return {key: encode_columnar(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [encode_columnar(item) for item in value]
+    return value
+
+
+def _decode_column(encoded: Any, count: int) -> list[Any]:
+    if isinstance(encoded, list):
+        return [decode_columnar(value) for value in encoded]
+    if "const" in encoded:
+        return [encoded["const"]] * count
+    if "dict" in encoded:
+        lookup = encoded["dict"]
+        return [lookup[code] for code in encoded["codes"]]
+
+    children = _decode_rows(encoded["table"])
+    decoded: list[Any] = []
+    offset = 0
+    for length in encoded["lengths"]:
+        decoded.append(children[offset : offset + length])
+        offset += length
+    return decoded
+
+
+def _decode_rows(table: dict[str, Any]) -> list[dict[str, Any]]:
+    row_count = table["rowCount"]
+    missing = table.get("missing", {})
+    rows: list[dict[str, Any]] = [{} for _ in range(row_count)]
+
+    for column, encoded in zip(table["columns"], table["values"], strict=True):
+        absent = set(missing.get(column, ()))
+        present = iter(_decode_column(encoded, row_count - len(absent)))
+        parts = column.split(".")
+        for index, row in enumerate(rows):
+            if index in absent:
+                continue
+            node = row
+            for part in parts[:-1]:
+                node = node.setdefault(part, {})
+            node[parts[-1]] = next(present)
+    return rows
+
+
+def decode_columnar(value: Any) -> Any:
+    """Inverse of ``encode_columnar``: expand every columnar table back into rows."""
+    if isinstance(value, dict):
+        if value.get("encoding") == ENCODING and "columns" in value:
+            return _decode_rows(value)
+        return {key: decode_columnar(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [decode_columnar(item) for item in value]
+    return value
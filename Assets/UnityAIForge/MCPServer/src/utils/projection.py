@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+# Marks a trie node whose whole subtree is selected.
+_LEAF = "\0"
+
+
+def _build_trie(paths: Iterable[str]) -> dict[str, Any]:
+    trie: dict[str, Any] = {}
+    for path in paths:
+        parts = [part for part in path.split(".") if part]
+        if not parts:
+            continue
+        node = trie
+        for part in parts[:-1]:
+            child = node.setdefault(part, {})
+            if _LEAF in child:
+                break
+            node = child
+        else:
+            node[parts[-1]] = {_LEAF: True}
+    return trie
+
+
+def _include(value: Any, trie: dict[str, Any]) -> Any:
+    if _LEAF in trie:
+        return value
+    if isinstance(value, list):
+        return [_include(item, trie) for item in value]
+    if isinstance(value, dict):
+        return {key: _include(item, trie[key]) for key, item in value.items() if key in trie}
+    return value
+
+
+def _exclude(value: Any, trie: dict[str, Any]) -> Any:
+    if isinstance(value, list):
+        return [_exclude(item, trie) for item in value]
+    if isinstance(value, dict):
+        projected: dict[str, Any] = {}
+        for key, item in value.items():
+            sub_trie = trie.get(key)
+            if sub_trie is None:
+                projected[key] = item
+            elif _LEAF not in sub_trie:
+                projected[key] = _exclude(item, sub_trie)
+        return projected
+    return value
+
+
+def project(
+    value: Any,
+    fields: Iterable[str] | None = None,
+    exclude: Iterable[str] | None = None,
+) -> Any:
+    """
+    Keep or drop dotted field paths in a JSON-like value.
+
+    Paths address nested dictionary keys (``results.gameObjectPath``); lists
+    are traversed transparently so a path applies to every element. ``fields``
+    is applied before ``exclude``.
+    """
+    if fields:
+        value = _include(value, _build_trie(fields))
+    if exclude:
+        value = _exclude(value, _build_trie(exclude))
+    return value
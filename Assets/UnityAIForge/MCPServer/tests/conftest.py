@@ -0,0 +1,99 @@
+"""
+Shared fixtures for the MCP server tests.
+
+The server modules are imported from ``src`` the way ``main.py`` runs them.
+Every test gets its own batch queue state directory, and ``bridge`` swaps the
+Unity bridge for a ``FakeBridge`` whose responses the test decides.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+import tools.batch_fusion as batch_fusion  # noqa: E402
+import tools.batch_results as batch_results  # noqa: E402
+import tools.batch_sequential as batch_sequential  # noqa: E402
+from bridge.bridge_manager import bridge_manager  # noqa: E402
+from tools.builtin_tools import register_builtin_tools  # noqa: E402
+from tools.registry import tool_registry  # noqa: E402
+
+Responder = Callable[[str, dict[str, Any]], Any]
+
+
+def succeed(tool_name: str, payload: dict[str, Any]) -> dict[str, Any]:
+    return {"success": True, "result": {"operation": payload.get("operation")}}
+
+
+class FakeBridge:
+    """
+    Records every command and answers it with ``respond(tool_name, payload)``.
+
+    A returned exception is raised instead, like a failed or timed out
+    command. ``latency`` delays every answer so commands overlap.
+    """
+
+    def __init__(self) -> None:
+        self.respond: Responder = succeed
+        self.latency = 0.0
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def send_command(self, tool_name: str, payload: Any, timeout_ms: int = 30_000) -> Any:
+        self.calls.append((tool_name, payload))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            response = self.respond(tool_name, payload)
+        finally:
+            self.in_flight -= 1
+        if isinstance(response, BaseException):
+            raise response
+        return response
+
+    def operations(self, tool_name: str | None = None) -> list[str]:
+        """The ``operation`` of each command sent, optionally of one bridge command."""
+        return [
+            payload.get("operation")
+            for name, payload in self.calls
+            if tool_name is None or name == tool_name
+        ]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def builtin_tools() -> None:
+    if tool_registry.get("unity_gameobject_crud") is None:
+        register_builtin_tools(tool_registry)
+
+
+@pytest.fixture(autouse=True)
+def queue_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep batch queue state, journals and spilled results under ``tmp_path``."""
+    state_file = tmp_path / ".batch_queue_state.json"
+    monkeypatch.setattr(batch_sequential, "STATE_FILE", state_file)
+    monkeypatch.setattr(batch_sequential, "JOURNAL_FILE", state_file.with_suffix(".journal.jsonl"))
+    monkeypatch.setattr(batch_sequential, "_queues", {})
+    monkeypatch.setattr(batch_sequential, "_running", set())
+    monkeypatch.setattr(batch_results, "RESULTS_DIR", tmp_path / ".batch_results")
+    return tmp_path
+
+
+@pytest.fixture
+def bridge(monkeypatch: pytest.MonkeyPatch) -> FakeBridge:
+    fake = FakeBridge()
+    monkeypatch.setattr(bridge_manager, "send_command", fake.send_command)
+    monkeypatch.setattr(bridge_manager, "is_connected", lambda: True)
+    monkeypatch.setattr(batch_fusion, "_bridge_accepts_targets", None)
+    return fake
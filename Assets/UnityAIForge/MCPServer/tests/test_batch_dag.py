@@ -0,0 +1,158 @@
+"""Dependency-aware DAG batches: ordering, references and plan validation."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from tools.batch_dag import BatchPlanError, build_plan, run_batch_dag
+
+
+def _create(op_id: str, depends_on: list[str] | None = None, **arguments) -> dict:
+    operation = {
+        "id": op_id,
+        "tool": "unity_gameobject_crud",
+        "arguments": {"operation": "create", "name": op_id, **arguments},
+    }
+    if depends_on:
+        operation["dependsOn"] = depends_on
+    return operation
+
+
+def _run(arguments: dict) -> dict:
+    return asyncio.run(run_batch_dag(arguments))
+
+
+def _sent_names(bridge) -> list[str]:
+    return [payload["name"] for _, payload in bridge.calls]
+
+
+def test_operations_wait_for_their_dependencies(bridge):
+    bridge.latency = 0.01
+    operations = [
+        _create("root"),
+        _create("child", ["root"]),
+        _create("independent"),
+        _create("grandchild", ["child"]),
+    ]
+
+    result = _run({"operations": operations})
+
+    assert result["success"]
+    assert _sent_names(bridge) == ["root", "independent", "child", "grandchild"]
+    assert [entry["id"] for entry in result["results"]] == ["root", "child", "independent", "grandchild"]
+    assert result["timing"]["criticalPath"] == ["root", "child", "grandchild"]
+
+
+def test_failure_skips_only_dependent_operations(bridge):
+    bridge.respond = lambda tool_name, payload: (
+        {"success": False, "error": "name taken"} if payload["name"] == "root" else {"success": True}
+    )
+    operations = [_create("root"), _create("child", ["root"]), _create("grandchild", ["child"]), _create("other")]
+
+    result = _run({"operations": operations})
+
+    assert [entry["status"] for entry in result["results"]] == ["failed", "skipped", "skipped", "succeeded"]
+    assert result["results"][2]["skippedBecause"] == "root"
+    assert _sent_names(bridge) == ["root", "other"]
+
+
+def test_references_resolve_to_earlier_results(bridge):
+    def respond(tool_name: str, payload: dict) -> dict:
+        if payload["name"] == "player":
+            return {"success": True, "gameObjectPath": "Level/Player", "instanceID": 42}
+        return {"success": True}
+
+    bridge.respond = respond
+    operations = [
+        _create("player"),
+        {
+            "id": "label",
+            "tool": "unity_gameobject_crud",
+            "arguments": {
+                "operation": "create",
+                "name": "Label for ${player.gameObjectPath} ($${not a reference})",
+                "parentPath": "${player.gameObjectPath}",
+                "tags": ["${player.instanceID}"],
+            },
+        },
+    ]
+
+    result = _run({"operations": operations})
+
+    assert result["success"]
+    assert result["results"][1]["dependsOn"] == ["player"]
+    assert bridge.calls[1][1] == {
+        "operation": "create",
+        "name": "Label for Level/Player (${not a reference})",
+        "parentPath": "Level/Player",
+        # A lone placeholder keeps the referenced value's type
+        "tags": [42],
+    }
+
+
+def test_unresolvable_reference_fails_the_operation(bridge):
+    operations = [_create("player"), _create("label", parentPath="${player.missing.path}")]
+
+    result = _run({"operations": operations})
+
+    assert result["results"][1]["status"] == "failed"
+    assert "could not be resolved at 'missing'" in result["results"][1]["error"]
+
+
+def test_file_content_is_never_a_reference(bridge):
+    script = 'Debug.Log($"${name}"); var s = "$${x}";'
+    operations = [
+        {
+            "id": "write",
+            "tool": "unity_asset_crud",
+            "arguments": {"operation": "create", "assetPath": "Assets/Data/log.txt", "content": script},
+        }
+    ]
+
+    nodes = build_plan(operations)
+    result = _run({"operations": operations, "deferCompilation": False})
+
+    assert nodes["write"].depends_on == []
+    assert result["success"]
+    assert bridge.calls[0][1]["content"] == script
+
+
+@pytest.mark.parametrize("max_in_flight", [0, 33, True, "4"])
+def test_max_in_flight_is_validated(bridge, max_in_flight):
+    result = _run({"operations": [_create("a")], "maxInFlight": max_in_flight})
+
+    assert not result["success"]
+    assert "maxInFlight must be an integer between 1 and 32" in result["error"]
+    assert bridge.calls == []
+
+
+def test_max_in_flight_bounds_concurrent_commands(bridge):
+    bridge.latency = 0.01
+
+    result = _run({"operations": [_create(f"op{i}") for i in range(8)], "maxInFlight": 3})
+
+    assert result["success"]
+    assert bridge.max_in_flight == result["maxObservedInFlight"] == 3
+
+
+@pytest.mark.parametrize(
+    ("operations", "message"),
+    [
+        ([_create("a", ["b"]), _create("b", ["a"])], "Dependency cycle between operations: a, b"),
+        ([_create("a", ["missing"])], "depends on unknown id 'missing'"),
+        ([_create("a", ["a"])], "depends on itself"),
+        ([_create("a"), _create("a")], "Duplicate operation id 'a'"),
+        ([{"id": "a", "tool": "unity_nothing", "arguments": {}}], "unknown tool 'unity_nothing'"),
+        ([_create("a", parentPath="${ghost.path}")], "depends on unknown id 'ghost'"),
+    ],
+)
+def test_invalid_plans_are_rejected_before_sending(bridge, operations, message):
+    with pytest.raises(BatchPlanError, match=message):
+        build_plan(operations)
+
+    result = _run({"operations": operations})
+
+    assert not result["success"] and message in result["error"]
+    assert bridge.calls == []
@@ -0,0 +1,183 @@
+"""Operation fusion: step planning, per-operation result mapping and resume."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+import tools.batch_fusion as batch_fusion
+from bridge.bridge_manager import BridgeCommandError, bridge_manager
+from tools.batch_fusion import MAX_FUSED_TARGETS, plan_steps
+from tools.batch_sequential import get_batch_state, run_batch_sequential
+
+
+def _component(operation: str, index: int) -> dict:
+    return {
+        "tool": "unity_component_crud",
+        "arguments": {
+            "operation": operation,
+            "gameObjectPath": f"Root/Object{index}",
+            "componentType": "UnityEngine.Rigidbody",
+        },
+    }
+
+
+def _create(index: int) -> dict:
+    return {"tool": "unity_gameobject_crud", "arguments": {"operation": "create", "name": f"Object{index}"}}
+
+
+def _pending(operations: list[dict]) -> list[tuple[dict, None, int]]:
+    return [(operation, None, 0) for operation in operations]
+
+
+class FusingUnity:
+    """Applies ``targets`` one by one like the bridge's ``ApplyEachTarget``."""
+
+    def __init__(self, failing: set[str] = frozenset()) -> None:
+        self.failing = failing
+        self.applied: list[tuple[str, str]] = []
+
+    def apply(self, operation: str, payload: dict) -> dict:
+        path = payload.get("gameObjectPath")
+        if path in self.failing:
+            return {"success": False, "error": f"{operation} failed on {path}"}
+        self.applied.append((operation, path))
+        return {"success": True, "gameObjectPath": path}
+
+    def __call__(self, tool_name: str, payload: dict) -> dict:
+        operation = payload["operation"]
+        if "targets" not in payload:
+            return self.apply(operation, payload)
+        results = []
+        for target in payload["targets"]:
+            results.append(self.apply(operation.removesuffix("Multiple"), target))
+            if payload.get("stopOnError") and not results[-1]["success"]:
+                break
+        return {"success": True, "results": results, "count": len(results)}
+
+
+def _run(arguments: dict) -> dict:
+    return asyncio.run(run_batch_sequential(arguments, bridge_manager))
+
+
+def test_adjacent_identical_operations_are_fused():
+    operations = [_component("add", i) for i in range(3)] + [_create(3)] + [_component("remove", i) for i in range(2)]
+    steps = list(plan_steps(_pending(operations), 0, set()))
+
+    assert [(step.index, len(step.operations), step.bulk_operation) for step in steps] == [
+        (0, 3, "addMultiple"),
+        (3, 1, None),
+        (4, 2, "removeMultiple"),
+    ]
+    tool_name, arguments = steps[0].request(stop_on_error=True)
+    assert tool_name == "unity_component_crud"
+    assert arguments["operation"] == "addMultiple"
+    assert arguments["stopOnError"] is True
+    assert [target["gameObjectPath"] for target in arguments["targets"]] == [f"Root/Object{i}" for i in range(3)]
+    assert "operation" not in arguments["targets"][0]
+
+
+def test_executed_operations_break_runs():
+    operations = [_component("add", i) for i in range(4)]
+    steps = list(plan_steps(_pending(operations), 10, {11}))
+
+    assert [(step.index, len(step.operations), step.skipped) for step in steps] == [
+        (10, 1, False),
+        (11, 1, True),
+        (12, 2, False),
+    ]
+
+
+def test_runs_are_capped():
+    operations = [_component("add", i) for i in range(MAX_FUSED_TARGETS + 5)]
+    steps = list(plan_steps(_pending(operations), 0, set()))
+
+    assert [len(step.operations) for step in steps] == [MAX_FUSED_TARGETS, 5]
+
+
+def test_fused_results_map_to_original_indices(bridge):
+    unity = FusingUnity()
+    bridge.respond = unity
+    operations = [_component("add", i) for i in range(5)] + [_create(5)] + [_component("update", i) for i in range(3)]
+
+    result = _run({"operations": operations})
+
+    assert result["success"]
+    assert [item["index"] for item in result["completed"]] == list(range(9))
+    assert len(bridge.calls) == 3
+    assert result["fusion"] == {"fused_steps": 2, "operations_fused": 8, "round_trips_saved": 6}
+    assert batch_fusion.fusion_confirmed()
+
+
+def test_failed_target_stops_at_its_own_index_and_resumes_there(bridge):
+    bridge.respond = FusingUnity(failing={"Root/Object3"})
+    operations = [_component("add", i) for i in range(6)]
+
+    stopped = _run({"operations": operations})
+
+    assert stopped["stopped_at_index"] == 3
+    assert stopped["errors"] == [
+        {"index": 3, "tool": "unity_component_crud", "error": "add failed on Root/Object3"}
+    ]
+    assert [item["index"] for item in stopped["completed"]] == [0, 1, 2]
+    assert get_batch_state().current_index == 3
+
+    unity = FusingUnity()
+    bridge.respond = unity
+    resumed = _run({"resume": True})
+
+    assert resumed["success"]
+    assert [item["index"] for item in resumed["completed"]] == [3, 4, 5]
+    assert unity.applied == [("add", f"Root/Object{i}") for i in range(3, 6)]
+
+
+def test_bridge_without_targets_support_gets_individual_operations(bridge):
+    unity = FusingUnity()
+
+    def old_bridge(tool_name: str, payload: dict):
+        if payload["operation"].endswith("Multiple"):
+            return BridgeCommandError("pattern parameter is required")
+        return unity(tool_name, payload)
+
+    bridge.respond = old_bridge
+    operations = [_component("add", i) for i in range(3)] + [_component("remove", i) for i in range(3)]
+
+    result = _run({"operations": operations})
+
+    assert result["success"]
+    assert [item["index"] for item in result["completed"]] == list(range(6))
+    # One rejected bulk operation, then every operation on its own
+    assert bridge.operations() == ["addMultiple"] + ["add"] * 3 + ["remove"] * 3
+    assert batch_fusion._bridge_accepts_targets is False
+
+    bridge_manager._emit("connected")
+    assert batch_fusion._bridge_accepts_targets is None
+
+
+@pytest.mark.parametrize("stop_on_error", [True, False])
+def test_failed_fused_send_stops_with_unknown_outcome(bridge, stop_on_error):
+    unity = FusingUnity()
+
+    def timing_out(tool_name: str, payload: dict):
+        if payload["operation"].endswith("Multiple"):
+            # Unity applied part of the run before the answer was lost
+            for target in payload["targets"][:2]:
+                unity.apply("add", target)
+            return TimeoutError('Bridge command "componentManage" timed out after 45000ms')
+        return unity(tool_name, payload)
+
+    bridge.respond = timing_out
+    operations = [_create(0)] + [_component("add", i) for i in range(1, 5)]
+
+    result = _run({"operations": operations, "stop_on_error": stop_on_error})
+
+    assert not result["success"]
+    assert result["stopped_at_index"] == 1
+    assert result["outcome_unknown"] == [1, 2, 3, 4]
+    assert result["errors"][0]["outcome_unknown"] is True
+    # Nothing after the fused step was sent and it is not counted as done
+    assert bridge.operations() == ["create", "addMultiple"]
+    assert get_batch_state().current_index == 1
+    # A timeout says nothing about targets support
+    assert batch_fusion._bridge_accepts_targets is None
@@ -0,0 +1,109 @@
+"""Pipelined sequential batches: send order, stop-on-error and exact resume."""
+
+from __future__ import annotations
+
+import asyncio
+
+from bridge.bridge_manager import bridge_manager
+from tools.batch_sequential import get_batch_state, run_batch_sequential
+
+
+def _creates(count: int) -> list[dict]:
+    return [
+        {"tool": "unity_gameobject_crud", "arguments": {"operation": "create", "name": f"Object{i}"}}
+        for i in range(count)
+    ]
+
+
+def _failing_on(*names: str):
+    def respond(tool_name: str, payload: dict) -> dict:
+        if payload.get("name") in names:
+            return {"success": False, "error": f"cannot create {payload['name']}"}
+        return {"success": True, "result": {"name": payload.get("name")}}
+
+    return respond
+
+
+def _run(arguments: dict) -> dict:
+    return asyncio.run(run_batch_sequential(arguments, bridge_manager))
+
+
+def _sent_names(bridge) -> list[str]:
+    return [payload["name"] for _, payload in bridge.calls]
+
+
+def test_pipeline_keeps_operations_in_flight_in_order(bridge):
+    bridge.latency = 0.005
+
+    result = _run({"operations": _creates(12), "pipeline_depth": 4})
+
+    assert result["success"]
+    assert _sent_names(bridge) == [f"Object{i}" for i in range(12)]
+    assert [item["index"] for item in result["completed"]] == list(range(12))
+    assert bridge.max_in_flight == 4
+
+
+def test_depth_one_waits_for_each_result(bridge):
+    bridge.latency = 0.001
+
+    result = _run({"operations": _creates(5)})
+
+    assert result["success"]
+    assert bridge.max_in_flight == 1
+
+
+def test_stop_reports_operations_executed_after_the_failure(bridge):
+    bridge.respond = _failing_on("Object3", "Object5")
+
+    stopped = _run({"operations": _creates(10), "pipeline_depth": 4})
+
+    assert stopped["stopped_at_index"] == 3
+    assert stopped["remaining_operations"] == 7
+    # Object4-6 were already sent when Object3 failed
+    assert [(item["index"], item["success"]) for item in stopped["executed_after_stop"]] == [
+        (4, True),
+        (5, False),
+        (6, True),
+    ]
+    assert _sent_names(bridge) == [f"Object{i}" for i in range(7)]
+    state = get_batch_state()
+    assert state.current_index == 3
+    assert state.executed_ahead == [4, 6]
+
+
+def test_resume_skips_operations_executed_ahead(bridge):
+    bridge.respond = _failing_on("Object3")
+    _run({"operations": _creates(10), "pipeline_depth": 4})
+    bridge.calls.clear()
+
+    bridge.respond = _failing_on()
+    resumed = _run({"resume": True, "pipeline_depth": 4})
+
+    assert resumed["success"]
+    assert resumed["total_operations"] == 10
+    # Object4-6 succeeded before the stop and are not sent again
+    assert _sent_names(bridge) == ["Object3"] + [f"Object{i}" for i in range(7, 10)]
+    skipped = [item["index"] for item in resumed["completed"] if item.get("skipped")]
+    assert skipped == [4, 5, 6]
+    assert not get_batch_state().has_source()
+
+
+def test_resume_after_a_failure_among_the_operations_sent_ahead(bridge):
+    bridge.respond = _failing_on("Object3", "Object5")
+    _run({"operations": _creates(10), "pipeline_depth": 4})
+    bridge.calls.clear()
+
+    bridge.respond = _failing_on()
+    resumed = _run({"resume": True, "pipeline_depth": 4})
+
+    assert resumed["success"]
+    # Object5 failed after the stop, so it runs again; Object4 and Object6 do not
+    assert _sent_names(bridge) == ["Object3", "Object5"] + [f"Object{i}" for i in range(7, 10)]
+
+
+def test_resume_without_saved_batch_is_an_error(bridge):
+    result = _run({"resume": True})
+
+    assert not result["success"]
+    assert "no saved batch" in result["error"]
+    assert bridge.calls == []
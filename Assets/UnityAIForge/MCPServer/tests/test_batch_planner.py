@@ -0,0 +1,135 @@
+"""Batch planner ordering, flush placement and the deferred imports it relies on."""
+
+from __future__ import annotations
+
+import asyncio
+
+from bridge.bridge_manager import bridge_manager
+from tools.batch_planner import FLUSH_OPERATION, plan_batch
+from tools.batch_sequential import run_batch_sequential
+from tools.compile_barrier import compile_barrier
+from tools.executor import execute_tool
+from tools.registry import tool_registry
+
+
+def _create_object(name: str) -> dict:
+    return {"tool": "unity_gameobject_crud", "arguments": {"operation": "create", "name": name}}
+
+
+def _write(asset_path: str, operation: str = "create") -> dict:
+    return {
+        "tool": "unity_asset_crud",
+        "arguments": {"operation": operation, "assetPath": asset_path, "content": "// content"},
+    }
+
+
+def _add(path: str, component_type: str) -> dict:
+    return {
+        "tool": "unity_component_crud",
+        "arguments": {"operation": "add", "gameObjectPath": path, "componentType": component_type},
+    }
+
+
+def _refresh_aware(tool_name: str, payload: dict) -> dict:
+    if payload.get("operation") == "refresh":
+        return {"success": True, "compiling": False}
+    return {"success": True, "result": {}}
+
+
+def test_script_writes_are_grouped_before_one_flush():
+    operations = []
+    for i in range(3):
+        operations += [
+            _create_object(f"Enemy{i}"),
+            _write(f"Assets/Scripts/Enemy{i}AI.cs"),
+            _add(f"Enemy{i}", f"Enemy{i}AI"),
+            _write(f"Assets/Data/enemy{i}.json"),
+        ]
+
+    planned, report = plan_batch(operations, defer_compilation=False)
+
+    assert report["order"] == [0, 4, 8, 1, 3, 5, 7, 9, 11, None, 2, 6, 10]
+    assert planned[9] == FLUSH_OPERATION
+    assert report["refreshPoints"] == 1
+    assert report["compiles"] == {"before": 3, "after": 1}
+    # Script writes get deferRefresh from the barrier; other assets from the planner
+    deferred = [op["arguments"]["assetPath"] for op in planned if op["arguments"].get("deferRefresh")]
+    assert deferred == [f"Assets/Data/enemy{i}.json" for i in range(3)]
+
+
+def test_dependent_script_update_gets_its_own_flush():
+    operations = [
+        _write("Assets/Scripts/Player.cs"),
+        _add("Player", "Player"),
+        _write("Assets/Scripts/Player.cs", "update"),
+        {
+            "tool": "unity_component_crud",
+            "arguments": {"operation": "inspect", "gameObjectPath": "Player", "componentType": "Player"},
+        },
+    ]
+
+    planned, report = plan_batch(operations)
+
+    assert report["order"] == [0, None, 1, 2, None, 3]
+    assert [op["tool"] for op in planned].count("unity_compile_barrier") == 2
+
+
+def test_independent_operations_keep_their_order():
+    operations = [_create_object(f"Object{i}") for i in range(5)]
+
+    planned, report = plan_batch(operations)
+
+    assert planned == operations
+    assert not report["reordered"]
+    assert report["refreshPoints"] == 0
+
+
+def test_planned_batch_refreshes_once_per_flush(bridge):
+    bridge.respond = _refresh_aware
+    operations = [
+        _write("Assets/Scripts/A.cs"),
+        _write("Assets/Data/a.json"),
+        _add("Root", "A"),
+    ]
+
+    result = asyncio.run(run_batch_sequential({"operations": operations, "plan_operations": True}, bridge_manager))
+
+    assert result["success"]
+    assert result["plan"]["refreshPoints"] == 1
+    assert bridge.operations("assetManage") == ["create", "create", "refresh"]
+
+
+def test_stopped_batch_still_imports_deferred_assets(bridge):
+    def respond(tool_name: str, payload: dict) -> dict:
+        if payload.get("assetPath") == "Assets/Data/b.json":
+            return {"success": False, "error": "disk full"}
+        return _refresh_aware(tool_name, payload)
+
+    bridge.respond = respond
+    operations = [_write("Assets/Data/a.json"), _write("Assets/Data/b.json"), _create_object("Object")]
+
+    result = asyncio.run(run_batch_sequential({"operations": operations, "plan_operations": True}, bridge_manager))
+
+    assert not result["success"]
+    # a.json was written with deferRefresh before the planned flush was reached
+    assert [payload.get("deferRefresh") for name, payload in bridge.calls if name == "assetManage"][:2] == [True, True]
+    assert bridge.operations("assetManage")[-1] == "refresh"
+
+
+def test_explicit_barrier_reports_pending_imports(bridge):
+    bridge.respond = _refresh_aware
+
+    async def scenario() -> tuple[dict, dict]:
+        compile_barrier.begin("test")
+        await execute_tool(
+            tool_registry.get("unity_asset_crud"),
+            {"operation": "create", "assetPath": "Assets/Data/c.json", "content": "{}", "deferRefresh": True},
+        )
+        status = compile_barrier.status()
+        return status, await compile_barrier.end()
+
+    status, ended = asyncio.run(scenario())
+
+    assert status["pendingImports"] == ["Assets/Data/c.json"]
+    assert ended["importedAssets"] == ["Assets/Data/c.json"]
+    assert bridge.operations("assetManage") == ["create", "refresh"]
@@ -0,0 +1,106 @@
+"""Batch timing profiles: records across resumes, the report and the Chrome trace."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from tools.batch_profile import BatchProfiler, build_chrome_trace, build_report, load_records
+
+OPERATION = {"tool": "unity_gameobject_crud", "arguments": {"operation": "create"}}
+
+
+def _trace(sent_at: float, completed_at: float, execution_ms: float = 0.0) -> dict:
+    return {
+        "sentAt": sent_at,
+        "completedAt": completed_at,
+        "requestBytes": 100,
+        "responseBytes": 40,
+        "unity": {"queuedMs": 0.0, "executionMs": execution_ms},
+    }
+
+
+def _profile(path: Path, fresh: bool, indices: range) -> None:
+    profiler = BatchProfiler(path, fresh, "default")
+    for index in indices:
+        profiler.record(index, OPERATION, 10.0 + index, 10.0 + index, [_trace(10.0 + index, 10.5 + index)], True)
+    profiler.close()
+
+
+def test_resumed_batch_appends_after_a_torn_line(tmp_path):
+    path = tmp_path / "profile.jsonl"
+    _profile(path, True, range(2))
+    # A crash in the middle of writing a record
+    with open(path, "a", encoding="utf-8") as stream:
+        stream.write('{"index":2,"tool":"unity_')
+
+    _profile(path, False, range(2, 4))
+
+    records = load_records(path)
+    assert [record.get("event", record.get("index")) for record in records] == ["run", 0, 1, "run", 2, 3]
+
+
+def test_fresh_batch_starts_a_new_profile(tmp_path):
+    path = tmp_path / "profile.jsonl"
+    _profile(path, True, range(3))
+    _profile(path, True, range(1))
+
+    assert len(load_records(path)) == 2
+
+
+def test_missing_profile_has_no_records(tmp_path):
+    assert load_records(tmp_path / "missing.jsonl") == []
+
+
+def test_report_splits_fused_round_trips_between_their_operations():
+    records = [{"event": "run"}] + [
+        {
+            "index": index,
+            "step": 0,
+            "tool": "unity_component_crud",
+            "operation": "add",
+            "success": index != 1,
+            "enqueuedAt": 0.0,
+            "sentAt": 0.1,
+            "completedAt": 0.5,
+            "processedAt": 0.5,
+            "criticalMs": 250.0 if index == 0 else 0.0,
+            "requestBytes": 300,
+            "responseBytes": 90,
+            "unityExecutionMs": 120.0,
+            "fused": 2,
+        }
+        for index in range(2)
+    ]
+
+    report = build_report(records)
+
+    assert (report["runs"], report["operations"], report["failures"]) == (1, 2, 1)
+    assert report["criticalPathMs"] == 250.0
+    group = report["byOperation"][0]
+    assert group["operation"] == "unity_component_crud:add"
+    assert (group["latencyMs"], group["requestBytes"], group["unityExecutionMs"]) == (400.0, 300, 120.0)
+    assert report["timeBreakdown"] == {
+        "serverWaitMs": 100.0,
+        "transportMs": 280.0,
+        "unityQueuedMs": 0.0,
+        "unityExecutionMs": 120.0,
+    }
+
+
+def test_overlapping_steps_get_separate_trace_lanes(tmp_path):
+    path = tmp_path / "profile.jsonl"
+    profiler = BatchProfiler(path, True, "default", pipeline_depth=2)
+    profiler.record(0, OPERATION, 1.0, 1.0, [_trace(1.0, 1.4, execution_ms=50.0)], True)
+    profiler.record(1, OPERATION, 1.0, 1.1, [_trace(1.1, 1.5)], True)
+    profiler.close()
+
+    trace = build_chrome_trace(load_records(path))
+
+    spans = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert [(event["name"], event["tid"]) for event in spans] == [
+        ("unity_gameobject_crud:create", 1),
+        ("unity unity_gameobject_crud:create", 1),
+        ("waiting to send", 2),
+        ("unity_gameobject_crud:create", 2),
+    ]
+    assert spans[0]["dur"] == 400_000
@@ -0,0 +1,140 @@
+"""Batch queue persistence: snapshot, journal replay and the cross-process lock."""
+
+from __future__ import annotations
+
+import json
+
+import tools.batch_sequential as batch_sequential
+from tools.batch_sequential import BatchQueueState, QueueLock
+
+
+def _operations(count: int) -> list[dict]:
+    return [
+        {"tool": "unity_gameobject_crud", "arguments": {"operation": "create", "name": f"Object{i}"}}
+        for i in range(count)
+    ]
+
+
+def _started_state(count: int = 10) -> BatchQueueState:
+    state = BatchQueueState()
+    state.operations = _operations(count)
+    state.started_at = "2026-01-01T00:00:00"
+    state.save()
+    return state
+
+
+def test_journal_replays_progress_and_errors():
+    state = _started_state()
+    for index in range(1, 4):
+        state.current_index = index
+        state.record_progress()
+    state.last_error, state.last_error_index = "boom", 3
+    state.record_error()
+    state._close_journal()
+
+    snapshot = json.loads(state.state_file.read_text(encoding="utf-8"))
+    assert snapshot["current_index"] == 0
+
+    loaded = BatchQueueState.load()
+    assert loaded.current_index == 3
+    assert (loaded.last_error, loaded.last_error_index) == ("boom", 3)
+    # Loading folds the journal into a new snapshot
+    assert not loaded.journal_file.exists()
+    assert json.loads(loaded.state_file.read_text(encoding="utf-8"))["current_index"] == 3
+
+
+def test_torn_final_journal_line_is_ignored():
+    state = _started_state()
+    for index in range(1, 3):
+        state.current_index = index
+        state.record_progress()
+    state._journal.write('{"event":"progress","current_in')
+    state._close_journal()
+
+    loaded = BatchQueueState.load()
+    assert loaded.current_index == 2
+    assert len(loaded.operations) == 10
+
+
+def test_torn_only_line_is_compacted_so_later_events_survive():
+    state = _started_state()
+    # A crash in the first append after a snapshot
+    state.journal_file.write_text('{"event":"progress","current_in', encoding="utf-8")
+
+    resumed = BatchQueueState.load()
+    assert not resumed.journal_file.exists()
+    resumed.current_index = 4
+    resumed.record_progress()
+    resumed._close_journal()
+
+    assert BatchQueueState.load().current_index == 4
+
+
+def test_journal_of_a_previous_batch_is_ignored():
+    state = _started_state()
+    state.current_index = 7
+    state.record_progress()
+    journal = state.journal_file.read_text(encoding="utf-8")
+    state._close_journal()
+
+    # A crash between replacing the snapshot and removing the journal
+    fresh = _started_state()
+    fresh.started_at = "2026-01-02T00:00:00"
+    fresh.save()
+    fresh.journal_file.write_text(journal, encoding="utf-8")
+
+    loaded = BatchQueueState.load()
+    assert loaded.current_index == 0
+
+
+def test_journal_is_compacted_past_the_threshold(monkeypatch):
+    monkeypatch.setattr(batch_sequential, "JOURNAL_COMPACT_BYTES", 500)
+    state = _started_state(100)
+    for index in range(1, 51):
+        state.current_index = index
+        state.record_progress()
+
+    assert state.journal_file.stat().st_size < 500
+    assert json.loads(state.state_file.read_text(encoding="utf-8"))["current_index"] > 0
+    state._close_journal()
+    assert BatchQueueState.load().current_index == 50
+
+
+def test_clear_removes_state_files():
+    state = _started_state()
+    state.current_index = 1
+    state.record_progress()
+    state.clear()
+
+    assert not state.state_file.exists()
+    assert not state.journal_file.exists()
+    assert not BatchQueueState.load().has_source()
+
+
+
+def test_named_queues_keep_separate_state():
+    default = _started_state()
+    default.current_index = 2
+    default.record_progress()
+    default._close_journal()
+    named = BatchQueueState("level-2")
+    named.operations = _operations(3)
+    named.started_at = "2026-01-01T00:00:00"
+    named.save()
+
+    assert named.state_file != default.state_file
+    assert BatchQueueState.load().current_index == 2
+    assert len(BatchQueueState.load("level-2").operations) == 3
+
+
+def test_queue_lock_is_exclusive():
+    first, second = QueueLock("default"), QueueLock("default")
+    assert first.acquire()
+    try:
+        assert not second.acquire()
+        assert batch_sequential.is_queue_running("default")
+    finally:
+        first.release()
+    assert not batch_sequential.is_queue_running("default")
+    assert second.acquire()
+    second.release()
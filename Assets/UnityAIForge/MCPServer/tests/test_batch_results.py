@@ -0,0 +1,73 @@
+"""Result retention of sequential batches and paging through spilled results."""
+
+from __future__ import annotations
+
+import pytest
+
+import tools.batch_results as batch_results
+from tools.batch_results import BatchResults, list_result_runs, read_results
+
+
+def _fill(results: BatchResults, count: int, failing: frozenset[int] = frozenset()) -> None:
+    for index in range(count):
+        if index in failing:
+            results.add_error({"index": index, "error": f"failed {index}"})
+        else:
+            results.add_completed({"index": index, "success": True})
+    results.close()
+
+
+def test_all_keeps_every_result_without_a_spill_file():
+    results = BatchResults("default")
+    _fill(results, 5, failing={2})
+
+    response = results.to_response()
+
+    assert [entry["index"] for entry in response["completed"]] == [0, 1, 3, 4]
+    assert "results_uri" not in response
+    assert list_result_runs() == []
+
+
+@pytest.mark.parametrize(
+    ("mode", "completed", "errors"),
+    [("last", [7, 8, 9], [2, 5]), ("errors", [], [2, 5]), ("summary", [], [])],
+)
+def test_bounded_modes_keep_the_tail_and_spill_everything(mode, completed, errors):
+    results = BatchResults("default", mode, limit=3)
+    _fill(results, 10, failing={2, 5})
+
+    response = results.to_response()
+
+    assert [entry["index"] for entry in response["completed"]] == completed
+    assert [entry["index"] for entry in response["errors"]] == errors
+    assert (response["completed_count"], response["error_count"]) == (8, 2)
+    assert response["results_uri"] == f"batch://results/{results.run_id}"
+    spilled = read_results(results.run_id, limit=1000)["results"]
+    assert [entry["index"] for entry in spilled] == list(range(10))
+    assert [entry["success"] for entry in spilled].count(False) == 2
+
+
+def test_spilled_results_are_read_in_pages():
+    results = BatchResults("default", "summary")
+    _fill(results, 5)
+
+    first = read_results(results.run_id, limit=2)
+    last = read_results(results.run_id, offset=4, limit=2)
+
+    assert ([entry["index"] for entry in first["results"]], first["next_offset"]) == ([0, 1], 2)
+    assert [entry["index"] for entry in last["results"]] == [4]
+    assert "next_offset" not in last
+
+
+def test_old_spill_files_are_pruned(monkeypatch):
+    monkeypatch.setattr(batch_results, "RESULT_FILES_KEPT", 2)
+    runs = []
+    for _ in range(3):
+        results = BatchResults("default", "summary")
+        _fill(results, 1)
+        runs.append(results.run_id)
+
+    kept = list_result_runs()
+    assert len(kept) == 2 and runs[2] in kept
+    with pytest.raises(ValueError, match="Invalid batch run id"):
+        read_results("../state")
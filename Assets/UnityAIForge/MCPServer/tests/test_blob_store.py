@@ -0,0 +1,94 @@
+"""Content-addressed blob store for oversized tool results."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+
+import pytest
+
+import resources.blob_resources as blob_resources
+import tools.response_options as response_options
+from services.blob_store import BlobStore
+from tools.response_options import ResponseOptions, render_response
+
+
+def test_blobs_are_keyed_by_content(tmp_path):
+    store = BlobStore(tmp_path, max_bytes=1_000, threshold_bytes=10)
+    data = b'{"results": [1, 2, 3]}'
+
+    digest = store.put(data)
+
+    assert digest == hashlib.sha256(data).hexdigest()
+    assert store.put(data) == digest
+    assert [path.name for path in tmp_path.iterdir()] == [digest]
+    assert store.get_stats()["bytes"] == len(data)
+    assert store.read(digest) == data
+    assert store.read(digest, offset=2, length=7) == data[2:9]
+
+
+def test_unknown_or_malformed_digests_are_not_read(tmp_path):
+    store = BlobStore(tmp_path, max_bytes=1_000, threshold_bytes=10)
+    store.put(b"content")
+
+    with pytest.raises(KeyError):
+        store.read("0" * 64)
+    with pytest.raises(KeyError):
+        store.read("../outside")
+
+
+def test_least_recently_used_blobs_are_evicted(tmp_path):
+    store = BlobStore(tmp_path, max_bytes=30, threshold_bytes=1)
+    first = store.put(b"a" * 10)
+    second = store.put(b"b" * 10)
+    third = store.put(b"c" * 10)
+    store.read(first)
+
+    store.put(b"d" * 10)
+
+    assert store.size_of(second) is None
+    assert not (tmp_path / second).exists()
+    assert {first, third} <= {path.name for path in tmp_path.iterdir()}
+    assert store.get_stats()["bytes"] == 30
+
+
+def test_lru_order_survives_a_restart(tmp_path):
+    store = BlobStore(tmp_path, max_bytes=20, threshold_bytes=1)
+    older = store.put(b"a" * 10)
+    newer = store.put(b"b" * 10)
+    os.utime(tmp_path / older, (1, 1))
+    os.utime(tmp_path / newer, (2, 2))
+
+    restarted = BlobStore(tmp_path, max_bytes=20, threshold_bytes=1)
+    restarted.put(b"c" * 10)
+
+    assert restarted.size_of(older) is None
+    assert restarted.size_of(newer) == 10
+
+
+def test_only_results_over_the_threshold_are_offloaded(tmp_path):
+    store = BlobStore(tmp_path, max_bytes=1_000, threshold_bytes=100)
+
+    assert not store.should_offload(100)
+    assert store.should_offload(101)
+    assert not BlobStore(tmp_path, max_bytes=1_000, threshold_bytes=0).should_offload(10**9)
+
+
+def test_oversized_result_is_returned_as_a_blob_uri(tmp_path, monkeypatch):
+    store = BlobStore(tmp_path, max_bytes=100_000, threshold_bytes=200)
+    monkeypatch.setattr(response_options, "blob_store", store)
+    monkeypatch.setattr(blob_resources, "blob_store", store)
+    response = {"success": True, "results": [{"name": f"Object_{i}"} for i in range(50)]}
+
+    [content] = render_response(response, ResponseOptions(compact=True))
+    envelope = json.loads(content.text)
+
+    assert envelope["offloaded"] and envelope["summary"] == {"success": True, "results": "[50 items]"}
+    assert json.loads(asyncio.run(blob_resources.read_blob_resource(envelope["blobUri"]))) == response
+    ranged = asyncio.run(blob_resources.read_blob_resource(envelope["blobUri"] + "?offset=0&length=11"))
+    assert ranged == '{"success":'
+
+    [inline] = render_response(response, ResponseOptions(compact=True, inline=True))
+    assert json.loads(inline.text) == response
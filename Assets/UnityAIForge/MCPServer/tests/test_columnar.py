@@ -0,0 +1,145 @@
+"""Columnar encoding of bulk list results restores the original rows exactly."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from utils.columnar import decode_columnar, encode_columnar
+
+
+def _round_trip(value):
+    # Through JSON, as a client receives it
+    encoded = json.loads(json.dumps(encode_columnar(value)))
+    assert decode_columnar(encoded) == value
+    return encoded
+
+
+def _column(table: dict, name: str):
+    return table["values"][table["columns"].index(name)]
+
+
+def test_plain_rows_become_one_column_per_key():
+    rows = [{"name": f"Enemy_{i}", "instanceID": -i, "active": i % 2 == 0} for i in range(4)]
+
+    table = _round_trip({"success": True, "results": rows})["results"]
+
+    assert table["encoding"] == "columnar" and table["rowCount"] == 4
+    assert table["columns"] == ["name", "instanceID", "active"]
+    assert _column(table, "instanceID") == [0, -1, -2, -3]
+
+
+def test_absent_keys_are_listed_per_column():
+    rows = [{"name": "A", "tag": "Enemy"}, {"name": "B"}, {"name": "C", "tag": None}, {"layer": 3}]
+
+    table = _round_trip(rows)
+
+    assert table["missing"] == {"name": [3], "tag": [1, 3], "layer": [0, 1, 2]}
+
+
+def test_nested_objects_become_dotted_columns():
+    rows = [
+        {"path": "A", "transform": {"position": {"x": 1.5, "y": 0.0}, "tag": "Enemy"}},
+        {"path": "B", "transform": {"position": {"x": -2.0, "y": 0.0}}},
+        {"path": "C", "transform": {}},
+        {"path": "D", "transform": 7},
+    ]
+
+    table = _round_trip(rows)
+
+    assert table["columns"] == ["path", "transform.position.x", "transform.position.y", "transform.tag", "transform"]
+    assert table["missing"]["transform.position.x"] == [2, 3]
+
+
+def test_objects_with_dotted_keys_stay_whole():
+    rows = [{"values": {"a.b": 1}}, {"values": {"a.b": 2}}]
+
+    table = _round_trip(rows)
+
+    assert table["columns"] == ["values"]
+
+
+def test_rows_with_dotted_keys_are_not_tables():
+    rows = [{"a.b": 1}, {"a.b": 2}]
+
+    assert _round_trip(rows) == rows
+
+
+def test_repeated_strings_are_dictionary_encoded():
+    rows = [{"tag": tag} for tag in ["Enemy", "Enemy", "Player", None, "Enemy", "Player"]]
+
+    table = _round_trip(rows)
+
+    assert _column(table, "tag") == {"dict": ["Enemy", "Player", None], "codes": [0, 0, 1, 2, 0, 1]}
+
+
+def test_mostly_distinct_strings_stay_plain():
+    rows = [{"name": name} for name in ["A", "B", "C", "A"]]
+
+    assert _column(_round_trip(rows), "name") == ["A", "B", "C", "A"]
+
+
+@pytest.mark.parametrize("value", [0.0, "Default", None, True])
+def test_same_value_in_every_row_is_stored_once(value):
+    rows = [{"layer": value, "index": i} for i in range(5)]
+
+    assert _column(_round_trip(rows), "layer") == {"const": value}
+
+
+def test_equal_values_of_different_types_are_not_constant():
+    rows = [{"value": 1}, {"value": True}, {"value": 1.0}]
+
+    table = _round_trip(rows)
+
+    assert _column(table, "value") == [1, True, 1.0]
+    assert [type(row["value"]) for row in decode_columnar(table)] == [int, bool, float]
+
+
+def test_lists_of_objects_become_child_tables():
+    rows = [
+        {"path": "A", "components": [{"type": "Transform"}, {"type": "Rigidbody", "mass": 2}]},
+        {"path": "B", "components": []},
+        {"path": "C", "components": [{"type": "Transform"}]},
+    ]
+
+    table = _round_trip(rows)
+
+    components = _column(table, "components")
+    assert components["lengths"] == [2, 0, 1]
+    assert components["table"]["rowCount"] == 3
+    assert components["table"]["missing"] == {"mass": [0, 2]}
+
+
+def test_other_lists_are_kept_per_row():
+    rows = [{"tags": ["a", "b"]}, {"tags": []}, {"tags": [{"x": 1}, "mixed"]}]
+
+    _round_trip(rows)
+
+
+def test_tables_nested_anywhere_are_encoded():
+    value = {
+        "success": True,
+        "scenes": [{"name": "Main", "roots": [{"name": "Camera"}, {"name": "Light"}]}],
+        "pages": [[{"i": 1}, {"i": 2}], []],
+        "count": 2,
+    }
+
+    encoded = _round_trip(value)
+
+    assert encoded["pages"][0]["encoding"] == "columnar"
+    assert encoded["scenes"][0]["roots"]["encoding"] == "columnar"
+
+
+def test_short_lists_and_scalars_are_unchanged():
+    assert encode_columnar([{"a": 1}]) == [{"a": 1}]
+    assert encode_columnar("text") == "text"
+    assert encode_columnar([]) == []
+
+
+def test_corrupted_table_raises_instead_of_dropping_columns():
+    table = encode_columnar([{"a": 1, "b": 2}, {"a": 3, "b": 4}])
+    table["values"].pop()
+
+    with pytest.raises(ValueError):
+        decode_columnar(table)
@@ -0,0 +1,183 @@
+"""Compile barriers: one refresh per flush, session scoping and expiry."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+
+import pytest
+
+import tools.compile_barrier as compile_barrier_module
+from bridge.bridge_manager import bridge_manager
+from tools.batch_dag import run_batch_dag
+from tools.compile_barrier import barrier_session, compile_barrier
+from tools.executor import execute_tool
+from tools.registry import tool_registry
+
+COMPILATION = {"success": True, "completed": True, "errorCount": 0, "elapsedSeconds": 2.5}
+
+
+class Compiler:
+    """Stands in for ``bridge_manager.await_compilation``."""
+
+    def __init__(self) -> None:
+        self.waits = 0
+
+    async def await_compilation(self, timeout_seconds: int = 60) -> dict:
+        self.waits += 1
+        return dict(COMPILATION)
+
+
+@pytest.fixture
+def compiler(bridge, monkeypatch) -> Compiler:
+    fake = Compiler()
+    monkeypatch.setattr(bridge_manager, "await_compilation", fake.await_compilation)
+    monkeypatch.setattr(compile_barrier, "_explicit", {})
+    monkeypatch.setattr(compile_barrier, "_expiry", {})
+    bridge.respond = lambda tool_name, payload: (
+        {"success": True, "compiling": True} if payload["operation"] == "refresh" else {"success": True}
+    )
+    return fake
+
+
+def _write_script(name: str):
+    arguments = {"operation": "create", "assetPath": f"Assets/Scripts/{name}.cs", "content": "class X {}"}
+    return execute_tool(tool_registry.get("unity_asset_crud"), arguments)
+
+
+def test_script_write_outside_a_barrier_waits_for_its_own_compilation(bridge, compiler):
+    async def scenario() -> list[dict]:
+        return [await _write_script("A"), await _write_script("B")]
+
+    results = asyncio.run(scenario())
+
+    assert compiler.waits == 2
+    assert bridge.operations("assetManage") == ["create", "create"]
+    assert not any(payload.get("deferRefresh") for _, payload in bridge.calls)
+    assert results[0]["compilation"] == COMPILATION
+
+
+def test_barrier_refreshes_and_compiles_once_for_many_writes(bridge, compiler):
+    async def scenario() -> tuple[list[dict], dict]:
+        compile_barrier.begin("scripts")
+        written = [await _write_script(f"Script{i}") for i in range(5)]
+        return written, await compile_barrier.end()
+
+    written, ended = asyncio.run(scenario())
+
+    assert compiler.waits == 1
+    assert bridge.operations("assetManage") == ["create"] * 5 + ["refresh"]
+    assert all(payload.get("deferRefresh") for _, payload in bridge.calls[:5])
+    assert ended["deferredWrites"] == 5
+    assert ended["assetPaths"] == [f"Assets/Scripts/Script{i}.cs" for i in range(5)]
+    # The shared result is attached to every deferred write once the barrier closes
+    assert all(result["compilation"]["elapsedSeconds"] == 2.5 for result in written)
+    assert all(result["compilation"]["deferredWrites"] == 5 for result in written)
+
+
+def test_flush_keeps_the_barrier_open(bridge, compiler):
+    async def scenario() -> tuple[dict, dict, dict]:
+        compile_barrier.begin()
+        await _write_script("A")
+        flushed = await compile_barrier.flush_active()
+        await _write_script("B")
+        status = compile_barrier.status()
+        return flushed, status, await compile_barrier.end()
+
+    flushed, status, ended = asyncio.run(scenario())
+
+    assert flushed["deferredWrites"] == 1
+    assert status["open"] and status["assetPaths"] == ["Assets/Scripts/B.cs"]
+    assert ended["deferredWrites"] == 1
+    assert compiler.waits == 2
+    assert bridge.operations("assetManage") == ["create", "refresh", "create", "refresh"]
+
+
+def test_barrier_without_writes_does_not_refresh(bridge, compiler):
+    async def scenario() -> dict:
+        compile_barrier.begin()
+        return await compile_barrier.end()
+
+    ended = asyncio.run(scenario())
+
+    assert ended["compilation"] is None
+    assert bridge.calls == []
+
+
+def test_explicit_barrier_only_defers_its_own_session(bridge, compiler):
+    async def in_session(session: str, action):
+        barrier_session.set(session)
+        return await action()
+
+    async def scenario() -> tuple[dict, dict, dict, dict]:
+        async def begin() -> dict:
+            return compile_barrier.begin("owner")
+
+        opened = await asyncio.create_task(in_session("owner", begin))
+        again = await asyncio.create_task(in_session("owner", begin))
+        other = await asyncio.create_task(in_session("other", lambda: _write_script("Other")))
+        await asyncio.create_task(in_session("owner", lambda: _write_script("Mine")))
+        not_open = await asyncio.create_task(in_session("other", compile_barrier.end))
+        await asyncio.create_task(in_session("owner", compile_barrier.end))
+        return opened, again, other, not_open
+
+    opened, again, other, not_open = asyncio.run(scenario())
+
+    assert opened["success"] and not again["success"]
+    assert other["compilation"] == COMPILATION
+    assert not not_open["success"]
+    payloads = {payload.get("assetPath"): payload for _, payload in bridge.calls}
+    assert "deferRefresh" not in payloads["Assets/Scripts/Other.cs"]
+    assert payloads["Assets/Scripts/Mine.cs"]["deferRefresh"]
+    assert compiler.waits == 2
+
+
+def test_disconnected_session_closes_its_barrier(bridge, compiler):
+    async def scenario() -> dict | None:
+        barrier_session.set("client")
+        compile_barrier.begin()
+        await _write_script("A")
+        return await compile_barrier.close_session("client")
+
+    closed = asyncio.run(scenario())
+
+    assert closed["deferredWrites"] == 1
+    assert compile_barrier._explicit == {}
+    assert bridge.operations("assetManage") == ["create", "refresh"]
+
+
+def test_forgotten_barrier_expires_after_its_ttl(bridge, compiler, monkeypatch):
+    monkeypatch.setattr(
+        compile_barrier_module,
+        "env",
+        dataclasses.replace(compile_barrier_module.env, compile_barrier_ttl_seconds=1),
+    )
+
+    async def scenario() -> tuple[dict, dict, dict]:
+        opened = compile_barrier.begin()
+        written = await _write_script("A")
+        await asyncio.sleep(1.1)
+        return opened, written, compile_barrier.status()
+
+    opened, written, status = asyncio.run(scenario())
+
+    assert opened["expiresInSeconds"] == 1
+    assert not status["open"]
+    assert bridge.operations("assetManage") == ["create", "refresh"]
+    assert written["compilation"]["elapsedSeconds"] == 2.5
+
+
+def test_batch_compiles_its_script_writes_once(bridge, compiler):
+    operations = [
+        {
+            "tool": "unity_asset_crud",
+            "arguments": {"operation": "create", "assetPath": f"Assets/Scripts/S{i}.cs", "content": ""},
+        }
+        for i in range(4)
+    ]
+
+    result = asyncio.run(run_batch_dag({"operations": operations}))
+
+    assert result["success"]
+    assert compiler.waits == 1
+    assert bridge.operations("assetManage").count("refresh") == 1
@@ -0,0 +1,135 @@
+"""Server-side paging of large list results."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+import services.cursor_store as cursor_store_module
+from services.cursor_store import CursorStore
+from tools.register_tools import dispatch_tool
+from tools.registry import tool_registry
+from tools.response_options import split_response_options
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    fake = Clock()
+    monkeypatch.setattr(cursor_store_module.time, "monotonic", fake)
+    return fake
+
+
+def _result(count: int) -> dict:
+    return {"success": True, "results": [f"Object_{i}" for i in range(count)], "count": count}
+
+
+def _items_bytes(count: int) -> int:
+    return len(json.dumps(_result(count)["results"], separators=(",", ":")))
+
+
+def test_pages_follow_the_cursor_to_the_end():
+    store = CursorStore(ttl_seconds=60, max_bytes=10_000)
+
+    body, page = store.open("tool", _result(5), "results", 2)
+    pages = [body["results"]]
+    while page["nextCursor"]:
+        body, page = store.next_page("tool", page["nextCursor"])
+        pages.append(body["results"])
+
+    assert pages == [["Object_0", "Object_1"], ["Object_2", "Object_3"], ["Object_4"]]
+    assert body["count"] == 5
+    assert (page["offset"], page["total"], page["hasMore"]) == (4, 5, False)
+
+
+def test_page_size_can_change_between_pages():
+    store = CursorStore(ttl_seconds=60, max_bytes=10_000)
+    _, page = store.open("tool", _result(10), "results", 2)
+
+    body, page = store.next_page("tool", page["nextCursor"], page_size=5)
+
+    assert body["results"] == [f"Object_{i}" for i in range(2, 7)]
+    assert page["nextCursor"].endswith(":7")
+
+
+def test_results_that_fit_a_page_or_exceed_the_budget_stay_unpaged():
+    store = CursorStore(ttl_seconds=60, max_bytes=_items_bytes(5))
+
+    assert store.open("tool", _result(3), "results", 3) is None
+    assert store.open("tool", _result(6), "results", 2) is None
+    assert store.get_stats()["cursors"] == 0
+
+
+def test_cursors_expire_after_their_last_access(clock):
+    store = CursorStore(ttl_seconds=30, max_bytes=10_000)
+    _, page = store.open("tool", _result(6), "results", 2)
+
+    clock.now += 20
+    _, page = store.next_page("tool", page["nextCursor"])
+    clock.now += 20
+    store.next_page("tool", page["nextCursor"])
+    clock.now += 31
+
+    with pytest.raises(RuntimeError, match="unknown or has expired"):
+        store.next_page("tool", page["nextCursor"])
+    assert store.get_stats() == {"cursors": 0, "bytes": 0, "maxBytes": 10_000, "ttlSeconds": 30}
+
+
+def test_least_recently_used_cursor_is_evicted_first(clock):
+    store = CursorStore(ttl_seconds=60, max_bytes=_items_bytes(4) * 2)
+    _, first = store.open("tool", _result(4), "results", 2)
+    _, second = store.open("tool", _result(4), "results", 2)
+    store.next_page("tool", first["nextCursor"])
+
+    store.open("tool", _result(4), "results", 2)
+
+    store.next_page("tool", first["nextCursor"])
+    with pytest.raises(RuntimeError, match="unknown or has expired"):
+        store.next_page("tool", second["nextCursor"])
+    assert store.get_stats()["cursors"] == 2
+
+
+def test_cursor_of_another_tool_or_malformed_is_rejected():
+    store = CursorStore(ttl_seconds=60, max_bytes=10_000)
+    _, page = store.open("tool", _result(4), "results", 2)
+    cursor_id = page["nextCursor"].partition(":")[0]
+
+    with pytest.raises(RuntimeError, match="belongs to tool"):
+        store.next_page("other_tool", page["nextCursor"])
+    with pytest.raises(RuntimeError, match="Malformed"):
+        store.next_page("tool", f"{cursor_id}:two")
+
+
+@pytest.mark.parametrize("page_size", [0, -5, "10", True])
+def test_page_size_must_be_a_positive_integer(page_size):
+    with pytest.raises(ValueError, match="pageSize"):
+        split_response_options({"operation": "findMultiple", "pageSize": page_size})
+
+
+def test_follow_up_pages_do_not_reach_unity(bridge):
+    bridge.respond = lambda tool_name, payload: _result(5)
+    spec = tool_registry.get("unity_gameobject_crud")
+
+    async def scenario() -> list[dict]:
+        pages = []
+        [content] = await dispatch_tool(spec, {"operation": "findMultiple", "pattern": "*", "pageSize": 2})
+        pages.append(json.loads(content.text))
+        while pages[-1]["page"]["nextCursor"]:
+            cursor = pages[-1]["page"]["nextCursor"]
+            [content] = await dispatch_tool(spec, {"operation": "findMultiple", "cursor": cursor})
+            pages.append(json.loads(content.text))
+        return pages
+
+    pages = asyncio.run(scenario())
+
+    assert [page["results"] for page in pages] == [["Object_0", "Object_1"], ["Object_2", "Object_3"], ["Object_4"]]
+    assert bridge.operations() == ["findMultiple"]
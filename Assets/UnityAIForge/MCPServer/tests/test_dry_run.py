@@ -0,0 +1,199 @@
+"""Dry-run validation against the cached editor state."""
+
+from __future__ import annotations
+
+import dataclasses
+import time
+
+import pytest
+
+import tools.dry_run as dry_run
+from bridge.bridge_manager import bridge_manager
+from tools.dry_run import (
+    EXISTS,
+    MISSING,
+    UNKNOWN,
+    UNVERIFIED,
+    ValidationContext,
+    validate_operations,
+)
+
+CONTEXT_TIME = 1_700_000_000.0
+
+
+def _context(loaded_scenes: int = 1) -> dict:
+    return {
+        "updatedAt": int(CONTEXT_TIME * 1000),
+        "loadedSceneCount": loaded_scenes,
+        "hierarchy": {
+            "children": [
+                {
+                    "name": "Player",
+                    "components": [{"type": "UnityEngine.Transform"}, {"type": "UnityEngine.Rigidbody"}],
+                    "childNames": ["Camera"],
+                }
+            ]
+        },
+        "assets": [{"path": "Assets/Prefabs/Enemy.prefab"}],
+    }
+
+
+@pytest.fixture
+def written_before(monkeypatch):
+    """The last write happened before the cached context was taken."""
+    monkeypatch.setattr(bridge_manager, "last_write_at", CONTEXT_TIME - 5)
+
+
+@pytest.fixture
+def written_after(monkeypatch):
+    """A write happened after the cached context was taken."""
+    monkeypatch.setattr(bridge_manager, "last_write_at", CONTEXT_TIME + 5)
+
+
+def test_current_context_proves_absence(written_before):
+    ctx = ValidationContext(_context(), None)
+
+    assert ctx.context_current
+    assert ctx.object_state("Player") == EXISTS
+    assert ctx.object_state("/Player/Camera/") == EXISTS
+    assert ctx.object_state("Ghost") == MISSING
+    assert ctx.object_state("Player/Ghost") == MISSING
+    assert ctx.component_state("Player", "Rigidbody") == EXISTS
+    assert ctx.component_state("Player", "BoxCollider") == MISSING
+
+
+def test_context_never_written_to_is_current(monkeypatch):
+    monkeypatch.setattr(bridge_manager, "last_write_at", None)
+
+    assert ValidationContext(_context(), None).object_state("Ghost") == MISSING
+
+
+def test_paths_deeper_than_the_cache_are_unknown(written_before):
+    ctx = ValidationContext(_context(), None)
+
+    assert ctx.object_state("Player/Camera/Lens") == UNKNOWN
+    assert ctx.object_state("${player.gameObjectPath}") == UNKNOWN
+
+
+def test_stale_context_only_leaves_absence_unverified(written_after):
+    ctx = ValidationContext(_context(), None)
+
+    assert not ctx.context_current
+    assert ctx.object_state("Player") == EXISTS
+    assert ctx.object_state("Ghost") == UNVERIFIED
+    assert ctx.component_state("Player", "BoxCollider") == UNVERIFIED
+    assert ctx.stale_reason() == "the cache predates the last write, so it may exist"
+
+
+def test_several_loaded_scenes_leave_absence_unverified(written_before):
+    ctx = ValidationContext(_context(loaded_scenes=2), None)
+
+    assert ctx.object_state("Ghost") == UNVERIFIED
+    assert ctx.stale_reason() == "it may exist in another loaded scene"
+
+
+def test_without_a_context_nothing_is_known(written_before):
+    ctx = ValidationContext(None, None)
+
+    assert ctx.object_state("Ghost") == UNKNOWN
+    assert ctx.component_state("Player", "Rigidbody") == UNKNOWN
+    assert ctx.asset_state("Assets/Prefabs/Enemy.prefab") == UNKNOWN
+
+
+def test_effects_of_earlier_operations_are_applied(written_before):
+    ctx = ValidationContext(_context(), None)
+
+    ctx.add_object("Enemy")
+    ctx.remove_object("Player")
+    ctx.add_component("Enemy", "UnityEngine.BoxCollider")
+
+    assert ctx.object_state("Enemy") == EXISTS
+    assert ctx.object_state("Enemy/Weapon") == UNKNOWN
+    assert ctx.object_state("Player/Camera") == MISSING
+    assert ctx.component_state("Enemy", "BoxCollider") == EXISTS
+
+
+def test_assets_are_checked_on_disk_or_in_the_index(tmp_path, written_before):
+    (tmp_path / "Assets" / "Scripts").mkdir(parents=True)
+    (tmp_path / "Assets" / "Scripts" / "Player.cs").write_text("")
+
+    on_disk = ValidationContext(_context(), tmp_path)
+    indexed = ValidationContext(_context(), None)
+
+    assert on_disk.asset_state("Assets/Scripts/Player.cs") == EXISTS
+    assert on_disk.asset_state("Assets/Prefabs/Enemy.prefab") == MISSING
+    assert indexed.asset_state("Assets/Prefabs/Enemy.prefab") == EXISTS
+    assert indexed.asset_state("Assets/Scripts/Player.cs") == UNKNOWN
+
+
+@pytest.fixture
+def cached_context(monkeypatch, tmp_path):
+    (tmp_path / "Assets").mkdir()
+    monkeypatch.setattr(bridge_manager, "get_context", _context)
+    monkeypatch.setattr(dry_run, "env", dataclasses.replace(dry_run.env, unity_project_root=tmp_path))
+
+
+def _issues(report: dict) -> list[tuple[int, str, str]]:
+    return [(issue["index"], issue["argument"], issue["severity"]) for issue in report["issues"]]
+
+
+def test_batch_may_use_objects_created_earlier(cached_context, written_before):
+    operations = [
+        {"tool": "unity_gameobject_crud", "arguments": {"operation": "create", "name": "Enemy"}},
+        {
+            "tool": "unity_component_crud",
+            "arguments": {"operation": "add", "gameObjectPath": "Enemy", "componentType": "BoxCollider"},
+        },
+        {
+            "tool": "unity_component_crud",
+            "arguments": {"operation": "update", "gameObjectPath": "Enemy", "componentType": "BoxCollider"},
+        },
+        {"tool": "unity_asset_crud", "arguments": {"operation": "create", "assetPath": "Assets/a.json"}},
+        {"tool": "unity_asset_crud", "arguments": {"operation": "update", "assetPath": "Assets/a.json"}},
+    ]
+
+    report = validate_operations(operations)
+
+    assert report["valid"] and report["issues"] == []
+    assert report["checked"] == 5
+
+
+def test_definite_problems_are_errors_when_the_context_is_current(cached_context, written_before):
+    operations = [
+        {"tool": "unity_gameobject_crud", "arguments": {"operation": "delete", "gameObjectPath": "Ghost"}},
+        {
+            "tool": "unity_component_crud",
+            "arguments": {"operation": "remove", "gameObjectPath": "Player", "componentType": "BoxCollider"},
+        },
+        {"tool": "unity_asset_crud", "arguments": {"operation": "delete", "assetPath": "Assets/missing.mat"}},
+        {"tool": "unity_nothing", "arguments": {}},
+    ]
+
+    report = validate_operations(operations)
+
+    assert not report["valid"]
+    assert report["context"]["current"]
+    assert _issues(report) == [
+        (0, "gameObjectPath", "error"),
+        (1, "componentType", "error"),
+        (2, "assetPath", "error"),
+        (3, "tool", "error"),
+    ]
+
+
+def test_stale_context_turns_scene_problems_into_warnings(cached_context, monkeypatch):
+    monkeypatch.setattr(bridge_manager, "last_write_at", time.time())
+    operations = [
+        {"tool": "unity_gameobject_crud", "arguments": {"operation": "delete", "gameObjectPath": "Ghost"}},
+        {
+            "tool": "unity_component_crud",
+            "arguments": {"operation": "remove", "gameObjectPath": "Player", "componentType": "BoxCollider"},
+        },
+    ]
+
+    report = validate_operations(operations)
+
+    assert report["valid"]
+    assert not report["context"]["current"]
+    assert _issues(report) == [(0, "gameObjectPath", "warning"), (1, "componentType", "warning")]
+    assert "predates the last write" in report["issues"][0]["message"]
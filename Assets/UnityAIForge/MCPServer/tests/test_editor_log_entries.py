@@ -0,0 +1,112 @@
+"""Editor.log entry parsing and the deduplicating index."""
+
+from __future__ import annotations
+
+from services.editor_log_entries import LogEntryIndex, LogEntryParser
+
+EXCEPTION = [
+    "NullReferenceException: Object reference not set to an instance of an object",
+    "  at Enemy.Update () [0x00012] in /Project/Assets/Scripts/Enemy.cs:42 ",
+    "",
+]
+
+
+def _logged(message: str, frame: str = "Spawner:Update () (at Assets/Scripts/Spawner.cs:7)") -> list[str]:
+    return [message, "UnityEngine.Debug:Log (object)", frame, ""]
+
+
+def test_messages_group_with_their_frames():
+    entries = LogEntryParser().feed(EXCEPTION + _logged("Spawned enemy 3"))
+
+    assert [(entry.severity, entry.message, len(entry.frames)) for entry in entries] == [
+        ("error", EXCEPTION[0], 1),
+        ("normal", "Spawned enemy 3", 2),
+    ]
+    assert (entries[0].file, entries[0].line) == ("/Project/Assets/Scripts/Enemy.cs", 42)
+    assert (entries[1].file, entries[1].line) == ("Assets/Scripts/Spawner.cs", 7)
+
+
+def test_compiler_diagnostics_are_single_line_entries():
+    line = "Assets/Scripts/Player.cs(12,5): error CS0103: The name 'speed' does not exist in the current context"
+
+    [entry] = LogEntryParser().feed([line])
+
+    assert (entry.severity, entry.code, entry.file, entry.line, entry.column) == (
+        "error",
+        "CS0103",
+        "Assets/Scripts/Player.cs",
+        12,
+        5,
+    )
+
+
+def test_frames_of_an_entry_cut_off_by_a_tail_read_are_dropped():
+    parser = LogEntryParser()
+
+    entries = parser.feed(EXCEPTION[1:] + _logged("Loaded scene"))
+
+    assert [entry.message for entry in entries] == ["Loaded scene"]
+
+
+def test_open_message_is_pending_until_closed():
+    parser = LogEntryParser()
+
+    assert parser.feed(["Build finished"]) == []
+    assert parser.pending().message == "Build finished"
+    assert [entry.message for entry in parser.feed([""])] == ["Build finished"]
+    assert parser.pending() is None
+
+
+def test_repeats_differing_in_numbers_are_deduplicated():
+    index = LogEntryIndex(capacity=10)
+    parser = LogEntryParser()
+    for i in range(5):
+        for entry in parser.feed(_logged(f"Spawned enemy {i}")):
+            index.add(entry, seen_at=float(i))
+
+    [entry] = index.entries()
+    assert entry.count == 5
+    assert (entry.first_seen, entry.last_seen) == (0.0, 4.0)
+
+
+def test_least_recently_seen_entries_are_evicted():
+    index = LogEntryIndex(capacity=2)
+    parser = LogEntryParser()
+    for message in ("alpha", "beta", "alpha", "gamma"):
+        for entry in parser.feed([message, ""]):
+            index.add(entry)
+
+    assert [entry.message for entry in index.entries()] == ["alpha", "gamma"]
+
+
+def test_query_continues_after_a_cursor():
+    index = LogEntryIndex(capacity=10)
+    parser = LogEntryParser()
+    for message in ("one", "two", "three"):
+        for entry in parser.feed([message, ""]):
+            index.add(entry)
+    cursor = index.sequence
+    for message in ("four", "one"):
+        for entry in parser.feed([message, ""]):
+            index.add(entry)
+
+    entries, more = index.query(after=cursor, limit=10)
+
+    assert [entry.message for entry in entries] == ["four", "one"]
+    assert not more
+    entries, more = index.query(after=cursor, limit=1)
+    assert [entry.message for entry in entries] == ["four"]
+    assert more
+
+
+def test_replace_swaps_a_provisional_sighting():
+    index = LogEntryIndex(capacity=10)
+    parser = LogEntryParser()
+    parser.feed(["Player spawned"])
+    early = index.add(parser.pending(), seen_at=1.0)
+
+    [complete] = parser.feed(["UnityEngine.Debug:LogWarning (object)", "Player:Start () (at Assets/Player.cs:3)", ""])
+    index.replace(early, complete, seen_at=2.0)
+
+    [entry] = index.entries()
+    assert (entry.severity, entry.count, entry.first_seen, entry.last_seen) == ("warning", 1, 1.0, 2.0)
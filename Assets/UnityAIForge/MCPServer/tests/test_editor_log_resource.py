@@ -0,0 +1,59 @@
+"""Server-side filters and cursors of the unity://editor-log resource."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+import resources.editor_log as editor_log
+from resources.editor_log import read_editor_log_resource
+from services.editor_log_watcher import EditorLogWatcher
+
+DIAGNOSTICS = [
+    "Assets/Scripts/Player.cs(12,5): error CS0103: The name 'speed' does not exist in the current context",
+    "Assets/Scripts/MyPlayer.cs(3,1): error CS1002: ; expected",
+    "Assets/Other/Player.cs(8,9): warning CS0168: The variable 'e' is declared but never used",
+]
+
+
+@pytest.fixture
+def log_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "Editor.log"
+    path.write_text("\n".join(DIAGNOSTICS) + "\n", encoding="utf-8")
+    monkeypatch.setattr(editor_log, "editor_log_watcher", EditorLogWatcher(path, max_entries=50))
+    return path
+
+
+def _read(query: str) -> dict:
+    return json.loads(asyncio.run(read_editor_log_resource(f"unity://editor-log?{query}")))
+
+
+def _files(result: dict) -> list[str]:
+    return [entry["file"] for entry in result["entries"]]
+
+
+def test_file_filter_matches_whole_path_segments(log_path):
+    assert _files(_read("file=Player.cs")) == ["Assets/Scripts/Player.cs", "Assets/Other/Player.cs"]
+    assert _files(_read("file=Scripts/Player.cs")) == ["Assets/Scripts/Player.cs"]
+    assert _files(_read("file=Assets%5CScripts%5CMyPlayer.cs")) == ["Assets/Scripts/MyPlayer.cs"]
+    assert _files(_read("file=layer.cs")) == []
+
+
+def test_severity_and_pattern_filters(log_path):
+    assert _files(_read("severity=warning")) == ["Assets/Other/Player.cs"]
+    assert _files(_read("severity=error&pattern=CS10")) == []
+    assert _files(_read("severity=error&pattern=expected")) == ["Assets/Scripts/MyPlayer.cs"]
+
+
+def test_cursor_returns_only_entries_seen_since(log_path):
+    first = _read("severity=error")
+
+    with open(log_path, "a", encoding="utf-8") as stream:
+        stream.write("Assets/Scripts/Enemy.cs(1,1): error CS0246: The type 'Foo' could not be found\n")
+    follow_up = _read(f"severity=error&cursor={first['cursor']}")
+
+    assert _files(follow_up) == ["Assets/Scripts/Enemy.cs"]
+    assert not follow_up["hasMore"]
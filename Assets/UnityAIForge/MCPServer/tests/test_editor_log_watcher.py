@@ -0,0 +1,188 @@
+"""Editor.log tailing: incremental reads, truncation, rotation and split UTF-8."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+
+import services.editor_log_watcher as editor_log_watcher
+from services.editor_log_watcher import EditorLogWatcher
+
+
+@pytest.fixture
+def log_path(tmp_path: Path) -> Path:
+    path = tmp_path / "Editor.log"
+    path.write_bytes(b"")
+    return path
+
+
+def _append(path: Path, data: bytes) -> None:
+    with open(path, "ab") as stream:
+        stream.write(data)
+
+
+def _refresh(watcher: EditorLogWatcher) -> None:
+    asyncio.run(watcher.refresh())
+
+
+def _lines(watcher: EditorLogWatcher) -> list[str]:
+    return watcher.get_snapshot().lines
+
+
+def test_only_appended_lines_are_read(log_path, monkeypatch):
+    watcher = EditorLogWatcher(log_path)
+    _append(log_path, b"first\nsecond\n")
+    _refresh(watcher)
+
+    opened = []
+    real_open = open
+
+    def tracking_open(file, mode="r", *args, **kwargs):
+        opened.append(file)
+        return real_open(file, mode, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", tracking_open)
+    _refresh(watcher)
+    assert opened == []
+
+    monkeypatch.undo()
+    _append(log_path, b"third\n")
+    _refresh(watcher)
+    assert _lines(watcher) == ["first", "second", "third"]
+
+
+def test_unfinished_line_waits_for_its_newline(log_path):
+    watcher = EditorLogWatcher(log_path)
+    _append(log_path, b"complete\nhalf a li")
+    _refresh(watcher)
+    assert _lines(watcher) == ["complete"]
+
+    _append(log_path, b"ne\n")
+    _refresh(watcher)
+    assert _lines(watcher) == ["complete", "half a line"]
+
+
+def test_multibyte_character_split_across_writes(log_path):
+    watcher = EditorLogWatcher(log_path)
+    line = "error CS0103: 名前 'x' は現在のコンテキストに存在しません\n".encode()
+    split = line.index("名".encode()) + 1
+    _append(log_path, line[:split])
+    _refresh(watcher)
+    _append(log_path, line[split:])
+    _refresh(watcher)
+
+    assert _lines(watcher) == [line.decode().rstrip("\n")]
+    assert "�" not in _lines(watcher)[0]
+    assert watcher.get_snapshot().error_lines == _lines(watcher)
+
+
+def test_truncated_log_starts_over(log_path):
+    watcher = EditorLogWatcher(log_path)
+    _append(log_path, b"old one\nold two\nold three\n")
+    _refresh(watcher)
+
+    with open(log_path, "r+b") as stream:
+        stream.truncate(0)
+        stream.write(b"new\n")
+    _refresh(watcher)
+
+    assert _lines(watcher) == ["new"]
+
+
+def test_rotated_log_starts_over(log_path):
+    watcher = EditorLogWatcher(log_path)
+    _append(log_path, b"previous session\n")
+    _refresh(watcher)
+
+    os.replace(log_path, log_path.with_name("Editor-prev.log"))
+    # Same size as before, but a different file
+    log_path.write_bytes(b"this session !!!\n")
+    _refresh(watcher)
+
+    assert _lines(watcher) == ["this session !!!"]
+
+
+def test_missing_log_is_cleared(log_path):
+    watcher = EditorLogWatcher(log_path)
+    _append(log_path, b"line\n")
+    _refresh(watcher)
+
+    log_path.unlink()
+    _refresh(watcher)
+
+    assert _lines(watcher) == []
+
+
+def test_first_read_only_takes_the_tail(log_path, monkeypatch):
+    monkeypatch.setattr(editor_log_watcher, "MAX_LINES", 50)
+    monkeypatch.setattr(editor_log_watcher, "TAIL_BLOCK_BYTES", 256)
+    _append(log_path, b"".join(f"line {i}\n".encode() for i in range(5000)))
+    watcher = EditorLogWatcher(log_path, capacities={"normal": 50, "warning": 10, "error": 10})
+
+    _refresh(watcher)
+
+    lines = _lines(watcher)
+    assert lines[-1] == "line 4999"
+    assert len(lines) <= 50
+    # The tail never starts with a line cut in half
+    assert all(line.startswith("line ") for line in lines)
+
+
+def test_large_burst_keeps_only_its_last_lines(log_path, monkeypatch):
+    monkeypatch.setattr(editor_log_watcher, "MAX_INCREMENTAL_BYTES", 1024)
+    watcher = EditorLogWatcher(log_path, capacities={"normal": 100, "warning": 10, "error": 10})
+    _append(log_path, b"before\n")
+    _refresh(watcher)
+
+    _append(log_path, b"".join(f"burst {i}\n".encode() for i in range(20000)))
+    _refresh(watcher)
+
+    lines = _lines(watcher)
+    assert lines[-1] == "burst 19999"
+    assert all(line.startswith("burst ") for line in lines[-100:])
+
+
+
+def test_each_severity_keeps_its_own_number_of_lines(log_path):
+    watcher = EditorLogWatcher(log_path, capacities={"normal": 3, "warning": 2, "error": 5})
+    _append(log_path, b"NullReferenceException: first\nWarning: slow import\n")
+    _append(log_path, b"".join(f"noise {i}\n".encode() for i in range(10)))
+    _append(log_path, b"Warning: second\nWarning: third\nNullReferenceException: second\n")
+    _refresh(watcher)
+
+    snapshot = watcher.get_snapshot()
+    assert snapshot.error_lines == ["NullReferenceException: first", "NullReferenceException: second"]
+    assert snapshot.warning_lines == ["Warning: second", "Warning: third"]
+    assert snapshot.normal_lines == ["noise 7", "noise 8", "noise 9"]
+    assert len(snapshot.lines) == 15
+
+    limited = watcher.get_snapshot(limit=1)
+    assert (limited.lines, limited.normal_lines, limited.warning_lines) == (
+        ["NullReferenceException: second"],
+        ["noise 9"],
+        ["Warning: third"],
+    )
+
+
+def test_last_message_shows_before_the_next_one(log_path):
+    watcher = EditorLogWatcher(log_path, max_entries=10)
+    _append(log_path, b"Player spawned\n")
+    _refresh(watcher)
+
+    entries = watcher.get_entries()
+    assert [(entry.severity, entry.message, entry.count) for entry in entries] == [
+        ("normal", "Player spawned", 1)
+    ]
+
+    # Its frames arrive with the next write and replace the early entry
+    _append(log_path, b"UnityEngine.Debug:LogError (object)\nPlayer:Start () (at Assets/Player.cs:12)\n\n")
+    _refresh(watcher)
+
+    entries = watcher.get_entries()
+    assert [(entry.severity, entry.message, entry.count) for entry in entries] == [
+        ("error", "Player spawned", 1)
+    ]
+    assert (entries[0].file, entries[0].line) == ("Assets/Player.cs", 12)
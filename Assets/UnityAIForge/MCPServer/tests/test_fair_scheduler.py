@@ -0,0 +1,58 @@
+"""Round-robin turns for batch queues sharing the bridge."""
+
+from __future__ import annotations
+
+import asyncio
+
+from services.fair_scheduler import FairScheduler
+
+
+async def _run_queue(scheduler: FairScheduler, queue_id: str, count: int, order: list[str]) -> None:
+    for _ in range(count):
+        async with scheduler.turn(queue_id):
+            order.append(queue_id)
+            await asyncio.sleep(0)
+
+
+def test_concurrent_queues_interleave_one_operation_at_a_time():
+    scheduler = FairScheduler()
+    order: list[str] = []
+
+    async def scenario() -> None:
+        await asyncio.gather(
+            _run_queue(scheduler, "a", 4, order),
+            _run_queue(scheduler, "b", 2, order),
+            _run_queue(scheduler, "c", 2, order),
+        )
+
+    asyncio.run(scenario())
+
+    assert order == ["a", "b", "c", "a", "b", "c", "a", "a"]
+    assert scheduler.get_stats() == {"active": None, "waiting": {}, "turns": {"a": 4, "b": 2, "c": 2}}
+
+
+def test_cancelled_waiter_gives_up_its_turn():
+    scheduler = FairScheduler()
+    order: list[str] = []
+
+    async def scenario() -> None:
+        release = asyncio.Event()
+
+        async def hold() -> None:
+            async with scheduler.turn("a"):
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(_run_queue(scheduler, "b", 1, order))
+        other = asyncio.create_task(_run_queue(scheduler, "c", 1, order))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(holder, other)
+
+    asyncio.run(scenario())
+
+    assert order == ["c"]
+    assert scheduler.get_stats()["active"] is None
@@ -0,0 +1,93 @@
+"""inotify change notification and the editor log watcher's polling fallback."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from pathlib import Path
+
+import pytest
+
+import services.editor_log_watcher as editor_log_watcher
+from services.editor_log_watcher import EditorLogWatcher
+from services.inotify import watch_directory
+
+
+def _require_inotify(tmp_path: Path) -> None:
+    async def probe() -> bool:
+        watch = watch_directory(tmp_path, set(), lambda: None)
+        if watch is None:
+            return False
+        watch.close()
+        return True
+
+    if not asyncio.run(probe()):
+        pytest.skip("inotify is not available")
+
+
+def test_only_watched_names_are_reported(tmp_path):
+    _require_inotify(tmp_path)
+    changes: list[str] = []
+
+    async def scenario() -> None:
+        watch = watch_directory(tmp_path, {"Editor.log"}, lambda: changes.append("change"))
+        try:
+            (tmp_path / "other.txt").write_text("x")
+            await asyncio.sleep(0.05)
+            assert changes == []
+            (tmp_path / "Editor.log").write_text("line\n")
+            await asyncio.sleep(0.05)
+        finally:
+            watch.close()
+
+    asyncio.run(scenario())
+
+    assert changes
+
+
+def test_missing_directory_cannot_be_watched(tmp_path):
+    async def scenario() -> object:
+        return watch_directory(tmp_path / "missing", {"Editor.log"}, lambda: None)
+
+    assert asyncio.run(scenario()) is None
+
+
+async def _watch_until(watcher: EditorLogWatcher, path: Path, expected: str, timeout: float) -> float:
+    """Append a line while the watch loop runs; returns the seconds until it showed up."""
+    task = asyncio.create_task(watcher._watch_loop())
+    try:
+        await asyncio.sleep(0.05)
+        loop = asyncio.get_running_loop()
+        written = loop.time()
+        with open(path, "a", encoding="utf-8") as stream:
+            stream.write(expected + "\n")
+        while expected not in watcher.get_snapshot().lines:
+            if loop.time() - written > timeout:
+                raise AssertionError(f"{expected!r} did not show up within {timeout}s")
+            await asyncio.sleep(0.005)
+        return loop.time() - written
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
+def test_new_lines_show_up_within_the_debounce_window(tmp_path):
+    _require_inotify(tmp_path)
+    path = tmp_path / "Editor.log"
+    path.write_text("")
+    # Polling alone would take a minute
+    watcher = EditorLogWatcher(path, poll_interval=60, debounce=0.01)
+
+    elapsed = asyncio.run(_watch_until(watcher, path, "Compilation failed", timeout=1))
+
+    assert elapsed < 0.5
+
+
+def test_polls_when_inotify_is_unavailable(tmp_path, monkeypatch):
+    monkeypatch.setattr(editor_log_watcher, "watch_directory", lambda *args: None)
+    path = tmp_path / "Editor.log"
+    path.write_text("")
+    watcher = EditorLogWatcher(path, poll_interval=0.01)
+
+    asyncio.run(_watch_until(watcher, path, "Compilation failed", timeout=1))
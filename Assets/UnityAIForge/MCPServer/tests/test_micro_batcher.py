@@ -0,0 +1,163 @@
+"""Micro-batching of concurrent single-object reads."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from services.micro_batcher import MicroBatcher
+
+
+class Unity:
+    """Answers ``inspectMultiple`` with one result per target, or ``response`` when set."""
+
+    def __init__(self, response: Any = None) -> None:
+        self.response = response
+        self.requests: list[dict[str, Any]] = []
+
+    async def send(self, bridge_command: str, payload: dict[str, Any]) -> Any:
+        self.requests.append(payload)
+        await asyncio.sleep(0)
+        if isinstance(self.response, BaseException):
+            raise self.response
+        if "targets" not in payload:
+            return {"success": True, "gameObjectPath": payload["gameObjectPath"], "single": True}
+        if self.response is not None:
+            return self.response
+        return {
+            "success": True,
+            "results": [{"gameObjectPath": target["gameObjectPath"]} for target in payload["targets"]],
+        }
+
+
+def _inspect(path: str, **extra: Any) -> dict[str, Any]:
+    return {"operation": "inspect", "gameObjectPath": path, **extra}
+
+
+async def _submit_all(batcher: MicroBatcher, unity: Unity, paths: list[str]) -> list[Any]:
+    return await asyncio.gather(
+        *(batcher.submit("gameObjectManage", "inspectMultiple", _inspect(path), unity.send) for path in paths),
+        return_exceptions=True,
+    )
+
+
+def test_requests_within_the_window_share_one_round_trip():
+    batcher = MicroBatcher(window_ms=20, max_batch_size=16)
+    unity = Unity()
+
+    results = asyncio.run(_submit_all(batcher, unity, ["A", "B", "C"]))
+
+    assert unity.requests == [
+        {
+            "operation": "inspectMultiple",
+            "targets": [{"gameObjectPath": "A"}, {"gameObjectPath": "B"}, {"gameObjectPath": "C"}],
+        }
+    ]
+    # Each caller gets the result of its own target
+    assert results == [{"gameObjectPath": path} for path in "ABC"]
+    assert batcher.get_stats()["roundTripsSaved"] == 2
+
+
+def test_window_flushes_after_its_time():
+    batcher = MicroBatcher(window_ms=30, max_batch_size=16)
+    unity = Unity()
+
+    async def scenario() -> tuple[float, Any]:
+        started = time.perf_counter()
+        first = await batcher.submit("gameObjectManage", "inspectMultiple", _inspect("A"), unity.send)
+        elapsed = time.perf_counter() - started
+        await _submit_all(batcher, unity, ["B", "C"])
+        return elapsed, first
+
+    elapsed, first = asyncio.run(scenario())
+
+    assert elapsed >= 0.025
+    # A lone request is sent as it was, without targets
+    assert first == {"success": True, "gameObjectPath": "A", "single": True}
+    assert [len(request.get("targets", [request])) for request in unity.requests] == [1, 2]
+
+
+def test_full_batch_flushes_before_the_window_ends():
+    batcher = MicroBatcher(window_ms=10_000, max_batch_size=3)
+    unity = Unity()
+
+    async def scenario() -> list[Any]:
+        return await asyncio.wait_for(_submit_all(batcher, unity, ["A", "B", "C"]), timeout=1)
+
+    results = asyncio.run(scenario())
+
+    assert results == [{"gameObjectPath": path} for path in "ABC"]
+    assert len(unity.requests) == 1
+
+
+def test_different_operations_are_batched_separately():
+    batcher = MicroBatcher(window_ms=20, max_batch_size=16)
+    unity = Unity()
+
+    async def scenario() -> list[Any]:
+        return await asyncio.gather(
+            batcher.submit("gameObjectManage", "inspectMultiple", _inspect("A"), unity.send),
+            batcher.submit("componentManage", "inspectMultiple", _inspect("B"), unity.send),
+            batcher.submit("gameObjectManage", "inspectMultiple", _inspect("C"), unity.send),
+        )
+
+    results = asyncio.run(scenario())
+
+    assert results[1]["single"]
+    assert [result["gameObjectPath"] for result in results] == ["A", "B", "C"]
+    assert len(unity.requests) == 2
+
+
+def test_most_patient_timeout_is_used_for_the_batch():
+    batcher = MicroBatcher(window_ms=20, max_batch_size=16)
+    unity = Unity()
+
+    async def scenario() -> None:
+        await asyncio.gather(
+            batcher.submit("gameObjectManage", "inspectMultiple", _inspect("A", timeoutSeconds=5), unity.send),
+            batcher.submit("gameObjectManage", "inspectMultiple", _inspect("B", timeoutSeconds=30), unity.send),
+        )
+
+    asyncio.run(scenario())
+
+    assert unity.requests[0]["timeoutSeconds"] == 30
+
+
+def test_transport_error_fails_every_caller_without_a_resend():
+    batcher = MicroBatcher(window_ms=20, max_batch_size=16)
+    unity = Unity(response=TimeoutError("bridge timed out"))
+
+    results = asyncio.run(_submit_all(batcher, unity, ["A", "B", "C"]))
+
+    assert all(isinstance(result, TimeoutError) for result in results)
+    assert len(unity.requests) == 1
+    assert batcher.get_stats()["fallbacks"] == 0
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        {"success": True, "results": [{"gameObjectPath": "A"}]},
+        {"success": False, "error": "Unknown operation: inspectMultiple"},
+        "not a dict",
+    ],
+)
+def test_malformed_batch_response_falls_back_to_individual_sends(response):
+    batcher = MicroBatcher(window_ms=20, max_batch_size=16)
+    unity = Unity(response=response)
+
+    results = asyncio.run(_submit_all(batcher, unity, ["A", "B", "C"]))
+
+    assert [result["gameObjectPath"] for result in results] == ["A", "B", "C"]
+    assert all(result["single"] for result in results)
+    assert [request.get("gameObjectPath") for request in unity.requests] == [None, "A", "B", "C"]
+    assert batcher.get_stats()["fallbacks"] == 1
+
+
+def test_disabled_without_a_window_or_batch_size():
+    assert not MicroBatcher(window_ms=0, max_batch_size=16).enabled
+    assert not MicroBatcher(window_ms=5, max_batch_size=1).enabled
+    assert MicroBatcher(window_ms=5, max_batch_size=2).enabled
@@ -0,0 +1,81 @@
+"""Batch operations streamed from a JSONL file under the project root."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import json
+from pathlib import Path
+
+import pytest
+
+import tools.operation_stream as operation_stream
+from bridge.bridge_manager import bridge_manager
+from tools.batch_sequential import get_batch_state, run_batch_sequential
+from tools.operation_stream import iter_operations_file, resolve_operations_file
+
+
+@pytest.fixture
+def project_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    root = tmp_path / "Project"
+    root.mkdir()
+    monkeypatch.setattr(operation_stream, "env", dataclasses.replace(operation_stream.env, unity_project_root=root))
+    return root
+
+
+def _write_creates(path: Path, count: int) -> None:
+    lines = [
+        json.dumps({"tool": "unity_gameobject_crud", "arguments": {"operation": "create", "name": f"Object{i}"}})
+        for i in range(count)
+    ]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_lines_are_read_from_a_byte_offset(tmp_path):
+    path = tmp_path / "ops.jsonl"
+    path.write_text('{"tool": "a"}\n\n{"tool": \n[1]\n{"tool": "b"}', encoding="utf-8")
+
+    items = list(iter_operations_file(path))
+
+    assert [item.operation for item in items] == [{"tool": "a"}, None, None, {"tool": "b"}]
+    assert items[1].error.startswith("Invalid JSON at byte 15")
+    assert "not an object with a 'tool' name" in items[2].error
+    # Resuming from the end of a line yields exactly the lines after it
+    assert list(iter_operations_file(path, items[2].end)) == items[3:]
+
+
+def test_files_outside_the_project_root_are_rejected(project_root, tmp_path):
+    _write_creates(project_root / "ops.jsonl", 1)
+    _write_creates(tmp_path / "outside.jsonl", 1)
+
+    assert resolve_operations_file("ops.jsonl") == project_root / "ops.jsonl"
+    with pytest.raises(ValueError, match="inside the Unity project root"):
+        resolve_operations_file("../outside.jsonl")
+    with pytest.raises(ValueError, match="not found"):
+        resolve_operations_file("missing.jsonl")
+
+
+def test_streamed_batch_resumes_at_the_byte_offset_it_stopped_at(bridge, project_root):
+    _write_creates(project_root / "ops.jsonl", 5)
+    fail = {"Object2"}
+
+    def respond(tool_name: str, payload: dict) -> dict:
+        if payload["name"] in fail:
+            return {"success": False, "error": f"cannot create {payload['name']}"}
+        return {"success": True}
+
+    bridge.respond = respond
+    arguments = {"operations_file": "ops.jsonl", "fuse_operations": False}
+
+    stopped = asyncio.run(run_batch_sequential(arguments, bridge_manager))
+
+    lines = (project_root / "ops.jsonl").read_bytes().splitlines(keepends=True)
+    assert stopped["stopped_at_index"] == 2
+    assert stopped["stopped_at_byte"] == len(lines[0]) + len(lines[1])
+    assert get_batch_state().operations == []
+
+    fail.clear()
+    resumed = asyncio.run(run_batch_sequential({"resume": True, "fuse_operations": False}, bridge_manager))
+
+    assert resumed["success"]
+    assert [payload["name"] for _, payload in bridge.calls] == [f"Object{i}" for i in (0, 1, 2, 2, 3, 4)]
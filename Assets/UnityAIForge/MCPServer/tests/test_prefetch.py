@@ -0,0 +1,166 @@
+"""Predictive prefetch: transition learning, budget, TTL and invalidation."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from bridge.bridge_manager import bridge_manager
+from tools.executor import execute_tool
+from tools.prefetch import MIN_OBSERVATIONS, Prefetcher
+from tools.registry import tool_registry
+
+TOOL = "unity_gameobject_crud"
+
+
+def _respond(tool_name: str, payload: dict) -> dict:
+    return {"success": True, "operation": payload["operation"], "path": payload.get("gameObjectPath")}
+
+
+async def _call(prefetcher: Prefetcher, operation: str, path: str = "Player", **arguments: Any) -> Any:
+    spec = tool_registry.get(TOOL)
+    response = await prefetcher.run(spec, {"operation": operation, "gameObjectPath": path, **arguments}, execute_tool)
+    # Let a prefetch issued by this call reach the bridge
+    await asyncio.sleep(0.02)
+    return response
+
+
+async def _learn(prefetcher: Prefetcher, times: int = MIN_OBSERVATIONS) -> None:
+    """Teach that an update of an object is followed by an inspect of the same object."""
+    for i in range(times):
+        await _call(prefetcher, "update", f"Learn{i}", name="x")
+        await _call(prefetcher, "inspect", f"Learn{i}")
+
+
+def test_learned_follow_up_read_is_served_from_the_cache(bridge):
+    bridge.respond = _respond
+    prefetcher = Prefetcher(budget_per_minute=60, ttl_ms=5_000)
+
+    async def scenario() -> Any:
+        await _learn(prefetcher)
+        await _call(prefetcher, "update", "Enemy", name="Boss")
+        sent = len(bridge.calls)
+        response = await _call(prefetcher, "inspect", "Enemy")
+        assert len(bridge.calls) == sent
+        return response
+
+    response = asyncio.run(scenario())
+
+    # The prefetch copied the path of the update it followed
+    assert bridge.calls[-1] == ("gameObjectManage", {"operation": "inspect", "gameObjectPath": "Enemy"})
+    assert response == {"success": True, "operation": "inspect", "path": "Enemy"}
+    stats = prefetcher.get_stats()
+    assert (stats["issued"], stats["used"]) == (1, 1)
+    assert stats["topTransitions"][0]["from"] in {f"{TOOL}:update", f"{TOOL}:inspect"}
+
+
+def test_nothing_is_prefetched_before_enough_observations(bridge):
+    bridge.respond = _respond
+    prefetcher = Prefetcher(budget_per_minute=60, ttl_ms=5_000)
+
+    async def scenario() -> None:
+        await _learn(prefetcher, times=MIN_OBSERVATIONS - 1)
+        await _call(prefetcher, "update", "Enemy", name="Boss")
+
+    asyncio.run(scenario())
+
+    assert prefetcher.get_stats()["issued"] == 0
+
+
+def test_uncertain_transition_is_not_prefetched(bridge):
+    bridge.respond = _respond
+    prefetcher = Prefetcher(budget_per_minute=60, ttl_ms=5_000)
+
+    async def scenario() -> None:
+        for i in range(4):
+            await _call(prefetcher, "update", f"Object{i}", name="x")
+            await _call(prefetcher, "inspect" if i % 2 else "delete", f"Object{i}")
+        await _call(prefetcher, "update", "Enemy", name="Boss")
+
+    asyncio.run(scenario())
+
+    assert prefetcher.get_stats()["issued"] == 0
+
+
+def test_prefetches_stop_when_the_budget_runs_out(bridge):
+    bridge.respond = _respond
+    prefetcher = Prefetcher(budget_per_minute=1, ttl_ms=5_000)
+
+    async def scenario() -> None:
+        await _learn(prefetcher)
+        await _call(prefetcher, "update", "A", name="x")
+        await _call(prefetcher, "update", "B", name="x")
+
+    asyncio.run(scenario())
+
+    stats = prefetcher.get_stats()
+    assert (stats["issued"], stats["skippedBudget"]) == (1, 1)
+
+
+def test_expired_prefetch_is_not_used(bridge):
+    bridge.respond = _respond
+    prefetcher = Prefetcher(budget_per_minute=60, ttl_ms=30)
+
+    async def scenario() -> None:
+        await _learn(prefetcher)
+        await _call(prefetcher, "update", "Enemy", name="Boss")
+        await asyncio.sleep(0.05)
+        await _call(prefetcher, "inspect", "Enemy")
+
+    asyncio.run(scenario())
+
+    assert bridge.operations()[-2:] == ["inspect", "inspect"]
+    stats = prefetcher.get_stats()
+    assert (stats["used"], stats["expired"]) == (0, 1)
+
+
+def test_write_through_the_prefetcher_clears_the_cache(bridge):
+    bridge.respond = _respond
+    prefetcher = Prefetcher(budget_per_minute=60, ttl_ms=5_000)
+
+    async def scenario() -> None:
+        await _learn(prefetcher)
+        await _call(prefetcher, "update", "Enemy", name="Boss")
+        await _call(prefetcher, "delete", "Other")
+        await _call(prefetcher, "inspect", "Enemy")
+
+    asyncio.run(scenario())
+
+    assert bridge.operations()[-4:] == ["update", "inspect", "delete", "inspect"]
+    assert prefetcher.get_stats()["used"] == 0
+
+
+def test_write_outside_the_prefetcher_drops_the_prefetch(bridge):
+    bridge.respond = _respond
+    prefetcher = Prefetcher(budget_per_minute=60, ttl_ms=5_000)
+    spec = tool_registry.get(TOOL)
+
+    async def scenario() -> Any:
+        await _learn(prefetcher)
+        await _call(prefetcher, "update", "Enemy", name="Boss")
+        # A batch operation or raw bridge command, which never passes through the prefetcher
+        await execute_tool(spec, {"operation": "update", "gameObjectPath": "Enemy", "name": "Renamed"})
+        return await _call(prefetcher, "inspect", "Enemy")
+
+    response = asyncio.run(scenario())
+
+    assert bridge.operations()[-3:] == ["inspect", "update", "inspect"]
+    assert response["path"] == "Enemy"
+    stats = prefetcher.get_stats()
+    assert (stats["used"], stats["invalidated"]) == (0, 1)
+
+
+def test_raw_bridge_command_drops_the_prefetch(bridge):
+    bridge.respond = _respond
+    prefetcher = Prefetcher(budget_per_minute=60, ttl_ms=5_000)
+
+    async def scenario() -> None:
+        await _learn(prefetcher)
+        await _call(prefetcher, "update", "Enemy", name="Boss")
+        bridge_manager.note_write()
+        await _call(prefetcher, "inspect", "Enemy")
+
+    asyncio.run(scenario())
+
+    assert bridge.operations()[-2:] == ["inspect", "inspect"]
+    assert prefetcher.get_stats()["used"] == 0
@@ -0,0 +1,103 @@
+"""fields/exclude projection and the shared response options."""
+
+from __future__ import annotations
+
+import json
+
+from tools.response_options import (
+    ResponseOptions,
+    render_response,
+    split_response_options,
+    with_response_options,
+)
+from utils.projection import project
+
+INSPECT_MULTIPLE = {
+    "success": True,
+    "results": [
+        {
+            "gameObjectPath": "Level/Enemy_1",
+            "properties": {"position": {"x": 1, "y": 0}, "name": "Enemy_1", "tag": "Enemy"},
+        },
+        {
+            "gameObjectPath": "Level/Enemy_2",
+            "properties": {"position": {"x": 2, "y": 0}, "name": "Enemy_2", "tag": "Enemy"},
+        },
+    ],
+    "count": 2,
+}
+
+
+def test_fields_keep_paths_through_lists():
+    projected = project(INSPECT_MULTIPLE, fields=["results.gameObjectPath", "results.properties.position.x"])
+
+    assert projected == {
+        "results": [
+            {"gameObjectPath": "Level/Enemy_1", "properties": {"position": {"x": 1}}},
+            {"gameObjectPath": "Level/Enemy_2", "properties": {"position": {"x": 2}}},
+        ]
+    }
+
+
+def test_a_parent_path_keeps_its_whole_subtree():
+    projected = project(INSPECT_MULTIPLE, fields=["results.properties.position.x", "results.properties"])
+
+    assert projected["results"][0]["properties"] == INSPECT_MULTIPLE["results"][0]["properties"]
+
+
+def test_exclude_drops_paths_and_keeps_the_rest():
+    projected = project(INSPECT_MULTIPLE, exclude=["results.properties.position", "count"])
+
+    assert projected == {
+        "success": True,
+        "results": [
+            {"gameObjectPath": "Level/Enemy_1", "properties": {"name": "Enemy_1", "tag": "Enemy"}},
+            {"gameObjectPath": "Level/Enemy_2", "properties": {"name": "Enemy_2", "tag": "Enemy"}},
+        ],
+    }
+
+
+def test_fields_apply_before_exclude():
+    projected = project(INSPECT_MULTIPLE, fields=["results.properties"], exclude=["results.properties.tag"])
+
+    assert projected["results"][1] == {"properties": {"position": {"x": 2, "y": 0}, "name": "Enemy_2"}}
+
+
+def test_missing_and_empty_paths_are_ignored():
+    assert project(INSPECT_MULTIPLE, fields=["nothing.here", ""]) == {}
+    assert project(INSPECT_MULTIPLE, exclude=["nothing.here"]) == INSPECT_MULTIPLE
+    assert project(INSPECT_MULTIPLE) == INSPECT_MULTIPLE
+
+
+def test_response_options_never_reach_unity():
+    arguments = {"operation": "inspect", "fields": ["results.name"], "compact": True, "dryRun": False}
+
+    remaining, options = split_response_options(arguments)
+
+    assert remaining == {"operation": "inspect"}
+    assert options == ResponseOptions(fields=("results.name",), compact=True)
+    assert split_response_options({"operation": "inspect"}) == ({"operation": "inspect"}, ResponseOptions())
+
+
+def test_compact_output_has_no_whitespace():
+    [pretty] = render_response(INSPECT_MULTIPLE, ResponseOptions())
+    [compact] = render_response(INSPECT_MULTIPLE, ResponseOptions(compact=True))
+
+    assert json.loads(pretty.text) == json.loads(compact.text) == INSPECT_MULTIPLE
+    assert "\n" in pretty.text
+    assert "\n" not in compact.text and ": " not in compact.text
+
+
+def test_rendered_response_is_projected():
+    [content] = render_response(INSPECT_MULTIPLE, ResponseOptions(fields=("count",), compact=True))
+
+    assert content.text == '{"count":2}'
+
+
+def test_schemas_get_the_shared_options():
+    schema = {"type": "object", "properties": {"operation": {"type": "string"}}}
+
+    enriched = with_response_options(schema)
+
+    assert {"operation", "fields", "exclude", "compact"} <= set(enriched["properties"])
+    assert set(schema["properties"]) == {"operation"}
@@ -0,0 +1,140 @@
+"""Tool registry lookups, dispatch order and tool pack entry points."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+import tools.registry as registry_module
+from tools.executor import execute_tool
+from tools.registry import ToolRegistry, ToolSpec, tool_registry
+
+
+def _schema() -> dict[str, Any]:
+    return {"type": "object", "properties": {"operation": {"type": "string"}}}
+
+
+def _spec(name: str = "test_tool", **kwargs: Any) -> ToolSpec:
+    kwargs.setdefault("bridge_command", "testManage")
+    return ToolSpec(name=name, description="Test tool", schema_factory=_schema, **kwargs)
+
+
+class FakeEntryPoint:
+    def __init__(self, name: str, target: Any) -> None:
+        self.name = name
+        self.target = target
+
+    def load(self) -> Any:
+        if isinstance(self.target, Exception):
+            raise self.target
+        return self.target
+
+
+def test_hooks_run_in_order_around_the_bridge_command(bridge):
+    steps = []
+
+    def pre(label: str):
+        def hook(arguments: dict) -> dict:
+            steps.append(label)
+            return {**arguments, "seen": [*arguments.get("seen", []), label]}
+
+        return hook
+
+    def post(label: str):
+        async def hook(arguments: dict, response: Any) -> Any:
+            steps.append(label)
+            return {**response, "post": [*response.get("post", []), label]}
+
+        return hook
+
+    def respond(tool_name: str, payload: dict) -> dict:
+        steps.append(tool_name)
+        return {"success": True}
+
+    bridge.respond = respond
+    spec = _spec(pre_hooks=(pre("pre 1"), pre("pre 2")), post_hooks=(post("post 1"), post("post 2")))
+
+    response = asyncio.run(execute_tool(spec, {"operation": "create"}))
+
+    assert steps == ["pre 1", "pre 2", "testManage", "post 1", "post 2"]
+    assert bridge.calls == [("testManage", {"operation": "create", "seen": ["pre 1", "pre 2"]})]
+    assert response == {"success": True, "post": ["post 1", "post 2"]}
+
+
+def test_handler_replaces_the_bridge_command(bridge):
+    async def handler(arguments: dict) -> dict:
+        return {"handled": arguments["operation"]}
+
+    response = asyncio.run(execute_tool(_spec(bridge_command=None, handler=handler), {"operation": "run"}))
+
+    assert response == {"handled": "run"}
+    assert bridge.calls == []
+
+
+def test_tool_needs_a_bridge_command_or_handler():
+    with pytest.raises(ValueError):
+        ToolRegistry().register(_spec(bridge_command=None))
+
+
+def test_unknown_names_resolve_to_raw_bridge_commands():
+    registry = ToolRegistry()
+    registry.register(_spec())
+
+    assert registry.resolve_bridge_command("test_tool") == "testManage"
+    assert registry.resolve_bridge_command("gameObjectManage") == "gameObjectManage"
+
+
+def test_read_operations_decide_is_read():
+    registry = ToolRegistry()
+    registry.register(_spec())
+    registry.register(_spec("test_reader", read_only=True))
+
+    assert registry.is_read("test_tool", {"operation": "inspect"})
+    assert not registry.is_read("test_tool", {"operation": "create"})
+    assert registry.is_read("test_reader", {"operation": "create"})
+    assert not registry.is_read("missing_tool", {"operation": "inspect"})
+
+
+def test_tool_list_is_rebuilt_after_a_registration():
+    registry = ToolRegistry()
+    registry.register(_spec("first_tool"))
+    tools = registry.list_tools()
+    assert registry.list_tools() is tools
+
+    registry.register(_spec("second_tool"))
+
+    assert [tool.name for tool in registry.list_tools()] == ["first_tool", "second_tool"]
+    assert "fields" in registry.list_tools()[0].inputSchema["properties"]
+
+
+def test_builtin_tools_are_registered():
+    assert tool_registry.resolve_bridge_command("unity_gameobject_crud") == "gameObjectManage"
+    assert tool_registry.get("unity_batch_sequential_execute").handler is not None
+
+
+def test_entry_points_register_tool_packs_once(monkeypatch):
+    def register_pack(registry: ToolRegistry) -> None:
+        registry.register(_spec("pack_callable"))
+
+    loaded = [
+        FakeEntryPoint("callable", register_pack),
+        FakeEntryPoint("broken", ImportError("missing dependency")),
+        FakeEntryPoint("specs", [_spec("pack_spec_1"), _spec("pack_spec_2")]),
+    ]
+    groups = []
+
+    def entry_points(group: str) -> list[FakeEntryPoint]:
+        groups.append(group)
+        return loaded
+
+    monkeypatch.setattr(registry_module, "entry_points", entry_points)
+    registry = ToolRegistry()
+
+    registry.load_entry_points()
+    registry.load_entry_points()
+
+    assert groups == ["unity_ai_forge.tools"]
+    # A pack that fails to load doesn't keep the others out
+    assert registry.names() == ["pack_callable", "pack_spec_1", "pack_spec_2"]
@@ -0,0 +1,150 @@
+"""Last-write-wins coalescing of rapid updates to the same target."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import tools.executor as executor
+from services.write_coalescer import WriteCoalescer
+from tools.registry import tool_registry
+
+
+class Unity:
+    def __init__(self, error: Exception | None = None) -> None:
+        self.error = error
+        self.requests: list[dict[str, Any]] = []
+
+    async def send(self, bridge_command: str, payload: dict[str, Any]) -> Any:
+        self.requests.append(payload)
+        if self.error is not None:
+            raise self.error
+        return {"success": True, "updated": sorted(payload["propertyChanges"])}
+
+
+def _update(changes: dict[str, Any], path: str = "Player", component: str = "Rigidbody") -> dict[str, Any]:
+    return {
+        "operation": "update",
+        "gameObjectPath": path,
+        "componentType": component,
+        "propertyChanges": changes,
+    }
+
+
+async def _submit_all(coalescer: WriteCoalescer, unity: Unity, payloads: list[dict[str, Any]]) -> list[Any]:
+    return await asyncio.gather(
+        *(coalescer.submit("componentManage", payload, unity.send) for payload in payloads),
+        return_exceptions=True,
+    )
+
+
+def test_updates_of_one_target_merge_with_the_last_write_winning():
+    coalescer = WriteCoalescer(window_ms=20)
+    unity = Unity()
+    payloads = [_update({"mass": 1, "drag": 0.1}), _update({"mass": 2}), _update({"mass": 3, "useGravity": False})]
+
+    responses = asyncio.run(_submit_all(coalescer, unity, payloads))
+
+    assert unity.requests == [_update({"mass": 3, "drag": 0.1, "useGravity": False})]
+    # Every caller gets the single response, which reflects the final state
+    assert all(response is responses[0] for response in responses)
+    assert responses[0]["coalesced"] == {
+        "mergedUpdates": 3,
+        "propertiesOverwritten": 2,
+        "propertyChanges": {"mass": 3, "drag": 0.1, "useGravity": False},
+    }
+
+
+def test_target_is_every_argument_but_the_changes():
+    coalescer = WriteCoalescer(window_ms=20)
+    unity = Unity()
+    reordered = {
+        "propertyChanges": {"drag": 1},
+        "componentType": "Rigidbody",
+        "gameObjectPath": "Player",
+        "operation": "update",
+    }
+    payloads = [
+        _update({"mass": 1}),
+        reordered,
+        _update({"mass": 2}, path="Enemy"),
+        _update({"size": 1}, component="BoxCollider"),
+    ]
+
+    asyncio.run(_submit_all(coalescer, unity, payloads))
+
+    sent = {
+        (request["gameObjectPath"], request["componentType"]): request["propertyChanges"]
+        for request in unity.requests
+    }
+    assert sent == {
+        ("Player", "Rigidbody"): {"mass": 1, "drag": 1},
+        ("Enemy", "Rigidbody"): {"mass": 2},
+        ("Player", "BoxCollider"): {"size": 1},
+    }
+    assert len(unity.requests) == 3
+
+
+def test_updates_after_the_window_are_sent_separately():
+    coalescer = WriteCoalescer(window_ms=10)
+    unity = Unity()
+
+    async def scenario() -> None:
+        await coalescer.submit("componentManage", _update({"mass": 1}), unity.send)
+        await coalescer.submit("componentManage", _update({"mass": 2}), unity.send)
+
+    asyncio.run(scenario())
+
+    assert [request["propertyChanges"] for request in unity.requests] == [{"mass": 1}, {"mass": 2}]
+
+
+def test_stats_count_merged_updates_and_overwrites():
+    coalescer = WriteCoalescer(window_ms=20)
+    unity = Unity()
+
+    async def scenario() -> None:
+        await _submit_all(coalescer, unity, [_update({"mass": 1}), _update({"mass": 2}), _update({"drag": 1})])
+        await _submit_all(coalescer, unity, [_update({"mass": 5}, path="Enemy")])
+
+    asyncio.run(scenario())
+
+    assert coalescer.get_stats() == {
+        "enabled": True,
+        "windowMs": 20.0,
+        "requests": 4,
+        "updatesSent": 2,
+        "updatesMerged": 2,
+        "propertiesOverwritten": 1,
+        "largestMerge": 3,
+        "failures": 0,
+    }
+
+
+def test_failed_update_fails_every_merged_caller():
+    coalescer = WriteCoalescer(window_ms=20)
+    unity = Unity(error=ConnectionError("bridge disconnected"))
+
+    responses = asyncio.run(_submit_all(coalescer, unity, [_update({"mass": 1}), _update({"mass": 2})]))
+
+    assert all(isinstance(response, ConnectionError) for response in responses)
+    assert len(unity.requests) == 1
+    assert coalescer.get_stats()["failures"] == 1
+
+
+def test_only_calls_opting_in_are_coalesced(bridge, monkeypatch):
+    monkeypatch.setattr(executor, "update_coalescer", WriteCoalescer(window_ms=20))
+    spec = tool_registry.get("unity_component_crud")
+
+    async def scenario() -> list[Any]:
+        return await asyncio.gather(
+            executor.execute_tool(spec, {**_update({"mass": 1}), "coalesce": True}),
+            executor.execute_tool(spec, {**_update({"mass": 2}), "coalesce": True}),
+            executor.execute_tool(spec, _update({"drag": 1})),
+        )
+
+    responses = asyncio.run(scenario())
+
+    assert [payload["propertyChanges"] for _, payload in bridge.calls] == [{"drag": 1}, {"mass": 2}]
+    assert all("coalesce" not in payload for _, payload in bridge.calls)
+    assert responses[0]["coalesced"]["mergedUpdates"] == 2
+    assert "coalesced" not in responses[2]